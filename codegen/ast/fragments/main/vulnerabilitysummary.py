@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import typing
+from collections import Counter
 from typing import Any
 from typing import Dict
 
 from pydantic import Field
 from pydantic import model_validator
 
+from ..log import logger
+from .scanner import Severity
+
 
 class VulnerabilitySummary(BaseModel):
     # Summary dict keys added as fields
@@ -38,3 +43,34 @@ class VulnerabilitySummary(BaseModel):
         if not isinstance(summary, dict):
             raise ValueError("'summary' must be a dict")
         return {**values, **summary}
+
+    @property
+    def distribution(self) -> typing.Counter[Severity]:
+        """The number of vulnerabilities of each severity.
+
+        Returns
+        -------
+        Counter[Severity]
+            The number of vulnerabilities of each severity.
+            Severities without vulnerabilities are omitted.
+        """
+        if self.summary:
+            counts = self.summary
+        else:
+            counts = {
+                "Critical": self.critical,
+                "High": self.high,
+                "Medium": self.medium,
+                "Low": self.low,
+                "Unknown": self.unknown,
+            }
+        dist: typing.Counter[Severity] = Counter()
+        for name, count in counts.items():
+            try:
+                severity = Severity(name)
+            except ValueError:
+                logger.warning("Unknown severity in vulnerability summary: %s", name)
+                continue
+            if count:
+                dist[severity] += count
+        return dist
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-import functools
+import heapq
+import operator
 import typing
 from collections import Counter
 from functools import cached_property
+from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from pydantic import AwareDatetime
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
+
+from .base import without_private
 
 
 class HarborVulnerabilityReport(BaseModel):
@@ -36,17 +43,37 @@ class HarborVulnerabilityReport(BaseModel):
         default_factory=list,
         description="The list of vulnerabilities found.",
     )
+    _severity_index: Optional["_SeverityIndex"] = PrivateAttr(default=None)
+
+    def __eq__(self, other: Any) -> bool:
+        # The severity index is derived from the vulnerabilities,
+        # so reports with the same fields are equal whether or not
+        # their indexes have been built.
+        if not isinstance(other, HarborVulnerabilityReport):
+            return super().__eq__(other)
+        return BaseModel.__eq__(
+            without_private(self, "_severity_index"),
+            without_private(other, "_severity_index"),
+        )
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Don't pickle the severity index, it is rebuilt on first use
+        state = super().__getstate__()
+        state["__pydantic_private__"] = without_private(
+            self, "_severity_index"
+        ).__pydantic_private__
+        return state
 
     def __repr__(self) -> str:
         return f"HarborVulnerabilityReport(generated_at={self.generated_at}, artifact={self.artifact}, scanner={self.scanner}, severity={self.severity}, vulnerabilities=list(len={len(self.vulnerabilities)}))"
 
     @property
     def fixable(self) -> List[VulnerabilityItem]:
-        return [v for v in self.vulnerabilities if v.fixable]
+        return list(self._get_severity_index().fixable)
 
     @property
     def unfixable(self) -> List[VulnerabilityItem]:
-        return [v for v in self.vulnerabilities if not v.fixable]
+        return list(self._get_severity_index().unfixable)
 
     @property
     def critical(self) -> List[VulnerabilityItem]:
@@ -66,16 +93,78 @@ class HarborVulnerabilityReport(BaseModel):
 
     @property
     def distribution(self) -> Counter[Severity]:
-        dist: typing.Counter[Severity] = Counter()
-        for vulnerability in self.vulnerabilities:
-            if vulnerability.severity:
-                dist[vulnerability.severity] += 1
-        return dist
+        return self._get_severity_index().distribution.copy()
 
     def vulnerabilities_by_severity(
         self, severity: Severity
     ) -> List[VulnerabilityItem]:
-        return [v for v in self.vulnerabilities if v.severity == severity]
+        return list(self._get_severity_index().by_severity.get(severity, []))
+
+    def _get_severity_index(self) -> _SeverityIndex:
+        """Get the vulnerabilities grouped by severity and fixability.
+
+        The index is built on first use, and rebuilt if `vulnerabilities` is
+        reassigned or its items are added, removed, replaced or reordered.
+        Call [`reindex()`][harborapi.models.scanner.HarborVulnerabilityReport.reindex]
+        after modifying the fields of a vulnerability in place.
+        """
+        index = self._severity_index
+        if index is None or not index.is_current(self.vulnerabilities):
+            index = self._severity_index = _SeverityIndex(self.vulnerabilities)
+        return index
+
+    def reindex(self) -> None:
+        """Rebuild the aggregates of the vulnerabilities on next use.
+
+        Must be called after modifying the fields of a vulnerability in place,
+        e.g. `report.vulnerabilities[0].severity = Severity.low`, for
+        `fixable`, `unfixable`, `critical`, `high`, `medium`, `low`,
+        `distribution`, `top_vulns` and the CVSS scores to reflect the change.
+        Changes to the list of vulnerabilities itself are detected automatically.
+        """
+        self._severity_index = None
+
+    def get_cvss_scores(
+        self, version: int = 3, vendor_priority: Optional[Iterable[str]] = None
+    ) -> List[float]:
+        """Returns the CVSS score of each vulnerability, in the same order
+        as `vulnerabilities`. Vulnerabilities without a score get a score of 0.0.
+
+        The scores are resolved once per report for each combination of
+        scanner, version and vendor priority, and reused until the
+        vulnerabilities are modified.
+
+        Parameters
+        ----------
+        version : int
+            The CVSS version of the scores, by default 3
+        vendor_priority : Optional[Iterable[str]]
+            The vendors to get the score from, in order of priority,
+            by default NVD over RedHat.
+
+        Returns
+        -------
+        List[float]
+            The CVSS score of each vulnerability.
+        """
+        return list(self._get_cvss_column(version, vendor_priority))
+
+    def _get_cvss_column(
+        self, version: int = 3, vendor_priority: Optional[Iterable[str]] = None
+    ) -> List[float]:
+        """Get the stored CVSS scores of the vulnerabilities, resolving them
+        if needed. The returned list must not be modified."""
+        vendors = DEFAULT_VENDORS if vendor_priority is None else tuple(vendor_priority)
+        scanner = self.scanner.name if self.scanner else None
+        key = (scanner, version, vendors)
+        index = self._get_severity_index()
+        scores = index.cvss_scores.get(key)
+        if scores is None:
+            scores = index.cvss_scores[key] = [
+                v.get_cvss_score(self.scanner, version=version, vendor_priority=vendors)
+                for v in self.vulnerabilities
+            ]
+        return scores
 
     def sort(self, descending: bool = True, use_cvss: bool = False) -> None:
         """Sorts the vulnerabilities by severity in place.
@@ -93,27 +182,31 @@ class HarborVulnerabilityReport(BaseModel):
             when items have identical severity, by default False
             This is somewhat experimental and may be removed in the future.
         """
+        vulns = self.vulnerabilities
+        severities = [SEVERITY_PRIORITY[v.severity] for v in vulns]
+        if use_cvss:
+            scores = self._get_cvss_column()
+            order = sorted(
+                range(len(vulns)),
+                key=lambda i: (severities[i], scores[i]),
+                reverse=descending,
+            )
+        else:
+            order = sorted(
+                range(len(vulns)), key=severities.__getitem__, reverse=descending
+            )
+        index = self._severity_index
+        if index is not None and not index.is_current(vulns):
+            index = None
+        vulns[:] = [vulns[i] for i in order]
+        self.reindex()
+        if index is not None and index.cvss_scores:
+            # The stored scores are still valid, only in a different order
+            columns = self._get_severity_index().cvss_scores
+            for key, column in index.cvss_scores.items():
+                columns[key] = [column[i] for i in order]
 
-        # TODO: implement this comparison in the VulnerabilityItem class
-        def cmp(v1: VulnerabilityItem, v2: VulnerabilityItem) -> int:
-            # First try to compare severities
-            if v1.severity > v2.severity:
-                return 1
-            elif v1.severity < v2.severity:
-                return -1
-            if not use_cvss:
-                return 0
-            # Only proceeed if severities are identical
-            diff = v1.get_cvss_score(self.scanner) - v2.get_cvss_score(self.scanner)
-            if diff > 0:
-                return 1
-            elif diff < 0:
-                return -1
-            return 0
-
-        self.vulnerabilities.sort(key=functools.cmp_to_key(cmp), reverse=descending)
-
-    @cached_property
+    @property
     def cvss_scores(self) -> List[float]:
         """Returns a list of CVSS scores for each vulnerability.
         Vulnerabilities with a score of `None` are omitted.
@@ -123,12 +216,7 @@ class HarborVulnerabilityReport(BaseModel):
         List[Optional[float]]
             A list of CVSS scores for each vulnerability.
         """
-        return list(
-            filter(
-                None,
-                [v.get_cvss_score(self.scanner) for v in self.vulnerabilities],
-            )
-        )
+        return list(filter(None, self._get_cvss_column()))
 
     def top_vulns(self, n: int = 5, fixable: bool = False) -> List[VulnerabilityItem]:
         """Returns the n most severe vulnerabilities.
@@ -147,25 +235,12 @@ class HarborVulnerabilityReport(BaseModel):
             The n most severe vulnerabilities.
 
         """
-        # TODO: implement UNfixable
-        vulns: Iterable[VulnerabilityItem] = []  # declare type for mypy
-
+        vulns = self.vulnerabilities
+        scores = self._get_cvss_column()
+        positions: Iterable[int] = range(len(vulns))
         if fixable:
-            vulns = self.fixable
-        else:
-            vulns = self.vulnerabilities
-
-        # Remove vulnerabilities with no CVSS score
-        vulns = filter(lambda v: v.get_cvss_score(self.scanner) is not None, vulns)
-
-        # Sort by CVSS score
-        return sorted(
-            vulns, key=lambda v: v.get_cvss_score(self.scanner), reverse=True
-        )[:n]
-
-    # DEPRECATED:
-    # The with_ and has_ methods are deprecated in favor of similar methods
-    # on the `ext.artifact.ArtifactInfo` class.
+            positions = (i for i in positions if vulns[i].fix_version)
+        return [vulns[i] for i in heapq.nlargest(n, positions, key=scores.__getitem__)]
 
     def has_cve(self, cve_id: str, case_sensitive: bool = False) -> bool:
         """Whether or not the report contains a vulnerability with the given CVE ID.
@@ -308,3 +383,49 @@ class HarborVulnerabilityReport(BaseModel):
 
             if description in vuln_description:
                 yield vuln
+
+
+class _SeverityIndex:
+    """Vulnerabilities of a report grouped by severity and fixability,
+    and their CVSS scores. Each aggregate is computed on first use."""
+
+    def __init__(self, vulnerabilities: List[VulnerabilityItem]) -> None:
+        # A copy, so that changes to the list can be detected
+        self.vulnerabilities = list(vulnerabilities)
+        # (scanner name, CVSS version, vendor priority) -> score of each vulnerability
+        self.cvss_scores: Dict[
+            Tuple[Optional[str], int, Tuple[str, ...]], List[float]
+        ] = {}
+
+    @cached_property
+    def by_severity(self) -> Dict[Severity, List[VulnerabilityItem]]:
+        by_severity: Dict[Severity, List[VulnerabilityItem]] = {}
+        for vuln in self.vulnerabilities:
+            bucket = by_severity.get(vuln.severity)
+            if bucket is None:
+                bucket = by_severity[vuln.severity] = []
+            bucket.append(vuln)
+        return by_severity
+
+    @cached_property
+    def fixable(self) -> List[VulnerabilityItem]:
+        return [v for v in self.vulnerabilities if v.fix_version]
+
+    @cached_property
+    def unfixable(self) -> List[VulnerabilityItem]:
+        return [v for v in self.vulnerabilities if not v.fix_version]
+
+    @cached_property
+    def distribution(self) -> typing.Counter[Severity]:
+        return Counter({s: len(b) for s, b in self.by_severity.items() if s})
+
+    def is_current(self, vulnerabilities: List[VulnerabilityItem]) -> bool:
+        """Check if the index was built from the same vulnerabilities,
+        in the same order.
+
+        Only compares the identities of the vulnerabilities, so modifying
+        the fields of a vulnerability in place is not detected.
+        """
+        return len(vulnerabilities) == len(self.vulnerabilities) and all(
+            map(operator.is_, vulnerabilities, self.vulnerabilities)
+        )
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+import httpx
+from httpx import Response
+
+from ._types import QueryParamMapping
+from .log import logger
+from .serialization import JSONBackend
+from .serialization import get_json_backend
+
+T = TypeVar("T")
+
+KEY_HEADERS = ("Accept", "X-Accept-Vulnerabilities")
+"""Request headers that select the representation of a response.
+
+Responses are cached separately per value of each of these headers."""
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body along with the validators used to revalidate it."""
+
+    data: bytes
+    """The undecoded JSON body of the response."""
+    etag: Optional[str] = None
+    """The value of the `ETag` header of the response."""
+    last_modified: Optional[str] = None
+    """The value of the `Last-Modified` header of the response."""
+    next_url: Optional[str] = None
+    """The next page URL parsed from the `Link` header of the response."""
+    total_count: Optional[int] = None
+    """The total number of results reported by the `X-Total-Count` header."""
+    expires: Optional[float] = None
+    """Monotonic time after which the entry is discarded."""
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers to revalidate the entry with."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU cache of GET responses revalidated with conditional requests.
+
+    Responses with an `ETag` or `Last-Modified` header are stored, and
+    subsequent requests for the same URL send `If-None-Match` and
+    `If-Modified-Since` headers. When the server responds with
+    `304 Not Modified`, the cached body is used instead of downloading it
+    again.
+
+    Bodies are stored undecoded, and each call decodes the body and
+    constructs new models from it, so modifying the results of a call
+    does not affect the results of subsequent calls.
+
+    Cached entries are always revalidated with the server, so the TTL
+    only limits how long an entry is kept around, not how stale it
+    can be.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 300.0) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of responses to keep in the cache.
+            The least recently used response is evicted when the cache is full.
+        ttl : Optional[float]
+            Number of seconds to keep a response in the cache.
+            `None` means responses are kept until evicted.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        """Number of requests answered with `304 Not Modified`."""
+        self.misses = 0
+        """Number of responses downloaded in full and stored in the cache."""
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Create a cache key for a request.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request.
+        params : Optional[QueryParamMapping]
+            The query parameters of the request.
+        headers : Optional[Dict[str, str]]
+            The headers of the request.
+            Responses are cached separately per value of each header in
+            [KEY_HEADERS][harborapi.cache.KEY_HEADERS], such as `Accept` and
+            `X-Accept-Vulnerabilities`.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        h = httpx.Headers(headers or {})
+        values = " ".join(h.get(name, "") for name in KEY_HEADERS)
+        return f"{values} {httpx.URL(url).copy_merge_params(params or {})}"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get a cached entry if it exists and has not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def update(
+        self,
+        key: str,
+        response: Response,
+        next_url: Optional[str] = None,
+        total_count: Optional[int] = None,
+    ) -> Optional[CacheEntry]:
+        """Store a response in the cache if it can be revalidated.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request.
+        response : Response
+            The response to store.
+        next_url : Optional[str]
+            The next page URL of the response.
+        total_count : Optional[int]
+            The total number of results reported by the response.
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The new entry, or `None` if the response has no validators.
+        """
+        self._remove(key)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+        self.misses += 1
+        entry = CacheEntry(
+            data=response.content,
+            etag=etag,
+            last_modified=last_modified,
+            next_url=next_url,
+            total_count=total_count,
+            expires=time.monotonic() + self.ttl if self.ttl is not None else None,
+        )
+        self._entries[key] = entry
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._entries.clear()
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of responses in the cache."""
+        return len(self._entries)
+
+
+class ReportCache:
+    """Persistent cache of vulnerability reports stored in an SQLite database.
+
+    A vulnerability report only changes when its artifact is rescanned,
+    which gives the report a new ID. Reports are therefore cached by the
+    digest of the artifact, the MIME type of the report and the ID of the
+    report found in the artifact's scan overview, and are never revalidated
+    with the server. Storing a report for a digest and MIME type removes the
+    reports with other IDs for the same digest and MIME type, as they have
+    been superseded by a rescan.
+
+    Reports are stored as compressed JSON. When the total size of the stored
+    reports exceeds `max_size`, the least recently used reports are evicted.
+    The access times of reports are recorded in memory and written to the
+    database in batches.
+
+    The client uses the async methods [aget][harborapi.cache.ReportCache.aget]
+    and [aset][harborapi.cache.ReportCache.aset], which run the queries,
+    compression and JSON encoding in a thread so that they don't block
+    the event loop.
+
+    Examples
+    --------
+    ```py
+    cache = ReportCache("reports.db")
+    client = HarborAsyncClient(..., report_cache=cache)
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]] = ":memory:",
+        max_size: Optional[int] = 1024 * 1024 * 1024,
+        json_backend: Union[str, JSONBackend, None] = None,
+        flush_interval: int = 100,
+    ) -> None:
+        """Open or create the cache.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path to the SQLite database file.
+            The default `":memory:"` keeps the cache in memory only.
+        max_size : Optional[int]
+            Maximum total size in bytes of the compressed reports.
+            `None` means no limit.
+        json_backend : Union[str, JSONBackend, None]
+            JSON backend used to encode and decode the reports.
+            If `None`, the client the cache is passed to sets it to its own
+            `json_backend`, and the standard library `json` module is used
+            if the cache is used on its own.
+            See [get_json_backend][harborapi.serialization.get_json_backend].
+        flush_interval : int
+            Number of cache hits after which their access times are written
+            to the database.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.json_backend = (
+            get_json_backend(json_backend) if json_backend is not None else None
+        )
+        self.flush_interval = flush_interval
+        self.hits = 0
+        """Number of reports found in the cache."""
+        self.misses = 0
+        """Number of reports not found in the cache."""
+        self.evictions = 0
+        """Number of reports evicted to stay within `max_size`."""
+        # Access times of cache hits not yet written to the database
+        self._accessed: Dict[Tuple[str, str, str], float] = {}
+        # The connection is shared by the threads running the async methods
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                "digest TEXT NOT NULL, "
+                "mime_type TEXT NOT NULL, "
+                "report_id TEXT NOT NULL, "
+                "data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "accessed REAL NOT NULL, "
+                "PRIMARY KEY (digest, mime_type, report_id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS reports_accessed ON reports (accessed)"
+            )
+        # Running total of the sizes of the reports, kept up to date by
+        # the methods that insert and delete reports
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM reports")
+        self._size = int(row.fetchone()[0])
+
+    @property
+    def _json(self) -> JSONBackend:
+        if self.json_backend is None:
+            self.json_backend = get_json_backend("json")
+        return self.json_backend
+
+    def get(
+        self, digest: str, mime_type: str, report_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached report.
+
+        Parameters
+        ----------
+        digest : str
+            The digest of the artifact.
+        mime_type : str
+            The MIME type of the report.
+        report_id : str
+            The ID of the report, found in the artifact's scan overview.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The report as returned by the API, or `None` if it is not cached.
+        """
+        key = (digest, mime_type, report_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM reports "
+                "WHERE digest = ? AND mime_type = ? AND report_id = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= self.flush_interval:
+                self._flush()
+        report: Dict[str, Any] = self._json.loads(zlib.decompress(row[0]))
+        return report
+
+    def set(
+        self, digest: str, mime_type: str, report_id: str, report: Dict[str, Any]
+    ) -> None:
+        """Store a report in the cache.
+
+        Parameters
+        ----------
+        digest : str
+            The digest of the artifact.
+        mime_type : str
+            The MIME type of the report.
+        report_id : str
+            The ID of the report, found in the artifact's scan overview.
+        report : Dict[str, Any]
+            The report as returned by the API.
+        """
+        data = zlib.compress(self._json.dumps(report))
+        if self.max_size is not None and len(data) > self.max_size:
+            return
+        with self._lock:
+            with self._conn:
+                # Reports of previous scans of the artifact are no longer needed
+                row = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM reports "
+                    "WHERE digest = ? AND mime_type = ?",
+                    (digest, mime_type),
+                ).fetchone()
+                self._conn.execute(
+                    "DELETE FROM reports WHERE digest = ? AND mime_type = ?",
+                    (digest, mime_type),
+                )
+                self._conn.execute(
+                    "INSERT INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                    (digest, mime_type, report_id, data, len(data), time.time()),
+                )
+            self._size += len(data) - int(row[0])
+            if self.max_size is not None and self._size > self.max_size:
+                self._evict(self.max_size)
+
+    async def aget(
+        self, digest: str, mime_type: str, report_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached report without blocking the event loop.
+
+        See [get][harborapi.cache.ReportCache.get].
+        """
+        return await self._run(self.get, digest, mime_type, report_id)
+
+    async def aset(
+        self, digest: str, mime_type: str, report_id: str, report: Dict[str, Any]
+    ) -> None:
+        """Store a report in the cache without blocking the event loop.
+
+        See [set][harborapi.cache.ReportCache.set].
+        """
+        await self._run(self.set, digest, mime_type, report_id, report)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a method in the default executor of the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the compressed reports.
+
+        Computed when the cache is opened and updated as reports are
+        stored and evicted, so it does not include reports stored by
+        other processes using the same database file.
+        """
+        return self._size
+
+    def flush(self) -> None:
+        """Write the access times of recent cache hits to the database."""
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        """Remove all reports from the cache."""
+        with self._lock:
+            self._accessed.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM reports")
+            self._size = 0
+
+    def close(self) -> None:
+        """Write the pending access times and close the database connection."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def _flush(self) -> None:
+        if not self._accessed:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE reports SET accessed = ? "
+                "WHERE digest = ? AND mime_type = ? AND report_id = ?",
+                [(accessed, *key) for key, accessed in self._accessed.items()],
+            )
+        self._accessed.clear()
+
+    def _evict(self, max_size: int) -> None:
+        """Evict the least recently used reports until the total size
+        is at most `max_size`."""
+        # Evict based on the latest access times
+        self._flush()
+        excess = self._size - max_size
+        evicted: List[Tuple[str, str, str]] = []
+        evicted_size = 0
+        rows = self._conn.execute(
+            "SELECT digest, mime_type, report_id, size FROM reports ORDER BY accessed"
+        )
+        for digest, mime_type, report_id, size in rows:
+            if evicted_size >= excess:
+                break
+            evicted.append((digest, mime_type, report_id))
+            evicted_size += size
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM reports "
+                "WHERE digest = ? AND mime_type = ? AND report_id = ?",
+                evicted,
+            )
+        self._size -= evicted_size
+        self.evictions += len(evicted)
+        logger.debug("Evicted %d reports from the report cache", len(evicted))
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a `(digest, mime_type, report_id)` tuple is cached."""
+        if not isinstance(key, tuple) or len(key) != 3:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM reports "
+                "WHERE digest = ? AND mime_type = ? AND report_id = ?",
+                key,
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        """Return the number of reports in the cache."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM reports").fetchone()
+        return int(row[0])
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import os
 import warnings
 from http.cookiejar import CookieJar
 from pathlib import Path
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
 from typing import Dict
 from typing import Generator
 from typing import List
@@ -25,6 +29,7 @@ from httpx import Timeout
 from httpx._types import VerifyTypes
 from pydantic import BaseModel
 from pydantic import SecretStr
+from pydantic import TypeAdapter
 from pydantic import ValidationError
 from typing_extensions import deprecated
 
@@ -34,6 +39,11 @@ from ._types import JSONType
 from ._types import QueryParamMapping
 from .auth import load_harbor_auth_file
 from .auth import new_authfile_from_robotcreate
+from .cache import CacheEntry
+from .cache import ReportCache
+from .cache import ResponseCache
+from .concurrency import AdaptiveLimiter
+from .concurrency import SingleFlight
 from .exceptions import HarborAPIException
 from .exceptions import NotFound
 from .exceptions import UnprocessableEntity
@@ -119,18 +129,28 @@ from .models import WebhookJob
 from .models import WebhookLastTrigger
 from .models import WebhookPolicy
 from .models.buildhistory import BuildHistoryEntry
+from .models.construct import construct
 from .models.file import FileResponse
+from .models.intern import InternPool
+from .models.lazy import LazyList
+from .models.projection import get_projection
+from .models.projection import project as project_data
 from .models.scanner import HarborVulnerabilityReport
 from .responselog import ResponseLog
 from .responselog import ResponseLogEntry
 from .retry import RetrySettings
 from .retry import retry
+from .serialization import JSONBackend
+from .serialization import get_json_backend
 from .utils import get_artifact_path
 from .utils import get_basicauth
+from .utils import get_page_urls
 from .utils import get_params
 from .utils import get_project_headers
 from .utils import get_repo_path
+from .utils import get_total_count
 from .utils import handle_optional_json_response
+from .utils import is_json
 from .utils import parse_pagination_url
 from .utils import urldecode_header
 
@@ -152,6 +172,12 @@ def model_to_dict(model: BaseModel) -> JSONType:
     return cast(JSONType, model.model_dump(mode="json", exclude_unset=True))
 
 
+@functools.lru_cache(maxsize=None)
+def _list_adapter(cls: Type[T]) -> TypeAdapter[List[T]]:
+    """Get a cached type adapter that validates a list of `cls` in one call."""
+    return TypeAdapter(List[cls])  # type: ignore[valid-type]
+
+
 class CookieDiscarder(CookieJar):
     """A CookieJar that discards all cookies."""
 
@@ -177,14 +203,29 @@ class HarborAsyncClient:
         credentials_file: Optional[Union[str, Path]] = None,
         validate: bool = True,
         raw: bool = False,
+        lazy: bool = False,
         logging: bool = False,
         max_logs: Optional[int] = None,
         # HTTPX client options
         follow_redirects: bool = True,
         timeout: Union[float, Timeout] = 10.0,
         verify: VerifyTypes = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        limiter: Optional[AdaptiveLimiter] = None,
         # Retry options
         retry: Optional[RetrySettings] = RetrySettings(),  # type: ignore[call-arg]
+        # Pagination options
+        page_concurrency: Optional[int] = None,
+        # Caching options
+        cache: Optional[ResponseCache] = None,
+        report_cache: Optional[ReportCache] = None,
+        coalesce_requests: bool = False,
+        # Serialization options
+        json_backend: Union[str, JSONBackend, None] = "json",
+        intern_pool: Optional[InternPool] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize a new HarborAsyncClient with either a username and secret,
@@ -208,12 +249,20 @@ class HarborAsyncClient:
         validate : bool
             If True, validate the results with Pydantic models.
             If False, data is returned as Pydantic models, but without
-            validation, and as such may contain invalid data, and
-            fields with submodels are not constructed (they are just dicts).
+            validation, and as such may contain invalid data.
+            Submodels and enums are constructed, but other values
+            (such as datetimes) are not converted from their JSON values.
         raw : bool
             If True, return the raw response from the API, be it a dict or a list.
             If False, use Pydantic models to parse the response.
             Takes precedence over `validate` if `raw=True`.
+        lazy : bool
+            If True, methods that return lists of models return a
+            `LazyList` that keeps the JSON data of each item, and only
+            validates (or constructs, if `validate=False`) an item the first
+            time it is accessed.
+            Reduces CPU time and memory usage when only some of the items
+            of large lists are used.
         logging : bool
             Enable logging for the library.
         max_logs : Optional[int]
@@ -228,6 +277,68 @@ class HarborAsyncClient:
             Control verification of the server's TLS certificate.
             See `httpx._types.VerifyTypes` for more information or
             <https://www.python-httpx.org/advanced/ssl/>.
+        max_connections : Optional[int]
+            Maximum number of concurrent connections to the server.
+            `None` means no limit.
+        max_keepalive_connections : Optional[int]
+            Maximum number of idle connections kept alive in the connection pool.
+            Should be raised along with `max_connections` for highly
+            concurrent workloads to avoid re-establishing connections.
+            `None` means no limit.
+        keepalive_expiry : Optional[float]
+            Number of seconds an idle connection is kept alive.
+            `None` means idle connections never expire.
+        http2 : bool
+            Enable HTTP/2 support, which multiplexes concurrent requests
+            over a single connection.
+            Requires the `h2` package (`pip install harborapi[http2]`).
+        limiter : Optional[AdaptiveLimiter]
+            Limiter that adapts the number of concurrent requests to the
+            server's capacity, backing off when the server is overloaded.
+            If `None`, the number of concurrent requests is only limited
+            by `max_connections`.
+        retry : Optional[RetrySettings]
+            Settings for retrying failed requests.
+            Set to `None` to disable retrying.
+        page_concurrency : Optional[int]
+            Maximum number of pages to fetch concurrently when paginating.
+            If set to a value greater than 1, the total number of results
+            is read from the `X-Total-Count` header of the first page, and
+            the remaining pages are fetched concurrently.
+            If `None`, pages are fetched one by one by following the
+            `Link` header of each page.
+        cache : Optional[ResponseCache]
+            Cache for GET responses. Cached responses are revalidated with
+            the server using `If-None-Match` and `If-Modified-Since` headers,
+            and the cached data and models are reused if the server responds
+            with `304 Not Modified`.
+            Set to `None` to disable caching.
+        report_cache : Optional[ReportCache]
+            Persistent cache of vulnerability reports, checked by
+            [get_artifact_vulnerabilities][harborapi.client.HarborAsyncClient.get_artifact_vulnerabilities]
+            before requesting a report whose ID is known.
+            Reports are encoded with the client's `json_backend` unless the
+            cache has its own.
+            Set to `None` to disable caching.
+        coalesce_requests : bool
+            Coalesce concurrent identical GET requests (same path, parameters
+            and headers) into a single request whose result is shared
+            between the callers.
+            The number of requests saved is tracked by
+            `HarborAsyncClient.singleflight.coalesced`.
+        json_backend : Union[str, JSONBackend, None]
+            The JSON backend used to decode response bodies and encode
+            request bodies. Either `"json"` (standard library), `"orjson"`,
+            or a `JSONBackend` instance.
+            `"auto"` uses orjson if it is installed (`pip install harborapi[orjson]`),
+            and falls back on the standard library otherwise.
+            NOTE: orjson decodes integers larger than 64 bits as floats.
+        intern_pool : Optional[InternPool]
+            Pool used to de-duplicate identical vulnerabilities, strings and
+            values across the vulnerability reports returned by the client,
+            reducing the memory usage of large numbers of reports.
+            Interned objects are shared between reports, and must not be modified.
+            Set to `None` to disable interning.
         **kwargs : Any
             Backwards-compatibility with deprecated parameters.
             Unknown kwargs are ignored.
@@ -241,10 +352,25 @@ class HarborAsyncClient:
 
         self.validate = validate
         self.raw = raw
+        self.lazy = lazy
         self.retry = retry
         self.verify = verify
         self.timeout = timeout
         self.follow_redirects = follow_redirects
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.limiter = limiter
+        self.page_concurrency = page_concurrency
+        self.cache = cache
+        self.report_cache = report_cache
+        self.coalesce_requests = coalesce_requests
+        self.singleflight = SingleFlight()
+        self.json_backend = get_json_backend(json_backend)
+        self.intern_pool = intern_pool
 
         if logging or os.environ.get("HARBORAPI_LOGGING", "") == "1":
             enable_logging()
@@ -260,6 +386,8 @@ class HarborAsyncClient:
             timeout=self.timeout,
             cookies=CookieDiscarder(),
             verify=self.verify,
+            limits=self.limits,
+            http2=self.http2,
         )
 
     def authenticate(
@@ -355,6 +483,16 @@ class HarborAsyncClient:
         finally:
             self.retry = old_retry
 
+    @contextlib.contextmanager
+    def no_cache(self) -> Generator[None, None, None]:
+        """Context manager that temporarily disables the response cache."""
+        old_cache = self.cache
+        self.cache = None
+        try:
+            yield
+        finally:
+            self.cache = old_cache
+
     @contextlib.contextmanager
     def no_validation(self) -> Generator[None, None, None]:
         """Context manager that temporarily disables validation of response data."""
@@ -365,6 +503,20 @@ class HarborAsyncClient:
         finally:
             self.validate = old_validate
 
+    @contextlib.contextmanager
+    def lazy_mode(self) -> Generator[None, None, None]:
+        """Context manager that temporarily enables lazy mode.
+
+        Lazy mode causes lists of models to be returned as `LazyList`s,
+        whose items are only validated when they are accessed.
+        """
+        old_lazy = self.lazy
+        self.lazy = True
+        try:
+            yield
+        finally:
+            self.lazy = old_lazy
+
     @contextlib.contextmanager
     def raw_mode(self) -> Generator[None, None, None]:
         """Context manager that temporarily enables raw mode.
@@ -383,6 +535,16 @@ class HarborAsyncClient:
         finally:
             self.raw = old_raw
 
+    @contextlib.asynccontextmanager
+    async def _limit_request(self) -> AsyncIterator[None]:
+        """Context manager that waits for the client's limiter (if any)
+        to allow another request before sending it."""
+        if self.limiter is None:
+            yield
+        else:
+            async with self.limiter.acquire():
+                yield
+
     def log_response(self, response: Response) -> None:
         """Log the response to a request.
 
@@ -413,35 +575,119 @@ class HarborAsyncClient:
 
     @overload
     def construct_model(
-        self, cls: Type[T], data: Any, is_list: Literal[True]
+        self,
+        cls: Type[T],
+        data: Any,
+        is_list: Literal[True],
+        fields: Optional[Sequence[str]] = None,
     ) -> List[T]: ...
 
     @overload
     def construct_model(
-        self, cls: Type[T], data: Any, is_list: Literal[False] = False
+        self,
+        cls: Type[T],
+        data: Any,
+        is_list: Literal[False] = False,
+        fields: Optional[Sequence[str]] = None,
     ) -> T: ...
 
     def construct_model(
-        self, cls: Type[T], data: Any, is_list: bool = False
+        self,
+        cls: Type[T],
+        data: Any,
+        is_list: bool = False,
+        fields: Optional[Sequence[str]] = None,
     ) -> Union[T, List[T]]:
+        projection = get_projection(cls, fields) if fields is not None else None
         # NOTE: `raw` is an escape hatch, and should not be treated as part
         # of the normal flow of the client, or indeed a stable interface.
         # We provide it as a way to get the raw response from the API, but
         # we give no guarantees about the type of the response.
         if self.raw:
+            if isinstance(data, bytes):
+                data = self._decode_json(data)
+            if projection is not None:
+                data = project_data(data, projection)
             return data
 
-        if is_list:
-            return [self._construct_model(cls, item) for item in data]
+        obj = data
+        if projection is not None:
+            # Drop unwanted fields before any models are constructed
+            if isinstance(obj, bytes):
+                obj = self._decode_json(obj)
+            obj = project_data(obj, projection)
+
+        model: Union[T, List[T]]
+        if is_list and self.lazy:
+            model = self._lazy_list(cls, obj)
+        elif self.validate:
+            model = self._validate_model(cls, obj, is_list)
         else:
-            return self._construct_model(cls, data)
+            if isinstance(obj, bytes):
+                obj = self._decode_json(obj)
+            if is_list:
+                model = [self._construct_model(cls, item) for item in obj]
+            else:
+                model = self._construct_model(cls, obj)
+        if self.intern_pool is not None and isinstance(
+            model, HarborVulnerabilityReport
+        ):
+            self.intern_pool.intern_report(model)
+        return model
+
+    def _validate_model(
+        self, cls: Type[T], data: Any, is_list: bool
+    ) -> Union[T, List[T]]:
+        """Validate a model or a list of models in a single call.
+
+        Undecoded JSON (bytes) is validated directly by Pydantic,
+        without first being decoded to Python objects.
+        """
+        try:
+            if isinstance(data, bytes):
+                if is_list:
+                    return _list_adapter(cls).validate_json(data)
+                return cls.model_validate_json(data)
+            if is_list:
+                return _list_adapter(cls).validate_python(data)
+            return cls.model_validate(data)
+        except ValidationError as e:
+            if isinstance(data, bytes) and e.errors()[0]["type"] == "json_invalid":
+                logger.error("Failed to parse JSON for %s: %s", cls, e)
+                raise HarborAPIException(f"Failed to parse JSON for {cls}") from e
+            if not is_list:
+                logger.error("Failed to construct %s with %s", cls, data)
+                raise e
+        # Validate item by item to raise the error of the offending item itself
+        obj = self._decode_json(data) if isinstance(data, bytes) else data
+        return [self._construct_model(cls, item) for item in obj]
+
+    def _lazy_list(self, cls: Type[T], data: Any) -> List[T]:
+        """Create a list whose items are validated when they are accessed."""
+        obj = self._decode_json(data) if isinstance(data, bytes) else data
+        if not isinstance(obj, list):
+            return [self._construct_model(cls, item) for item in obj]
+        loader: Callable[[Any], T]
+        if self.validate:
+            loader = cls.model_validate
+        else:
+            loader = functools.partial(construct, cls)
+        return LazyList(obj, loader=loader)
+
+    def _decode_json(self, data: bytes) -> JSONType:
+        """Decode undecoded JSON returned by `_get_data`."""
+        try:
+            return cast(JSONType, self.json_backend.loads(data))
+        except ValueError as e:
+            logger.error("Failed to parse JSON: %s", e)
+            raise HarborAPIException("Failed to parse JSON") from e
 
     def _construct_model(self, cls: Type[T], data: Any) -> T:
         try:
             if self.validate:
                 return cls.model_validate(data)
             else:
-                return cls.model_construct(**data)
+                return construct(cls, data)
         except ValidationError as e:
             logger.error("Failed to construct %s with %s", cls, data)
             raise e
@@ -495,7 +741,7 @@ class HarborAsyncClient:
             The maximum number of results to return.
         """
         params = get_params(username=username, page=page, page_size=page_size)
-        users_resp = await self.get(
+        users_resp = await self._get_data(
             "/users/search",
             params=params,
             limit=limit,
@@ -522,7 +768,7 @@ class HarborAsyncClient:
             A list of Permission objects for the current user.
         """
         params = get_params(scope=scope, relative=relative)
-        resp = await self.get("/users/current/permissions", params=params)
+        resp = await self._get_data("/users/current/permissions", params=params)
         return self.construct_model(Permission, resp, is_list=True)
 
     # GET /users/current
@@ -534,7 +780,7 @@ class HarborAsyncClient:
         UserResp
             Information about the current user.
         """
-        user_resp = await self.get("/users/current")
+        user_resp = await self._get_data("/users/current")
         return self.construct_model(UserResp, user_resp)
 
     # PUT /users/{user_id}/sysadmin
@@ -654,9 +900,37 @@ class HarborAsyncClient:
             A list of users.
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        users_resp = await self.get("/users", params=params, limit=limit)
+        users_resp = await self._get_data("/users", params=params, limit=limit)
         return self.construct_model(UserResp, users_resp, is_list=True)
 
+    async def aiter_users(
+        self,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[UserResp]:
+        """Iterate over all users.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_users][harborapi.client.HarborAsyncClient.get_users] for a description
+        of the parameters.
+
+        Yields
+        ------
+        UserResp
+            A user.
+        """
+        params = get_params(q=query, sort=sort, page=page, page_size=page_size)
+        async for user in self._iter_models(
+            UserResp, "/users", params=params, limit=limit
+        ):
+            yield user
+
     # PUT /users/{user_id}
     async def update_user(self, user_id: int, user: UserProfile) -> None:
         """Update a user's profile.
@@ -684,7 +958,7 @@ class HarborAsyncClient:
         UserResp
             Information about the user.
         """
-        user_resp = await self.get(f"/users/{user_id}")
+        user_resp = await self._get_data(f"/users/{user_id}")
         return self.construct_model(UserResp, user_resp)
 
     async def get_user_by_username(self, username: str) -> UserResp:
@@ -743,7 +1017,7 @@ class HarborAsyncClient:
         Schedule
             The gc's schedule.
         """
-        resp = await self.get("/system/gc/schedule")
+        resp = await self._get_data("/system/gc/schedule")
         return self.construct_model(Schedule, resp)
 
     # POST /system/gc/schedule
@@ -824,7 +1098,7 @@ class HarborAsyncClient:
             List of Garbage Collection logs.
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        resp = await self.get("/system/gc", params=params, limit=limit)
+        resp = await self._get_data("/system/gc", params=params, limit=limit)
         return self.construct_model(GCHistory, resp, is_list=True)
 
     # GET /system/gc/{gc_id}/log
@@ -872,7 +1146,7 @@ class HarborAsyncClient:
         GCHistory
             Information about the Garbage Collection job.
         """
-        resp = await self.get(f"/system/gc/{gc_id}")
+        resp = await self._get_data(f"/system/gc/{gc_id}")
         return self.construct_model(GCHistory, resp)
 
     # CATEGORY: scanAll
@@ -886,7 +1160,7 @@ class HarborAsyncClient:
         Stats
             The metrics for the Scan All job.
         """
-        resp = await self.get("/scans/all/metrics")
+        resp = await self._get_data("/scans/all/metrics")
         return self.construct_model(Stats, resp)
 
     # PUT /system/scanAll/schedule
@@ -926,7 +1200,7 @@ class HarborAsyncClient:
         Schedule
             The schedule for the Scan All job.
         """
-        resp = await self.get("/system/scanAll/schedule")
+        resp = await self._get_data("/system/scanAll/schedule")
         return self.construct_model(Schedule, resp)
 
     # POST /system/scanAll/stop
@@ -966,7 +1240,7 @@ class HarborAsyncClient:
         ConfigurationsResponse
             The system configuration.
         """
-        resp = await self.get("/configurations")
+        resp = await self._get_data("/configurations")
         return self.construct_model(ConfigurationsResponse, resp)
 
     # CATEGORY: usergroup
@@ -998,7 +1272,7 @@ class HarborAsyncClient:
             List of user groups.
         """
         params = get_params(groupname=group_name, page=page, page_size=page_size)
-        resp = await self.get("/usergroups/search", params=params, limit=limit)
+        resp = await self._get_data("/usergroups/search", params=params, limit=limit)
         return self.construct_model(UserGroupSearchItem, resp, is_list=True)
 
     # POST /usergroups
@@ -1055,7 +1329,7 @@ class HarborAsyncClient:
             page=page,
             page_size=page_size,
         )
-        resp = await self.get("/usergroups", params=params, limit=limit)
+        resp = await self._get_data("/usergroups", params=params, limit=limit)
         return self.construct_model(UserGroup, resp, is_list=True)
 
     # PUT /usergroups/{group_id}
@@ -1087,7 +1361,7 @@ class HarborAsyncClient:
         UserGroup
             The user group.
         """
-        resp = await self.get(f"/usergroups/{group_id}")
+        resp = await self._get_data(f"/usergroups/{group_id}")
         return self.construct_model(UserGroup, resp)
 
     # DELETE /usergroups/{group_id}
@@ -1137,7 +1411,7 @@ class HarborAsyncClient:
         ReplicationExecution
             The replication execution.
         """
-        resp = await self.get(f"/replication/executions/{execution_id}")
+        resp = await self._get_data(f"/replication/executions/{execution_id}")
         return self.construct_model(ReplicationExecution, resp)
 
     # GET /replication/executions/{id}/tasks
@@ -1181,7 +1455,7 @@ class HarborAsyncClient:
             status=status,
             resource_type=resource_type,
         )
-        resp = await self.get(
+        resp = await self._get_data(
             f"/replication/executions/{execution_id}/tasks", params=params, limit=limit
         )
         return self.construct_model(ReplicationTask, resp, is_list=True)
@@ -1257,7 +1531,7 @@ class HarborAsyncClient:
         params = get_params(
             q=query, sort=sort, page=page, page_size=page_size, name=name
         )
-        resp = await self.get("/replication/policies", params=params, limit=limit)
+        resp = await self._get_data("/replication/policies", params=params, limit=limit)
         return self.construct_model(ReplicationPolicy, resp, is_list=True)
 
     # POST /replication/executions
@@ -1323,7 +1597,9 @@ class HarborAsyncClient:
             page=page,
             page_size=page_size,
         )
-        resp = await self.get("/replication/executions", params=params, limit=limit)
+        resp = await self._get_data(
+            "/replication/executions", params=params, limit=limit
+        )
         return self.construct_model(ReplicationExecution, resp, is_list=True)
 
     # PUT /replication/policies/{id}
@@ -1357,7 +1633,7 @@ class HarborAsyncClient:
         ReplicationPolicy
             The replication policy.
         """
-        resp = await self.get(f"/replication/policies/{policy_id}")
+        resp = await self._get_data(f"/replication/policies/{policy_id}")
         return self.construct_model(ReplicationPolicy, resp)
 
     # DELETE /replication/policies/{id}
@@ -1466,7 +1742,7 @@ class HarborAsyncClient:
             scope=scope,
             project_id=project_id,
         )
-        resp = await self.get("/labels", params=params, limit=limit)
+        resp = await self._get_data("/labels", params=params, limit=limit)
         return self.construct_model(Label, resp, is_list=True)
 
     # PUT /labels/{label_id}
@@ -1499,7 +1775,7 @@ class HarborAsyncClient:
         Label
             The label.
         """
-        resp = await self.get(f"/labels/{label_id}")
+        resp = await self._get_data(f"/labels/{label_id}")
         return self.construct_model(Label, resp)
 
     # DELETE /labels/{label_id}
@@ -1545,7 +1821,7 @@ class HarborAsyncClient:
             Information about the created robot account.
         """
         resp = await self.post("/robots", json=robot)
-        j = handle_optional_json_response(resp)
+        j = handle_optional_json_response(resp, self.json_backend)
         if not j:
             raise HarborAPIException("Server returned an empty response.")
         robot_created = self.construct_model(RobotCreated, j)
@@ -1603,7 +1879,7 @@ class HarborAsyncClient:
             A list of registered robot accounts matching the query.
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        resp = await self.get("/robots", params=params, limit=limit)
+        resp = await self._get_data("/robots", params=params, limit=limit)
         return self.construct_model(Robot, resp, is_list=True)
 
     # GET /robots/{robot_id}
@@ -1620,7 +1896,7 @@ class HarborAsyncClient:
         Robot
             Information about the robot account.
         """
-        resp = await self.get(f"/robots/{robot_id}")
+        resp = await self._get_data(f"/robots/{robot_id}")
         return self.construct_model(Robot, resp)
 
     # PUT /robots/{robot_id}
@@ -1701,7 +1977,7 @@ class HarborAsyncClient:
         ExecHistory
             The audit log rotation job status.
         """
-        resp = await self.get(f"/system/purgeaudit/{purge_id}")
+        resp = await self._get_data(f"/system/purgeaudit/{purge_id}")
         return self.construct_model(ExecHistory, resp)
 
     @deprecated("Use `get_purge_job`", category=DeprecationWarning, stacklevel=1)
@@ -1860,7 +2136,7 @@ class HarborAsyncClient:
             A list of purge jobs jobs matching the query.
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        resp = await self.get("/system/purgeaudit", params=params, limit=limit)
+        resp = await self._get_data("/system/purgeaudit", params=params, limit=limit)
         return self.construct_model(ExecHistory, resp, is_list=True)
 
     @deprecated(
@@ -1890,7 +2166,7 @@ class HarborAsyncClient:
         ScanDataExportExecutionList
             A list of scan data export execution jobs for the current user.
         """
-        resp = await self.get("/export/cve/executions")
+        resp = await self._get_data("/export/cve/executions")
         return self.construct_model(ScanDataExportExecutionList, resp)
 
     # GET /export/cve/execution/{execution_id}
@@ -1908,7 +2184,7 @@ class HarborAsyncClient:
         ScanDataExportExecution
             The scan data export execution.
         """
-        resp = await self.get(f"/export/cve/execution/{execution_id}")
+        resp = await self._get_data(f"/export/cve/execution/{execution_id}")
         return self.construct_model(ScanDataExportExecution, resp)
 
     # POST /export/cve
@@ -1939,7 +2215,7 @@ class HarborAsyncClient:
         """
         headers = {"X-Scan-Data-Type": scan_type}
         resp = await self.post("/export/cve", headers=headers, json=criteria)
-        j = handle_optional_json_response(resp)
+        j = handle_optional_json_response(resp, self.json_backend)
         if not j:
             raise HarborAPIException("API returned empty response body.")
         return self.construct_model(ScanDataExportJob, j)
@@ -1978,7 +2254,7 @@ class HarborAsyncClient:
         Icon
             The icon.
         """
-        resp = await self.get(f"/icons/{digest}")
+        resp = await self._get_data(f"/icons/{digest}")
         return self.construct_model(Icon, resp)
 
     # CATEGORY: project
@@ -2028,7 +2304,7 @@ class HarborAsyncClient:
             The scanner registration of the specified project
         """
         headers = get_project_headers(project_name_or_id)
-        resp = await self.get(
+        resp = await self._get_data(
             f"/projects/{project_name_or_id}/scanner", headers=headers
         )
         return self.construct_model(ScannerRegistration, resp)
@@ -2080,11 +2356,40 @@ class HarborAsyncClient:
             The maximum number of results to return
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        logs = await self.get(
+        logs = await self._get_data(
             f"/projects/{project_name}/logs", params=params, limit=limit
         )
         return self.construct_model(AuditLog, logs, is_list=True)
 
+    async def aiter_project_logs(
+        self,
+        project_name: str,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[AuditLog]:
+        """Iterate over the audit logs of the specified project.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_project_logs][harborapi.client.HarborAsyncClient.get_project_logs] for a description
+        of the parameters.
+
+        Yields
+        ------
+        AuditLog
+            An audit log entry.
+        """
+        params = get_params(q=query, sort=sort, page=page, page_size=page_size)
+        async for log in self._iter_models(
+            AuditLog, f"/projects/{project_name}/logs", params=params, limit=limit
+        ):
+            yield log
+
     # HEAD /projects
     async def project_exists(self, project_name: str) -> bool:
         """Check if a project exists.
@@ -2132,6 +2437,7 @@ class HarborAsyncClient:
         page: int = 1,
         page_size: int = 10,
         limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
         **kwargs: Any,
     ) -> List[Project]:
         """Get all projects, optionally filtered by query.
@@ -2173,6 +2479,13 @@ class HarborAsyncClient:
             The number of results to return per page
         limit : Optional[int]
             The maximum number of results to return
+        fields : Optional[Sequence[str]]
+            Only include these fields of each project,
+            e.g. `["name", "project_id"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
 
         Returns
         -------
@@ -2189,8 +2502,50 @@ class HarborAsyncClient:
             page=page,
             page_size=page_size,
         )
-        projects = await self.get("/projects", params=params, limit=limit)
-        return self.construct_model(Project, projects, is_list=True)
+        projects = await self._get_data("/projects", params=params, limit=limit)
+        return self.construct_model(Project, projects, is_list=True, fields=fields)
+
+    async def aiter_projects(
+        self,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        name: Optional[str] = None,
+        public: Optional[bool] = None,
+        owner: Optional[str] = None,
+        with_detail: bool = True,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Project]:
+        """Iterate over all projects, optionally filtered by query.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_projects][harborapi.client.HarborAsyncClient.get_projects] for a description
+        of the parameters.
+
+        Yields
+        ------
+        Project
+            A project.
+        """
+        params = get_params(
+            q=query,
+            sort=sort,
+            name=name,
+            public=public,
+            owner=owner,
+            with_detail=with_detail,
+            page=page,
+            page_size=page_size,
+        )
+        async for project in self._iter_models(
+            Project, "/projects", params=params, limit=limit, fields=fields
+        ):
+            yield project
 
     # PUT /projects/{project_name_or_id}
     async def update_project(
@@ -2227,7 +2582,9 @@ class HarborAsyncClient:
             The project with the given name or ID.
         """
         headers = get_project_headers(project_name_or_id)
-        project = await self.get(f"/projects/{project_name_or_id}", headers=headers)
+        project = await self._get_data(
+            f"/projects/{project_name_or_id}", headers=headers
+        )
         return self.construct_model(Project, project)
 
     # DELETE /projects/{project_name_or_id}
@@ -2303,7 +2660,7 @@ class HarborAsyncClient:
         """
         headers = get_project_headers(project_name_or_id)
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        candidates = await self.get(
+        candidates = await self._get_data(
             f"/projects/{project_name_or_id}/scanner/candidates",
             params=params,
             headers=headers,
@@ -2330,7 +2687,7 @@ class HarborAsyncClient:
             The summary of a project.
         """
         headers = get_project_headers(project_name_or_id)
-        summary = await self.get(
+        summary = await self._get_data(
             f"/projects/{project_name_or_id}/summary", headers=headers
         )
         return self.construct_model(ProjectSummary, summary)
@@ -2356,7 +2713,7 @@ class HarborAsyncClient:
             This is an implementation detail, and might change in the future.
         """
         headers = get_project_headers(project_name_or_id)
-        deletable = await self.get(
+        deletable = await self._get_data(
             f"/projects/{project_name_or_id}/_deletable", headers=headers
         )
         return self.construct_model(ProjectDeletable, deletable)
@@ -2383,7 +2740,7 @@ class HarborAsyncClient:
             The member of the project with the given ID.
         """
         headers = get_project_headers(project_name_or_id)
-        resp = await self.get(
+        resp = await self._get_data(
             f"/projects/{project_name_or_id}/members/{member_id}", headers=headers
         )
         return self.construct_model(ProjectMemberEntity, resp)
@@ -2623,7 +2980,7 @@ class HarborAsyncClient:
         """
         headers = get_project_headers(project_name_or_id)
         params = get_params(entityname=entity_name, page=page, page_size=page_size)
-        members = await self.get(
+        members = await self._get_data(
             f"/projects/{project_name_or_id}/members",
             params=params,
             headers=headers,
@@ -2700,7 +3057,7 @@ class HarborAsyncClient:
             params["status"] = ",".join(
                 status
             )  # probably needs some sort of urlencoding?
-        resp = await self.get(
+        resp = await self._get_data(
             f"/projects/{project_name_or_id}/webhook/jobs",
             params=params,
             headers=headers,
@@ -2749,7 +3106,7 @@ class HarborAsyncClient:
     ) -> List[WebhookPolicy]:
         headers = get_project_headers(project_name_or_id)
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        policies = await self.get(
+        policies = await self._get_data(
             f"/projects/{project_name_or_id}/webhook/policies",
             headers=headers,
             params=params,
@@ -2777,7 +3134,7 @@ class HarborAsyncClient:
             The supported event types and notify types of webhooks for a project.
         """
         headers = get_project_headers(project_name_or_id)
-        events = await self.get(
+        events = await self._get_data(
             f"/projects/{project_name_or_id}/webhook/events", headers=headers
         )
         return self.construct_model(SupportedWebhookEventTypes, events)
@@ -2806,7 +3163,7 @@ class HarborAsyncClient:
             A list of the last webhook policy triggers.
         """
         headers = get_project_headers(project_name_or_id)
-        last_trigger = await self.get(
+        last_trigger = await self._get_data(
             f"/projects/{project_name_or_id}/webhook/lasttrigger",
             headers=headers,
             limit=limit,
@@ -2865,7 +3222,7 @@ class HarborAsyncClient:
             The webhook policy of a project.
         """
         headers = get_project_headers(project_name_or_id)
-        policy = await self.get(
+        policy = await self._get_data(
             f"/projects/{project_name_or_id}/webhook/policies/{webhook_policy_id}",
             headers=headers,
         )
@@ -3003,7 +3360,7 @@ class HarborAsyncClient:
             The result of the ping
         """
         resp = await self.post("/ldap/ping", json=configuration)
-        j = handle_optional_json_response(resp)
+        j = handle_optional_json_response(resp, self.json_backend)
         if not j:  # pragma: no cover # this shouldn't happen
             logger.warning(
                 "Empty response from LDAP ping (%s %s)",
@@ -3042,7 +3399,7 @@ class HarborAsyncClient:
             raise ValueError("Must specify either group_dn or group_name")
 
         params = get_params(groupname=group_name, groupdn=group_dn)
-        resp = await self.get("/ldap/groups/search", params=params, limit=limit)
+        resp = await self._get_data("/ldap/groups/search", params=params, limit=limit)
         return self.construct_model(UserGroup, resp, is_list=True)
 
     # GET /ldap/users/search
@@ -3065,7 +3422,7 @@ class HarborAsyncClient:
             The list of LDAP users that match the search.
         """
         params = get_params(username=username)
-        resp = await self.get("/ldap/users/search", params=params, limit=limit)
+        resp = await self._get_data("/ldap/users/search", params=params, limit=limit)
         return self.construct_model(LdapUser, resp, is_list=True)
 
     # POST /ldap/users/import
@@ -3131,7 +3488,7 @@ class HarborAsyncClient:
         RegistryInfo
             The info of a registry
         """
-        resp = await self.get(f"/registries/{id}/info")
+        resp = await self._get_data(f"/registries/{id}/info")
         return self.construct_model(RegistryInfo, resp)
 
     # GET /replication/adapterinfos
@@ -3143,7 +3500,7 @@ class HarborAsyncClient:
         RegistryProviders
             An overview of the registered registry providers.
         """
-        resp = await self.get("/replication/adapterinfos")
+        resp = await self._get_data("/replication/adapterinfos")
         return self.construct_model(RegistryProviders, resp)
 
     # PUT /registries/{id}
@@ -3173,7 +3530,7 @@ class HarborAsyncClient:
         Registry
             The registry
         """
-        resp = await self.get(f"/registries/{id}")
+        resp = await self._get_data(f"/registries/{id}")
         return self.construct_model(Registry, resp)
 
     # DELETE /registries/{id}
@@ -3259,7 +3616,7 @@ class HarborAsyncClient:
         params = get_params(
             q=query, sort=sort, page=page, page_size=page_size, name=name
         )
-        resp = await self.get("/registries", params=params, limit=limit)
+        resp = await self._get_data("/registries", params=params, limit=limit)
         return self.construct_model(Registry, resp, is_list=True)
 
     # CATEGORY: search
@@ -3277,7 +3634,7 @@ class HarborAsyncClient:
         Search
             The search results.
         """
-        resp = await self.get("/search", params={"q": query})
+        resp = await self._get_data("/search", params={"q": query})
         return self.construct_model(Search, resp)
 
     # CATEGORY: artifact
@@ -3385,7 +3742,7 @@ class HarborAsyncClient:
             with_signature=with_signature,
             with_immutable_status=with_immutable_status,
         )
-        resp = await self.get(
+        resp = await self._get_data(
             f"{path}/tags",
             params=params,
             limit=limit,
@@ -3450,7 +3807,7 @@ class HarborAsyncClient:
         """
         path = get_artifact_path(project_name, repository_name, reference)
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        resp = await self.get(f"{path}/accessories", params=params, limit=limit)
+        resp = await self._get_data(f"{path}/accessories", params=params, limit=limit)
         return self.construct_model(Accessory, resp, is_list=True)
 
     # DELETE /projects/{project_name}/repositories/{repository_name}/artifacts/{reference}/tags
@@ -3528,6 +3885,7 @@ class HarborAsyncClient:
         with_immutable_status: bool = False,
         with_accessory: bool = False,
         mime_type: str = "application/vnd.security.vulnerability.report; version=1.1",
+        fields: Optional[Sequence[str]] = None,
         **kwargs: Any,
     ) -> List[Artifact]:
         """Get the artifacts in a repository.
@@ -3585,6 +3943,13 @@ class HarborAsyncClient:
 
                 * application/vnd.scanner.adapter.vuln.report.harbor+json; version=1.0
                 * application/vnd.security.vulnerability.report; version=1.1
+        fields : Optional[Sequence[str]]
+            Only include these fields of each artifact,
+            e.g. `["digest", "tags.name"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
 
         Returns
         -------
@@ -3604,13 +3969,68 @@ class HarborAsyncClient:
             with_immutable_status=with_immutable_status,
             with_accessory=with_accessory,
         )
-        resp = await self.get(
+        resp = await self._get_data(
             path,
             params=params,
             headers={"X-Accept-Vulnerabilities": mime_type},
             limit=limit,
         )
-        return self.construct_model(Artifact, resp, is_list=True)
+        return self.construct_model(Artifact, resp, is_list=True, fields=fields)
+
+    async def aiter_artifacts(
+        self,
+        project_name: str,
+        repository_name: str,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+        with_tag: bool = True,
+        with_label: bool = False,
+        with_scan_overview: bool = False,
+        with_signature: bool = False,
+        with_immutable_status: bool = False,
+        with_accessory: bool = False,
+        mime_type: str = "application/vnd.security.vulnerability.report; version=1.1",
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Artifact]:
+        """Iterate over the artifacts in a repository.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_artifacts][harborapi.client.HarborAsyncClient.get_artifacts] for a description
+        of the parameters.
+
+        Yields
+        ------
+        Artifact
+            An artifact in the repository matching the query.
+        """
+        path = f"{get_repo_path(project_name, repository_name)}/artifacts"
+        params = get_params(
+            q=query,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            with_tag=with_tag,
+            with_label=with_label,
+            with_scan_overview=with_scan_overview,
+            with_signature=with_signature,
+            with_immutable_status=with_immutable_status,
+            with_accessory=with_accessory,
+        )
+        async for artifact in self._iter_models(
+            Artifact,
+            path,
+            params=params,
+            headers={"X-Accept-Vulnerabilities": mime_type},
+            limit=limit,
+            fields=fields,
+        ):
+            yield artifact
 
     # POST /projects/{project_name}/repositories/{repository_name}/artifacts/{reference}/labels
     async def add_artifact_label(
@@ -3655,6 +4075,7 @@ class HarborAsyncClient:
         with_immutable_status: bool = False,
         with_accessory: bool = False,
         mime_type: str = "application/vnd.security.vulnerability.report; version=1.1",
+        fields: Optional[Sequence[str]] = None,
     ) -> Artifact:
         """Get an artifact.
 
@@ -3690,6 +4111,13 @@ class HarborAsyncClient:
 
                 * application/vnd.scanner.adapter.vuln.report.harbor+json; version=1.0
                 * application/vnd.security.vulnerability.report; version=1.1
+        fields : Optional[Sequence[str]]
+            Only include these fields of the artifact,
+            e.g. `["digest", "tags.name"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
 
         Returns
         -------
@@ -3697,7 +4125,7 @@ class HarborAsyncClient:
             An artifact.
         """
         path = get_artifact_path(project_name, repository_name, reference)
-        resp = await self.get(
+        resp = await self._get_data(
             f"{path}",
             params={
                 "page": page,
@@ -3711,7 +4139,7 @@ class HarborAsyncClient:
             },
             headers={"X-Accept-Vulnerabilities": mime_type},
         )
-        return self.construct_model(Artifact, resp)
+        return self.construct_model(Artifact, resp, fields=fields)
 
     async def delete_artifact(
         self,
@@ -3771,6 +4199,8 @@ class HarborAsyncClient:
         repository_name: str,
         reference: str,  # Make this default to "latest"?
         mime_type: str = "application/vnd.security.vulnerability.report; version=1.1",
+        fields: Optional[Sequence[str]] = None,
+        report_id: Optional[str] = None,
     ) -> HarborVulnerabilityReport:
         """Get the vulnerabilities for an artifact.
 
@@ -3788,12 +4218,35 @@ class HarborAsyncClient:
             The reference of the artifact, can be digest or tag
         mime_type : str
             A comma-separated lists of MIME types for the scan report or scan summary.
+        fields : Optional[Sequence[str]]
+            Only include these fields of the report,
+            e.g. `["vulnerabilities.id", "vulnerabilities.severity"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
+        report_id : Optional[str]
+            The ID of the report, found in the scan overview of the artifact
+            (`Artifact.scan.report_id`). If specified and the client has a
+            `report_cache`, the report is looked up in the cache before it is
+            requested, and stored in the cache after.
+            `reference` should then be the digest of the artifact.
 
         Returns
         -------
         HarborVulnerabilityReport
             The vulnerabilities for the artifact, or None if the artifact is not found
         """
+        report_cache = self.report_cache
+        if report_cache is not None and report_id:
+            if report_cache.json_backend is None:
+                report_cache.json_backend = self.json_backend
+            cached = await report_cache.aget(reference, mime_type, report_id)
+            if cached is not None:
+                return self.construct_model(
+                    HarborVulnerabilityReport, cached, fields=fields
+                )
+
         path = get_artifact_path(project_name, repository_name, reference)
         url = f"{path}/additions/vulnerabilities"
         resp = await self.get(url, headers={"X-Accept-Vulnerabilities": mime_type})
@@ -3810,7 +4263,9 @@ class HarborAsyncClient:
         if not report:
             raise NotFound(f"Unable to find report for {mime_type} from {url}")
 
-        return self.construct_model(HarborVulnerabilityReport, report)
+        if report_cache is not None and report_id:
+            await report_cache.aset(reference, mime_type, report_id, report)
+        return self.construct_model(HarborVulnerabilityReport, report, fields=fields)
 
     async def get_artifact_vulnerability_reports(
         self,
@@ -3818,6 +4273,7 @@ class HarborAsyncClient:
         repository_name: str,
         reference: str,
         mime_type: Union[str, Sequence[str]] = DEFAULT_MIME_TYPES,
+        fields: Optional[Sequence[str]] = None,
     ) -> FirstDict[str, HarborVulnerabilityReport]:
         """Get the vulnerability report(s) for an artifact.
 
@@ -3831,6 +4287,13 @@ class HarborAsyncClient:
             The reference of the artifact, can be digest or tag
         mime_type : Union[str, Sequence[str]]
             MIME type or list of MIME types for the scan report or scan summary.
+        fields : Optional[Sequence[str]]
+            Only include these fields of the report,
+            e.g. `["vulnerabilities.id", "vulnerabilities.severity"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
 
         Returns
         -------
@@ -3857,7 +4320,9 @@ class HarborAsyncClient:
         for mt in mime_type:
             report = resp.get(mt)
             if report:
-                reports[mt] = self.construct_model(HarborVulnerabilityReport, report)
+                reports[mt] = self.construct_model(
+                    HarborVulnerabilityReport, report, fields=fields
+                )
         return reports
 
     # GET /projects/{project_name}/repositories/{repository_name}/artifacts/{reference}/additions/build_history
@@ -3888,7 +4353,7 @@ class HarborAsyncClient:
         """
         path = get_artifact_path(project_name, repository_name, reference)
         url = f"{path}/additions/build_history"
-        resp = await self.get(url, limit=limit)
+        resp = await self._get_data(url, limit=limit)
         return self.construct_model(BuildHistoryEntry, resp, is_list=True)
 
     # NYI:
@@ -3939,7 +4404,7 @@ class HarborAsyncClient:
             page_size=page_size,
         )
         headers = get_project_headers(project_name_or_id)
-        projects = await self.get(
+        projects = await self._get_data(
             f"/projects/{project_name_or_id}/immutabletagrules",
             params=params,
             limit=limit,
@@ -4109,7 +4574,7 @@ class HarborAsyncClient:
         RetentionPolicy
             The retention policy.
         """
-        resp = await self.get(f"/retentions/{retention_id}")
+        resp = await self._get_data(f"/retentions/{retention_id}")
         return self.construct_model(RetentionPolicy, resp)
 
     # POST /retentions
@@ -4207,7 +4672,7 @@ class HarborAsyncClient:
         List[RetentionExecutionTask]
             The retention tasks.
         """
-        resp = await self.get(
+        resp = await self._get_data(
             f"/retentions/{retention_id}/executions/{execution_id}/tasks",
             params={"page": page, "page_size": page_size},
             limit=limit,
@@ -4224,7 +4689,7 @@ class HarborAsyncClient:
         RetentionMetadata
             The retention metadata.
         """
-        resp = await self.get("/retentions/metadatas")
+        resp = await self._get_data("/retentions/metadatas")
         return self.construct_model(RetentionMetadata, resp)
 
     # GET /retentions/{id}/executions/{eid}/tasks/{tid}
@@ -4280,7 +4745,7 @@ class HarborAsyncClient:
             The retention executions for the policy.
         """
         params = get_params(page=page, page_size=page_size)
-        resp = await self.get(
+        resp = await self._get_data(
             f"/retentions/{retention_id}/executions", params=params, limit=limit
         )
         return self.construct_model(RetentionExecution, resp, is_list=True)
@@ -4404,7 +4869,7 @@ class HarborAsyncClient:
             _description_
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        scanners = await self.get("/scanners", params=params, limit=limit)
+        scanners = await self._get_data("/scanners", params=params, limit=limit)
         return self.construct_model(ScannerRegistration, scanners, is_list=True)
 
     # PUT /scanners/{registration_id}
@@ -4438,7 +4903,7 @@ class HarborAsyncClient:
         ScannerRegistration
             The scanner.
         """
-        scanner = await self.get(f"/scanners/{registration_id}")
+        scanner = await self._get_data(f"/scanners/{registration_id}")
         return self.construct_model(ScannerRegistration, scanner)
 
     # DELETE /scanners/{registration_id}
@@ -4520,7 +4985,7 @@ class HarborAsyncClient:
         ScannerAdapterMetadata
             The metadata of the scanner adapter.
         """
-        scanner = await self.get(f"/scanners/{registration_id}/metadata")
+        scanner = await self._get_data(f"/scanners/{registration_id}/metadata")
         return self.construct_model(ScannerAdapterMetadata, scanner)
 
     # CATEGORY: systeminfo
@@ -4534,7 +4999,7 @@ class HarborAsyncClient:
         SystemInfo
             Information about the system's volumes.
         """
-        resp = await self.get("/systeminfo/volumes")
+        resp = await self._get_data("/systeminfo/volumes")
         return self.construct_model(SystemInfo, resp)
 
     # GET /systeminfo/getcert
@@ -4559,7 +5024,7 @@ class HarborAsyncClient:
         GeneralInfo
             The general info about the system
         """
-        resp = await self.get("/systeminfo")
+        resp = await self._get_data("/systeminfo")
         return self.construct_model(GeneralInfo, resp)
 
     # CATEGORY: statistic
@@ -4571,7 +5036,7 @@ class HarborAsyncClient:
         Statistic
             The statistics on the Harbor server
         """
-        stats = await self.get("/statistics")
+        stats = await self._get_data("/statistics")
         return self.construct_model(Statistic, stats)
 
     # CATEGORY: quota
@@ -4625,7 +5090,7 @@ class HarborAsyncClient:
             page=page,
             page_size=page_size,
         )
-        quotas = await self.get("/quotas", params=params, limit=limit)
+        quotas = await self._get_data("/quotas", params=params, limit=limit)
         return self.construct_model(Quota, quotas, is_list=True)
 
     async def update_quota(self, id: int, quota: QuotaUpdateReq) -> None:
@@ -4662,7 +5127,7 @@ class HarborAsyncClient:
         Quota
             The quota
         """
-        quota = await self.get(f"/quotas/{id}")
+        quota = await self._get_data(f"/quotas/{id}")
         return self.construct_model(Quota, quota)
 
     # CATEGORY: repository
@@ -4688,7 +5153,7 @@ class HarborAsyncClient:
             The repository.
         """
         path = get_repo_path(project_name, repository_name)
-        resp = await self.get(path)
+        resp = await self._get_data(path)
         return self.construct_model(Repository, resp)
 
     # PUT /projects/{project_name}/repositories/{repository_name}
@@ -4747,6 +5212,7 @@ class HarborAsyncClient:
         page: int = 1,
         page_size: int = 10,
         limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
         **kwargs: Any,
     ) -> List[Repository]:
         """Get a list of all repositories, optionally only in a specific project.
@@ -4784,6 +5250,13 @@ class HarborAsyncClient:
             The number of results to return per page
         limit : Optional[int]
             The maximum number of results to return.
+        fields : Optional[Sequence[str]]
+            Only include these fields of each repository,
+            e.g. `["name", "artifact_count"]`.
+            Other fields are dropped from the response before the models
+            are constructed, and are left at their defaults.
+            Fields of nested models are specified with dotted names.
+            If `None`, all fields are included.
 
         Returns
         -------
@@ -4795,8 +5268,42 @@ class HarborAsyncClient:
             url = f"/projects/{project_name}/repositories"
         else:
             url = "/repositories"
-        resp = await self.get(url, params=params, limit=limit)
-        return self.construct_model(Repository, resp, is_list=True)
+        resp = await self._get_data(url, params=params, limit=limit)
+        return self.construct_model(Repository, resp, is_list=True, fields=fields)
+
+    async def aiter_repositories(
+        self,
+        project_name: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Repository]:
+        """Iterate over all repositories, optionally only in a specific project.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_repositories][harborapi.client.HarborAsyncClient.get_repositories] for a description
+        of the parameters.
+
+        Yields
+        ------
+        Repository
+            A repository matching the query.
+        """
+        params = get_params(q=query, sort=sort, page=page, page_size=page_size)
+        if project_name:
+            url = f"/projects/{project_name}/repositories"
+        else:
+            url = "/repositories"
+        async for repository in self._iter_models(
+            Repository, url, params=params, limit=limit, fields=fields
+        ):
+            yield repository
 
     # CATEGORY: ping
     # GET /ping
@@ -4845,7 +5352,7 @@ class HarborAsyncClient:
         CVEAllowlist
             The current CVE allowlist.
         """
-        resp = await self.get("/system/CVEAllowlist")
+        resp = await self._get_data("/system/CVEAllowlist")
         return self.construct_model(CVEAllowlist, resp)
 
     # CATEGORY: health
@@ -4858,7 +5365,7 @@ class HarborAsyncClient:
         OverallHealthStatus
             The health status of the Harbor server.
         """
-        resp = await self.get("/health")
+        resp = await self._get_data("/health")
         return self.construct_model(OverallHealthStatus, resp)
 
     # CATEGORY: robotv1
@@ -4898,7 +5405,7 @@ class HarborAsyncClient:
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
         headers = get_project_headers(project_name_or_id)
-        robots = await self.get(
+        robots = await self._get_data(
             f"/projects/{project_name_or_id}/robots",
             params=params,
             limit=limit,
@@ -4932,7 +5439,7 @@ class HarborAsyncClient:
         resp = await self.post(
             f"/projects/{project_name_or_id}/robots", json=robot, headers=headers
         )
-        j = handle_optional_json_response(resp)
+        j = handle_optional_json_response(resp, self.json_backend)
         if not j:
             raise HarborAPIException("Server returned an empty response.")
         return self.construct_model(RobotCreated, j)
@@ -4958,7 +5465,7 @@ class HarborAsyncClient:
             The robot v1 account.
         """
         headers = get_project_headers(project_name_or_id)
-        robot = await self.get(
+        robot = await self._get_data(
             f"/projects/{project_name_or_id}/robots/{robot_id}", headers=headers
         )
         return self.construct_model(Robot, robot)
@@ -5054,7 +5561,7 @@ class HarborAsyncClient:
             The metadata of the project.
         """
         headers = get_project_headers(project_name_or_id)
-        resp = await self.get(
+        resp = await self._get_data(
             f"/projects/{project_name_or_id}/metadatas", headers=headers
         )
         return self.construct_model(ProjectMetadata, resp)
@@ -5208,9 +5715,37 @@ class HarborAsyncClient:
             The list of audit logs.
         """
         params = get_params(q=query, sort=sort, page=page, page_size=page_size)
-        resp = await self.get("/audit-logs", params=params, limit=limit)
+        resp = await self._get_data("/audit-logs", params=params, limit=limit)
         return self.construct_model(AuditLog, resp, is_list=True)
 
+    async def aiter_audit_logs(
+        self,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[AuditLog]:
+        """Iterate over the audit logs for the projects the user is a member of.
+
+        Pages are fetched on demand, and the next page is fetched in the
+        background while the current one is consumed. Models are validated
+        one page at a time.
+
+        See [get_audit_logs][harborapi.client.HarborAsyncClient.get_audit_logs] for a description
+        of the parameters.
+
+        Yields
+        ------
+        AuditLog
+            An audit log entry.
+        """
+        params = get_params(q=query, sort=sort, page=page, page_size=page_size)
+        async for log in self._iter_models(
+            AuditLog, "/audit-logs", params=params, limit=limit
+        ):
+            yield log
+
     # CATEGORY: permissions
     # GET /permissions
     async def get_permissions(self) -> Permissions:
@@ -5225,7 +5760,7 @@ class HarborAsyncClient:
         Permissions
             The system and project level permissions.
         """
-        resp = await self.get("/permissions")
+        resp = await self._get_data("/permissions")
         return self.construct_model(Permissions, resp)
 
     def _get_headers(self, headers: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
@@ -5237,7 +5772,32 @@ class HarborAsyncClient:
         base_headers.update(headers)  # Override defaults with provided headers
         return base_headers
 
-    @retry()
+    def _encode_json(
+        self,
+        json: Optional[Union[BaseModel, JSONType]],
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Encode a JSON request body with the client's JSON backend.
+
+        Models are serialized directly to JSON by Pydantic, without
+        first converting them to dicts.
+
+        Returns
+        -------
+        Tuple[Optional[bytes], Dict[str, str]]
+            The encoded body (if any) and the request headers.
+        """
+        headers = self._get_headers(headers)
+        if json is None:
+            return None, headers
+        if isinstance(json, BaseModel):
+            content = self.json_backend.dump_model(json)
+        else:
+            content = self.json_backend.dumps(json)
+        headers.setdefault("Content-Type", "application/json")
+        return content, headers
+
+    @retry(safe=True)
     async def get(
         self,
         path: str,
@@ -5245,6 +5805,7 @@ class HarborAsyncClient:
         headers: Optional[Dict[str, Any]] = None,
         follow_links: bool = True,
         limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
         **kwargs: Any,
     ) -> JSONType:
         """Send a GET request to the Harbor API.
@@ -5262,6 +5823,9 @@ class HarborAsyncClient:
         limit : Optional[int]
             The maximum number of results to return.
             None and n<=0 are treated as no limit.
+        page_concurrency : Optional[int]
+            Maximum number of pages to fetch concurrently.
+            Overrides the client's `page_concurrency` setting for this request.
         kwargs : Any
             Additional keyword arguments that might be added in the future.
 
@@ -5270,44 +5834,326 @@ class HarborAsyncClient:
         JSONType
             The JSON response from the API.
         """
+        return await self._get_coalesced(
+            path, params, headers, follow_links, limit, page_concurrency, **kwargs
+        )
+
+    @retry(safe=True)
+    async def _get_data(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        follow_links: bool = True,
+        limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Union[JSONType, bytes]:
+        """Like `get`, but a JSON response that fits in a single page is
+        returned undecoded, so that `construct_model` can validate it
+        directly from bytes. Used by methods that return models."""
+        return await self._get_coalesced(
+            path,
+            params,
+            headers,
+            follow_links,
+            limit,
+            page_concurrency,
+            decode=False,
+            **kwargs,
+        )
+
+    async def _get_coalesced(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        follow_links: bool = True,
+        limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        decode: bool = True,
+        **kwargs: Any,
+    ) -> JSONType:
+        """Fetch a resource, coalescing identical requests if enabled."""
+        if not self.coalesce_requests:
+            return await self._get_all(
+                path,
+                params,
+                headers,
+                follow_links,
+                limit,
+                page_concurrency,
+                decode=decode,
+                **kwargs,
+            )
+
+        # Identical requests in flight share a single response
+        key = (
+            str(httpx.URL(f"{self.url}{path}").copy_merge_params(params or {})),
+            tuple(sorted(self._get_headers(headers).items())),
+            follow_links,
+            limit,
+            page_concurrency,
+            decode,
+            tuple(sorted(kwargs.items())),
+        )
+        return await self.singleflight.do(
+            key,
+            lambda: self._get_all(
+                path,
+                params,
+                headers,
+                follow_links,
+                limit,
+                page_concurrency,
+                decode=decode,
+                **kwargs,
+            ),
+        )
+
+    async def _get_all(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        follow_links: bool = True,
+        limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        decode: bool = True,
+        **kwargs: Any,
+    ) -> JSONType:
+        """Fetch a resource and all its pages. See `HarborAsyncClient.get`.
+
+        If `decode` is False, a single page JSON response is returned as bytes.
+        """
         limit = limit if limit and limit > 0 else 0
-        next_url = path  # type: str | None
-        paginating = False
+        if page_concurrency is None:
+            page_concurrency = self.page_concurrency
+
+        res, next_url, total_count = await self._get_page(
+            path,
+            params=params,
+            headers=headers,
+            follow_links=follow_links,
+            decode=decode,
+            **kwargs,
+        )
+        # No next URL - return the result directly
+        if not next_url:
+            return res
+        if isinstance(res, bytes):
+            res = self._decode_json(res)
+
+        # Expect list results from here on out
         results = []  # type: List[JSONType]
-        while next_url:
-            res, next_url = await self._get(
+        self._add_page_results(results, res, path)
+
+        # Fetch the remaining pages concurrently if we know how many there are
+        if (
+            page_concurrency
+            and page_concurrency > 1
+            and total_count is not None
+            and not (limit and len(results) >= limit)
+        ):
+            page_urls = get_page_urls(
                 next_url,
+                total_count,
+                limit=limit - len(results) if limit else 0,
+            )
+            if page_urls:
+                pages = await self._get_pages(
+                    page_urls, headers=headers, concurrency=page_concurrency
+                )
+                for page_url, page in zip(page_urls, pages):
+                    self._add_page_results(results, page, page_url)
+                return results[:limit] if limit else results
+
+        while next_url:
+            if limit and len(results) >= limit:
+                break
+            url = next_url
+            res, next_url, _ = await self._get_page(
+                url,
                 # When paginating, params are in next link
-                params=None if paginating else params,
+                params=None,
                 headers=headers,
                 follow_links=follow_links,
                 **kwargs,
             )
+            self._add_page_results(results, res, url)
 
-            # No next URL - return the result directly
-            if not next_url and not paginating:
-                return res
+        return results[:limit] if limit else results
+
+    async def get_iter(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the results of a paginated GET request to the Harbor API.
+
+        Unlike [get][harborapi.client.HarborAsyncClient.get], results are
+        yielded page by page as they arrive, instead of being collected
+        into a single list. The next page is fetched in the background
+        while the results of the current page are consumed.
+
+        Each page request is retried according to the client's retry settings.
+
+        Parameters
+        ----------
+        path : str
+            The path to send the request to.
+        params : Optional[Dict[str, Any]]
+            The query parameters to send with the request.
+        headers : Optional[Dict[str, Any]]
+            The headers to send with the request.
+        limit : Optional[int]
+            The maximum number of results to return.
+            None and n<=0 are treated as no limit.
+        kwargs : Any
+            Additional keyword arguments that might be added in the future.
+
+        Yields
+        ------
+        Any
+            The JSON value of each result.
+        """
+        async for page in self._iter_pages(
+            path, params=params, headers=headers, limit=limit, **kwargs
+        ):
+            for result in page:
+                yield result
 
-            # Expect list results from here on out
-            paginating = True
-            if not isinstance(res, list):
-                logger.error(
-                    "Unable to handle paginated results: Expected a list from 'GET %s', but got %s",
-                    next_url,
-                    type(res),
+    async def _iter_models(
+        self,
+        cls: Type[T],
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[T]:
+        """Iterate over the results of a paginated GET request as models.
+        Results are validated one page at a time.
+
+        See [get_iter][harborapi.client.HarborAsyncClient.get_iter].
+        """
+        async for page in self._iter_pages(
+            path, params=params, headers=headers, limit=limit
+        ):
+            models = self.construct_model(cls, page, is_list=True, fields=fields)
+            for model in models:
+                yield model
+
+    async def _iter_pages(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[Any]]:
+        """Iterate over the pages of a paginated GET request,
+        fetching the next page while the current one is consumed."""
+        limit = limit if limit and limit > 0 else 0
+        n_results = 0
+        page_task = asyncio.ensure_future(
+            self._get_next_page(path, params=params, headers=headers, **kwargs)
+        )  # type: Optional[asyncio.Future[Tuple[JSONType, Optional[str], Optional[int]]]]
+        try:
+            while page_task is not None:
+                res, next_url, _ = await page_task
+                page_task = None
+                last_page = (
+                    limit and isinstance(res, list) and n_results + len(res) >= limit
                 )
-                # OPINION: do best-effort to return results instead of raising an exception (bad?)
-                continue
-            results.extend(res)
+                if next_url and not last_page:
+                    # Read-ahead: fetch the next page while this one is consumed
+                    page_task = asyncio.ensure_future(
+                        self._get_next_page(next_url, headers=headers, **kwargs)
+                    )
+
+                page = []  # type: List[Any]
+                self._add_page_results(page, res, path)
+                if limit:
+                    page = page[: limit - n_results]
+                n_results += len(page)
+                if page:
+                    yield page
+        finally:
+            # Consumer stopped iterating before the last page
+            if page_task is not None:
+                page_task.cancel()
 
-            if limit:
-                if len(results) > limit:
-                    results = results[:limit]
-                    break
+    @retry(safe=True)
+    async def _get_next_page(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[JSONType, Optional[str], Optional[int]]:
+        """Retrying version of `_get_page` used when iterating over pages."""
+        return await self._get_page(path, params=params, headers=headers, **kwargs)
 
-        return results
+    def _add_page_results(
+        self, results: List[JSONType], page: JSONType, url: str
+    ) -> None:
+        """Add the results of a page to a list of paginated results."""
+        if not isinstance(page, list):
+            logger.error(
+                "Unable to handle paginated results: Expected a list from 'GET %s', but got %s",
+                url,
+                type(page),
+            )
+            # OPINION: do best-effort to return results instead of raising an exception (bad?)
+            return
+        results.extend(page)
 
-    @retry()
+    async def _get_pages(
+        self,
+        urls: Sequence[str],
+        headers: Optional[Dict[str, Any]] = None,
+        concurrency: int = 1,
+    ) -> List[JSONType]:
+        """Fetch multiple pages concurrently and return their results
+        in the same order as the given URLs.
+
+        Parameters
+        ----------
+        urls : Sequence[str]
+            The URLs of the pages to fetch.
+        headers : Optional[dict]
+            Request headers
+        concurrency : int
+            Maximum number of pages to fetch concurrently.
+
+        Returns
+        -------
+        List[JSONType]
+            The JSON data of each page.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _get_page(url: str) -> JSONType:
+            async with sem:
+                res, _, _ = await self._get_page(
+                    url, headers=headers, follow_links=False
+                )
+                return res
+
+        tasks = [asyncio.ensure_future(_get_page(url)) for url in urls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Don't leave the remaining requests running in the background
+            for task in tasks:
+                task.cancel()
+            raise
+
+    @retry(safe=True)
     async def get_text(
         self,
         path: str,
@@ -5322,7 +6168,7 @@ class HarborAsyncClient:
         # OPINION: assume text is never paginated
         return str(resp)
 
-    @retry()
+    @retry(safe=True)
     async def get_file(
         self,
         path: str,
@@ -5379,9 +6225,13 @@ class HarborAsyncClient:
             "Accept": "*/*",
             "Accept-encoding": "gzip, deflate, br",
         }
-        resp = await self.client.get(
-            self.url + path, params=params, headers=self._get_headers(headers), **kwargs
-        )
+        async with self._limit_request():
+            resp = await self.client.get(
+                self.url + path,
+                params=params,
+                headers=self._get_headers(headers),
+                **kwargs,
+            )
         return FileResponse(resp)
 
     # TODO: refactor this method so it looks like the other methods, while still supporting pagination.
@@ -5412,24 +6262,95 @@ class HarborAsyncClient:
         Tuple[JSONType, Optional[str]]
             JSON data returned by the API, and the next URL if pagination is enabled.
         """
-        url = f"{self.url}{path}"
-        resp = await self.client.get(
-            url,
-            params=params,
-            headers=self._get_headers(headers),
+        j, next_url, _ = await self._get_page(
+            path, params=params, headers=headers, follow_links=follow_links, **kwargs
         )
-        self.log_response(resp)
-        check_response_status(resp)
-        j = handle_optional_json_response(resp)
+        return j, next_url
+
+    async def _get_page(
+        self,
+        path: str,
+        params: Optional[QueryParamMapping] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        follow_links: bool = True,
+        decode: bool = True,
+        **kwargs: Any,
+    ) -> Tuple[JSONType, Optional[str], Optional[int]]:
+        """Sends a GET request to the Harbor API and returns a single page of results.
+
+        Parameters
+        ----------
+        path : str
+            URL path to resource
+        params : Optional[dict]
+            Request parameters
+        headers : Optional[dict]
+            Request headers
+        follow_links : bool
+            Enable pagination by following links in response header
+        decode : bool
+            Decode the JSON response. If False, the JSON response is
+            returned as bytes.
+
+        Returns
+        -------
+        Tuple[JSONType, Optional[str], Optional[int]]
+            JSON data returned by the API, the next URL if pagination is enabled,
+            and the total number of results if the API reports it.
+        """
+        url = f"{self.url}{path}"
+        headers = self._get_headers(headers)
+
+        cache = self.cache
+        cache_key = ""
+        entry: Optional[CacheEntry] = None
+        if cache is not None:
+            cache_key = cache.make_key(url, params, headers)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                headers.update(entry.validators)
+
+        async with self._limit_request():
+            resp = await self.client.get(
+                url,
+                params=params,
+                headers=headers,
+            )
+            self.log_response(resp)
+            if cache is not None and entry is not None and resp.status_code == 304:
+                cache.hits += 1
+                next_url = entry.next_url if follow_links else None
+                # The cached body is decoded anew for each call, so callers
+                # can't modify the cached response
+                data: Any = entry.data
+                if decode:
+                    data = self._decode_json(data)
+                return data, next_url, entry.total_count
+
+            check_response_status(resp)
+        j: Any  # bytes if not decoding
+        if decode:
+            j = handle_optional_json_response(resp, self.json_backend)
+        elif is_json(resp) and resp.status_code != 204:
+            j = resp.content
+        else:
+            j = None
         if j is None:
-            return resp.text, None  # type: ignore # FIXME: resolve this ASAP (use overload?)
+            return resp.text, None, None  # type: ignore # FIXME: resolve this ASAP (use overload?)
 
         # If we have "Link" in headers, we need to parse the next page link
-        if follow_links and (link := resp.headers.get("link")):
+        next_url = None
+        if link := resp.headers.get("link"):
+            next_url = parse_pagination_url(link)
+        total_count = get_total_count(resp)
+        if cache is not None:
+            cache.update(cache_key, resp, next_url, total_count)
+
+        if follow_links and next_url:
             logger.debug("Handling paginated results. Header value: %s", link)
-            return j, parse_pagination_url(link)
+            return j, next_url, total_count
 
-        return j, None
+        return j, None, total_count
 
     # NOTE: POST is not idempotent, should we still retry?
     @retry()
@@ -5455,16 +6376,16 @@ class HarborAsyncClient:
         params: Optional[QueryParamMapping] = None,
         headers: Optional[Dict[str, Any]] = None,
     ) -> Response:
-        if isinstance(json, BaseModel):
-            json = model_to_dict(json)
-        resp = await self.client.post(
-            self.url + path,
-            json=json,
-            params=params,
-            headers=self._get_headers(headers),
-        )
-        self.log_response(resp)
-        check_response_status(resp)
+        content, headers = self._encode_json(json, headers)
+        async with self._limit_request():
+            resp = await self.client.post(
+                self.url + path,
+                content=content,
+                params=params,
+                headers=headers,
+            )
+            self.log_response(resp)
+            check_response_status(resp)
         return resp
 
     @retry()
@@ -5483,7 +6404,7 @@ class HarborAsyncClient:
             headers=headers,
             **kwargs,
         )
-        return handle_optional_json_response(resp)
+        return handle_optional_json_response(resp, self.json_backend)
 
     async def _put(
         self,
@@ -5493,17 +6414,17 @@ class HarborAsyncClient:
         headers: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Response:
-        if isinstance(json, BaseModel):
-            json = model_to_dict(json)
-        resp = await self.client.put(
-            self.url + path,
-            json=json,
-            params=params,
-            headers=self._get_headers(headers),
-            **kwargs,
-        )
-        self.log_response(resp)
-        check_response_status(resp)
+        content, headers = self._encode_json(json, headers)
+        async with self._limit_request():
+            resp = await self.client.put(
+                self.url + path,
+                content=content,
+                params=params,
+                headers=headers,
+                **kwargs,
+            )
+            self.log_response(resp)
+            check_response_status(resp)
         return resp
 
     @retry()
@@ -5522,7 +6443,7 @@ class HarborAsyncClient:
             params=params,
             **kwargs,
         )
-        return handle_optional_json_response(resp)
+        return handle_optional_json_response(resp, self.json_backend)
 
     async def _patch(
         self,
@@ -5532,18 +6453,17 @@ class HarborAsyncClient:
         headers: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Response:
-        if isinstance(json, BaseModel):
-            json = model_to_dict(json)
-
-        resp = await self.client.patch(
-            self.url + path,
-            json=json,
-            params=params,
-            headers=self._get_headers(headers),
-            **kwargs,
-        )
-        self.log_response(resp)
-        check_response_status(resp)
+        content, headers = self._encode_json(json, headers)
+        async with self._limit_request():
+            resp = await self.client.patch(
+                self.url + path,
+                content=content,
+                params=params,
+                headers=headers,
+                **kwargs,
+            )
+            self.log_response(resp)
+            check_response_status(resp)
         return resp
 
     @retry()
@@ -5562,7 +6482,7 @@ class HarborAsyncClient:
             missing_ok=missing_ok,
             **kwargs,
         )
-        return handle_optional_json_response(resp)
+        return handle_optional_json_response(resp, self.json_backend)
 
     async def _delete(
         self,
@@ -5572,17 +6492,18 @@ class HarborAsyncClient:
         missing_ok: Optional[bool] = None,
         **kwargs: Any,
     ) -> Response:
-        resp = await self.client.delete(
-            self.url + path,
-            params=params,
-            headers=self._get_headers(headers),
-            **kwargs,
-        )
-        check_response_status(resp, missing_ok=missing_ok)
-        self.log_response(resp)
+        async with self._limit_request():
+            resp = await self.client.delete(
+                self.url + path,
+                params=params,
+                headers=self._get_headers(headers),
+                **kwargs,
+            )
+            check_response_status(resp, missing_ok=missing_ok)
+            self.log_response(resp)
         return resp
 
-    @retry()
+    @retry(safe=True)
     async def head(
         self,
         path: str,
@@ -5608,14 +6529,15 @@ class HarborAsyncClient:
         missing_ok: Optional[bool] = None,
         **kwargs: Any,
     ) -> Response:
-        resp = await self.client.head(
-            self.url + path,
-            params=params,
-            headers=self._get_headers(headers),
-            **kwargs,
-        )
-        check_response_status(resp, missing_ok=missing_ok)
-        self.log_response(resp)
+        async with self._limit_request():
+            resp = await self.client.head(
+                self.url + path,
+                params=params,
+                headers=self._get_headers(headers),
+                **kwargs,
+            )
+            check_response_status(resp, missing_ok=missing_ok)
+            self.log_response(resp)
         return resp
 
     # TODO: add on_giveup callback for all backoff methods
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+from httpx import TimeoutException
+
+from .exceptions import StatusError
+from .log import logger
+
+T = TypeVar("T")
+
+OVERLOAD_STATUS_CODES = (429, 503)
+"""Status codes indicating that the server is overloaded."""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single call.
+
+    While a call for a key is in flight, subsequent calls with the same key
+    wait for the result of the first call instead of making their own.
+    Once the call finishes, the next call with the key is made anew.
+
+    Cancelling one of the callers does not cancel the shared call for
+    the remaining callers.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        """Number of calls made."""
+        self.coalesced = 0
+        """Number of calls that shared the result of an in-flight call."""
+        self._inflight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Call `func` unless a call with the same key is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying identical calls.
+        func : Callable[[], Awaitable[T]]
+            Function returning the awaitable to run.
+
+        Returns
+        -------
+        T
+            The result of the call.
+            Exceptions raised by the call are raised in every caller.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(func())
+        self._inflight[key] = future
+
+        def _done(fut: asyncio.Future[Any]) -> None:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+            # Mark the exception as retrieved in case every caller was cancelled
+            if not fut.cancelled():
+                fut.exception()
+
+        future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._inflight)
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter that adapts its limit to the server's capacity.
+
+    The limit is adjusted with AIMD (additive increase, multiplicative decrease):
+    while requests succeed and latency is stable, the limit grows by roughly 1
+    for every `limit` successful requests. When the server signals that it is
+    overloaded, the limit is multiplied by `backoff_factor`. Overload is
+    signalled by:
+
+    - A `429 Too Many Requests` or `503 Service Unavailable` response.
+    - A request timing out.
+    - The 95th percentile latency of the last `window` requests rising above
+      `latency_tolerance` times the lowest 95th percentile latency observed.
+
+    Optionally, the rate of requests can be capped with a token bucket
+    by specifying `rate`.
+
+    Examples
+    --------
+    ```py
+    limiter = AdaptiveLimiter(initial_limit=5, max_limit=50, rate=100)
+    async with limiter.acquire():
+        await client.get_project("library")
+    ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Parameters
+        ----------
+        initial_limit : int
+            The initial number of concurrent requests allowed.
+        min_limit : int
+            The lowest the limit can go.
+        max_limit : int
+            The highest the limit can go.
+        backoff_factor : float
+            Factor the limit is multiplied by when the server is overloaded.
+        latency_tolerance : float
+            How many times the baseline 95th percentile latency the current
+            95th percentile latency can rise to before backing off.
+        window : int
+            Number of requests to compute the 95th percentile latency over.
+        rate : Optional[float]
+            Maximum number of requests per second.
+            `None` means no limit.
+        burst : Optional[int]
+            Number of requests that can be made at once when not rate limited.
+            Defaults to `rate` (rounded up).
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate or 1))
+
+        self.in_flight = 0
+        """Number of requests currently in flight."""
+        self.backoffs = 0
+        """Number of times the limit has been decreased."""
+        self.baseline_p95: Optional[float] = None
+        """Lowest 95th percentile latency observed (in seconds)."""
+
+        self._limit = float(initial_limit)
+        self._epoch = 0  # incremented on every decrease
+        self._latencies: List[float] = []
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait for a free slot, and release it when the block exits.
+
+        The outcome of the block is used to adjust the limit.
+        """
+        await self._acquire_slot()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._release_slot()
+            raise
+
+        epoch = self._epoch
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            if self._is_overload(e):
+                self._decrease(epoch, reason=f"{type(e).__name__}: {e}")
+            raise
+        else:
+            self._on_success(time.monotonic() - start)
+        finally:
+            self._release_slot()
+
+    async def _acquire_slot(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self.in_flight >= self.limit:
+            waiter = loop.create_future()  # type: asyncio.Future[None]
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on the wakeup we might have received
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        for waiter in self._waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def _take_token(self) -> None:
+        if self.rate is None:
+            return
+        while True:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def _is_overload(self, e: BaseException) -> bool:
+        if isinstance(e, (TimeoutException, asyncio.TimeoutError)):
+            return True
+        return isinstance(e, StatusError) and e.status_code in OVERLOAD_STATUS_CODES
+
+    def _on_success(self, latency: float) -> None:
+        self._latencies.append(latency)
+        if len(self._latencies) >= self.window:
+            latencies = sorted(self._latencies)
+            self._latencies.clear()
+            p95 = latencies[math.ceil(0.95 * len(latencies)) - 1]
+            if self.baseline_p95 is None or p95 < self.baseline_p95:
+                self.baseline_p95 = p95
+            elif p95 > self.baseline_p95 * self.latency_tolerance:
+                self._decrease(
+                    self._epoch,
+                    reason=f"p95 latency {p95:.3f}s (baseline {self.baseline_p95:.3f}s)",
+                )
+                # Let a sustained change in latency become the new baseline
+                self.baseline_p95 = 0.9 * self.baseline_p95 + 0.1 * p95
+                return
+
+        # Only grow the limit when we are actually using it
+        if self.in_flight >= self.limit and self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._wake()
+
+    def _decrease(self, epoch: int, reason: str) -> None:
+        # Requests started before the last decrease were sent at the old limit,
+        # so they should not cause a second decrease.
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        self.backoffs += 1
+        self._latencies.clear()
+        self._limit = max(self.min_limit, self._limit * self.backoff_factor)
+        logger.debug("Decreasing concurrency limit to %d: %s", self.limit, reason)
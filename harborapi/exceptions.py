@@ -17,6 +17,10 @@ class HarborAPIException(Exception):
     pass
 
 
+class CircuitOpenError(HarborAPIException):
+    """Raised when a request is rejected by an open circuit breaker."""
+
+
 class StatusError(HarborAPIException):
     def __init__(
         self,
@@ -118,10 +122,18 @@ class UnprocessableEntity(StatusError):
     pass
 
 
+class TooManyRequests(StatusError):
+    pass
+
+
 class InternalServerError(StatusError):
     pass
 
 
+class ServiceUnavailable(StatusError):
+    pass
+
+
 EXCEPTIONS_MAP = {
     400: BadRequest,
     401: Unauthorized,
@@ -132,7 +144,9 @@ EXCEPTIONS_MAP = {
     412: PreconditionFailed,
     415: UnsupportedMediaType,
     422: UnprocessableEntity,
+    429: TooManyRequests,
     500: InternalServerError,
+    503: ServiceUnavailable,
 }
 
 
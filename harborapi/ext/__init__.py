@@ -38,5 +38,8 @@ from __future__ import annotations
 from .api import *
 from .artifact import ArtifactInfo
 from .cve import *
+from .executor import Executor
+from .index import ArtifactIndex
 from .report import ArtifactReport
 from .report import Vulnerability
+from .table import VulnerabilityTable
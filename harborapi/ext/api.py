@@ -1,25 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterator
 from typing import Awaitable
 from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
 import backoff
 from httpx import TimeoutException
 
+from ..concurrency import AdaptiveLimiter
 from ..exceptions import NotFound
 from ..log import logger
 from ..models import Artifact
 from ..models import Repository
 from ..models import UserResp
+from ..models.scanner import HarborVulnerabilityReport
+from ..models.scanner import Severity
 from .artifact import ArtifactInfo
+from .executor import Executor
 
 if TYPE_CHECKING:
     from .. import HarborAsyncClient
@@ -29,6 +40,31 @@ T = TypeVar("T")
 ExceptionCallback = Callable[[List[Exception]], None]
 
 
+@dataclass
+class CrawlStats:
+    """Statistics of the vulnerability reports fetched by
+    [get_artifact_vulnerabilities][harborapi.ext.api.get_artifact_vulnerabilities]
+    and [aiter_artifact_vulnerabilities][harborapi.ext.api.aiter_artifact_vulnerabilities].
+
+    The same digest is often present in several repositories, e.g. after
+    an image has been promoted or replicated, and the child manifests of
+    an image index can be listed alongside the index. The report of each
+    digest is only fetched once per crawl, and shared between all the
+    artifacts with the digest.
+    """
+
+    artifacts: int = 0
+    """Number of artifacts whose report was requested."""
+    reports_fetched: int = 0
+    """Number of reports fetched from the API."""
+    reports_shared: int = 0
+    """Number of artifacts that share the report fetched for another artifact
+    with the same digest."""
+    index_children: int = 0
+    """Number of distinct digests that are child manifests of an image index
+    whose report was also requested."""
+
+
 # TODO: support passing in existing project/repo objects
 async def get_artifact(
     client: HarborAsyncClient,
@@ -98,6 +134,8 @@ async def get_artifacts(
     query: Optional[str] = None,
     callback: Optional[Callable[[List[Exception]], None]] = None,
     max_connections: Optional[int] = 5,
+    limiter: Optional[AdaptiveLimiter] = None,
+    fields: Optional[Sequence[str]] = None,
     **kwargs: Any,
 ) -> List[ArtifactInfo]:
     """Fetch all artifacts in all repositories.
@@ -135,6 +173,14 @@ async def get_artifacts(
         The function always fires even if there are no exceptions.
     max_connections : Optional[int]
         The maximum number of concurrent connections to open.
+    limiter : Optional[AdaptiveLimiter]
+        Limiter that adapts the number of concurrent requests to the
+        server's capacity. Replaces `max_connections` if specified.
+    fields : Optional[Sequence[str]]
+        Only include these fields of each artifact, e.g. `["digest", "tags.name"]`.
+        The other fields are dropped before the artifacts are validated.
+        `digest` is always included.
+        See [get_artifacts][harborapi.client.HarborAsyncClient.get_artifacts].
     **kwargs : Any
         Additional arguments to pass to the `HarborAsyncClient.get_artifacts` method.
 
@@ -152,13 +198,21 @@ async def get_artifacts(
         ]
     # FIXME: invalid repository names are silently skipped
 
+    if fields is not None:
+        fields = [*fields, "digest"]
+
     # Fetch artifacts from each repository concurrently
-    coros = [
-        _get_artifacts_in_repository(client, repo, tag=tag, query=query, **kwargs)
-        for repo in repos
-    ]
-    a = await run_coros(coros, max_connections=max_connections)
-    return handle_gather(a, callback=callback)
+    errors: List[Exception] = []
+    executor = _make_executor(max_connections, limiter, errors)
+    results = await executor.run(
+        lambda repo: _get_artifacts_in_repository(
+            client, repo, tag=tag, query=query, fields=fields, **kwargs
+        ),
+        repos,
+    )
+    if callback is not None:
+        callback(errors)
+    return [artifact for artifacts in results for artifact in artifacts]
 
 
 @backoff.on_exception(
@@ -257,6 +311,13 @@ async def get_artifact_vulnerabilities(
     repositories: Optional[List[str]] = None,
     max_connections: Optional[int] = 5,
     callback: Optional[Callable[[List[Exception]], None]] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    fields: Optional[Sequence[str]] = None,
+    report_fields: Optional[Sequence[str]] = None,
+    min_severity: Optional[Severity] = None,
+    predicate: Optional[Callable[[ArtifactInfo], bool]] = None,
+    summary_only: bool = False,
+    stats: Optional[CrawlStats] = None,
     **kwargs: Any,
 ) -> List[ArtifactInfo]:
     """Fetch all artifact vulnerability reports in all projects or a subset of projects,
@@ -270,13 +331,15 @@ async def get_artifact_vulnerabilities(
     simultaneously will likely DoS your harbor instance, and as such it is not advisable
     to set `max_connections` to a large value. The default value of 5 is a known safe value,
     but you may need to experiment with your own instance to find the optimal value.
+    Alternatively, pass in an `AdaptiveLimiter` to let the number of concurrent
+    requests adapt to the load on the server.
 
     Parameters
     ----------
     client : HarborAsyncClient
         The client to use for the API call.
     tags : Optional[List[str]]
-        The tag(s) to filter the artifacts by.
+        Only return artifacts with at least one of these tags.
     projects : Optional[List[str]]
         The project(s) to fetch artifacts from.
         If not specified, all projects will be used.
@@ -289,6 +352,34 @@ async def get_artifact_vulnerabilities(
         The function takes a list of exceptions as its only argument.
         If not specified, exceptions are ignored.
         The function always fires even if there are no exceptions.
+    limiter : Optional[AdaptiveLimiter]
+        Limiter that adapts the number of concurrent requests to the
+        server's capacity. Replaces `max_connections` if specified.
+    fields : Optional[Sequence[str]]
+        Only include these fields of each artifact.
+        `digest`, `scan_overview` and `references.child_digest` are always
+        included, as is `tags.name` if `tags` is specified.
+        See [get_artifacts][harborapi.ext.api.get_artifacts].
+    report_fields : Optional[Sequence[str]]
+        Only include these fields of each report,
+        e.g. `["vulnerabilities.id", "vulnerabilities.severity"]`.
+        The other fields are dropped before the reports are validated.
+    min_severity : Optional[Severity]
+        Only fetch the reports of artifacts whose overall severity in their
+        scan overview is at least this severity. Artifacts whose severity
+        cannot be determined from the scan overview are always fetched.
+    predicate : Optional[Callable[[ArtifactInfo], bool]]
+        Only fetch the reports of artifacts for which this function returns
+        True. Called with artifacts without a report, so it can only use the
+        artifact, its repository and its scan overview.
+    summary_only : bool
+        Don't fetch any reports. The artifacts are returned with only
+        their scan overviews, whose severity counts are available through
+        [ArtifactInfo.summary_distribution][harborapi.ext.artifact.ArtifactInfo.summary_distribution].
+    stats : Optional[CrawlStats]
+        Filled in with the number of reports fetched and the number of
+        artifacts that share the report of another artifact with the
+        same digest. The report of each digest is only fetched once.
     **kwargs : Any
         Additional arguments to pass to the `HarborAsyncClient.get_artifacts` method.
 
@@ -299,84 +390,420 @@ async def get_artifact_vulnerabilities(
         is populated with the vulnerability report.
     """
 
+    if fields is not None:
+        fields = [*fields, "scan_overview", "references.child_digest"]
+        if tags:
+            fields.append("tags.name")
+
     # We first retrieve all artifacts before we get the vulnerability reports
     # since the reports themselves lack information about the artifact.
     artifacts = await get_artifacts(
         client,
         projects=projects,
         repositories=repositories,
-        tags=tags,
         max_connections=max_connections,
         callback=callback,
+        limiter=limiter,
+        fields=fields,
         **kwargs,
     )
-
-    # Filter out artifacts without a successful scan
-    # A failed scan will not produce a report
-    has_scan = []
-    for artifact in artifacts:
-        if artifact.artifact.scan_overview is None:
-            continue
-        try:
-            if artifact.artifact.scan_overview.scan_status == "Success":
-                has_scan.append(artifact)
-        except AttributeError:
-            continue
+    if tags:
+        artifacts = [a for a in artifacts if any(tag in tags for tag in a.tags)]
+
+    # Skip the artifacts whose reports we don't need based on their
+    # scan overview, which we already have.
+    should_fetch = _make_report_filter(min_severity, predicate)
+    to_fetch = [artifact for artifact in artifacts if should_fetch(artifact)]
+    logger.debug(
+        "Skipping %d of %d artifact reports based on their scan overview",
+        len(artifacts) - len(to_fetch),
+        len(artifacts),
+    )
+    if summary_only:
+        return to_fetch
 
     # We must fetch each report individually, since the API doesn't support
     # getting all reports in one call.
     # This is done concurrently to speed up the process.
-    coros = [_get_artifact_report(client, artifact) for artifact in has_scan]
-    artifacts = await run_coros(coros, max_connections=max_connections)
-    return handle_gather(artifacts, callback=callback)
+    errors: List[Exception] = []
+    executor = _make_executor(max_connections, limiter, errors)
+    reports = _SharedReports(
+        lambda artifact: _get_artifact_report(client, artifact, fields=report_fields),
+        stats,
+    )
+    # Only fetch the first artifact of each digest, so the artifacts sharing
+    # its report don't hold up the executor while they wait for it.
+    unique, duplicates = _split_duplicates(to_fetch)
+    artifacts = await executor.run(reports, unique)
+    for artifact in duplicates:
+        try:
+            artifacts.append(await reports(artifact))
+        except Exception as e:  # noqa: BLE001
+            # Collected and passed to the callback, like the executor's errors
+            errors.append(e)
+    reports.log()
+    # Restore the order of the artifacts
+    positions = {id(artifact): i for i, artifact in enumerate(to_fetch)}
+    artifacts.sort(key=lambda artifact: positions[id(artifact)])
+    if callback is not None:
+        callback(errors)
+    return artifacts
+
+
+async def aiter_artifact_vulnerabilities(
+    client: HarborAsyncClient,
+    tags: Optional[List[str]] = None,
+    projects: Optional[List[str]] = None,
+    repositories: Optional[List[str]] = None,
+    max_connections: Optional[int] = 5,
+    callback: Optional[Callable[[List[Exception]], None]] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    fields: Optional[Sequence[str]] = None,
+    report_fields: Optional[Sequence[str]] = None,
+    min_severity: Optional[Severity] = None,
+    predicate: Optional[Callable[[ArtifactInfo], bool]] = None,
+    summary_only: bool = False,
+    stats: Optional[CrawlStats] = None,
+    queue_size: int = 100,
+    **kwargs: Any,
+) -> AsyncIterator[ArtifactInfo]:
+    """Iterate over artifacts and their vulnerability reports in all projects
+    or a subset of projects, optionally filtered by tags.
+
+    A pipelined version of [get_artifact_vulnerabilities][harborapi.ext.api.get_artifact_vulnerabilities].
+    Instead of first listing the artifacts of every repository and then fetching
+    their reports, the reports of a repository's artifacts are fetched as soon
+    as the repository has been listed, and each artifact is yielded as soon as
+    its report has been fetched. Artifacts are therefore yielded in the order
+    their reports are fetched, not in the order of their repositories.
+
+    Artifacts and results waiting to be processed are held in queues of at
+    most `queue_size` items. If the results are consumed slower than they are
+    fetched, fetching pauses until there is room in the queues.
+
+    Listing artifacts and fetching reports share the same limit of
+    `max_connections` concurrent requests (or the `limiter`).
+
+    Parameters
+    ----------
+    client : HarborAsyncClient
+        The client to use for the API calls.
+    tags : Optional[List[str]]
+        Only yield artifacts with at least one of these tags.
+    projects : Optional[List[str]]
+        The project(s) to fetch artifacts from.
+        If not specified, all projects will be used.
+    repositories : Optional[List[str]]
+        The repositories to fetch artifacts from.
+        See [get_artifacts][harborapi.ext.api.get_artifacts].
+    max_connections : Optional[int]
+        The maximum number of concurrent connections to the Harbor API.
+        If None, the number of connections is limited by `queue_size`.
+    callback : Optional[Callable[[List[Exception]], None]]
+        A callback function to handle exceptions raised by the API calls.
+        The function takes a list of exceptions as its only argument.
+        If not specified, exceptions are ignored.
+        The function fires once all artifacts have been yielded,
+        even if there are no exceptions.
+    limiter : Optional[AdaptiveLimiter]
+        Limiter that adapts the number of concurrent requests to the
+        server's capacity. Replaces `max_connections` if specified.
+    fields : Optional[Sequence[str]]
+        Only include these fields of each artifact.
+        `digest`, `scan_overview` and `references.child_digest` are always
+        included, as is `tags.name` if `tags` is specified.
+    report_fields : Optional[Sequence[str]]
+        Only include these fields of each report.
+    min_severity : Optional[Severity]
+        Only fetch the reports of artifacts whose overall severity in their
+        scan overview is at least this severity. Artifacts whose severity
+        cannot be determined from the scan overview are always fetched.
+    predicate : Optional[Callable[[ArtifactInfo], bool]]
+        Only fetch the reports of artifacts for which this function returns
+        True. Called with artifacts without a report, so it can only use the
+        artifact, its repository and its scan overview.
+    summary_only : bool
+        Don't fetch any reports. The artifacts are yielded with only
+        their scan overviews, whose severity counts are available through
+        [ArtifactInfo.summary_distribution][harborapi.ext.artifact.ArtifactInfo.summary_distribution].
+    stats : Optional[CrawlStats]
+        Filled in with the number of reports fetched and the number of
+        artifacts that share the report of another artifact with the
+        same digest. The report of each digest is only fetched once.
+    queue_size : int
+        The maximum number of repositories being listed and artifacts
+        waiting for their report to be fetched, and of artifacts being
+        fetched and waiting to be yielded.
+    **kwargs : Any
+        Additional arguments to pass to the `HarborAsyncClient.get_artifacts` method.
+
+    Yields
+    ------
+    ArtifactInfo
+        An artifact with its `report` field populated with the vulnerability report.
+    """
+    if queue_size < 1:
+        raise ValueError("queue_size must be at least 1")
+    repos = await get_repositories(client, projects=projects)
+    if repositories:
+        repos = [
+            r for r in repos if r.name in repositories or r.base_name in repositories
+        ]
+    if fields is not None:
+        fields = [*fields, "digest", "scan_overview", "references.child_digest"]
+        if tags:
+            fields.append("tags.name")
+
+    if limiter is not None:
+        concurrency = limiter.max_limit
+    else:
+        concurrency = max_connections or queue_size
+    sem = asyncio.Semaphore(concurrency)
+
+    async def limited(coro: Awaitable[T]) -> T:
+        if limiter is not None:
+            async with limiter.acquire():
+                return await coro
+        async with sem:
+            return await coro
+
+    errors: List[Exception] = []
+    listing = Executor(concurrency, on_error=errors.append, buffer_size=queue_size)
+    # Artifacts waiting for the report of another artifact with the same
+    # digest hold a worker but not a connection, so the number of workers is
+    # only limited by the queue size.
+    fetching = Executor(queue_size, on_error=errors.append, buffer_size=queue_size)
+
+    async def list_artifacts(repo: Repository) -> List[ArtifactInfo]:
+        return await limited(
+            _get_artifacts_in_repository(client, repo, fields=fields, **kwargs)
+        )
+
+    async def fetch_report(artifact: ArtifactInfo) -> ArtifactInfo:
+        return await limited(
+            _get_artifact_report(client, artifact, fields=report_fields)
+        )
+
+    reports = _SharedReports(fetch_report, stats)
+
+    should_fetch = _make_report_filter(min_severity, predicate)
+
+    async def scanned_artifacts() -> AsyncGenerator[ArtifactInfo, None]:
+        async for artifacts in listing.map(list_artifacts, repos):
+            for artifact in artifacts:
+                if tags and not any(tag in tags for tag in artifact.tags):
+                    continue
+                if should_fetch(artifact):
+                    yield artifact
+
+    if summary_only:
+        results = scanned_artifacts()
+    else:
+        results = fetching.map(reports, scanned_artifacts())
+    try:
+        async for artifact in results:
+            yield artifact
+    finally:
+        # Stop fetching if the caller stops iterating early
+        await results.aclose()
+    reports.log()
+    if callback is not None:
+        callback(errors)
+
+
+def _make_report_filter(
+    min_severity: Optional[Severity],
+    predicate: Optional[Callable[[ArtifactInfo], bool]],
+) -> Callable[[ArtifactInfo], bool]:
+    """Create a function that checks if the report of an artifact
+    should be fetched, based on the artifact's scan overview."""
+
+    def should_fetch(artifact: ArtifactInfo) -> bool:
+        if not _has_successful_scan(artifact):
+            return False
+        if min_severity is not None:
+            severity = artifact.scan_severity
+            # Rather fetch a report we don't need than skip one we do
+            if severity is not None and severity < min_severity:
+                return False
+        return predicate is None or predicate(artifact)
+
+    return should_fetch
+
+
+class _SharedReports:
+    """Fetches the report of each digest once, and shares it between all
+    the artifacts with the digest.
+
+    Artifacts whose digest is already being fetched wait for the report
+    instead of fetching it again, and artifacts whose digest has already been
+    fetched get the report right away. If fetching a report fails, the
+    artifacts waiting for it fail with the same exception.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[ArtifactInfo], Awaitable[ArtifactInfo]],
+        stats: Optional[CrawlStats] = None,
+    ) -> None:
+        self.fetch = fetch
+        self.stats = stats if stats is not None else CrawlStats()
+        self._reports: Dict[str, asyncio.Future[HarborVulnerabilityReport]] = {}
+        self._children: Set[str] = set()
+
+    async def __call__(self, artifact: ArtifactInfo) -> ArtifactInfo:
+        self.stats.artifacts += 1
+        digest = artifact.artifact.digest
+        if digest is None:
+            return await self.fetch(artifact)
+        self._add_children(artifact)
+
+        future = self._reports.get(digest)
+        if future is not None:
+            self.stats.reports_shared += 1
+            artifact.report = await future
+            return artifact
+
+        if digest in self._children:
+            self.stats.index_children += 1
+        self.stats.reports_fetched += 1
+        future = asyncio.get_running_loop().create_future()
+        self._reports[digest] = future
+        try:
+            artifact = await self.fetch(artifact)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no artifact shares it
+            future.exception()
+            raise
+        future.set_result(artifact.report)
+        return artifact
+
+    def _add_children(self, artifact: ArtifactInfo) -> None:
+        """Keep track of the child manifests referenced by an image index."""
+        for reference in artifact.artifact.references or []:
+            child = reference.child_digest
+            if child is None or child in self._children:
+                continue
+            self._children.add(child)
+            if child in self._reports:
+                self.stats.index_children += 1
+
+    def log(self) -> None:
+        stats = self.stats
+        logger.debug(
+            "Fetched %d reports for %d artifacts (%d shared, %d index children)",
+            stats.reports_fetched,
+            stats.artifacts,
+            stats.reports_shared,
+            stats.index_children,
+        )
+
+
+def _split_duplicates(
+    artifacts: Iterable[ArtifactInfo],
+) -> Tuple[List[ArtifactInfo], List[ArtifactInfo]]:
+    """Split artifacts into the first artifact with each digest
+    and the artifacts whose digest is already in the first list."""
+    unique: List[ArtifactInfo] = []
+    duplicates: List[ArtifactInfo] = []
+    digests: Set[str] = set()
+    for artifact in artifacts:
+        digest = artifact.artifact.digest
+        if digest is not None and digest in digests:
+            duplicates.append(artifact)
+            continue
+        if digest is not None:
+            digests.add(digest)
+        unique.append(artifact)
+    return unique, duplicates
+
+
+def _has_successful_scan(artifact: ArtifactInfo) -> bool:
+    """Check if an artifact has been scanned successfully.
+    A failed scan will not produce a report."""
+    scan = artifact.artifact.scan
+    return scan is not None and scan.scan_status == "Success"
 
 
 async def run_coros(
-    coros: Sequence[Awaitable[T]],
+    coros: Iterable[Awaitable[T]],
     max_connections: Optional[int],
-) -> List[T]:
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> List[Union[T, Exception]]:
     """Runs an iterable of coroutines concurrently and returns the results.
 
     Given a `max_connections` value, the number of concurrent coroutines is limited.
-    All coroutines are run with `asyncio.gather(..., return_exceptions=True)`,
-    so the list of results can contain exceptions, which must be handled
-    by the caller.
+    Given a `limiter`, the number of concurrent coroutines is adjusted
+    according to the outcome and latency of the coroutines instead.
+    Exceptions raised by the coroutines are returned in place of their
+    results, like `asyncio.gather(..., return_exceptions=True)`,
+    and must be handled by the caller.
+
+    Prefer [Executor][harborapi.ext.executor.Executor] for large numbers of
+    work items, which only creates each coroutine once a worker is available
+    to run it, and does not collect the results into a list.
 
     Parameters
     ----------
-    coros : Sequence[Awaitable[T]]
+    coros : Iterable[Awaitable[T]]
         An iterable of coroutines to run.
     max_connections : Optional[int]
         The maximum number of concurrent coroutines to run.
+        If None, the number of concurrent coroutines is unlimited.
+    limiter : Optional[AdaptiveLimiter]
+        Adaptive limiter to use instead of a fixed `max_connections`.
+        Should not be the same limiter as the one used by the client
+        making the requests, as each coroutine would then hold a slot while
+        waiting for another.
 
     Returns
     -------
-    List[T]
+    List[Union[T, Exception]]
         A list of results from running the coroutines, which may contain exceptions.
     """
-    results = []
 
-    # Create semaphore to limit concurrent connections
-    maxconn = max_connections or 0  # semamphore expects an int
-    sem = asyncio.Semaphore(maxconn)
-    logger.debug("Running with max connections: %s", maxconn)
+    results: Dict[int, Union[T, Exception]] = {}
 
-    # Instead of passing the semaphore to each coroutine, we wrap each coroutine
-    # in a function that acquires the semaphore before calling the coroutine.
-    # This lets us run any coroutine without having to explicitly pass the semaphore.
-    async def _wrap_coro(coro: Awaitable[T]) -> T:
-        async with sem:
-            return await coro
+    async def _run(job: Tuple[int, Awaitable[T]]) -> None:
+        i, coro = job
+        try:
+            results[i] = await coro
+        except Exception as e:
+            # Raise the exception inside the executor's limiter block,
+            # so the limiter backs off on overload errors
+            results[i] = e
+            raise
+
+    executor = Executor(max_connections if limiter is None else None, limiter=limiter)
+    await executor.run(_run, enumerate(coros))
+    return [results[i] for i in range(len(results))]
 
-    res = await asyncio.gather(
-        *[_wrap_coro(coro) for coro in coros], return_exceptions=True
+
+def _make_executor(
+    max_connections: Optional[int],
+    limiter: Optional[AdaptiveLimiter],
+    errors: List[Exception],
+) -> Executor:
+    """Create an executor that preserves the order of the work items and
+    collects exceptions into `errors`.
+    A `limiter` replaces the `max_connections` limit."""
+    return Executor(
+        max_connections if limiter is None else None,
+        limiter=limiter,
+        ordered=True,
+        on_error=errors.append,
     )
-    results.extend(res)
-    return results
 
 
 async def _get_artifact_report(
-    client: HarborAsyncClient, artifact: ArtifactInfo
+    client: HarborAsyncClient,
+    artifact: ArtifactInfo,
+    fields: Optional[Sequence[str]] = None,
+    mime_type: str = "application/vnd.security.vulnerability.report; version=1.1",
 ) -> ArtifactInfo:
     """Given an ArtifactInfo, fetches the vulnerability report for the artifact,
     and assigns it to the `report` field of the ArtifactInfo object.
@@ -387,6 +814,10 @@ async def _get_artifact_report(
         The client to use for the API call.
     artifact : ArtifactInfo
         The artifact to get the vulnerability report for.
+    fields : Optional[Sequence[str]]
+        Only include these fields of the report.
+    mime_type : str
+        The MIME type of the report.
 
     Returns
     -------
@@ -405,10 +836,17 @@ async def _get_artifact_report(
         return artifact
 
     project_name, repo_name = s
+    # The ID of the report of this MIME type lets the client look up
+    # the report in its report cache
+    overview = artifact.artifact.scan_overview
+    summary = overview.root.get(mime_type) if overview and overview.root else None
     report = await client.get_artifact_vulnerabilities(
         project_name,
         repo_name,
         digest,
+        mime_type=mime_type,
+        fields=fields,
+        report_id=summary.report_id if summary is not None else None,
     )
     if report is None:
         logger.info(
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections import Counter
 from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Callable
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
+from ..version import SemVer
 from ..version import VersionType
 from ..version import get_semver
 
@@ -19,7 +22,9 @@ from ..models import Artifact
 from ..models import Repository
 from ..models.base import BaseModel
 from ..models.scanner import HarborVulnerabilityReport
+from ..models.scanner import Severity
 from ..models.scanner import VulnerabilityItem
+from ..models.scanner import most_severe
 from .cve import CVSSData
 from .regex import get_pattern
 from .regex import match
@@ -139,6 +144,53 @@ class ArtifactInfo(BaseModel):
             return []
         return list(filter(None, (t.name for t in self.artifact.tags)))
 
+    @property
+    def scan_severity(self) -> Optional[Severity]:
+        """Overall severity of the artifact according to its scan overview.
+
+        Available without fetching the artifact's report, as long as the
+        artifact was fetched with its scan overview.
+        Falls back on the most severe severity in the scan overview's
+        summary if the overall severity is missing.
+
+        Returns
+        -------
+        Optional[Severity]
+            The overall severity of the artifact, or None if it
+            cannot be determined from the scan overview.
+        """
+        scan = self.artifact.scan
+        if scan is None:
+            return None
+        if scan.severity:
+            try:
+                return Severity(scan.severity)
+            except ValueError:
+                pass
+        if scan.summary is not None:
+            dist = scan.summary.distribution
+            if dist:
+                return most_severe(dist)
+        return None
+
+    @property
+    def summary_distribution(self) -> "Counter[Severity]":
+        """Distribution of severities according to the artifact's scan overview.
+
+        Unlike `report.distribution`, this is available without fetching
+        the artifact's report, as long as the artifact was fetched with its
+        scan overview.
+
+        Returns
+        -------
+        Counter[Severity]
+            The number of vulnerabilities of each severity.
+        """
+        scan = self.artifact.scan
+        if scan is None or scan.summary is None:
+            return Counter()
+        return scan.summary.distribution
+
     def has_cve(self, cve_id: str) -> bool:
         """Returns whether the artifact is affected by the given CVE ID.
 
@@ -202,22 +254,10 @@ class ArtifactInfo(BaseModel):
             Whether the artifact is affected by a vulnerability whose affected
             package matches the given string.
         """
-        minv = get_semver(min_version)
-        maxv = get_semver(max_version)
-        if maxv and minv:
-            if maxv < minv:
-                raise ValueError(
-                    "max_version must be greater than or equal to min_version"
-                )
-
+        minv, maxv = get_version_range(min_version, max_version)
         for vuln in self.vulns_with_package(package, case_sensitive):
-            if not vuln.semver:
-                continue
-            if min_version is not None and vuln.semver < minv:
-                continue
-            if max_version is not None and vuln.semver > maxv:
-                continue
-            return True
+            if in_version_range(vuln, minv, maxv):
+                return True
         return False
 
     def has_tag(self, tag: str) -> bool:
@@ -323,6 +363,55 @@ class ArtifactInfo(BaseModel):
                 yield vuln
 
 
+def get_version_range(
+    min_version: Optional[VersionType], max_version: Optional[VersionType]
+) -> Tuple[Optional[SemVer], Optional[SemVer]]:
+    """Get the minimum and maximum versions of a package version range.
+
+    Parameters
+    ----------
+    min_version : Optional[VersionType]
+        The minimum version, or `None` for no minimum.
+    max_version : Optional[VersionType]
+        The maximum version, or `None` for no maximum.
+
+    Returns
+    -------
+    Tuple[Optional[SemVer], Optional[SemVer]]
+        The minimum and maximum versions, `None` if not specified.
+
+    Raises
+    ------
+    ValueError
+        Raised if the maximum version is less than the minimum version.
+    """
+    minv = get_semver(min_version)
+    maxv = get_semver(max_version)
+    if maxv and minv:
+        if maxv < minv:
+            raise ValueError("max_version must be greater than or equal to min_version")
+    return (
+        minv if min_version is not None else None,
+        maxv if max_version is not None else None,
+    )
+
+
+def in_version_range(
+    vuln: VulnerabilityItem, minv: Optional[SemVer], maxv: Optional[SemVer]
+) -> bool:
+    """Check if the affected package version of a vulnerability is within
+    a version range returned by
+    [`get_version_range()`][harborapi.ext.artifact.get_version_range].
+    Vulnerabilities without a version are never within the range."""
+    if not vuln.semver:
+        return False
+    if minv is not None and vuln.semver < minv:
+        return False
+    if maxv is not None and vuln.semver > maxv:
+        return False
+    return True
+
+
 async def filter_artifacts_latest(
     artifacts: List[ArtifactInfo],
     fallback: Optional[Callable[[ArtifactInfo, ArtifactInfo], ArtifactInfo]] = None,
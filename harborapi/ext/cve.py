@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from itertools import chain
 from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Optional
 
 from pydantic import BaseModel
 
-from . import stats
+from .stats import StatsAccumulator
 
 if TYPE_CHECKING:
     from .artifact import ArtifactInfo
@@ -20,6 +21,8 @@ class CVSSData(BaseModel):
     stdev: float
     min: float
     max: float
+    p90: float = 0.0
+    p99: float = 0.0
 
     @classmethod
     def from_artifactinfo(cls, artifact: "ArtifactInfo") -> "CVSSData":
@@ -39,14 +42,7 @@ class CVSSData(BaseModel):
         --------
         [ArtifactInfo.cvss][harborapi.ext.artifact.ArtifactInfo.cvss]
         """
-        scores = artifact.report.cvss_scores
-        return cls(
-            mean=stats.mean(scores),
-            median=stats.median(scores),
-            stdev=stats.stdev(scores),
-            min=stats.min(scores),
-            max=stats.max(scores),
-        )
+        return cls.from_stats(accumulate_cvss([artifact]))
 
     @classmethod
     def from_report(cls, report: "ArtifactReport") -> "CVSSData":
@@ -62,14 +58,82 @@ class CVSSData(BaseModel):
         CVSSData
             The CVSS data for the report.
         """
-        # Wrap generator in list to allow for re-use
-        scores = list(
-            chain.from_iterable([a.report.cvss_scores for a in report.artifacts])
-        )
+        return cls.from_artifacts(report.artifacts)
+
+    @classmethod
+    def from_artifacts(cls, artifacts: Iterable["ArtifactInfo"]) -> "CVSSData":
+        """Create a CVSSData instance from the CVSS scores of any number of
+        artifacts, in a single pass over the scores.
+
+        Parameters
+        ----------
+        artifacts : Iterable[ArtifactInfo]
+            The artifacts to extract CVSS data from. Can be a generator.
+
+        Returns
+        -------
+        CVSSData
+            The CVSS data for the artifacts.
+        """
+        return cls.from_stats(accumulate_cvss(artifacts))
+
+    @classmethod
+    def from_stats(cls, stats: StatsAccumulator) -> "CVSSData":
+        """Create a CVSSData instance from accumulated CVSS scores.
+
+        Parameters
+        ----------
+        stats : StatsAccumulator
+            The accumulated scores, e.g. from
+            [`accumulate_cvss()`][harborapi.ext.cve.accumulate_cvss].
+
+        Returns
+        -------
+        CVSSData
+            The CVSS data for the scores.
+        """
         return cls(
-            mean=stats.mean(scores),
-            median=stats.median(scores),
-            stdev=stats.stdev(scores),
-            min=stats.min(scores),
-            max=stats.max(scores),
+            mean=stats.mean,
+            median=stats.median,
+            stdev=stats.stdev,
+            min=stats.min,
+            max=stats.max,
+            p90=stats.quantile(0.9),
+            p99=stats.quantile(0.99),
         )
+
+
+def accumulate_cvss(
+    artifacts: Iterable["ArtifactInfo"], stats: Optional[StatsAccumulator] = None
+) -> StatsAccumulator:
+    """Accumulate the CVSS scores of artifacts.
+
+    Vulnerabilities without a CVSS score are not included.
+    Accumulators of separate groups of artifacts, e.g. computed in parallel,
+    can be combined with [`StatsAccumulator.merge()`][harborapi.ext.stats.StatsAccumulator.merge].
+
+    Parameters
+    ----------
+    artifacts : Iterable[ArtifactInfo]
+        The artifacts to accumulate the scores of. Can be a generator.
+    stats : Optional[StatsAccumulator]
+        An accumulator to add the scores to, by default a new one.
+
+    Returns
+    -------
+    StatsAccumulator
+        The accumulated scores.
+
+    Examples
+    --------
+    ```py
+    >>> stats = accumulate_cvss(report.artifacts[:100])
+    >>> stats = stats.merge(accumulate_cvss(report.artifacts[100:]))
+    >>> CVSSData.from_stats(stats)
+    ```
+    """
+    if stats is None:
+        stats = StatsAccumulator()
+    for artifact in artifacts:
+        stats.update(filter(None, artifact.report._get_cvss_column()))
+    return stats
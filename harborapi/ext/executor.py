@@ -0,0 +1,267 @@
+"""Bounded worker pool for running an async function over many work items."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from ..concurrency import AdaptiveLimiter
+
+I = TypeVar("I")
+T = TypeVar("T")
+
+_FAILED = object()
+"""Placeholder result of a failed work item."""
+
+
+async def _aiter(
+    items: Union[Iterable[I], AsyncIterable[I]],
+) -> AsyncGenerator[I, None]:
+    if isinstance(items, AsyncIterable):
+        iterator = items.__aiter__()
+        try:
+            async for item in iterator:
+                yield item
+        finally:
+            # Close async generators, which stops any work they are doing
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+    else:
+        for item in items:
+            yield item
+
+
+class Executor:
+    """Runs an async function over a stream of work items with a fixed
+    number of worker tasks.
+
+    Work items are taken from the iterable only as workers become available,
+    so the number of tasks, pending items and unconsumed results stays
+    bounded no matter how many items there are. Results are yielded as soon
+    as they are available, either in the order of the work items or in the
+    order they complete.
+
+    Exceptions raised by the function are passed to `on_error` as they occur
+    and the item is skipped. Exceptions raised by `on_error` or by the
+    iterable of work items stop the executor and are raised by
+    [map][harborapi.ext.executor.Executor.map].
+
+    Examples
+    --------
+    ```py
+    executor = Executor(max_workers=5, on_error=print)
+    async for artifacts in executor.map(fetch_artifacts, repositories):
+        ...
+    print(executor.completed, executor.failed)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = 5,
+        limiter: Optional[AdaptiveLimiter] = None,
+        ordered: bool = False,
+        on_error: Optional[Callable[[Exception], Any]] = None,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Parameters
+        ----------
+        max_workers : Optional[int]
+            Number of worker tasks, i.e. the maximum number of work items
+            processed concurrently.
+            If None, the number of workers is `limiter.max_limit` if a
+            `limiter` is specified, otherwise unlimited.
+        limiter : Optional[AdaptiveLimiter]
+            Limiter each worker acquires a slot from before processing a
+            work item, adapting concurrency to the server's capacity.
+            Should not be the same limiter as the one used by the client
+            making the requests, as each worker would then hold a slot while
+            waiting for another.
+        ordered : bool
+            Yield results in the order of the work items instead of the order
+            they complete. A slow item holds back the results after it.
+        on_error : Optional[Callable[[Exception], Any]]
+            Function called with each exception raised while processing
+            a work item. If not specified, exceptions are ignored.
+        buffer_size : Optional[int]
+            Maximum number of work items that are pending, being processed or
+            waiting to be consumed at once. Defaults to twice `max_workers`.
+            If the results are consumed slower than they are produced,
+            no more work items are taken until there is room in the buffer.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        if max_workers is None and limiter is not None:
+            max_workers = limiter.max_limit
+        self.max_workers = max_workers
+        self.limiter = limiter
+        self.ordered = ordered
+        self.on_error = on_error
+        if buffer_size is None and max_workers is not None:
+            buffer_size = max_workers * 2
+        self.buffer_size = buffer_size
+
+        self.submitted = 0
+        """Number of work items taken from the iterable."""
+        self.completed = 0
+        """Number of work items processed successfully."""
+        self.failed = 0
+        """Number of work items that raised an exception."""
+        self._stop_callbacks: Set[Callable[[], None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of work items taken from the iterable that are not yet processed."""
+        return self.submitted - self.completed - self.failed
+
+    def cancel(self) -> None:
+        """Stop all running [map][harborapi.ext.executor.Executor.map] calls.
+
+        Work items being processed are cancelled, and the iterators returned
+        by `map` stop without yielding the remaining results.
+        """
+        for stop in list(self._stop_callbacks):
+            stop()
+
+    async def map(
+        self,
+        func: Callable[[I], Awaitable[T]],
+        items: Union[Iterable[I], AsyncIterable[I]],
+    ) -> AsyncGenerator[T, None]:
+        """Call `func` on each work item and yield the results.
+
+        Parameters
+        ----------
+        func : Callable[[I], Awaitable[T]]
+            Async function to call with each work item.
+        items : Union[Iterable[I], AsyncIterable[I]]
+            The work items. Consumed lazily, so it can be a generator
+            producing an unbounded number of items.
+            Async generators are closed when the iterator returned
+            by `map` is closed.
+
+        Yields
+        ------
+        T
+            The result of each work item that did not raise an exception.
+        """
+        window = asyncio.Semaphore(self.buffer_size) if self.buffer_size else None
+        # None signals the end of the queues
+        work: asyncio.Queue[Optional[Tuple[int, I]]] = asyncio.Queue()
+        results: asyncio.Queue[Optional[Tuple[int, Any]]] = asyncio.Queue()
+        workers: List[asyncio.Future[None]] = []
+        failure: List[BaseException] = []
+
+        async def process(item: I) -> T:
+            if self.limiter is not None:
+                async with self.limiter.acquire():
+                    return await func(item)
+            return await func(item)
+
+        async def worker() -> None:
+            while (job := await work.get()) is not None:
+                i, item = job
+                try:
+                    result: Any = await process(item)
+                except Exception as e:  # noqa: BLE001
+                    # A failed item must not stop the pool; it is counted and
+                    # passed to on_error instead
+                    self.failed += 1
+                    result = _FAILED
+                    if self.on_error is not None:
+                        try:
+                            self.on_error(e)
+                        except Exception as err:  # noqa: BLE001
+                            # Re-raised from map() once the workers are stopped
+                            failure.append(err)
+                            results.put_nowait(None)
+                            return
+                else:
+                    self.completed += 1
+                results.put_nowait((i, result))
+
+        source = _aiter(items)
+
+        async def feed() -> None:
+            try:
+                i = 0
+                async for item in source:
+                    if window is not None:
+                        await window.acquire()
+                    if self.max_workers is None or len(workers) < self.max_workers:
+                        workers.append(asyncio.ensure_future(worker()))
+                    self.submitted += 1
+                    work.put_nowait((i, item))
+                    i += 1
+                for _ in workers:
+                    work.put_nowait(None)
+                await asyncio.gather(*workers)
+            except Exception as e:  # noqa: BLE001
+                # Re-raised from map() once the workers are stopped
+                failure.append(e)
+            finally:
+                await source.aclose()
+                results.put_nowait(None)
+
+        def stop() -> None:
+            for task in [feeder, *workers]:
+                task.cancel()
+            results.put_nowait(None)
+
+        feeder = asyncio.ensure_future(feed())
+        self._stop_callbacks.add(stop)
+        buffer: Dict[int, Any] = {}
+        next_index = 0
+        try:
+            while (res := await results.get()) is not None:
+                if failure:
+                    break
+                i, result = res
+                if self.ordered:
+                    buffer[i] = result
+                    ready = []
+                    while next_index in buffer:
+                        ready.append(buffer.pop(next_index))
+                        next_index += 1
+                else:
+                    ready = [result]
+                for result in ready:
+                    if window is not None:
+                        window.release()
+                    if result is not _FAILED:
+                        yield result
+        finally:
+            self._stop_callbacks.discard(stop)
+            # Stop processing if the caller stops iterating early
+            stop()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+        if failure:
+            raise failure[0]
+
+    async def run(
+        self,
+        func: Callable[[I], Awaitable[T]],
+        items: Union[Iterable[I], AsyncIterable[I]],
+    ) -> List[T]:
+        """Call `func` on each work item and return the results as a list.
+
+        See [map][harborapi.ext.executor.Executor.map].
+        """
+        return [result async for result in self.map(func, items)]
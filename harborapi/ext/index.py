@@ -0,0 +1,308 @@
+"""Inverted indexes of the vulnerabilities and tags of a group of artifacts.
+
+Used by [`ArtifactReport`][harborapi.ext.report.ArtifactReport] to look up
+the artifacts affected by a CVE or package, or having a tag, without
+scanning every vulnerability of every artifact.
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from ..models.scanner import VulnerabilityItem
+from ..version import VersionType
+from .artifact import ArtifactInfo
+from .artifact import get_version_range
+from .artifact import in_version_range
+from .regex import get_pattern
+from .report import Vulnerability
+
+__all__ = ["ArtifactIndex"]
+
+# (position of the artifact in the indexed artifacts, vulnerability)
+Entry = Tuple[int, VulnerabilityItem]
+# (artifact, its vulnerabilities and its tags when the index was built)
+Snapshot = Tuple[ArtifactInfo, List[VulnerabilityItem], List[str]]
+
+
+class ArtifactIndex:
+    """Inverted indexes of CVE IDs, package names and tags to the artifacts
+    (and vulnerabilities) they belong to.
+
+    Exact lookups (`lookup_*`) are dict lookups. Pattern queries (`find_*`
+    and `artifacts_with_*`) match the pattern against the distinct keys of
+    the index instead of every vulnerability, and the matching keys
+    of each pattern are cached.
+
+    The index is not updated if the artifacts are modified after it is built.
+    Use [`is_current()`][harborapi.ext.index.ArtifactIndex.is_current] to
+    check if it has to be rebuilt.
+
+    Parameters
+    ----------
+    artifacts : Sequence[ArtifactInfo]
+        The artifacts to index.
+    """
+
+    def __init__(self, artifacts: Sequence[ArtifactInfo]) -> None:
+        self.artifacts = artifacts
+        self.size = len(artifacts)
+        """The number of artifacts when the index was built."""
+        self.cves: Dict[str, List[Entry]] = {}
+        """Vulnerability IDs to the vulnerabilities with the ID."""
+        self.packages: Dict[str, List[Entry]] = {}
+        """Package names to the vulnerabilities affecting the package."""
+        self.tags: Dict[str, List[int]] = {}
+        """Tag names to the positions of the artifacts with the tag."""
+        self._keys: Dict[Tuple[str, str, bool], List[str]] = {}
+        # The artifacts, vulnerabilities and tags the index was built from
+        self._snapshot: List[Snapshot] = []
+        for position, artifact in enumerate(artifacts):
+            vulnerabilities = list(artifact.report.vulnerabilities)
+            tags = artifact.tags
+            self._snapshot.append((artifact, vulnerabilities, tags))
+            for vuln in vulnerabilities:
+                entry = (position, vuln)
+                if vuln.id is not None:
+                    self.cves.setdefault(vuln.id, []).append(entry)
+                if vuln.package is not None:
+                    self.packages.setdefault(vuln.package, []).append(entry)
+            for tag in tags:
+                self.tags.setdefault(tag, []).append(position)
+
+    def is_current(
+        self, artifacts: Sequence[ArtifactInfo], vulnerabilities: bool = True
+    ) -> bool:
+        """Check if the index was built from the given artifacts, with the
+        same vulnerabilities and tags.
+
+        Detects adding, removing, replacing and reordering artifacts and
+        their vulnerabilities, and changes to their tags. Only compares the
+        identities of the vulnerabilities, so modifying the fields of a
+        vulnerability in place is not detected.
+
+        Parameters
+        ----------
+        artifacts : Sequence[ArtifactInfo]
+            The artifacts to check.
+        vulnerabilities : bool
+            Check the vulnerabilities of the artifacts as well. The tag
+            index is current as long as the artifacts and their tags are.
+        """
+        if artifacts is not self.artifacts or len(artifacts) != self.size:
+            return False
+        for artifact, (indexed, vulns, tags) in zip(artifacts, self._snapshot):
+            if artifact is not indexed or artifact.tags != tags:
+                return False
+            if not vulnerabilities:
+                continue
+            current = artifact.report.vulnerabilities
+            if len(current) != len(vulns) or not all(map(operator.is_, current, vulns)):
+                return False
+        return True
+
+    def lookup_cve(self, cve_id: str) -> List[Vulnerability]:
+        """Get all vulnerabilities with the given ID.
+
+        Parameters
+        ----------
+        cve_id : str
+            The exact CVE ID, e.g. CVE-2019-1234.
+
+        Returns
+        -------
+        List[Vulnerability]
+            The vulnerabilities with their artifacts.
+        """
+        return self._vulnerabilities(self.cves.get(cve_id, []))
+
+    def lookup_package(self, package: str) -> List[Vulnerability]:
+        """Get all vulnerabilities affecting the given package.
+
+        Parameters
+        ----------
+        package : str
+            The exact package name.
+
+        Returns
+        -------
+        List[Vulnerability]
+            The vulnerabilities with their artifacts.
+        """
+        return self._vulnerabilities(self.packages.get(package, []))
+
+    def lookup_tag(self, tag: str) -> List[ArtifactInfo]:
+        """Get all artifacts with the given tag.
+
+        Parameters
+        ----------
+        tag : str
+            The exact tag name.
+
+        Returns
+        -------
+        List[ArtifactInfo]
+            The artifacts with the tag.
+        """
+        return [self.artifacts[i] for i in self.tags.get(tag, [])]
+
+    def find_cve(self, cve: str) -> List[Vulnerability]:
+        """Get all vulnerabilities whose ID matches a pattern.
+
+        Matches IDs the same way as
+        [`ArtifactInfo.has_cve()`][harborapi.ext.artifact.ArtifactInfo.has_cve].
+
+        Parameters
+        ----------
+        cve : str
+            The CVE ID, e.g. CVE-2019-1234.
+            Supports regular expressions.
+
+        Returns
+        -------
+        List[Vulnerability]
+            The vulnerabilities with their artifacts.
+        """
+        return self._vulnerabilities(self._find_cve(cve))
+
+    def find_package(
+        self,
+        package: str,
+        case_sensitive: bool = False,
+        min_version: Optional[VersionType] = None,
+        max_version: Optional[VersionType] = None,
+    ) -> List[Vulnerability]:
+        """Get all vulnerabilities affecting packages whose name matches a pattern.
+
+        Matches packages the same way as
+        [`ArtifactInfo.has_package()`][harborapi.ext.artifact.ArtifactInfo.has_package].
+
+        Parameters
+        ----------
+        package : str
+            The name of the package to search for.
+            Supports regular expressions.
+        case_sensitive : bool
+            Case sensitive matching, by default False.
+        min_version : Optional[VersionType]
+            The minimum version of the package, by default None.
+        max_version : Optional[VersionType]
+            The maximum version of the package, by default None.
+
+        Returns
+        -------
+        List[Vulnerability]
+            The vulnerabilities with their artifacts.
+        """
+        return self._vulnerabilities(
+            self._find_package(package, case_sensitive, min_version, max_version)
+        )
+
+    def artifacts_with_cve(self, cve: str) -> List[ArtifactInfo]:
+        """Get all artifacts affected by vulnerabilities whose ID matches a pattern.
+
+        See [`find_cve()`][harborapi.ext.index.ArtifactIndex.find_cve].
+
+        Returns
+        -------
+        List[ArtifactInfo]
+            The artifacts, in their original order.
+        """
+        return self._artifacts(position for position, _ in self._find_cve(cve))
+
+    def artifacts_with_package(
+        self,
+        package: str,
+        case_sensitive: bool = False,
+        min_version: Optional[VersionType] = None,
+        max_version: Optional[VersionType] = None,
+    ) -> List[ArtifactInfo]:
+        """Get all artifacts affected by vulnerabilities in packages whose name
+        matches a pattern.
+
+        See [`find_package()`][harborapi.ext.index.ArtifactIndex.find_package].
+
+        Returns
+        -------
+        List[ArtifactInfo]
+            The artifacts, in their original order.
+        """
+        minv, maxv = get_version_range(min_version, max_version)
+        found: Set[int] = set()
+        for key in self._match_keys("packages", self.packages, package, case_sensitive):
+            for position, vuln in self.packages[key]:
+                # Only check the versions of artifacts not found yet
+                if position not in found and in_version_range(vuln, minv, maxv):
+                    found.add(position)
+        return self._artifacts(found)
+
+    def artifacts_with_tag(self, tag: str) -> List[ArtifactInfo]:
+        """Get all artifacts with a tag matching a pattern.
+
+        Matches tags the same way as
+        [`ArtifactInfo.has_tag()`][harborapi.ext.artifact.ArtifactInfo.has_tag].
+
+        Parameters
+        ----------
+        tag : str
+            The tag to search for.
+            Supports regular expressions.
+
+        Returns
+        -------
+        List[ArtifactInfo]
+            The artifacts, in their original order.
+        """
+        return self._artifacts(
+            position
+            for key in self._match_keys("tags", self.tags, tag, False)
+            for position in self.tags[key]
+        )
+
+    def _find_cve(self, cve: str) -> List[Entry]:
+        keys = self._match_keys("cves", self.cves, cve, False)
+        if cve in self.cves and cve not in keys:
+            keys = [cve, *keys]  # exact matches are always included
+        return [entry for key in keys for entry in self.cves[key]]
+
+    def _find_package(
+        self,
+        package: str,
+        case_sensitive: bool,
+        min_version: Optional[VersionType],
+        max_version: Optional[VersionType],
+    ) -> List[Entry]:
+        minv, maxv = get_version_range(min_version, max_version)
+        return [
+            entry
+            for key in self._match_keys(
+                "packages", self.packages, package, case_sensitive
+            )
+            for entry in self.packages[key]
+            if in_version_range(entry[1], minv, maxv)
+        ]
+
+    def _match_keys(
+        self, name: str, index: Dict[str, Any], pattern: str, case_sensitive: bool
+    ) -> List[str]:
+        """Get the keys of an index matching a pattern."""
+        cache_key = (name, pattern, case_sensitive)
+        keys = self._keys.get(cache_key)
+        if keys is None:
+            compiled = get_pattern(pattern, case_sensitive=case_sensitive)
+            keys = self._keys[cache_key] = [k for k in index if compiled.match(k)]
+        return keys
+
+    def _vulnerabilities(self, entries: List[Entry]) -> List[Vulnerability]:
+        return [Vulnerability(vuln, self.artifacts[i]) for i, vuln in entries]
+
+    def _artifacts(self, positions: Iterable[int]) -> List[ArtifactInfo]:
+        return [self.artifacts[i] for i in sorted(set(positions))]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
-from functools import lru_cache
+from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -42,10 +44,184 @@ def get_pattern(pattern: str, case_sensitive: bool = False) -> "re.Pattern[str]"
     return _pattern_cache[cache_key]
 
 
-@lru_cache(maxsize=128)
+# NOTE: Not cached. Caching on (pattern, string) rarely hits, and keeps
+# references to the (potentially large) strings that are matched.
 def match(pattern: "re.Pattern[str]", s: str) -> Optional["re.Match[str]"]:
     try:
         return pattern.match(s)
     except Exception as e:
         logger.error("Error matching pattern %s to string %s: %s", pattern, s, e)
         return None
+
+
+# Inline flags that apply to the whole pattern, e.g. (?i)
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+class PatternSet:
+    """Matches strings against many patterns at once.
+
+    Instead of matching a string against each pattern separately, the
+    patterns are compiled into a single regular expression, so that each
+    string is scanned once to find all the patterns it matches:
+
+    * Literal strings (`literal=True`) are compiled into a trie of
+      alternatives, which finds every literal occurring at a position
+      in a single pass.
+    * Regular expressions are compiled into a chain of lookaheads,
+      one per pattern, which are all tried in a single call.
+      Patterns with groups or inline flags are matched separately.
+
+    Like [`match()`][harborapi.ext.regex.match], patterns match the start of
+    the string unless `search=True`.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        The patterns to match. Duplicates are ignored.
+    case_sensitive : bool, optional
+        Whether the patterns are case sensitive, by default False
+    literal : bool, optional
+        Match the patterns as literal strings instead of regular expressions,
+        by default False
+    search : bool, optional
+        Match the patterns anywhere in the string instead of only at the
+        start, by default False
+
+    Examples
+    --------
+    ```py
+    >>> patterns = PatternSet(["openssl", "libssl", "ssl"], literal=True, search=True)
+    >>> patterns.match("libssl3")
+    ['libssl', 'ssl']
+    ```
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        case_sensitive: bool = False,
+        literal: bool = False,
+        search: bool = False,
+    ) -> None:
+        self.patterns: List[str] = list(dict.fromkeys(patterns))
+        self.case_sensitive = case_sensitive
+        self.literal = literal
+        self.search = search
+        self._order = {pattern: i for i, pattern in enumerate(self.patterns)}
+        flags = 0 if case_sensitive else re.IGNORECASE
+        if literal:
+            self._literals: Dict[str, List[str]] = {}
+            for pattern in self.patterns:
+                self._literals.setdefault(self._key(pattern), []).append(pattern)
+            # Literals that are prefixes of each literal (including itself)
+            self._prefixes = {
+                key: [key[:i] for i in range(len(key) + 1) if key[:i] in self._literals]
+                for key in self._literals
+            }
+            trie = _trie_pattern(self._literals)
+            self._compiled = re.compile(
+                f"(?=({trie}))" if search else trie, flags=flags
+            )
+            return
+        # Patterns with groups or inline flags can't be combined,
+        # and are matched separately
+        base_flags = get_pattern("", case_sensitive).flags
+        self._combined: List[str] = []
+        self._separate: List[Tuple[str, "re.Pattern[str]"]] = []
+        for pattern in self.patterns:
+            compiled = get_pattern(pattern, case_sensitive)
+            if (
+                compiled.groups
+                or compiled.flags != base_flags
+                or _GLOBAL_FLAGS.match(pattern)
+            ):
+                self._separate.append((pattern, compiled))
+            else:
+                self._combined.append(pattern)
+        prefix = "(?s:.*?)" if search else ""
+        # Most strings match none of the patterns, so we first check if
+        # they match any of them before finding out which ones.
+        self._any = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self._combined) or "(?!)",
+            flags=flags,
+        )
+        self._compiled = re.compile(
+            "".join(f"(?:(?={prefix}({pattern}))|)" for pattern in self._combined),
+            flags=flags,
+        )
+
+    def match(self, s: str) -> List[str]:
+        """Get the patterns matching a string.
+
+        Parameters
+        ----------
+        s : str
+            The string to match.
+
+        Returns
+        -------
+        List[str]
+            The matching patterns, in the order they were given.
+        """
+        if self.literal:
+            return self._match_literals(s)
+        matches: List[str] = []
+        if (self._any.search if self.search else self._any.match)(s):
+            m = self._compiled.match(s)
+            if m is not None:
+                groups = m.groups()
+                matches = [p for p, g in zip(self._combined, groups) if g is not None]
+        for pattern, compiled in self._separate:
+            if (compiled.search if self.search else compiled.match)(s):
+                matches.append(pattern)
+        if self._separate:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+    def _match_literals(self, s: str) -> List[str]:
+        if self.search:
+            found = {m.group(1) for m in self._compiled.finditer(s)}
+        else:
+            m = self._compiled.match(s)
+            found = {m.group(0)} if m else set()
+        if not found:
+            return []
+        # The longest literal at a position is matched, and any other
+        # literals at the same position are prefixes of it
+        matches = {
+            pattern
+            for text in found
+            for key in self._prefixes[self._key(text)]
+            for pattern in self._literals[key]
+        }
+        return sorted(matches, key=self._order.__getitem__)
+
+    def _key(self, s: str) -> str:
+        return s if self.case_sensitive else s.lower()
+
+
+def _trie_pattern(literals: Iterable[str]) -> str:
+    """Compile literal strings into a regular expression that matches the
+    longest of the literals at a position."""
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}  # a literal ends here
+
+    def compile_node(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(c) + compile_node(child) for c, child in node.items() if c
+        ]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:  # the rest is optional, but preferred
+            pattern = f"(?:{pattern})?"
+        return pattern
+
+    if not trie:
+        return "(?!)"  # never matches
+    return compile_node(trie)
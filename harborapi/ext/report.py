@@ -1,25 +1,37 @@
 from __future__ import annotations
 
+import heapq
 import re
 from collections import Counter
 from dataclasses import dataclass
 from functools import cached_property
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from pydantic import ConfigDict
+from pydantic import PrivateAttr
 from pydantic import field_validator
 
 from harborapi.models.scanner import Severity
 from harborapi.models.scanner import VulnerabilityItem
 
 from ..models.base import BaseModel
+from ..models.base import without_private
 from ..version import VersionType
 from .artifact import ArtifactInfo
 from .cve import CVSSData
+from .regex import PatternSet
+
+if TYPE_CHECKING:
+    from .index import ArtifactIndex
+    from .table import VulnerabilityTable
 
 
 @dataclass
@@ -48,6 +60,7 @@ class ArtifactReport(BaseModel):
     artifacts: List[ArtifactInfo] = []
 
     model_config = ConfigDict(ignored_types=(cached_property,))
+    _index: Optional["ArtifactIndex"] = PrivateAttr(default=None)
 
     @field_validator("artifacts", mode="before")
     def _none_artifacts_is_empty_list(cls, v: Any) -> Any:
@@ -77,6 +90,23 @@ class ArtifactReport(BaseModel):
         """
         return cls.model_construct(artifacts=artifacts)
 
+    def __eq__(self, other: Any) -> bool:
+        # The index is derived from the artifacts, so reports with the same
+        # artifacts are equal whether or not their indexes have been built.
+        if not isinstance(other, ArtifactReport):
+            return super().__eq__(other)
+        return BaseModel.__eq__(
+            without_private(self, "_index"), without_private(other, "_index")
+        )
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Don't pickle the index, it is rebuilt on first use
+        state = super().__getstate__()
+        state["__pydantic_private__"] = without_private(
+            self, "_index"
+        ).__pydantic_private__
+        return state
+
     def __bool__(self) -> bool:
         return bool(self.artifacts)
 
@@ -92,6 +122,62 @@ class ArtifactReport(BaseModel):
         """Get an aggregate of CVSS data for the artifacts in this report."""
         return CVSSData.from_report(self)
 
+    @cached_property
+    def table(self) -> "VulnerabilityTable":
+        """Columnar table of the vulnerabilities of the artifacts in this report.
+
+        The table is built the first time it is accessed, and is not updated
+        if the artifacts of the report are modified afterwards.
+
+        Returns
+        -------
+        VulnerabilityTable
+            The vulnerability table of the report.
+
+        See Also
+        --------
+        [VulnerabilityTable][harborapi.ext.table.VulnerabilityTable]
+        """
+        from .table import VulnerabilityTable
+
+        return VulnerabilityTable.from_report(self)
+
+    @property
+    def index(self) -> "ArtifactIndex":
+        """Inverted indexes of the CVE IDs, package names and tags of the
+        artifacts in this report.
+
+        Used by the `has_*` and `with_*` methods for CVEs, packages and tags.
+        Built on first use, and rebuilt if artifacts or their vulnerabilities
+        are added, removed, replaced or reordered, or their tags change.
+        Call [`reindex()`][harborapi.ext.report.ArtifactReport.reindex]
+        after modifying the fields of a vulnerability in place.
+
+        Returns
+        -------
+        ArtifactIndex
+            The index of the report.
+        """
+        return self._get_index()
+
+    def _get_index(self, vulnerabilities: bool = True) -> "ArtifactIndex":
+        """Get the index, rebuilding it if it is not current.
+
+        Tag queries pass `vulnerabilities=False` to skip checking the
+        vulnerabilities of the artifacts, which the tag index doesn't use.
+        """
+        from .index import ArtifactIndex
+
+        index = self._index
+        if index is None or not index.is_current(self.artifacts, vulnerabilities):
+            index = self._index = ArtifactIndex(self.artifacts)
+        return index
+
+    def reindex(self) -> None:
+        """Rebuild the [`index`][harborapi.ext.report.ArtifactReport.index]
+        of the report on next use."""
+        self._index = None
+
     # TODO: The methods that return Iterable[Vulnerability] are inconsistent
     # with the other methods that return ArtifactReport. We should probably
     # change them to return ArtifactReport or Iterable[ArtifactInfo],
@@ -177,6 +263,25 @@ class ArtifactReport(BaseModel):
             dist.update(a_dist)
         return dist
 
+    @property
+    def summary_distribution(self) -> "Counter[Severity]":
+        """Get the distribution of severities from the scan overviews of all artifacts.
+
+        Unlike [distribution][harborapi.ext.report.ArtifactReport.distribution],
+        this does not require the artifacts' reports, so it can be used with
+        artifacts fetched with
+        `get_artifact_vulnerabilities(..., summary_only=True)`.
+
+        Returns
+        -------
+        Counter[Severity]
+            A counter of the severities.
+        """
+        dist = Counter()  # type: Counter[Severity]
+        for artifact in self.artifacts:
+            dist.update(artifact.summary_distribution)
+        return dist
+
     def vulnerabilities_by_severity(
         self, severity: Severity
     ) -> Iterable[Vulnerability]:
@@ -184,6 +289,160 @@ class ArtifactReport(BaseModel):
             for v in a.report.vulnerabilities_by_severity(severity):
                 yield Vulnerability(v, a)
 
+    def top_vulns(
+        self, n: int = 5, fixable: bool = False, unique: bool = True
+    ) -> List[Vulnerability]:
+        """Get the n vulnerabilities with the highest CVSS scores across
+        all artifacts.
+
+        Uses the CVSS scores stored by each artifact's report
+        (see [`HarborVulnerabilityReport.get_cvss_scores()`][harborapi.models.scanner.HarborVulnerabilityReport.get_cvss_scores]).
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of vulnerabilities to return.
+        fixable : bool
+            If `True`, only vulnerabilities with a fix version are returned.
+        unique : bool
+            If `True`, each CVE is only returned once, with the artifact
+            where it has the highest score (the first one on ties).
+            Use [`index.lookup_cve()`][harborapi.ext.index.ArtifactIndex.lookup_cve]
+            to get all the artifacts affected by a CVE.
+            Vulnerabilities without an ID are never merged.
+
+        Returns
+        -------
+        List[Vulnerability]
+            The vulnerabilities with their artifacts, highest score first.
+        """
+        candidates: Dict[Any, Tuple[float, VulnerabilityItem, ArtifactInfo]] = {}
+        for position, artifact in enumerate(self.artifacts):
+            report = artifact.report
+            scores = report._get_cvss_column()
+            for i, vuln in enumerate(report.vulnerabilities):
+                if fixable and not vuln.fix_version:
+                    continue
+                key = vuln.id if unique and vuln.id else (position, i)
+                candidate = candidates.get(key)
+                if candidate is None or scores[i] > candidate[0]:
+                    candidates[key] = (scores[i], vuln, artifact)
+        top = heapq.nlargest(n, candidates.values(), key=itemgetter(0))
+        return [Vulnerability(vuln, artifact) for _, vuln, artifact in top]
+
+    def find_cves(
+        self, cves: Iterable[str], literal: bool = False
+    ) -> Dict[str, List[Vulnerability]]:
+        """Find the vulnerabilities matching each of the given CVE IDs.
+
+        Matches IDs the same way as [`has_cve()`][harborapi.ext.report.ArtifactReport.has_cve],
+        but checks the vulnerabilities against all the IDs at once instead of
+        scanning every vulnerability once per ID.
+
+        Parameters
+        ----------
+        cves : Iterable[str]
+            The CVE IDs, e.g. CVE-2019-1234.
+            Supports regular expressions unless `literal` is `True`.
+        literal : bool
+            Match the CVE IDs as literal strings, by default False.
+            Faster for a large number of IDs.
+
+        Returns
+        -------
+        Dict[str, List[Vulnerability]]
+            The vulnerabilities matching each CVE ID, along with their artifacts.
+            IDs that match no vulnerabilities map to an empty list.
+        """
+        return self._find(PatternSet(cves, literal=literal), "id", exact=True)
+
+    def find_packages(
+        self,
+        packages: Iterable[str],
+        case_sensitive: bool = False,
+        literal: bool = False,
+    ) -> Dict[str, List[Vulnerability]]:
+        """Find the vulnerabilities affecting each of the given packages.
+
+        Matches packages the same way as [`has_package()`][harborapi.ext.report.ArtifactReport.has_package],
+        but checks the vulnerabilities against all the packages at once.
+
+        Parameters
+        ----------
+        packages : Iterable[str]
+            The names of the packages.
+            Supports regular expressions unless `literal` is `True`.
+        case_sensitive : bool
+            Case sensitive matching, by default False.
+        literal : bool
+            Match the package names as literal strings, by default False.
+
+        Returns
+        -------
+        Dict[str, List[Vulnerability]]
+            The vulnerabilities affecting each package, along with their artifacts.
+        """
+        matcher = PatternSet(packages, case_sensitive=case_sensitive, literal=literal)
+        return self._find(matcher, "package")
+
+    def find_descriptions(
+        self,
+        descriptions: Iterable[str],
+        case_sensitive: bool = False,
+        literal: bool = False,
+        search: bool = False,
+    ) -> Dict[str, List[Vulnerability]]:
+        """Find the vulnerabilities whose description matches each of the given strings.
+
+        Matches descriptions the same way as [`has_description()`][harborapi.ext.report.ArtifactReport.has_description],
+        but checks each distinct description against all the strings at once.
+
+        Parameters
+        ----------
+        descriptions : Iterable[str]
+            The strings to search for in the descriptions.
+            Supports regular expressions unless `literal` is `True`.
+        case_sensitive : bool
+            Case sensitive matching, by default False.
+        literal : bool
+            Match the strings as literal strings, by default False.
+        search : bool
+            Match the strings anywhere in the descriptions instead of only
+            at the start, by default False.
+
+        Returns
+        -------
+        Dict[str, List[Vulnerability]]
+            The vulnerabilities matching each string, along with their artifacts.
+        """
+        matcher = PatternSet(
+            descriptions, case_sensitive=case_sensitive, literal=literal, search=search
+        )
+        return self._find(matcher, "description")
+
+    def _find(
+        self, matcher: PatternSet, attr: str, exact: bool = False
+    ) -> Dict[str, List[Vulnerability]]:
+        """Find the vulnerabilities whose attribute matches each pattern of a
+        pattern set. Each distinct value is only matched once.
+
+        If `exact` is True, values equal to a pattern always match it."""
+        results: Dict[str, List[Vulnerability]] = {p: [] for p in matcher.patterns}
+        matched: Dict[str, List[str]] = {}
+        for artifact in self.artifacts:
+            for vuln in artifact.report.vulnerabilities:
+                value = getattr(vuln, attr)
+                if value is None:
+                    continue
+                patterns = matched.get(value)
+                if patterns is None:
+                    patterns = matched[value] = matcher.match(value)
+                    if exact and value in results and value not in patterns:
+                        patterns.insert(0, value)
+                for pattern in patterns:
+                    results[pattern].append(Vulnerability(vuln, artifact))
+        return results
+
     def has_cve(self, cve_id: str) -> bool:
         """Check if any of the artifacts has the given CVE.
 
@@ -197,7 +456,7 @@ class ArtifactReport(BaseModel):
         bool
             True if any of the artifacts has the given CVE, False otherwise.
         """
-        return any(a.has_cve(cve_id) for a in self.artifacts)
+        return bool(self.index.artifacts_with_cve(cve_id))
 
     def with_cve(self, cve_id: str) -> "ArtifactReport":
         """Get all artifacts that have the given CVE.
@@ -212,9 +471,7 @@ class ArtifactReport(BaseModel):
         ArtifactReport
             A report with all artifacts that are affected by the given CVE.
         """
-        return ArtifactReport.from_artifacts(
-            [a for a in self.artifacts if a.has_cve(cve_id)]
-        )
+        return ArtifactReport.from_artifacts(self.index.artifacts_with_cve(cve_id))
 
     def has_description(self, description: str, case_sensitive: bool = False) -> bool:
         """Check if any of the artifacts have a vulnerability with a description
@@ -288,14 +545,13 @@ class ArtifactReport(BaseModel):
         bool
             True if any of the artifacts has the given package, False otherwise.
         """
-        return any(
-            a.has_package(
+        return bool(
+            self.index.artifacts_with_package(
                 package,
                 case_sensitive=case_sensitive,
                 min_version=min_version,
                 max_version=max_version,
             )
-            for a in self.artifacts
         )
 
     def with_package(
@@ -326,16 +582,12 @@ class ArtifactReport(BaseModel):
             the given package.
         """
         return ArtifactReport.from_artifacts(
-            [
-                a
-                for a in self.artifacts
-                if a.has_package(
-                    package,
-                    case_sensitive,
-                    min_version=min_version,
-                    max_version=max_version,
-                )
-            ],
+            self.index.artifacts_with_package(
+                package,
+                case_sensitive=case_sensitive,
+                min_version=min_version,
+                max_version=max_version,
+            )
         )
 
     def has_severity(self, severity: Severity) -> bool:
@@ -450,7 +702,7 @@ class ArtifactReport(BaseModel):
         bool
             True if any of the artifacts has the given tag, False otherwise.
         """
-        return any(a.has_tag(tag) for a in self.artifacts)
+        return bool(self._get_index(vulnerabilities=False).artifacts_with_tag(tag))
 
     def with_tag(self, tag: str) -> "ArtifactReport":
         """Return a new report with all artifacts having the given tag.
@@ -466,7 +718,7 @@ class ArtifactReport(BaseModel):
             A new ArtifactReport where all artifacts have the given tag.
         """
         return ArtifactReport.from_artifacts(
-            [a for a in self.artifacts if a.has_tag(tag)]
+            self._get_index(vulnerabilities=False).artifacts_with_tag(tag)
         )
 
 
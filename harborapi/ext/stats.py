@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import math
 import statistics
+from bisect import bisect_right
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Optional
 
 from ..log import logger
 
 __all__ = [
+    "StatsAccumulator",
     "mean",
     "median",
     "stdev",
@@ -59,3 +65,230 @@ def _do_stats_math(
         logger.error("%s(%s) failed. Defaulting to %s", func.__name__, repr(a), default)
         return float(default)
     return float(res)
+
+
+class StatsAccumulator:
+    """Single-pass accumulator of summary statistics for a stream of values.
+
+    Tracks the count, mean and variance (using Welford's algorithm), minimum
+    and maximum of the values, as well as the number of occurrences of each
+    distinct value, from which the median, other quantiles and histograms
+    are computed. Values are consumed one at a time, so they can be read
+    from a generator without building a list.
+
+    CVSS scores have at most 101 distinct values (0.0 to 10.0 with one
+    decimal), so memory use does not grow with the number of scores.
+    For other values, pass `precision` to bound the number of distinct values.
+
+    Accumulators of separate chunks of values can be combined with
+    [`merge()`][harborapi.ext.stats.StatsAccumulator.merge], e.g. to compute
+    statistics for a large number of artifacts in parallel.
+
+    Parameters
+    ----------
+    values : Iterable[float]
+        The values to add.
+    precision : Optional[int]
+        Round values to this many decimals when counting them for quantiles
+        and histograms. The mean, variance, minimum and maximum always use
+        the exact values. By default, values are not rounded.
+
+    Examples
+    --------
+    ```py
+    >>> acc = StatsAccumulator([5.0, 7.5, 9.8])
+    >>> acc.update([3.1])
+    >>> acc.median
+    6.25
+    >>> acc.merge(StatsAccumulator([10.0])).max
+    10.0
+    ```
+    """
+
+    def __init__(
+        self, values: Iterable[float] = (), precision: Optional[int] = None
+    ) -> None:
+        self.precision = precision
+        self.count = 0
+        """The number of values."""
+        self.counts: Dict[float, int] = {}
+        """The number of occurrences of each distinct (rounded) value."""
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared differences from the mean
+        self._min = math.inf
+        self._max = -math.inf
+        self._cumulative: Optional[List[int]] = None
+        self._sorted: List[float] = []
+        self.update(values)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add values to the accumulator.
+
+        Parameters
+        ----------
+        values : Iterable[float]
+            The values to add.
+        """
+        count, mean, m2 = self.count, self._mean, self._m2
+        low, high = self._min, self._max
+        counts = self.counts
+        precision = self.precision
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+            if precision is not None:
+                value = round(value, precision)
+            counts[value] = counts.get(value, 0) + 1
+        if count != self.count:
+            self.count, self._mean, self._m2 = count, mean, m2
+            self._min, self._max = low, high
+            self._cumulative = None
+
+    def merge(self, other: StatsAccumulator) -> StatsAccumulator:
+        """Combine the statistics of two accumulators into a new one,
+        as if all their values had been added to a single accumulator.
+
+        Parameters
+        ----------
+        other : StatsAccumulator
+            The accumulator to merge with this one.
+
+        Returns
+        -------
+        StatsAccumulator
+            A new accumulator with the values of both accumulators.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators round values with different precisions.
+        """
+        if self.precision != other.precision:
+            raise ValueError(
+                f"Cannot merge accumulators with different precisions: {self.precision} and {other.precision}"
+            )
+        merged = StatsAccumulator(precision=self.precision)
+        count = self.count + other.count
+        if not count:
+            return merged
+        delta = other._mean - self._mean
+        merged.count = count
+        merged._mean = self._mean + delta * other.count / count
+        merged._m2 = self._m2 + other._m2 + delta**2 * self.count * other.count / count
+        merged._min = _min(self._min, other._min)
+        merged._max = _max(self._max, other._max)
+        merged.counts = dict(self.counts)
+        for value, n in other.counts.items():
+            merged.counts[value] = merged.counts.get(value, 0) + n
+        return merged
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values, or 0.0 if there are none."""
+        return self._mean if self.count else DEFAULT_VALUE
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the values, or 0.0 if there are fewer than 2."""
+        if self.count < 2:
+            return DEFAULT_VALUE
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        """The sample standard deviation of the values, or 0.0 if there are fewer than 2."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """The smallest value, or 0.0 if there are none."""
+        return self._min if self.count else DEFAULT_VALUE
+
+    @property
+    def max(self) -> float:
+        """The largest value, or 0.0 if there are none."""
+        return self._max if self.count else DEFAULT_VALUE
+
+    @property
+    def median(self) -> float:
+        """The median of the values, or 0.0 if there are none."""
+        return self.quantile(0.5)
+
+    def quantile(self, q: float) -> float:
+        """Get a quantile of the values.
+
+        Interpolates linearly between the two closest values, the same
+        way as `numpy.quantile()`. Exact unless values are rounded with
+        `precision`.
+
+        Parameters
+        ----------
+        q : float
+            The quantile to get, between 0 and 1, e.g. 0.9 for the 90th percentile.
+
+        Returns
+        -------
+        float
+            The quantile, or 0.0 if there are no values.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if not self.count:
+            return DEFAULT_VALUE
+        position = (self.count - 1) * q
+        rank = int(position)
+        fraction = position - rank
+        below = self._value_at(rank)
+        if not fraction:
+            return below
+        above = self._value_at(rank + 1)
+        return below + (above - below) * fraction
+
+    def histogram(
+        self, bins: int = 10, low: float = 0.0, high: float = 10.0
+    ) -> List[int]:
+        """Get the number of values in equal-width bins between `low` and `high`.
+
+        Each bin includes its lower edge, and the last bin also includes `high`.
+        Values outside the range are not counted. The default bins
+        are 0.0-1.0, 1.0-2.0, ..., 9.0-10.0, for CVSS scores.
+
+        Parameters
+        ----------
+        bins : int
+            The number of bins.
+        low : float
+            The lower edge of the first bin.
+        high : float
+            The upper edge of the last bin.
+
+        Returns
+        -------
+        List[int]
+            The number of values in each bin.
+        """
+        if bins < 1 or high <= low:
+            raise ValueError("Histogram must have at least one bin and high > low.")
+        width = (high - low) / bins
+        histogram = [0] * bins
+        for value, n in self.counts.items():
+            if low <= value <= high:
+                histogram[_min(int((value - low) / width), bins - 1)] += n
+        return histogram
+
+    def _value_at(self, rank: int) -> float:
+        """Get the value at a (0-based) rank in the sorted values."""
+        if self._cumulative is None:
+            self._sorted = sorted(self.counts)
+            self._cumulative = []
+            total = 0
+            for value in self._sorted:
+                total += self.counts[value]
+                self._cumulative.append(total)
+        return self._sorted[bisect_right(self._cumulative, rank)]
@@ -0,0 +1,553 @@
+"""Columnar representation of the vulnerabilities of an `ArtifactReport`.
+
+A `VulnerabilityTable` stores one row per vulnerability, with the
+attributes used for filtering and aggregating vulnerabilities (severity,
+CVSS scores, package, fix status and artifact) stored in columns.
+Queries are answered with masks and reductions over the columns instead
+of looping over every artifact and vulnerability.
+
+The columns are NumPy arrays if NumPy is installed, otherwise
+[`array.array`][array.array]s.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from ..models.scanner import DEFAULT_VENDORS
+from ..models.scanner import SEVERITY_PRIORITY
+from ..models.scanner import Severity
+from ..models.scanner import VulnerabilityItem
+from .artifact import ArtifactInfo
+from .cve import CVSSData
+from .regex import get_pattern
+from .report import ArtifactReport
+from .report import Vulnerability
+from .stats import StatsAccumulator
+
+# fmt: off
+try:
+    import numpy as np
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+try:
+    import pandas as pd
+    pandas_installed = True
+except ImportError:
+    pandas_installed = False
+# fmt: on
+
+__all__ = ["VulnerabilityTable"]
+
+Column = Any
+"""A NumPy array, or an `array.array` if NumPy is not installed."""
+Mask = Any
+"""A boolean column selecting rows of a table."""
+
+# Severities ordered by their severity code
+SEVERITIES: Tuple[Severity, ...] = tuple(
+    sorted(SEVERITY_PRIORITY, key=SEVERITY_PRIORITY.__getitem__)
+)
+NO_SEVERITY = -1
+"""Severity code of vulnerabilities without a severity."""
+
+
+class VulnerabilityTable:
+    """Columnar table of the vulnerabilities of a group of artifacts.
+
+    Each row is a vulnerability. Strings (vulnerability IDs and package names)
+    are stored as codes indexing into the `ids` and `packages` lists.
+
+    Use [`ArtifactReport.table`][harborapi.ext.report.ArtifactReport.table]
+    to get the table of a report, which is only built once per report.
+
+    Examples
+    --------
+    >>> table = report.table  # doctest: +SKIP
+    >>> table.distribution(table.mask(fixable=True))  # doctest: +SKIP
+    Counter({<Severity.high: 'High'>: 12, <Severity.critical: 'Critical'>: 3})
+    >>> table.cvss_stats(table.mask(package="openssl")).max  # doctest: +SKIP
+    9.8
+    """
+
+    artifacts: List[ArtifactInfo]
+    """The artifacts of the table. Indexed by the `artifact` column."""
+    vulnerabilities: List[VulnerabilityItem]
+    """The vulnerability of each row."""
+    ids: List[str]
+    """Vulnerability IDs. Indexed by the `id` column."""
+    packages: List[str]
+    """Package names. Indexed by the `package` column."""
+    vendors: Tuple[str, ...]
+    """The vendors in `vendor_cvss`."""
+
+    artifact: Column
+    """Index of the artifact of each row in `artifacts`."""
+    id: Column
+    """Index of the vulnerability ID of each row in `ids`."""
+    package: Column
+    """Index of the package name of each row in `packages`."""
+    severity: Column
+    """Severity code of each row. Codes are ordered by severity,
+    and -1 means that the vulnerability has no severity."""
+    fixable: Column
+    """Whether each row has a fix version."""
+    cvss: Column
+    """CVSS v3 score of each row, as used by
+    [`HarborVulnerabilityReport.cvss_scores`][harborapi.models.scanner.HarborVulnerabilityReport.cvss_scores].
+    0.0 if the vulnerability has no score."""
+    vendor_cvss: Dict[str, Column]
+    """CVSS v3 score of each row according to each vendor. NaN if the vendor
+    has not scored the vulnerability."""
+
+    def __init__(
+        self,
+        artifacts: List[ArtifactInfo],
+        vulnerabilities: List[VulnerabilityItem],
+        ids: List[str],
+        packages: List[str],
+        columns: Dict[str, Column],
+        vendor_cvss: Dict[str, Column],
+    ) -> None:
+        self.artifacts = artifacts
+        self.vulnerabilities = vulnerabilities
+        self.ids = ids
+        self.packages = packages
+        self.artifact = columns["artifact"]
+        self.id = columns["id"]
+        self.package = columns["package"]
+        self.severity = columns["severity"]
+        self.fixable = columns["fixable"]
+        self.cvss = columns["cvss"]
+        self.vendor_cvss = vendor_cvss
+        self.vendors = tuple(vendor_cvss)
+        self._id_codes = {s: i for i, s in enumerate(ids)}
+        self._package_codes = {s: i for i, s in enumerate(packages)}
+
+    @classmethod
+    def from_artifacts(
+        cls,
+        artifacts: Iterable[ArtifactInfo],
+        vendors: Sequence[str] = DEFAULT_VENDORS,
+    ) -> VulnerabilityTable:
+        """Build a table from the vulnerabilities of the given artifacts.
+
+        Parameters
+        ----------
+        artifacts : Iterable[ArtifactInfo]
+            The artifacts to build the table from.
+        vendors : Sequence[str]
+            Vendors to store CVSS scores for in `vendor_cvss`,
+            by default `("nvd", "redhat")`.
+
+        Returns
+        -------
+        VulnerabilityTable
+            The table.
+        """
+        artifacts = list(artifacts)
+        vulnerabilities: List[VulnerabilityItem] = []
+        ids: Dict[str, int] = {}
+        packages: Dict[str, int] = {}
+        # Build the columns with array.array, whose buffers can be shared
+        # with NumPy arrays without copying.
+        columns: Dict[str, "array[Any]"] = {
+            "artifact": array("q"),
+            "id": array("i"),
+            "package": array("i"),
+            "severity": array("b"),
+            "fixable": array("b"),
+            "cvss": array("d"),
+        }
+        vendor_cvss = {vendor: array("d") for vendor in vendors}
+        # Bind methods outside of the loop, since it runs for each vulnerability
+        append_artifact = columns["artifact"].append
+        append_id = columns["id"].append
+        append_package = columns["package"].append
+        append_severity = columns["severity"].append
+        append_fixable = columns["fixable"].append
+        append_cvss = columns["cvss"].append
+        get_severity = SEVERITY_PRIORITY.get
+        for index, artifact in enumerate(artifacts):
+            scanner = artifact.report.scanner
+            for vuln in artifact.report.vulnerabilities:
+                vulnerabilities.append(vuln)
+                append_artifact(index)
+                append_id(ids.setdefault(vuln.id or "", len(ids)))
+                append_package(packages.setdefault(vuln.package or "", len(packages)))
+                append_severity(get_severity(vuln.severity, NO_SEVERITY))
+                append_fixable(bool(vuln.fix_version))
+                append_cvss(vuln.get_cvss_score(scanner))
+                for vendor, column in vendor_cvss.items():
+                    column.append(
+                        vuln.get_cvss_score(
+                            scanner, vendor_priority=[vendor], default=math.nan
+                        )
+                    )
+        return cls(
+            artifacts=artifacts,
+            vulnerabilities=vulnerabilities,
+            ids=list(ids),
+            packages=list(packages),
+            columns={
+                name: _to_column(column, "?" if name == "fixable" else None)
+                for name, column in columns.items()
+            },
+            vendor_cvss={
+                vendor: _to_column(column) for vendor, column in vendor_cvss.items()
+            },
+        )
+
+    @classmethod
+    def from_report(
+        cls, report: ArtifactReport, vendors: Sequence[str] = DEFAULT_VENDORS
+    ) -> VulnerabilityTable:
+        """Build a table from the vulnerabilities of an `ArtifactReport`.
+
+        See [`from_artifacts`][harborapi.ext.table.VulnerabilityTable.from_artifacts].
+        """
+        return cls.from_artifacts(report.artifacts, vendors=vendors)
+
+    def __len__(self) -> int:
+        return len(self.vulnerabilities)
+
+    def mask(
+        self,
+        severity: Optional[Severity] = None,
+        min_severity: Optional[Severity] = None,
+        fixable: Optional[bool] = None,
+        package: Optional[str] = None,
+        cve: Optional[str] = None,
+        min_cvss: Optional[float] = None,
+        case_sensitive: bool = False,
+    ) -> Mask:
+        """Get a mask of the rows matching all of the given criteria.
+
+        Parameters
+        ----------
+        severity : Optional[Severity]
+            Select vulnerabilities with this severity.
+        min_severity : Optional[Severity]
+            Select vulnerabilities with this severity or higher.
+        fixable : Optional[bool]
+            Select fixable (`True`) or unfixable (`False`) vulnerabilities.
+        package : Optional[str]
+            Select vulnerabilities affecting packages whose name matches
+            this regular expression.
+        cve : Optional[str]
+            Select vulnerabilities with this ID, e.g. CVE-2019-1234.
+        min_cvss : Optional[float]
+            Select vulnerabilities with a CVSS score of at least this value.
+        case_sensitive : bool
+            Case sensitive package name matching, by default False.
+
+        Returns
+        -------
+        Mask
+            A boolean column selecting the matching rows.
+            All rows are selected if no criteria are given.
+        """
+        masks = []
+        if severity is not None:
+            masks.append(_compare(self.severity, SEVERITY_PRIORITY[severity]))
+        if min_severity is not None:
+            masks.append(
+                _compare(self.severity, SEVERITY_PRIORITY[min_severity], operator.ge)
+            )
+        if fixable is not None:
+            masks.append(_compare(self.fixable, fixable))
+        if package is not None:
+            pattern = get_pattern(package, case_sensitive)
+            codes = [
+                code
+                for name, code in self._package_codes.items()
+                if pattern.match(name)
+            ]
+            masks.append(_isin(self.package, codes))
+        if cve is not None:
+            codes = [self._id_codes[cve]] if cve in self._id_codes else []
+            masks.append(_isin(self.id, codes))
+        if min_cvss is not None:
+            masks.append(_compare(self.cvss, min_cvss, operator.ge))
+        if not masks:
+            return _full(len(self), True)
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = _and(mask, other)
+        return mask
+
+    def count(self, mask: Optional[Mask] = None) -> int:
+        """Get the number of rows selected by a mask.
+
+        Parameters
+        ----------
+        mask : Optional[Mask]
+            The mask to count. Counts all rows if `None`.
+
+        Returns
+        -------
+        int
+            The number of selected rows.
+        """
+        if mask is None:
+            return len(self)
+        if numpy_installed:
+            return int(np.count_nonzero(mask))
+        return sum(mask)
+
+    def select(self, mask: Mask) -> VulnerabilityTable:
+        """Get a new table with the rows selected by a mask.
+
+        Parameters
+        ----------
+        mask : Mask
+            The mask, as returned by [`mask`][harborapi.ext.table.VulnerabilityTable.mask].
+
+        Returns
+        -------
+        VulnerabilityTable
+            A table with the selected rows. Shares its `artifacts`,
+            `ids` and `packages` with this table.
+        """
+        return VulnerabilityTable(
+            artifacts=self.artifacts,
+            vulnerabilities=list(compress(self.vulnerabilities, _tolist(mask))),
+            ids=self.ids,
+            packages=self.packages,
+            columns={
+                "artifact": _compress(self.artifact, mask),
+                "id": _compress(self.id, mask),
+                "package": _compress(self.package, mask),
+                "severity": _compress(self.severity, mask),
+                "fixable": _compress(self.fixable, mask),
+                "cvss": _compress(self.cvss, mask),
+            },
+            vendor_cvss={
+                vendor: _compress(column, mask)
+                for vendor, column in self.vendor_cvss.items()
+            },
+        )
+
+    def filter(self, **criteria: Any) -> VulnerabilityTable:
+        """Get a new table with the rows matching all of the given criteria.
+
+        Shorthand for `table.select(table.mask(**criteria))`.
+        See [`mask`][harborapi.ext.table.VulnerabilityTable.mask] for the criteria.
+        """
+        return self.select(self.mask(**criteria))
+
+    def distribution(self, mask: Optional[Mask] = None) -> "Counter[Severity]":
+        """Get the distribution of severities of the selected rows.
+
+        Parameters
+        ----------
+        mask : Optional[Mask]
+            The rows to include. Includes all rows if `None`.
+
+        Returns
+        -------
+        Counter[Severity]
+            A counter of the severities. Vulnerabilities without
+            a severity are not counted.
+        """
+        codes = self.severity if mask is None else _compress(self.severity, mask)
+        if numpy_installed:
+            counts = np.bincount(codes[codes >= 0], minlength=len(SEVERITIES))
+            return Counter(
+                {
+                    SEVERITIES[code]: int(count)
+                    for code, count in enumerate(counts)
+                    if count
+                }
+            )
+        return Counter(SEVERITIES[code] for code in codes if code >= 0)
+
+    def cvss_stats(
+        self, mask: Optional[Mask] = None, vendor: Optional[str] = None
+    ) -> CVSSData:
+        """Get key CVSS statistics of the selected rows.
+
+        Vulnerabilities without a CVSS score are not included, which makes
+        `table.cvss_stats()` equivalent to
+        [`ArtifactReport.cvss`][harborapi.ext.report.ArtifactReport.cvss].
+
+        Parameters
+        ----------
+        mask : Optional[Mask]
+            The rows to include. Includes all rows if `None`.
+        vendor : Optional[str]
+            Use the scores of this vendor instead of the `cvss` column.
+            Must be one of the vendors the table was built with.
+
+        Returns
+        -------
+        CVSSData
+            The CVSS statistics.
+        """
+        column = self.cvss if vendor is None else self.vendor_cvss[vendor]
+        if mask is not None:
+            column = _compress(column, mask)
+        if not numpy_installed:
+            return CVSSData.from_stats(
+                StatsAccumulator(s for s in column if s and not math.isnan(s))
+            )
+        scores = column[(column != 0) & ~np.isnan(column)]
+        if not len(scores):
+            return CVSSData(mean=0.0, median=0.0, stdev=0.0, min=0.0, max=0.0)
+        median, p90, p99 = np.quantile(scores, [0.5, 0.9, 0.99])
+        return CVSSData(
+            mean=float(scores.mean()),
+            median=float(median),
+            stdev=float(scores.std(ddof=1)) if len(scores) > 1 else 0.0,
+            min=float(scores.min()),
+            max=float(scores.max()),
+            p90=float(p90),
+            p99=float(p99),
+        )
+
+    def iter_vulnerabilities(
+        self, mask: Optional[Mask] = None
+    ) -> Iterator[Vulnerability]:
+        """Iterate over the selected vulnerabilities and their artifacts.
+
+        Parameters
+        ----------
+        mask : Optional[Mask]
+            The rows to include. Includes all rows if `None`.
+
+        Yields
+        ------
+        Vulnerability
+            A vulnerability with its artifact.
+        """
+        vulnerabilities: Iterable[VulnerabilityItem] = self.vulnerabilities
+        indices: Iterable[int] = _tolist(self.artifact)
+        if mask is not None:
+            mask = _tolist(mask)
+            vulnerabilities = compress(vulnerabilities, mask)
+            indices = compress(indices, mask)
+        for vuln, index in zip(vulnerabilities, indices):
+            yield Vulnerability(vuln, self.artifacts[index])
+
+    def to_report(self, mask: Optional[Mask] = None) -> ArtifactReport:
+        """Get a report with the artifacts that have at least one selected row.
+
+        Parameters
+        ----------
+        mask : Optional[Mask]
+            The rows to include. Includes all rows if `None`.
+
+        Returns
+        -------
+        ArtifactReport
+            A report with the artifacts, in their original order.
+        """
+        indices = self.artifact if mask is None else _compress(self.artifact, mask)
+        if numpy_installed:
+            selected = np.unique(indices).tolist()
+        else:
+            selected = sorted(set(indices))
+        return ArtifactReport.from_artifacts([self.artifacts[i] for i in selected])
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Export the table to a pandas DataFrame.
+
+        Numeric columns share their memory with the table. Vulnerability IDs,
+        package names and severities are exported as categorical columns,
+        and the repository name and digest of the artifact of each row
+        are not included (use the `artifact` column to look them up).
+
+        Requires NumPy and pandas.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with the columns `artifact`, `id`, `package`,
+            `severity`, `fixable`, `cvss` and `cvss_<vendor>` for each vendor.
+
+        Raises
+        ------
+        ImportError
+            Raised if NumPy or pandas is not installed.
+        """
+        if not numpy_installed or not pandas_installed:
+            raise ImportError("NumPy and pandas are required to export to a DataFrame")
+        data = {
+            "artifact": self.artifact,
+            "id": pd.Categorical.from_codes(self.id, categories=self.ids),
+            "package": pd.Categorical.from_codes(
+                self.package, categories=self.packages
+            ),
+            "severity": pd.Categorical.from_codes(
+                self.severity,
+                categories=[s.value for s in SEVERITIES],
+                ordered=True,
+            ),
+            "fixable": self.fixable,
+            "cvss": self.cvss,
+        }
+        for vendor, column in self.vendor_cvss.items():
+            data[f"cvss_{vendor}"] = column
+        return pd.DataFrame(data, copy=False)
+
+
+def _to_column(values: "array[Any]", dtype: Optional[str] = None) -> Column:
+    """Convert an array.array to a column, sharing its buffer if possible."""
+    if not numpy_installed:
+        return values
+    np_dtype = np.dtype(dtype or values.typecode)
+    if not len(values):
+        return np.empty(0, dtype=np_dtype)
+    return np.frombuffer(values, dtype=np_dtype)
+
+
+def _tolist(column: Column) -> List[Any]:
+    """Convert a column to a list of Python objects for iteration."""
+    if numpy_installed:
+        return column.tolist()  # type: ignore[no-any-return]
+    return column  # type: ignore[no-any-return]
+
+
+def _full(size: int, value: bool) -> Mask:
+    if numpy_installed:
+        return np.full(size, value)
+    return array("b", [value]) * size
+
+
+def _compare(column: Column, value: Any, op: Any = operator.eq) -> Mask:
+    if numpy_installed:
+        return op(column, value)
+    return array("b", [op(v, value) for v in column])
+
+
+def _isin(column: Column, values: List[int]) -> Mask:
+    if numpy_installed:
+        return np.isin(column, values)
+    lookup = set(values)
+    return array("b", [v in lookup for v in column])
+
+
+def _and(a: Mask, b: Mask) -> Mask:
+    if numpy_installed:
+        return a & b
+    return array("b", map(operator.and_, a, b))
+
+
+def _compress(column: Column, mask: Mask) -> Column:
+    if numpy_installed:
+        return column[mask]
+    return array(column.typecode, compress(column, mask))
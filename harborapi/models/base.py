@@ -36,6 +36,7 @@ except ImportError:
 
 
 BaseModelType = TypeVar("BaseModelType", bound="BaseModel")
+PydanticModelType = TypeVar("PydanticModelType", bound=PydanticBaseModel)
 
 
 DEPTH_TITLE_COLORS = {
@@ -88,6 +89,34 @@ class StrRootModel(RootModel[str]):
         return str(self.root)
 
 
+def without_private(model: PydanticModelType, *names: str) -> PydanticModelType:
+    """Get a shallow copy of a model with the given private attributes
+    reset to `None`.
+
+    Used to leave private attributes that cache state derived from the
+    fields of a model, such as indexes, out of equality comparisons
+    and pickling.
+
+    Parameters
+    ----------
+    model : PydanticModelType
+        The model to copy.
+    *names : str
+        The names of the private attributes to reset.
+
+    Returns
+    -------
+    PydanticModelType
+        The copy of the model.
+    """
+    copy = model.model_copy()
+    private = copy.__pydantic_private__
+    if private:
+        for name in names:
+            private[name] = None
+    return copy
+
+
 class BaseModel(PydanticBaseModel):
     model_config = ConfigDict(extra="allow", validate_assignment=True, strict=False)
 
@@ -0,0 +1,294 @@
+"""Construction of nested models from trusted data without validation.
+
+`BaseModel.model_construct` only constructs the top-level model, leaving
+nested models, lists of models and enums as raw JSON values. The functions
+in this module build the entire model tree instead, using a construction
+plan that is computed once per model class.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import copy
+import functools
+import inspect
+import sys
+import types
+import typing
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Hashable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import cast
+
+from pydantic import BaseModel
+from typing_extensions import Annotated
+from typing_extensions import get_args
+from typing_extensions import get_origin
+
+T = TypeVar("T", bound=BaseModel)
+
+Builder = Callable[[Any], Any]
+"""Function that builds a value of a specific type from a JSON value."""
+
+_NO_ARGS: Tuple[Any, ...] = ()
+# Default values of these types can be shared between instances
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), Enum, tuple, frozenset)
+_REQUIRED = object()
+
+
+class _FieldPlan(NamedTuple):
+    name: str
+    """Name of the field."""
+    key: str
+    """Key of the field in the input data (its alias, if any)."""
+    builder: Optional[Builder]
+    """Function that builds the value of the field, `None` if used as-is."""
+    default: Any
+    """Default value of the field, `_REQUIRED` if it has none."""
+    default_factory: Optional[Callable[[], Any]]
+    """Function that creates the default value of the field, if any."""
+
+
+class ConstructPlan(NamedTuple):
+    """How to construct a model class from a dict."""
+
+    fields: Tuple[_FieldPlan, ...]
+    keys: FrozenSet[str]
+    """Keys in the input data that map to fields."""
+    extra: bool
+    """Whether to store unknown keys as extra fields."""
+    simple: bool
+    """Whether the model can be instantiated without `model_construct`."""
+    private: Tuple[Tuple[str, Any], ...]
+    """Private attributes of the model and their `ModelPrivateAttr`."""
+
+
+def construct(cls: Type[T], data: Any) -> T:
+    """Construct a model and all its nested models from trusted data
+    without validating it.
+
+    Nested models, lists and dicts of models, and enums are constructed
+    from their JSON values according to the field types of the model.
+    Other values, such as datetimes, are stored as-is, like `model_construct`
+    does, as are values that do not have the expected shape.
+    Validators are not run.
+
+    Parameters
+    ----------
+    cls : Type[T]
+        The model class to construct.
+    data : Any
+        The data to construct the model from, typically a dict
+        decoded from JSON.
+
+    Returns
+    -------
+    T
+        The constructed model.
+    """
+    if cls.__pydantic_root_model__:
+        builder = _root_builder(cls)
+        root = data if builder is None or data is None else builder(data)
+        # Root models have no extra or private attributes to initialize
+        m = cls.__new__(cls)
+        object.__setattr__(m, "__dict__", {"root": root})
+        object.__setattr__(m, "__pydantic_fields_set__", {"root"})
+        return m
+    if not isinstance(data, dict):
+        return cls.model_construct(**data)
+
+    plan = get_plan(cls)
+    if not plan.simple:
+        converted = dict(data)
+        for field in plan.fields:
+            if field.builder is not None and data.get(field.key) is not None:
+                converted[field.key] = field.builder(data[field.key])
+        return cls.model_construct(**converted)
+
+    values: Dict[str, Any] = {}
+    fields_set = set()
+    for name, key, builder, default, default_factory in plan.fields:
+        value = data.get(key, _REQUIRED)
+        if value is not _REQUIRED:
+            if builder is not None and value is not None:
+                value = builder(value)
+            values[name] = value
+            fields_set.add(name)
+        elif default_factory is not None:
+            values[name] = default_factory()
+        elif default is not _REQUIRED:
+            values[name] = default
+
+    extra: Optional[Dict[str, Any]] = None
+    if plan.extra:
+        if len(fields_set) < len(data):
+            extra = {k: v for k, v in data.items() if k not in plan.keys}
+        else:
+            extra = {}
+
+    # Equivalent to `model_construct`, minus looking up the fields
+    m = cls.__new__(cls)
+    object.__setattr__(m, "__dict__", values)
+    object.__setattr__(m, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(m, "__pydantic_extra__", extra)
+    private = None
+    if plan.private:
+        private = {name: attr.get_default() for name, attr in plan.private}
+    object.__setattr__(m, "__pydantic_private__", private)
+    return m
+
+
+@functools.lru_cache(maxsize=None)
+def get_plan(cls: Type[BaseModel]) -> ConstructPlan:
+    """Get the construction plan for a model class.
+
+    The plan is computed the first time a class is constructed,
+    and is reused for subsequent constructions.
+    """
+    fields = []
+    private = tuple(cls.__private_attributes__.items())
+    # Pydantic sets `model_post_init` to a function that only initializes
+    # the private attributes if the model doesn't define its own
+    post_init = getattr(cls.model_post_init, "__name__", None)
+    simple = not cls.__pydantic_post_init__ or post_init == "init_private_attributes"
+    for name, info in cls.model_fields.items():
+        key = info.alias or name
+        if info.validation_alias is not None:
+            if isinstance(info.validation_alias, str):
+                key = info.validation_alias
+            else:
+                # Leave AliasPath and AliasChoices to model_construct
+                simple = False
+        builder = get_builder(cast(Hashable, info.annotation))
+        default = _REQUIRED if info.is_required() else info.default
+        default_factory = cast(Optional[Callable[[], Any]], info.default_factory)
+        if default_factory is None and not isinstance(default, _IMMUTABLE_TYPES):
+            # Mutable defaults are copied, as Pydantic does
+            default_factory = functools.partial(copy.deepcopy, default)
+        fields.append(_FieldPlan(name, key, builder, default, default_factory))
+    return ConstructPlan(
+        fields=tuple(fields),
+        keys=frozenset(field.key for field in fields),
+        extra=cls.model_config.get("extra") == "allow",
+        simple=simple,
+        private=private,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_builder(tp: Any) -> Optional[Builder]:
+    """Get the function that builds a value of type `tp` from a JSON value.
+
+    Returns `None` if JSON values of the type can be used as-is.
+    """
+    origin = get_origin(tp)
+    args = get_args(tp) or _NO_ARGS
+
+    if origin in _UNION_ORIGINS:
+        return _union_builder(args)
+    if origin in _SEQUENCE_ORIGINS:
+        item_builder = get_builder(args[0]) if args else None
+        if item_builder is None:
+            return None
+        return functools.partial(_build_list, item_builder)
+    if origin in _MAPPING_ORIGINS:
+        value_builder = get_builder(args[1]) if len(args) == 2 else None
+        if value_builder is None:
+            return None
+        return functools.partial(_build_dict, value_builder)
+    if origin is Annotated:
+        return get_builder(args[0])
+
+    if inspect.isclass(tp):
+        if issubclass(tp, BaseModel):
+            return functools.partial(_build_model, tp)
+        if issubclass(tp, Enum):
+            return functools.partial(_build_enum, tp)
+    # Other types (datetimes, URLs, tuples, etc.) keep their JSON values
+    return None
+
+
+_SEQUENCE_ORIGINS = (list, collections.abc.Sequence, collections.abc.MutableSequence)
+_UNION_ORIGINS: Tuple[Any, ...] = (typing.Union,)
+if sys.version_info >= (3, 10):
+    _UNION_ORIGINS += (types.UnionType,)
+_MAPPING_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def _shape(tp: Any) -> Optional[type]:
+    """Get the JSON type of values of the given type, if it is a container."""
+    origin = get_origin(tp) or tp
+    if inspect.isclass(origin):
+        if issubclass(origin, BaseModel):
+            if origin.__pydantic_root_model__:
+                return _shape(_root_annotation(origin))
+            return dict
+        if issubclass(origin, dict):
+            return dict
+        if issubclass(origin, list):
+            return list
+    return None
+
+
+def _root_annotation(cls: Type[BaseModel]) -> Hashable:
+    return cast(Hashable, cls.model_fields["root"].annotation)
+
+
+@functools.lru_cache(maxsize=None)
+def _root_builder(cls: Type[BaseModel]) -> Optional[Builder]:
+    return get_builder(_root_annotation(cls))
+
+
+def _union_builder(args: Tuple[Any, ...]) -> Optional[Builder]:
+    options: List[Tuple[Optional[type], Optional[Builder]]] = [
+        (_shape(arg), get_builder(arg)) for arg in args if arg is not type(None)
+    ]
+    if all(builder is None for _, builder in options):
+        return None
+    if len(options) == 1:
+        return options[0][1]
+    return functools.partial(_build_union, tuple(options))
+
+
+def _build_union(
+    options: Tuple[Tuple[Optional[type], Optional[Builder]], ...], value: Any
+) -> Any:
+    # Use the first type whose JSON type matches the value
+    for shape, builder in options:
+        if shape is None or isinstance(value, shape):
+            return value if builder is None else builder(value)
+    return value
+
+
+def _build_model(cls: Type[BaseModel], value: Any) -> Any:
+    if isinstance(value, dict) or cls.__pydantic_root_model__:
+        return construct(cls, value)
+    return value
+
+
+def _build_list(item_builder: Builder, value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [item if item is None else item_builder(item) for item in value]
+
+
+def _build_dict(value_builder: Builder, value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return {k: v if v is None else value_builder(v) for k, v in value.items()}
+
+
+def _build_enum(enum: Type[Enum], value: Any) -> Any:
+    try:
+        return enum(value)
+    except ValueError:
+        return value
@@ -0,0 +1,197 @@
+"""De-duplication of identical vulnerabilities and values across reports.
+
+Artifacts built from the same base images share most of their
+vulnerabilities, so a fleet of vulnerability reports contains the same
+CVE IDs, package names, descriptions, links and vendor attributes many
+times over. An `InternPool` replaces the duplicates with a single shared
+(canonical) object, so that each distinct value is only stored once.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import cast
+
+from pydantic import BaseModel
+
+from .scanner import HarborVulnerabilityReport
+from .scanner import VulnerabilityItem
+
+
+class InternPool:
+    """Pool of canonical vulnerabilities, strings and values that are
+    shared between vulnerability reports.
+
+    Identical vulnerabilities (same ID, package, version, description,
+    links, etc.) are replaced by the first instance seen by the pool.
+    The strings and sub-objects (lists, dicts and models such as
+    `CVSSDetails`) of vulnerabilities that are not identical are
+    de-duplicated individually.
+
+    Warning
+    -------
+    Interned objects are shared between reports, and must be treated
+    as immutable. Modifying an interned vulnerability (or one of its lists
+    or dicts) modifies it in every report that contains it.
+
+    Examples
+    --------
+    >>> pool = InternPool()
+    >>> client = HarborAsyncClient(..., intern_pool=pool)  # doctest: +SKIP
+    >>> # or intern reports manually
+    >>> report = pool.intern_report(report)  # doctest: +SKIP
+    """
+
+    def __init__(self) -> None:
+        self._strings: Dict[str, str] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._vulnerabilities: Dict[Hashable, VulnerabilityItem] = {}
+        self.hits = 0
+        """Number of vulnerabilities replaced by a canonical vulnerability."""
+        self.misses = 0
+        """Number of vulnerabilities added to the pool."""
+
+    def __len__(self) -> int:
+        """The number of distinct vulnerabilities in the pool."""
+        return len(self._vulnerabilities)
+
+    def clear(self) -> None:
+        """Remove all objects from the pool.
+
+        Reports that have already been interned keep sharing their objects.
+        """
+        self._strings.clear()
+        self._values.clear()
+        self._vulnerabilities.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def intern_report(
+        self, report: HarborVulnerabilityReport
+    ) -> HarborVulnerabilityReport:
+        """De-duplicate the vulnerabilities and values of a report in place.
+
+        Parameters
+        ----------
+        report : HarborVulnerabilityReport
+            The report to intern.
+
+        Returns
+        -------
+        HarborVulnerabilityReport
+            The same report, for convenience.
+        """
+        # Modify the model's __dict__ directly to skip validating assignments
+        fields = report.__dict__
+        for name, value in fields.items():
+            if name != "vulnerabilities":
+                fields[name] = self.intern_value(value)
+        vulnerabilities = report.vulnerabilities
+        for i, vulnerability in enumerate(vulnerabilities):
+            vulnerabilities[i] = self.intern_vulnerability(vulnerability)
+        # Drop aggregates referring to the replaced vulnerabilities
+        report.reindex()
+        return report
+
+    def intern_vulnerability(
+        self, vulnerability: VulnerabilityItem
+    ) -> VulnerabilityItem:
+        """Get the canonical instance of a vulnerability.
+
+        Parameters
+        ----------
+        vulnerability : VulnerabilityItem
+            The vulnerability to intern.
+
+        Returns
+        -------
+        VulnerabilityItem
+            The canonical vulnerability if an identical one has been
+            interned before, otherwise `vulnerability` itself, whose values
+            have been interned in place.
+        """
+        key = _freeze(vulnerability)
+        if key is None:  # unhashable values
+            self._intern_fields(vulnerability)
+            return vulnerability
+        canonical = self._vulnerabilities.get(key)
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        self.misses += 1
+        self._intern_fields(vulnerability)
+        # Re-create the key from the interned values, so that the key
+        # does not keep the original values alive
+        self._vulnerabilities[_freeze_value(vulnerability)] = vulnerability
+        return vulnerability
+
+    def intern_str(self, s: str) -> str:
+        """Get the canonical instance of a string."""
+        return self._strings.setdefault(s, s)
+
+    def intern_value(self, value: Any) -> Any:
+        """Get the canonical instance of a value.
+
+        Strings are interned, and lists, dicts and models are interned
+        recursively and replaced by an identical canonical instance if one
+        exists. Other values are returned as-is.
+        """
+        if isinstance(value, str):
+            return self.intern_str(value)
+        if isinstance(value, list):
+            value[:] = [self.intern_value(item) for item in value]
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                value[k] = self.intern_value(v)
+        elif isinstance(value, BaseModel):
+            self._intern_fields(value)
+        else:
+            return value
+        key = _freeze(value)
+        if key is None:
+            return value
+        return self._values.setdefault(key, value)
+
+    def _intern_fields(self, model: BaseModel) -> None:
+        fields = model.__dict__
+        for name, value in fields.items():
+            fields[name] = self.intern_value(value)
+        if model.__pydantic_extra__:
+            extra = model.__pydantic_extra__
+            for name, value in extra.items():
+                extra[name] = self.intern_value(value)
+
+
+def _freeze(value: Any) -> Optional[Hashable]:
+    """Get a hashable key that identifies a value by its contents,
+    or `None` if the value cannot be hashed."""
+    try:
+        key = _freeze_value(value)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze_value(value: Any) -> Hashable:
+    cls = type(value)
+    if cls is str or value is None:
+        return cast(Optional[str], value)
+    if cls is list:
+        return (list, tuple(map(_freeze_value, value)))
+    if cls is dict:
+        return (dict, tuple([(k, _freeze_value(v)) for k, v in value.items()]))
+    if isinstance(value, BaseModel):
+        # Models of different types with the same fields are not identical
+        extra = value.__pydantic_extra__
+        return (
+            cls,
+            _freeze_value(value.__dict__),
+            _freeze_value(extra) if extra else None,
+            frozenset(value.__pydantic_fields_set__),
+        )
+    # Distinguish values that compare equal, such as 1, 1.0 and True
+    return (cls, value)
@@ -0,0 +1,168 @@
+"""Lists of models that are constructed from their JSON values on demand.
+
+Used by the client in lazy mode (`HarborAsyncClient(..., lazy=True)`)
+to defer validating the items of large list responses until they are
+accessed.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import SupportsIndex
+from typing import TypeVar
+from typing import Union
+from typing import overload
+
+T = TypeVar("T")
+
+
+class LazyList(List[T]):
+    """List that stores the JSON values of its items, and loads each item
+    the first time it is accessed.
+
+    The loaded item replaces the JSON value in the list, so each item
+    is only loaded once. Items whose values are dicts are considered
+    not yet loaded.
+
+    Indexing, iteration and `pop()` only load the accessed items.
+    Operations that need every item, such as comparisons, `sort()`,
+    `index()`, `count()`, `remove()`, `in`, `+` and `repr()`,
+    load the entire list first.
+
+    Errors raised by the loader (e.g. `pydantic.ValidationError`) are
+    raised when the offending item is accessed, and the item is left
+    unloaded.
+
+    Parameters
+    ----------
+    items : Iterable[Any]
+        The JSON values of the items.
+    loader : Callable[[Any], T]
+        Function that loads an item from its JSON value,
+        e.g. `Artifact.model_validate`.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), *, loader: Callable[[Any], T]):
+        super().__init__(items)
+        self.loader = loader
+
+    def _load(self, index: SupportsIndex) -> T:
+        item = super().__getitem__(index)
+        if type(item) is dict:
+            item = self.loader(item)
+            super().__setitem__(index, item)
+        return item
+
+    def materialize(self) -> LazyList[T]:
+        """Load all items that have not been loaded yet.
+
+        Returns
+        -------
+        LazyList[T]
+            The list itself.
+        """
+        for i in range(len(self)):
+            self._load(i)
+        return self
+
+    @property
+    def n_loaded(self) -> int:
+        """The number of items that have been loaded."""
+        return sum(type(item) is not dict for item in super().__iter__())
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyList[T]: ...
+
+    def __getitem__(self, index: Union[SupportsIndex, slice]) -> Union[T, LazyList[T]]:
+        if isinstance(index, slice):
+            return LazyList(super().__getitem__(index), loader=self.loader)
+        return self._load(index)
+
+    def __iter__(self) -> Iterator[T]:
+        # Index-based iteration picks up items appended while iterating,
+        # like list iteration does
+        i = 0
+        while i < len(self):
+            yield self._load(i)
+            i += 1
+
+    def __reversed__(self) -> Iterator[T]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self._load(i)
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        item = self._load(index)
+        super().pop(index)
+        return item
+
+    def copy(self) -> LazyList[T]:
+        return LazyList(super().__iter__(), loader=self.loader)
+
+    def index(
+        self, value: Any, start: SupportsIndex = 0, stop: SupportsIndex = sys.maxsize
+    ) -> int:
+        return super(LazyList, self.materialize()).index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        return super(LazyList, self.materialize()).count(value)
+
+    def remove(self, value: Any) -> None:
+        super(LazyList, self.materialize()).remove(value)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super(LazyList, self.materialize()).sort(*args, **kwargs)
+
+    def __contains__(self, value: object) -> bool:
+        return super(LazyList, self.materialize()).__contains__(value)
+
+    def __add__(self, other: List[Any]) -> List[Any]:
+        return super(LazyList, self.materialize()).__add__(_loaded(other))
+
+    def __radd__(self, other: List[Any]) -> List[Any]:
+        return list(other) + list(self)
+
+    def __mul__(self, n: SupportsIndex) -> List[T]:
+        return super(LazyList, self.materialize()).__mul__(n)
+
+    def __rmul__(self, n: SupportsIndex) -> List[T]:
+        return self.__mul__(n)
+
+    def __eq__(self, other: object) -> bool:
+        return super(LazyList, self.materialize()).__eq__(_loaded(other))
+
+    def __ne__(self, other: object) -> bool:
+        return super(LazyList, self.materialize()).__ne__(_loaded(other))
+
+    def __lt__(self, other: List[T]) -> bool:
+        return super(LazyList, self.materialize()).__lt__(_loaded(other))
+
+    def __le__(self, other: List[T]) -> bool:
+        return super(LazyList, self.materialize()).__le__(_loaded(other))
+
+    def __gt__(self, other: List[T]) -> bool:
+        return super(LazyList, self.materialize()).__gt__(_loaded(other))
+
+    def __ge__(self, other: List[T]) -> bool:
+        return super(LazyList, self.materialize()).__ge__(_loaded(other))
+
+    def __repr__(self) -> str:
+        return super(LazyList, self.materialize()).__repr__()
+
+    def __reduce__(self) -> Any:
+        # Pickle and copy as a regular list of loaded items
+        return (list, (list(self),))
+
+
+def _loaded(other: Any) -> Any:
+    """Load all items of `other` if it is a lazy list."""
+    if isinstance(other, LazyList):
+        return other.materialize()
+    return other
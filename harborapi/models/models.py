@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing
+from collections import Counter
 from enum import Enum
 from typing import Any
 from typing import Dict
@@ -282,6 +284,37 @@ class VulnerabilitySummary(BaseModel):
             raise ValueError("'summary' must be a dict")
         return {**values, **summary}
 
+    @property
+    def distribution(self) -> typing.Counter[Severity]:
+        """The number of vulnerabilities of each severity.
+
+        Returns
+        -------
+        Counter[Severity]
+            The number of vulnerabilities of each severity.
+            Severities without vulnerabilities are omitted.
+        """
+        if self.summary:
+            counts = self.summary
+        else:
+            counts = {
+                "Critical": self.critical,
+                "High": self.high,
+                "Medium": self.medium,
+                "Low": self.low,
+                "Unknown": self.unknown,
+            }
+        dist: typing.Counter[Severity] = Counter()
+        for name, count in counts.items():
+            try:
+                severity = Severity(name)
+            except ValueError:
+                logger.warning("Unknown severity in vulnerability summary: %s", name)
+                continue
+            if count:
+                dist[severity] += count
+        return dist
+
 
 class AuditLog(BaseModel):
     id: Optional[int] = Field(None, description="The ID of the audit log entry.")
@@ -0,0 +1,172 @@
+"""Projection of JSON data onto a subset of the fields of a model.
+
+Used by client methods that take a `fields` argument to drop the fields
+that are not needed from response data before models are constructed
+from it, so that no time or memory is spent on them.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from pydantic import BaseModel
+from typing_extensions import get_args
+from typing_extensions import get_origin
+
+
+class Projection(NamedTuple):
+    """Keys to keep from the JSON data of a model."""
+
+    keys: Tuple[Tuple[str, Optional[Projection]], ...]
+    """Keys to keep, each with the projection of its value
+    (`None` to keep the entire value)."""
+    mapping: bool
+    """Whether the projection applies to the values of a dict of models
+    rather than a single model."""
+
+
+def get_projection(cls: Type[BaseModel], fields: Iterable[str]) -> Projection:
+    """Get the projection of a model onto the given fields.
+
+    Required fields of the model are always included, so that the
+    projected data can still be validated.
+
+    Parameters
+    ----------
+    cls : Type[BaseModel]
+        The model class.
+    fields : Iterable[str]
+        Names of the fields to keep. Fields of nested models (including
+        models in lists and dicts) are specified with dotted names, e.g.
+        `"vulnerabilities.id"` or `"tags.name"`. Names that are not fields
+        of the model are treated as extra fields.
+
+    Returns
+    -------
+    Projection
+        The projection. Projections are cached per model and fields.
+
+    Raises
+    ------
+    ValueError
+        Raised if a dotted name refers to a field that is not a model.
+
+    Examples
+    --------
+    >>> from harborapi.models import Artifact
+    >>> projection = get_projection(Artifact, ["digest", "tags.name"])
+    >>> project({"digest": "sha256:abc", "size": 123}, projection)
+    {'digest': 'sha256:abc'}
+    """
+    if isinstance(fields, str):
+        fields = [fields]
+    return _get_projection(cls, frozenset(fields))
+
+
+@functools.lru_cache(maxsize=256)
+def _get_projection(
+    cls: Type[BaseModel], fields: FrozenSet[str], mapping: bool = False
+) -> Projection:
+    # Group nested fields by their top-level field
+    subfields: Dict[str, Optional[List[str]]] = {}
+    # "a" sorts before "a.b", so selecting "a" keeps all of it
+    for field in sorted(fields):
+        name, _, rest = field.partition(".")
+        if not rest:
+            subfields[name] = None
+        else:
+            nested = subfields.setdefault(name, [])
+            if nested is not None:
+                nested.append(rest)
+    for name, info in cls.model_fields.items():
+        if info.is_required():
+            subfields[name] = None
+
+    keys: List[Tuple[str, Optional[Projection]]] = []
+    for field_name, subfield_names in subfields.items():
+        field_info = cls.model_fields.get(field_name)
+        if field_info is None:
+            if subfield_names is not None:
+                raise ValueError(
+                    f"{cls.__name__} has no model field named {field_name!r}"
+                )
+            keys.append((field_name, None))
+            continue
+        key = field_info.alias or field_name
+        if isinstance(field_info.validation_alias, str):
+            key = field_info.validation_alias
+        if subfield_names is None:
+            keys.append((key, None))
+            continue
+        submodel = _find_model(field_info.annotation)
+        if submodel is None:
+            raise ValueError(f"{cls.__name__}.{field_name} is not a model field")
+        model, is_mapping = submodel
+        keys.append(
+            (key, _get_projection(model, frozenset(subfield_names), is_mapping))
+        )
+    return Projection(keys=tuple(keys), mapping=mapping)
+
+
+def _find_model(tp: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """Find the model in a field type, and whether it is the value type
+    of a dict, e.g. `Optional[List[Model]]` -> `(Model, False)`."""
+    if inspect.isclass(tp) and issubclass(tp, BaseModel):
+        if tp.__pydantic_root_model__:
+            return _find_model(tp.model_fields["root"].annotation)
+        return tp, False
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if inspect.isclass(origin) and issubclass(origin, dict):
+        found = _find_model(args[1]) if len(args) == 2 else None
+        return (found[0], True) if found is not None else None
+    for arg in args:
+        found = _find_model(arg)
+        if found is not None:
+            return found
+    return None
+
+
+def project(data: Any, projection: Projection) -> Any:
+    """Project JSON data onto the fields of a projection.
+
+    Parameters
+    ----------
+    data : Any
+        The JSON data of a model or a list of models.
+    projection : Projection
+        The projection, as returned by `get_projection`.
+
+    Returns
+    -------
+    Any
+        The projected data. Values that are not dicts or lists
+        are returned as-is.
+    """
+    if isinstance(data, list):
+        return [project(item, projection) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if projection.mapping:
+        values = projection._replace(mapping=False)
+        return {k: project(v, values) for k, v in data.items()}
+    projected = {}
+    for key, subprojection in projection.keys:
+        try:
+            value = data[key]
+        except KeyError:
+            continue
+        if subprojection is not None:
+            value = project(value, subprojection)
+        projected[key] = value
+    return projected
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import functools
+import logging
+import time
+from collections import deque
+from enum import Enum
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
 from typing import Callable
+from typing import Deque
 from typing import Dict
+from typing import Generator
 from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
+from typing import cast
 
 import backoff
+from backoff import _common as _backoff_common
 from backoff._typing import _Handler
 from backoff._typing import _Jitterer
 from backoff._typing import _Predicate
@@ -22,6 +33,14 @@ from httpx import TimeoutException
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
+
+from .exceptions import CircuitOpenError
+from .exceptions import ServiceUnavailable
+from .exceptions import StatusError
+from .exceptions import TooManyRequests
+from .log import logger
+from .utils import get_retry_after
 
 if TYPE_CHECKING:
     from .client import HarborAsyncClient
@@ -31,7 +50,15 @@ from typing_extensions import ParamSpec
 RETRY_ERRORS = (
     TimeoutException,
     NetworkError,
+    TooManyRequests,
+    ServiceUnavailable,
+)
+
+SAFE_ONLY_RETRY_ERRORS = (
+    TooManyRequests,
+    ServiceUnavailable,
 )
+"""Errors in `RETRY_ERRORS` that are only retried for GET and HEAD requests."""
 
 
 def DEFAULT_PREDICATE(e: Exception) -> bool:
@@ -39,6 +66,215 @@ def DEFAULT_PREDICATE(e: Exception) -> bool:
     return False
 
 
+class CircuitState(str, Enum):
+    """The state of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are allowed."""
+    OPEN = "open"
+    """Requests are rejected."""
+    HALF_OPEN = "half-open"
+    """A limited number of trial requests are allowed."""
+
+
+class CircuitBreaker:
+    """Circuit breaker that stops sending requests to a failing server.
+
+    After `failure_threshold` consecutive failures, the circuit opens and
+    requests fail immediately with a `CircuitOpenError` instead of being
+    sent to the server. After `reset_timeout` seconds, the circuit becomes
+    half-open and lets `half_open_max_calls` trial requests through.
+    If they succeed, the circuit closes again. If one of them fails,
+    the circuit opens again.
+
+    Network errors, timeouts and `429`/`5xx` responses count as failures.
+    Other responses mean the server is responding, and count as successes.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Parameters
+        ----------
+        failure_threshold : int
+            Number of consecutive failures before the circuit opens.
+        reset_timeout : float
+            Number of seconds the circuit stays open before letting
+            trial requests through.
+        half_open_max_calls : int
+            Number of concurrent trial requests allowed while half-open.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.failures = 0
+        """Number of consecutive failures."""
+        self.times_opened = 0
+        """Number of times the circuit has opened."""
+        self.rejected = 0
+        """Number of requests rejected while the circuit was open."""
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """Check if a request is allowed.
+
+        Raises
+        ------
+        CircuitOpenError
+            The circuit is open, or the maximum number of trial requests
+            are already in flight.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._trial_calls < self.half_open_max_calls
+        ):
+            self._trial_calls += 1
+            return
+        self.rejected += 1
+        remaining = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+        raise CircuitOpenError(
+            f"Circuit breaker is {state.value} after {self.failures} consecutive "
+            f"failures. Retry in {remaining:.1f}s."
+        )
+
+    def after_call(self, exc: Optional[BaseException] = None) -> None:
+        """Record the outcome of a request allowed by `before_call`.
+
+        Parameters
+        ----------
+        exc : Optional[BaseException]
+            The exception raised by the request, if any.
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._trial_calls = max(0, self._trial_calls - 1)
+        if exc is not None and not isinstance(exc, Exception):
+            return  # cancelled, says nothing about the server
+        if exc is not None and self.is_failure(exc):
+            self.failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self._open()
+        else:
+            self.failures = 0
+            self._state = CircuitState.CLOSED
+
+    def is_failure(self, exc: BaseException) -> bool:
+        """Whether an exception indicates that the server is failing."""
+        if isinstance(exc, StatusError):
+            return exc.status_code == 429 or exc.status_code >= 500
+        return isinstance(exc, RETRY_ERRORS)
+
+    def reset(self) -> None:
+        """Close the circuit."""
+        self._state = CircuitState.CLOSED
+        self.failures = 0
+
+    def _open(self) -> None:
+        if self._state != CircuitState.OPEN:
+            self.times_opened += 1
+            logger.warning(
+                "Circuit breaker opened after %d consecutive failures", self.failures
+            )
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+
+
+class RetryBudget:
+    """Client-wide budget that caps retries to a fraction of recent requests.
+
+    Prevents retry storms when the server is degraded, where every
+    concurrent request retrying on its own multiplies the load on the server.
+    Within the last `window` seconds, at most `ratio` retries per request
+    are allowed, plus `min_retries_per_second` to let clients with few
+    requests retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+    ) -> None:
+        """Initialize the retry budget.
+
+        Parameters
+        ----------
+        ratio : float
+            Number of retries allowed per request.
+        min_retries_per_second : float
+            Number of retries per second that are always allowed.
+        window : float
+            Number of seconds to count requests and retries over.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+
+        self.exhausted = 0
+        """Number of retries denied because the budget was exhausted."""
+
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    @property
+    def available(self) -> float:
+        """Number of retries currently available."""
+        self._prune(time.monotonic())
+        allowed = (
+            self.ratio * len(self._requests) + self.min_retries_per_second * self.window
+        )
+        return max(0.0, allowed - len(self._retries))
+
+    def record_request(self) -> None:
+        """Record a request (not counting retries)."""
+        self._requests.append(time.monotonic())
+
+    def try_retry(self) -> bool:
+        """Withdraw a retry from the budget.
+
+        Returns
+        -------
+        bool
+            Whether the retry is allowed.
+        """
+        if self.available < 1:
+            self.exhausted += 1
+            return False
+        self._retries.append(time.monotonic())
+        return True
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+
 class RetrySettings(BaseModel):
     enabled: bool = Field(True, description="Whether to retry requests.")
     # Required argument for backoff.on_exception
@@ -46,6 +282,14 @@ class RetrySettings(BaseModel):
         RETRY_ERRORS,
         description="Exception(s) to catch and retry on.",
     )
+    safe_only_exception: Union[Type[Exception], Tuple[Type[Exception], ...]] = Field(
+        SAFE_ONLY_RETRY_ERRORS,
+        description=(
+            "Exception(s) of `exception` that are only retried for GET and HEAD "
+            "requests, since the server may have processed a POST, PUT, PATCH "
+            "or DELETE request that failed with them."
+        ),
+    )
 
     # Optional arguments for backoff.on_exception
     max_tries: Optional[int] = Field(
@@ -86,15 +330,301 @@ class RetrySettings(BaseModel):
         default=True,
         description="Whether to raise the exception when giving up.",
     )
-    model_config = ConfigDict(extra="allow", validate_assignment=True)
+    circuit_breaker: Optional[CircuitBreaker] = Field(
+        default=None,
+        description="Circuit breaker that rejects requests while the server is failing.",
+    )
+    retry_budget: Optional[RetryBudget] = Field(
+        default=None,
+        description="Budget that caps retries to a fraction of recent requests.",
+    )
+    model_config = ConfigDict(
+        extra="allow", validate_assignment=True, arbitrary_types_allowed=True
+    )
+
+    respect_retry_after: bool = Field(
+        default=True,
+        description=(
+            "Whether to wait for the duration of the Retry-After header "
+            "of 429 and 503 responses instead of the wait generator."
+        ),
+    )
+    _policy: Optional[RetryPolicy] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._policy = None  # recompile on next use
 
     @property
     def wait_gen_kwargs(self) -> Dict[str, Any]:
         """Dict of extra model fields."""
-        fields = self.model_fields.keys()
-        return {
-            key: value for key, value in self.model_dump().items() if key not in fields
-        }
+        return dict(self.model_extra or {})
+
+    @property
+    def policy(self) -> RetryPolicy:
+        """The retry policy compiled from the settings.
+
+        Compiled on first use and cached until a setting is changed.
+        Changes to mutable values (e.g. appending to a list of handlers)
+        are not detected.
+        """
+        policy = self._policy
+        if policy is None or policy.settings is not self:
+            policy = self._policy = RetryPolicy(self)
+        return policy
+
+
+_backoff_logger = logging.getLogger("backoff")
+
+
+def _ensure_coroutine(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    if asyncio.iscoroutinefunction(func):
+        return func
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _config_handlers(
+    handlers: Union[_Handler, Iterable[_Handler], None],
+    default_handler: Optional[Callable[..., None]] = None,
+    log_level: int = logging.INFO,
+) -> List[Callable[..., Awaitable[Any]]]:
+    """Configures handlers the same way as `backoff.on_exception`,
+    i.e. the user's handlers preceded by a default log handler, if any."""
+    configured: List[Callable[..., Any]] = []
+    if default_handler is not None:
+        configured.append(
+            functools.partial(
+                default_handler, logger=_backoff_logger, log_level=log_level
+            )
+        )
+    if handlers is not None:
+        if isinstance(handlers, Iterable):
+            configured.extend(handlers)
+        else:
+            configured.append(handlers)
+    return [_ensure_coroutine(handler) for handler in configured]
+
+
+def _init_wait_gen(
+    wait_gen: Callable[..., Generator[Any, Any, None]], wait_gen_kwargs: Dict[str, Any]
+) -> Generator[Any, Any, None]:
+    """Create a wait generator and advance it to its first value."""
+    kwargs = {k: _maybe_call(v) for k, v in wait_gen_kwargs.items()}
+    initialized = wait_gen(**kwargs)
+    initialized.send(None)
+    return initialized
+
+
+def _next_wait(
+    wait: Generator[Any, Any, None],
+    exc: Exception,
+    jitter: Optional[Callable[[float], float]],
+    elapsed: float,
+    max_time: Optional[float],
+) -> float:
+    """Get the number of seconds to wait before the next attempt."""
+    value: float = wait.send(exc)
+    seconds = jitter(value) if jitter is not None else value
+    # Don't sleep past the max time
+    if max_time is not None:
+        seconds = min(seconds, max_time - elapsed)
+    return max(seconds, 0.0)
+
+
+def _maybe_call(value: Any) -> Any:
+    """Evaluate a value that can be either a fixed value or a callable."""
+    if callable(value):
+        try:
+            return value()
+        except TypeError:
+            return value
+    return value
+
+
+class RetryPolicy:
+    """Retry loop compiled from `RetrySettings`.
+
+    Replicates the behavior of `backoff.on_exception` without building
+    a new decorator for every call, and additionally:
+
+    - Waits for the duration of the `Retry-After` header of 429 and 503 responses.
+    - Rejects calls while the circuit breaker is open.
+    - Stops retrying when the retry budget is exhausted.
+
+    Obtained through `RetrySettings.policy`.
+    """
+
+    def __init__(self, settings: RetrySettings) -> None:
+        self.settings = settings
+        self.enabled = settings.enabled
+        self.exception = settings.exception
+        self.safe_only_exception = settings.safe_only_exception
+        self.max_tries = settings.max_tries
+        self.max_time = settings.max_time
+        self.wait_gen = settings.wait_gen
+        self.wait_gen_kwargs = settings.wait_gen_kwargs
+        self.jitter = settings.jitter
+        self.giveup = _ensure_coroutine(settings.giveup)
+        self.on_success = _config_handlers(settings.on_success)
+        self.on_backoff = _config_handlers(
+            settings.on_backoff, _backoff_common._log_backoff, logging.INFO
+        )
+        self.on_giveup = _config_handlers(
+            settings.on_giveup, _backoff_common._log_giveup, logging.ERROR
+        )
+        self.raise_on_giveup = settings.raise_on_giveup
+        self.respect_retry_after = settings.respect_retry_after
+        self.circuit_breaker = settings.circuit_breaker
+        self.retry_budget = settings.retry_budget
+
+    @property
+    def active(self) -> bool:
+        """Whether calls need to go through the policy at all."""
+        return self.enabled or self.circuit_breaker is not None
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        safe: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """Call a coroutine function, retrying it according to the policy.
+
+        Parameters
+        ----------
+        func : Callable[..., Awaitable[T]]
+            The coroutine function to call.
+        *args : Any
+            Positional arguments to pass to the function.
+        safe : bool
+            Whether the function sends a GET or HEAD request.
+            Only safe requests are retried on `safe_only_exception`.
+        **kwargs : Any
+            Keyword arguments to pass to the function.
+
+        Returns
+        -------
+        T
+            The result of the function.
+        """
+        if not self.enabled:
+            return await self._attempt(func, *args, **kwargs)
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+
+        max_tries = _maybe_call(self.max_tries)
+        max_time = _maybe_call(self.max_time)
+        tries = 0
+        start = time.monotonic()
+        wait = None  # only initialized once we need to wait
+        while True:
+            tries += 1
+            elapsed = time.monotonic() - start
+            details = {
+                "target": func,
+                "args": args,
+                "kwargs": kwargs,
+                "tries": tries,
+                "elapsed": elapsed,
+            }
+            try:
+                return_value = await self._attempt(func, *args, **kwargs)
+            except self.exception as e:
+                if not safe and isinstance(e, self.safe_only_exception):
+                    raise
+                seconds: Optional[float] = None
+                if self.respect_retry_after:
+                    seconds = _get_retry_after(e)
+
+                if (
+                    await self.giveup(e)
+                    or tries == max_tries
+                    or (max_time is not None and elapsed >= max_time)
+                    # Server wants us to wait longer than we are allowed to
+                    or (
+                        seconds is not None
+                        and max_time is not None
+                        and elapsed + seconds > max_time
+                    )
+                    or not self._may_retry(e)
+                ):
+                    await self._call_handlers(self.on_giveup, details, exception=e)
+                    if self.raise_on_giveup:
+                        raise
+                    return None  # type: ignore[return-value]
+
+                if seconds is None:
+                    if wait is None:
+                        wait = _init_wait_gen(self.wait_gen, self.wait_gen_kwargs)
+                    try:
+                        seconds = _next_wait(wait, e, self.jitter, elapsed, max_time)
+                    except StopIteration:
+                        await self._call_handlers(self.on_giveup, details, exception=e)
+                        raise e
+
+                await self._call_handlers(
+                    self.on_backoff, details, wait=seconds, exception=e
+                )
+                await asyncio.sleep(seconds)
+            else:
+                if self.on_success:
+                    await self._call_handlers(self.on_success, details)
+                return return_value
+
+    async def _attempt(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await func(*args, **kwargs)
+        breaker.before_call()
+        try:
+            return_value = await func(*args, **kwargs)
+        except BaseException as e:
+            breaker.after_call(e)
+            raise
+        breaker.after_call()
+        return return_value
+
+    def _may_retry(self, e: Exception) -> bool:
+        """Check the circuit breaker and retry budget before retrying."""
+        breaker = self.circuit_breaker
+        if breaker is not None and breaker.state == CircuitState.OPEN:
+            return False  # retrying would be rejected anyway
+        budget = self.retry_budget
+        if budget is not None and not budget.try_retry():
+            logger.warning("Retry budget exhausted, not retrying: %s", e)
+            return False
+        return True
+
+    @staticmethod
+    async def _call_handlers(
+        handlers: List[Callable[..., Awaitable[Any]]],
+        details: Dict[str, Any],
+        **extra: Any,
+    ) -> None:
+        if not handlers:
+            return
+        details = {**details, **extra}
+        for handler in handlers:
+            await handler(details)
+
+
+def _get_retry_after(e: Exception) -> Optional[float]:
+    """Get the Retry-After duration of a 429 or 503 response."""
+    if not isinstance(e, StatusError) or e.status_code not in (429, 503):
+        return None
+    response = e.response
+    if response is None:
+        return None
+    return get_retry_after(response)
 
 
 def get_backoff_kwargs(client: "HarborAsyncClient") -> Dict[str, Any]:
@@ -134,10 +664,16 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
-def retry() -> Callable[[Callable[P, T]], Callable[P, T]]:
+def retry(safe: bool = False) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Adds retry functionality to a HarborAsyncClient method.
 
     NOTE: will fail if applied to any other class than HarborAsyncClient.
+
+    Parameters
+    ----------
+    safe : bool
+        Whether the method sends GET or HEAD requests, which are also
+        retried on `RetrySettings.safe_only_exception`.
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
@@ -148,12 +684,14 @@ def retry() -> Callable[[Callable[P, T]], Callable[P, T]]:
                     "retry decorator must be applied on a HarborAsyncClient method."
                 )
             client = args[0]
-            if not client.retry or not client.retry.enabled:
+            retry_settings = client.retry
+            if not retry_settings:
                 return func(*args, **kwargs)
-
-            return backoff.on_exception(**get_backoff_kwargs(client))(func)(
-                *args, **kwargs
-            )
+            policy = retry_settings.policy
+            if not policy.active:
+                return func(*args, **kwargs)
+            coro_func = cast(Callable[..., Awaitable[Any]], func)
+            return cast(T, policy.call(coro_func, *args, safe=safe, **kwargs))
 
         return wrapper
 
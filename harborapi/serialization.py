@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from typing import Union
+
+from pydantic import BaseModel
+
+# fmt: off
+try:
+    import orjson
+    orjson_installed = True
+except ImportError:
+    orjson_installed = False
+# fmt: on
+
+
+class JSONBackend:
+    """JSON backend using the standard library `json` module.
+
+    Subclass this and override `loads` and `dumps` to use a different
+    JSON library.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize JSON.
+
+        Parameters
+        ----------
+        data : Union[bytes, str]
+            The JSON document to deserialize.
+
+        Returns
+        -------
+        Any
+            The deserialized data.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            Raised if the data is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON.
+
+        Parameters
+        ----------
+        obj : Any
+            The data to serialize.
+
+        Returns
+        -------
+        bytes
+            The serialized JSON document.
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def dump_model(self, model: BaseModel) -> bytes:
+        """Serialize a Pydantic model to UTF-8 encoded JSON.
+
+        Only fields that have been explicitly set are included.
+        The model is serialized by Pydantic directly to JSON, without
+        first converting it to a dict.
+
+        Parameters
+        ----------
+        model : BaseModel
+            The model to serialize.
+
+        Returns
+        -------
+        bytes
+            The serialized JSON document.
+        """
+        return model.model_dump_json(exclude_unset=True).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonBackend(JSONBackend):
+    """JSON backend using [orjson](https://github.com/ijl/orjson).
+
+    Requires the `orjson` package (`pip install harborapi[orjson]`).
+
+    Note
+    ----
+    Unlike the standard library, orjson decodes integers that do not
+    fit in 64 bits as floats.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not orjson_installed:
+            raise ImportError(
+                "The orjson JSON backend requires the orjson package. "
+                "Install it with `pip install harborapi[orjson]`."
+            )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+JSON_BACKENDS = {
+    JSONBackend.name: JSONBackend,
+    OrjsonBackend.name: OrjsonBackend,
+}
+"""JSON backends that can be selected by name."""
+
+
+def get_json_backend(backend: Union[str, JSONBackend, None] = "auto") -> JSONBackend:
+    """Get a JSON backend by name.
+
+    Parameters
+    ----------
+    backend : Union[str, JSONBackend, None]
+        Name of the backend (`"json"` or `"orjson"`), or a backend instance,
+        which is returned as-is.
+        `"auto"` or `None` selects orjson if it is installed, and falls back
+        on the standard library `json` module otherwise.
+
+    Returns
+    -------
+    JSONBackend
+        The JSON backend.
+
+    Raises
+    ------
+    ValueError
+        Raised if the backend name is unknown.
+    ImportError
+        Raised if the backend's library is not installed.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is None or backend == "auto":
+        return OrjsonBackend() if orjson_installed else JSONBackend()
+    try:
+        backend_cls = JSON_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON backend {backend!r}. "
+            f"Choose one of: {', '.join(['auto', *JSON_BACKENDS])}"
+        ) from None
+    return backend_cls()
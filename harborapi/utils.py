@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import re
+import time
 from base64 import b64encode
+from email.utils import parsedate_to_datetime
 from json import JSONDecodeError
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Union
 from typing import cast
+from urllib.parse import parse_qs
 from urllib.parse import quote_plus
 from urllib.parse import unquote_plus
+from urllib.parse import urlsplit
 
 from httpx import Response
 from pydantic import SecretStr
@@ -18,6 +23,7 @@ from ._types import QueryParamMapping
 from ._types import QueryParamValue
 from .exceptions import HarborAPIException  # avoid circular import
 from .log import logger
+from .serialization import JSONBackend
 
 
 def is_json(response: Response) -> bool:
@@ -36,7 +42,9 @@ def is_json(response: Response) -> bool:
     return response.headers.get("content-type", "").startswith("application/json")
 
 
-def handle_optional_json_response(resp: Response) -> Optional[JSONType]:
+def handle_optional_json_response(
+    resp: Response, json_backend: Optional[JSONBackend] = None
+) -> Optional[JSONType]:
     """Takes in a response and attempts to parse the body as JSON.
 
     If the response cannot be parsed, an exception is raised.
@@ -46,6 +54,9 @@ def handle_optional_json_response(resp: Response) -> Optional[JSONType]:
     ----------
     resp : Response
         The HTTPX response to parse.
+    json_backend : Optional[JSONBackend]
+        The JSON backend to decode the body with.
+        Defaults to HTTPX's JSON decoding (standard library `json`).
 
     Returns
     -------
@@ -66,7 +77,9 @@ def handle_optional_json_response(resp: Response) -> Optional[JSONType]:
     try:
         # We assume Harbor API returns dict or list.
         # If not, they are breaking their own schema and that is not our fault
-        return cast(JSONType, resp.json())
+        if json_backend is None:
+            return cast(JSONType, resp.json())
+        return cast(JSONType, json_backend.loads(resp.content))
     except JSONDecodeError as e:
         logger.error("Failed to parse JSON from %s: %s", resp.url, e)
         raise HarborAPIException(f"Failed to parse JSON from {resp.url}") from e
@@ -226,6 +239,111 @@ def parse_pagination_url(url: str, strip: bool = True) -> Optional[str]:
     return API_PATH_PATTERN.sub("", m)
 
 
+# Finds the page number in a pagination URL (e.g. /api/v2.0/endpoint?page=X&page_size=Y)
+PAGE_PARAM_PATTERN = re.compile(r"([?&])page=(\d+)")
+
+
+def get_total_count(response: Response) -> Optional[int]:
+    """Get the total number of results for a paginated request
+    from the `X-Total-Count` header of a response.
+
+    Parameters
+    ----------
+    response : Response
+        The HTTPX response to parse.
+
+    Returns
+    -------
+    Optional[int]
+        The total number of results, or `None` if the header is missing or invalid.
+    """
+    total = response.headers.get("x-total-count")
+    if total is None:
+        return None
+    try:
+        return int(total)
+    except ValueError:
+        logger.warning("Invalid X-Total-Count header value: %s", total)
+        return None
+
+
+def get_retry_after(response: Response) -> Optional[float]:
+    """Get the number of seconds to wait before retrying a request
+    from the `Retry-After` header of a response.
+
+    Parameters
+    ----------
+    response : Response
+        The HTTPX response to parse.
+
+    Returns
+    -------
+    Optional[float]
+        The number of seconds to wait, or `None` if the header is missing or invalid.
+        The header can be either a number of seconds or an HTTP date.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        logger.warning("Invalid Retry-After header value: %s", retry_after)
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def get_page_urls(next_url: str, total_count: int, limit: int = 0) -> List[str]:
+    """Get the URLs of all remaining pages of a paginated request,
+    given the URL of the next page and the total number of results.
+
+    Example
+    -------
+    ```pycon
+    >>> get_page_urls("/projects?page=2&page_size=10", 35)
+    ['/projects?page=2&page_size=10', '/projects?page=3&page_size=10', '/projects?page=4&page_size=10']
+    ```
+
+    Parameters
+    ----------
+    next_url : str
+        The URL of the next page, as parsed from the `Link` header.
+    total_count : int
+        The total number of results, as reported by the `X-Total-Count` header.
+    limit : int
+        The maximum number of results still needed.
+        Pages beyond this limit are not included.
+        0 means no limit.
+
+    Returns
+    -------
+    List[str]
+        The URLs of the remaining pages, in order.
+        Empty if the next URL does not contain `page` and `page_size` parameters.
+    """
+    query = parse_qs(urlsplit(next_url).query)
+    try:
+        page = int(query["page"][0])
+        page_size = int(query["page_size"][0])
+    except (KeyError, IndexError, ValueError):
+        return []
+    if page_size <= 0 or page < 1:
+        return []
+
+    last_page = -(-total_count // page_size)  # ceiling division
+    if limit:
+        last_page = min(last_page, page - 1 + -(-limit // page_size))
+
+    def _with_page(n: int) -> str:
+        return PAGE_PARAM_PATTERN.sub(lambda m: f"{m.group(1)}page={n}", next_url)
+
+    return [_with_page(n) for n in range(page, last_page + 1)]
+
+
 def get_project_headers(project_name_or_id: Union[str, int]) -> Dict[str, str]:
     """Get HTTP header for identifying whether a Project Name or
     Project ID is used in an API call.
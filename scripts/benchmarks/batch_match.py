@@ -0,0 +1,122 @@
+"""Benchmark checking a list of CVE IDs, packages and description keywords
+against an `ArtifactReport` with a single batch query against one query
+per item.
+
+"Per query" matches every vulnerability of every artifact against each item
+separately, as `ArtifactInfo.has_cve()`, `has_package()` and
+`has_description()` do. The batch queries (`ArtifactReport.find_cves()`,
+`find_packages()` and `find_descriptions()`) match each distinct value
+against all the items at once, either as regular expressions or as literals.
+
+Half of the CVE IDs and packages exist in the report. Description keywords
+are searched for anywhere in the descriptions, with a tenth as many
+keywords as `--queries`.
+
+Usage:
+
+    python scripts/benchmarks/batch_match.py --artifacts 20 --vulnerabilities 1000 --queries 500
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from table import make_artifact_report
+
+from harborapi.ext.regex import get_pattern
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.report import Vulnerability
+
+console = Console()
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def per_query(
+    report: ArtifactReport, queries: List[str], attr: str, search: bool = False
+) -> Dict[str, List[Vulnerability]]:
+    results = {}
+    for query in queries:
+        pattern = get_pattern(query)
+        method = pattern.search if search else pattern.match
+        results[query] = [
+            Vulnerability(v, a)
+            for a in report.artifacts
+            for v in a.report.vulnerabilities
+            if getattr(v, attr) is not None and method(getattr(v, attr))
+        ]
+    return results
+
+
+def main(
+    artifacts: int = typer.Option(20, "--artifacts", "-a"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    queries: int = typer.Option(500, "--queries", "-q"),
+) -> None:
+    report = make_artifact_report(artifacts, vulnerabilities)
+    rng = random.Random(1234)
+    vulns = report.artifacts[0].report.vulnerabilities
+    cves = [
+        rng.choice(vulns).id or "" if i % 2 else f"CVE-2099-{i:05d}"
+        for i in range(queries)
+    ]
+    packages = [
+        rng.choice(vulns).package or "" if i % 2 else f"missing-{i}"
+        for i in range(queries)
+    ]
+    # Searching descriptions one keyword at a time is slow
+    keywords = [f"package-{i} " for i in range(queries // 10)]
+    cases: Dict[str, Dict[str, Callable[[], Any]]] = {
+        f"{queries} CVE IDs": {
+            "per query": lambda: per_query(report, [re.escape(c) for c in cves], "id"),
+            "regex": lambda: report.find_cves([re.escape(c) for c in cves]),
+            "literal": lambda: report.find_cves(cves, literal=True),
+        },
+        f"{queries} packages": {
+            "per query": lambda: per_query(
+                report, [re.escape(p) for p in packages], "package"
+            ),
+            "regex": lambda: report.find_packages([re.escape(p) for p in packages]),
+            "literal": lambda: report.find_packages(packages, literal=True),
+        },
+        f"{len(keywords)} description keywords": {
+            "per query": lambda: per_query(report, keywords, "description", True),
+            "regex": lambda: report.find_descriptions(keywords, search=True),
+            "literal": lambda: report.find_descriptions(
+                keywords, literal=True, search=True
+            ),
+        },
+    }
+
+    console.print(f"{artifacts * vulnerabilities} vulnerabilities")
+    table = Table(
+        "Query", "Per query (ms)", "Batch regex (ms)", "Batch literal (ms)", "Speedup"
+    )
+    for name, funcs in cases.items():
+        times = {method: timed(func) for method, func in funcs.items()}
+        best = min(times["regex"], times["literal"])
+        table.add_row(
+            name,
+            f"{times['per query'] * 1000:.2f}",
+            f"{times['regex'] * 1000:.2f}",
+            f"{times['literal'] * 1000:.2f}",
+            f"{times['per query'] / best:.1f}x",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,146 @@
+"""Benchmark request throughput of HarborAsyncClient with different
+connection pool settings against a local HTTP server.
+
+The local server only speaks HTTP/1.1. To benchmark HTTP/2, point the
+script at a real Harbor instance with `--url` and pass `--http2`.
+
+Usage:
+
+    python scripts/benchmarks/connection_pool.py --requests 2000 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi import HarborAsyncClient
+
+console = Console()
+
+PAYLOAD = json.dumps({"harbor_version": "v2.10.0", "with_notary": False}).encode()
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(PAYLOAD)).encode() + b"\r\n\r\n" + PAYLOAD
+)
+
+
+async def _handle(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    connections: Any,
+    delay: float,
+) -> None:
+    with connections.get_lock():
+        connections.value += 1
+    try:
+        while True:
+            # Requests are bodyless GETs, so the head is all we need to read
+            if not await reader.readuntil(b"\r\n\r\n"):
+                break
+            if delay:
+                await asyncio.sleep(delay)
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _serve(port: Any, connections: Any, delay: float) -> None:
+    async def serve() -> None:
+        server = await asyncio.start_server(
+            lambda r, w: _handle(r, w, connections, delay), "127.0.0.1", 0
+        )
+        port.value = server.sockets[0].getsockname()[1]
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def start_server(delay: float) -> Tuple[multiprocessing.Process, Any, str]:
+    """Start the server in a separate process, so it does not compete
+    with the client for the GIL."""
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    proc = multiprocessing.Process(
+        target=_serve, args=(port, connections, delay), daemon=True
+    )
+    proc.start()
+    while not port.value:
+        time.sleep(0.01)
+    return proc, connections, f"http://127.0.0.1:{port.value}/api/v2.0"
+
+
+async def run(
+    url: str, n_requests: int, concurrency: int, **client_kwargs: Any
+) -> float:
+    client = HarborAsyncClient(
+        url=url, username="admin", secret="password", **client_kwargs
+    )
+    sem = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        async with sem:
+            await client.get("/systeminfo")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(n_requests)))
+    elapsed = time.perf_counter() - start
+    await client.client.aclose()
+    return elapsed
+
+
+def main(
+    requests: int = typer.Option(2000, "--requests", "-n"),
+    concurrency: int = typer.Option(50, "--concurrency", "-c"),
+    delay: float = typer.Option(0.005, help="Server response delay in seconds."),
+    url: Optional[str] = typer.Option(None, help="Benchmark a real server instead."),
+    http2: bool = typer.Option(False, help="Include an HTTP/2 run (requires h2)."),
+) -> None:
+    server = connections = None
+    if url is None:
+        server, connections, url = start_server(delay)
+
+    configs: List[Tuple[str, Dict[str, Any]]] = [
+        ("httpx defaults", {}),
+        (
+            "keep-alive pool = concurrency",
+            {
+                "max_connections": concurrency,
+                "max_keepalive_connections": concurrency,
+                "keepalive_expiry": 30.0,
+            },
+        ),
+    ]
+    if http2:
+        configs.append(("HTTP/2", {"http2": True, "keepalive_expiry": 30.0}))
+
+    table = Table("Configuration", "Time (s)", "Requests/s", "New connections")
+    for name, kwargs in configs:
+        if connections is not None:
+            connections.value = 0
+        elapsed = asyncio.run(run(url, requests, concurrency, **kwargs))
+        conns = str(connections.value) if connections is not None else "n/a"
+        table.add_row(name, f"{elapsed:.2f}", f"{requests / elapsed:.0f}", conns)
+    console.print(table)
+
+    if server is not None:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,93 @@
+"""Benchmark constructing vulnerability reports and artifacts without
+validation against validating them.
+
+Compares `model_validate`, `harborapi.models.construct.construct` (used by
+the client when `validate=False`), and Pydantic's shallow `model_construct`,
+which does not construct nested models.
+
+Usage:
+
+    python scripts/benchmarks/construct.py --vulnerabilities 10000 --artifacts 1000
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from typing import Callable
+
+import typer
+from json_backend import make_report
+from list_validation import make_artifact
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models import Artifact
+from harborapi.models.construct import construct
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+console = Console()
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(
+    vulnerabilities: int = typer.Option(10000, "--vulnerabilities", "-v"),
+    artifacts: int = typer.Option(1000, "--artifacts", "-a"),
+    repeat: int = typer.Option(10, "--repeat", "-r"),
+) -> None:
+    report = make_report(vulnerabilities)
+    artifact_list = [make_artifact(i) for i in range(artifacts)]
+
+    table = Table("Data", "Method", "Time (ms)", "Relative to validation")
+    cases = [
+        (
+            f"Report ({vulnerabilities} vulnerabilities)",
+            {
+                "model_validate": lambda: HarborVulnerabilityReport.model_validate(
+                    report
+                ),
+                "construct (deep)": lambda: construct(
+                    HarborVulnerabilityReport, report
+                ),
+                "model_construct (shallow)": lambda: (
+                    HarborVulnerabilityReport.model_construct(**report)
+                ),
+            },
+        ),
+        (
+            f"{artifacts} artifacts",
+            {
+                "model_validate": lambda: [
+                    Artifact.model_validate(a) for a in artifact_list
+                ],
+                "construct (deep)": lambda: [
+                    construct(Artifact, a) for a in artifact_list
+                ],
+                "model_construct (shallow)": lambda: [
+                    Artifact.model_construct(**a) for a in artifact_list
+                ],
+            },
+        ),
+    ]
+    for name, methods in cases:
+        results = {method: best_of(func, repeat) for method, func in methods.items()}
+        baseline = results["model_validate"]
+        for method, elapsed in results.items():
+            table.add_row(
+                name, method, f"{elapsed * 1000:.2f}", f"{elapsed / baseline:.2f}x"
+            )
+            name = ""
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
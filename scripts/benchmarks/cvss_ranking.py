@@ -0,0 +1,158 @@
+"""Benchmark ranking vulnerabilities by CVSS score using the scores stored
+by each report against resolving the score of a vulnerability every time
+it is compared.
+
+"Per comparison" is how `HarborVulnerabilityReport.top_vulns` and
+`sort(use_cvss=True)` worked before the scores were stored: `top_vulns`
+resolves the score twice per vulnerability and sorts the whole list, `sort`
+resolves both scores in every comparison of a `cmp_to_key` comparator. The
+fleet-wide top-k sorts every vulnerability of every artifact and keeps the
+first occurrence of each CVE.
+
+"Cold" times discard the stored scores of the reports before each run,
+"warm" times reuse them.
+
+Usage:
+
+    python scripts/benchmarks/cvss_ranking.py --artifacts 50 --vulnerabilities 1000
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Set
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from table import make_artifact_report
+
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.report import Vulnerability
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import VulnerabilityItem
+
+console = Console()
+
+
+def best_of(func: Callable[[], Any], repeat: int, setup: Callable[[], Any]) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    times = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def top_vulns_per_comparison(
+    report: HarborVulnerabilityReport, n: int
+) -> List[VulnerabilityItem]:
+    vulns = filter(
+        lambda v: v.get_cvss_score(report.scanner) is not None, report.vulnerabilities
+    )
+    return sorted(vulns, key=lambda v: v.get_cvss_score(report.scanner), reverse=True)[
+        :n
+    ]
+
+
+def sort_per_comparison(report: HarborVulnerabilityReport) -> None:
+    def cmp(v1: VulnerabilityItem, v2: VulnerabilityItem) -> int:
+        if v1.severity > v2.severity:
+            return 1
+        elif v1.severity < v2.severity:
+            return -1
+        diff = v1.get_cvss_score(report.scanner) - v2.get_cvss_score(report.scanner)
+        if diff > 0:
+            return 1
+        elif diff < 0:
+            return -1
+        return 0
+
+    report.vulnerabilities.sort(key=functools.cmp_to_key(cmp), reverse=True)
+    report.reindex()
+
+
+def fleet_top_vulns_per_comparison(
+    report: ArtifactReport, n: int
+) -> List[Vulnerability]:
+    vulns = [
+        Vulnerability(v, a) for a in report.artifacts for v in a.report.vulnerabilities
+    ]
+    vulns.sort(
+        key=lambda v: v.vulnerability.get_cvss_score(v.artifact.report.scanner),
+        reverse=True,
+    )
+    seen: Set[str] = set()
+    top = []
+    for v in vulns:
+        if v.vulnerability.id in seen:
+            continue
+        seen.add(v.vulnerability.id or "")
+        top.append(v)
+        if len(top) == n:
+            break
+    return top
+
+
+def main(
+    artifacts: int = typer.Option(50, "--artifacts", "-a"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    top: int = typer.Option(10, "--top", "-k"),
+    repeat: int = typer.Option(3, "--repeat", "-r"),
+) -> None:
+    report = make_artifact_report(artifacts, vulnerabilities)
+    reports = [a.report for a in report.artifacts]
+    for r in reports:
+        # Sort the vulnerabilities of each report separately
+        r.vulnerabilities = list(r.vulnerabilities)
+
+    def each(func: Callable[[HarborVulnerabilityReport], Any]) -> Callable[[], None]:
+        return lambda: [func(r) for r in reports] and None
+
+    cases = {
+        f"top_vulns({top})": (
+            each(lambda r: top_vulns_per_comparison(r, top)),
+            each(lambda r: r.top_vulns(top)),
+        ),
+        "sort(use_cvss=True)": (
+            each(sort_per_comparison),
+            each(lambda r: r.sort(use_cvss=True)),
+        ),
+        f"ArtifactReport.top_vulns({top})": (
+            lambda: fleet_top_vulns_per_comparison(report, top),
+            lambda: report.top_vulns(top),
+        ),
+    }
+
+    def invalidate() -> None:
+        for r in reports:
+            r.reindex()
+
+    console.print(
+        f"{artifacts} artifacts, {artifacts * vulnerabilities} vulnerabilities"
+    )
+    table = Table(
+        "Query", "Per comparison (ms)", "Cold (ms)", "Warm (ms)", "Speedup (cold)"
+    )
+    for name, (old, new) in cases.items():
+        old_time = best_of(old, repeat, invalidate)
+        cold_time = best_of(new, repeat, invalidate)
+        warm_time = best_of(new, repeat, lambda: None)
+        table.add_row(
+            name,
+            f"{old_time * 1000:.2f}",
+            f"{cold_time * 1000:.2f}",
+            f"{warm_time * 1000:.2f}",
+            f"{old_time / cold_time:.1f}x",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
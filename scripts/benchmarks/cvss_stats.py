@@ -0,0 +1,87 @@
+"""Benchmark computing `CVSSData` for an `ArtifactReport` with the
+single-pass `StatsAccumulator` against the `statistics` module.
+
+"statistics" is how `CVSSData.from_report` worked before the accumulator
+was added: every score of every artifact is collected into a list, which
+is passed to `statistics.mean`, `median` and `stdev`, and to `min` and `max`.
+"Accumulator" consumes the scores of each artifact without building a list,
+and additionally computes the 90th and 99th percentiles.
+"Merged" accumulates the artifacts in `--chunks` chunks and merges the
+results, as when computing them in parallel.
+
+Usage:
+
+    python scripts/benchmarks/cvss_stats.py --artifacts 200 --vulnerabilities 1000
+"""
+
+from __future__ import annotations
+
+import functools
+from itertools import chain
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from table import best_of
+from table import make_artifact_report
+
+from harborapi.ext import stats
+from harborapi.ext.cve import CVSSData
+from harborapi.ext.cve import accumulate_cvss
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.stats import StatsAccumulator
+
+console = Console()
+
+
+def with_statistics(report: ArtifactReport) -> CVSSData:
+    scores = list(chain.from_iterable([a.report.cvss_scores for a in report.artifacts]))
+    return CVSSData(
+        mean=stats.mean(scores),
+        median=stats.median(scores),
+        stdev=stats.stdev(scores),
+        min=stats.min(scores),
+        max=stats.max(scores),
+    )
+
+
+def merged(report: ArtifactReport, chunks: int) -> CVSSData:
+    size = -(-len(report.artifacts) // chunks)
+    parts = [
+        accumulate_cvss(report.artifacts[i : i + size])
+        for i in range(0, len(report.artifacts), size)
+    ]
+    return CVSSData.from_stats(functools.reduce(StatsAccumulator.merge, parts))
+
+
+def main(
+    artifacts: int = typer.Option(200, "--artifacts", "-a"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    chunks: int = typer.Option(8, "--chunks", "-c"),
+    repeat: int = typer.Option(5, "--repeat", "-r"),
+) -> None:
+    report = make_artifact_report(artifacts, vulnerabilities)
+    console.print(f"{artifacts * vulnerabilities} vulnerabilities")
+    # Resolve the CVSS scores of each report up front, so that only
+    # computing the statistics is timed
+    for artifact in report.artifacts:
+        artifact.report.cvss_scores
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "statistics": lambda: with_statistics(report),
+        "Accumulator": lambda: CVSSData.from_artifacts(report.artifacts),
+        f"Merged ({chunks} chunks)": lambda: merged(report, chunks),
+    }
+    baseline = best_of(cases["statistics"], repeat)
+    table = Table("Method", "Time (ms)", "Speedup")
+    for name, func in cases.items():
+        elapsed = best_of(func, repeat)
+        table.add_row(name, f"{elapsed * 1000:.2f}", f"{baseline / elapsed:.1f}x")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
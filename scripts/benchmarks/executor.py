@@ -0,0 +1,95 @@
+"""Benchmark running many work items with `asyncio.gather` against `Executor`.
+
+"gather" is how `ext.api.run_coros` and the `ext.api` helpers ran their
+requests before `Executor` was added: a coroutine and a task are created
+for every work item up front, limited by a semaphore, and the results are
+gathered into a list before `handle_gather` filters out exceptions.
+"Executor.run" takes the work items lazily and collects the results into
+a list, "Executor.map" consumes each result as it is yielded without
+keeping it.
+
+Each work item sleeps for `--latency` milliseconds and returns a small
+object. Peak memory is measured with `tracemalloc`, which slows down all
+methods.
+
+Usage:
+
+    python scripts/benchmarks/executor.py --items 100000 --workers 50
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import tracemalloc
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.ext.api import handle_gather
+from harborapi.ext.executor import Executor
+
+console = Console()
+
+
+def measure(func: Callable[[], Awaitable[Any]]) -> Tuple[float, float]:
+    """Return the time in seconds and peak memory in MiB of running `func`."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(func())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main(
+    items: int = typer.Option(100_000, "--items", "-n"),
+    workers: int = typer.Option(50, "--workers", "-w"),
+    latency: float = typer.Option(1, "--latency", "-l", help="Milliseconds."),
+) -> None:
+    async def work(i: int) -> Dict[str, int]:
+        await asyncio.sleep(latency / 1000)
+        return {"id": i}
+
+    async def with_gather() -> List[Dict[str, int]]:
+        sem = asyncio.Semaphore(workers)
+
+        async def wrap(coro: Awaitable[Dict[str, int]]) -> Dict[str, int]:
+            async with sem:
+                return await coro
+
+        coros = [wrap(work(i)) for i in range(items)]
+        return handle_gather(await asyncio.gather(*coros, return_exceptions=True))
+
+    async def with_executor_run() -> List[Dict[str, int]]:
+        return await Executor(workers, ordered=True).run(work, range(items))
+
+    async def with_executor_map() -> int:
+        n = 0
+        async for _ in Executor(workers).map(work, range(items)):
+            n += 1
+        return n
+
+    cases = {
+        "gather + handle_gather": with_gather,
+        "Executor.run": with_executor_run,
+        "Executor.map": with_executor_map,
+    }
+    console.print(f"{items} items, {workers} workers, {latency} ms latency")
+    table = Table("Method", "Time (s)", "Peak memory (MiB)")
+    for name, func in cases.items():
+        elapsed, peak = measure(func)
+        table.add_row(name, f"{elapsed:.2f}", f"{peak:.1f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,97 @@
+"""Benchmark CVE, package and tag queries on an `ArtifactReport` using
+its inverted index against scanning every artifact.
+
+Runs `--queries` lookups of existing CVE IDs, package names and tags.
+The scan uses the `ArtifactInfo.has_*` methods, which match the query
+against every vulnerability of every artifact. The index is built once
+before running the queries, and the time to build it is reported separately.
+
+Usage:
+
+    python scripts/benchmarks/index.py --artifacts 200 --vulnerabilities 1000
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from table import make_artifact_report
+
+from harborapi.ext.artifact import ArtifactInfo
+from harborapi.ext.report import ArtifactReport
+from harborapi.models import Tag
+
+console = Console()
+
+
+def scan(
+    report: ArtifactReport, has: Callable[[ArtifactInfo, str], bool], queries: List[str]
+) -> None:
+    for query in queries:
+        ArtifactReport.from_artifacts([a for a in report.artifacts if has(a, query)])
+
+
+def main(
+    artifacts: int = typer.Option(200, "--artifacts", "-a"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    queries: int = typer.Option(100, "--queries", "-q"),
+) -> None:
+    report = make_artifact_report(artifacts, vulnerabilities)
+    for i, artifact in enumerate(report.artifacts):
+        artifact.artifact.tags = [Tag(name=f"1.{i}"), Tag(name="latest")]
+    rng = random.Random(1234)
+    vulns = [
+        rng.choice(rng.choice(report.artifacts).report.vulnerabilities)
+        for _ in range(queries)
+    ]
+    cases = {
+        "with_cve": (
+            [v.id or "" for v in vulns],
+            ArtifactInfo.has_cve,
+            ArtifactReport.with_cve,
+        ),
+        "with_package": (
+            [v.package or "" for v in vulns],
+            ArtifactInfo.has_package,
+            ArtifactReport.with_package,
+        ),
+        "with_tag": (
+            [f"1.{rng.randrange(artifacts)}" for _ in range(queries)],
+            ArtifactInfo.has_tag,
+            ArtifactReport.with_tag,
+        ),
+    }
+
+    start = time.perf_counter()
+    report.index
+    build_time = time.perf_counter() - start
+
+    table = Table("Query", f"Scan (ms/{queries})", f"Index (ms/{queries})", "Speedup")
+    for name, (values, has, method) in cases.items():
+        start = time.perf_counter()
+        scan(report, has, values)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            method(report, value)
+        index_time = time.perf_counter() - start
+
+        table.add_row(
+            name,
+            f"{scan_time * 1000:.2f}",
+            f"{index_time * 1000:.2f}",
+            f"{scan_time / index_time:.1f}x",
+        )
+    table.add_row("building the index", "", f"{build_time * 1000:.2f}", "")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
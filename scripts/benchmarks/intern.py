@@ -0,0 +1,159 @@
+"""Benchmark the memory usage of a fleet of vulnerability reports with
+and without interning them with an `InternPool`.
+
+Each report contains a random sample of a catalogue of vulnerabilities,
+as artifacts built from the same base images share most of their
+vulnerabilities. The reports are validated one by one from their own
+JSON documents, as they would be when fetched from the API.
+
+Usage:
+
+    python scripts/benchmarks/intern.py --reports 500 --vulnerabilities 200 --catalogue 5000
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models.intern import InternPool
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+console = Console()
+
+SEVERITIES = ["Critical", "High", "Medium", "Low", "Unknown"]
+
+
+def make_catalogue(n: int, rng: random.Random) -> List[Dict[str, Any]]:
+    catalogue = []
+    for i in range(n):
+        package = f"package-{i % (n // 5 or 1)}"
+        score = round(rng.uniform(0, 10), 1)
+        catalogue.append(
+            {
+                "id": f"CVE-{rng.randint(1999, 2024)}-{i:05d}",
+                "package": package,
+                "version": f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 50)}",
+                "fix_version": f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.0",
+                "severity": rng.choice(SEVERITIES),
+                "description": f"A vulnerability in {package}. " + "x" * 1500,
+                "links": [
+                    f"https://avd.aquasec.com/nvd/cve-2024-{i:05d}",
+                    f"https://nvd.nist.gov/vuln/detail/CVE-2024-{i:05d}",
+                ],
+                "preferred_cvss": {
+                    "score_v3": score,
+                    "vector_v3": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+                },
+                "cwe_ids": [f"CWE-{rng.randint(1, 1000)}"],
+                "vendor_attributes": {
+                    "CVSS": {
+                        "nvd": {
+                            "V3Score": score,
+                            "V3Vector": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+                        }
+                    }
+                },
+            }
+        )
+    return catalogue
+
+
+def make_reports(
+    n_reports: int, n_vulnerabilities: int, catalogue: List[Dict[str, Any]]
+) -> List[bytes]:
+    rng = random.Random(1234)
+    return [
+        json.dumps(
+            {
+                "generated_at": "2024-01-01T00:00:00Z",
+                "scanner": {
+                    "name": "Trivy",
+                    "vendor": "Aqua Security",
+                    "version": "v0.50.0",
+                },
+                "severity": "Critical",
+                "vulnerabilities": rng.sample(catalogue, n_vulnerabilities),
+            }
+        ).encode()
+        for _ in range(n_reports)
+    ]
+
+
+def load(
+    reports: List[bytes], pool: Optional[InternPool]
+) -> List[HarborVulnerabilityReport]:
+    loaded = []
+    for body in reports:
+        report = HarborVulnerabilityReport.model_validate_json(body)
+        if pool is not None:
+            report = pool.intern_report(report)
+        loaded.append(report)
+    return loaded
+
+
+def measure(
+    reports: List[bytes], pool_factory: Callable[[], Optional[InternPool]]
+) -> Tuple[float, int]:
+    """Return the time it takes to load the reports, and the memory
+    retained by the loaded reports (measured in a separate run, as
+    tracing memory allocations slows down the run)."""
+    start = time.perf_counter()
+    load(reports, pool_factory())
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = load(reports, pool_factory())  # noqa: F841 (kept alive to measure it)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def main(
+    reports: int = typer.Option(500, "--reports", "-n"),
+    vulnerabilities: int = typer.Option(200, "--vulnerabilities", "-v"),
+    catalogue_size: int = typer.Option(5000, "--catalogue", "-c"),
+) -> None:
+    catalogue = make_catalogue(catalogue_size, random.Random(42))
+    bodies = make_reports(reports, vulnerabilities, catalogue)
+    console.print(
+        f"{reports} reports with {vulnerabilities} vulnerabilities each, "
+        f"sampled from {catalogue_size} distinct vulnerabilities"
+    )
+
+    table = Table("Method", "Time (s)", "Retained memory (MB)")
+    elapsed, baseline = measure(bodies, lambda: None)
+    table.add_row("No interning", f"{elapsed:.2f}", f"{baseline / 1e6:.1f}")
+    pools: List[InternPool] = []
+
+    def new_pool() -> InternPool:
+        pools.append(InternPool())
+        return pools[-1]
+
+    elapsed, retained = measure(bodies, new_pool)
+    table.add_row(
+        "InternPool",
+        f"{elapsed:.2f}",
+        f"{retained / 1e6:.1f} ({retained / baseline:.0%})",
+    )
+    console.print(table)
+    console.print(f"Distinct vulnerabilities in pool: {len(pools[-1])}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,126 @@
+"""Benchmark decoding and encoding of vulnerability reports with the
+available JSON backends.
+
+Reports are generated synthetically with the same shape as the
+reports returned by Harbor's vulnerability scanners.
+
+Usage:
+
+    python scripts/benchmarks/json_backend.py --vulnerabilities 5000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import httpx
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.serialization import JSON_BACKENDS
+from harborapi.serialization import JSONBackend
+from harborapi.utils import handle_optional_json_response
+
+console = Console()
+
+SEVERITIES = ["Unknown", "Low", "Medium", "High", "Critical"]
+
+
+def make_report(n_vulnerabilities: int) -> Dict[str, Any]:
+    rng = random.Random(1234)
+    vulnerabilities = []
+    for i in range(n_vulnerabilities):
+        package = f"package-{rng.randint(0, n_vulnerabilities // 10)}"
+        vulnerabilities.append(
+            {
+                "id": f"CVE-{rng.randint(1999, 2024)}-{i:05d}",
+                "package": package,
+                "version": f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 50)}",
+                "fix_version": f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.0",
+                "severity": rng.choice(SEVERITIES),
+                "description": "A vulnerability in " + package + " " * 20 + "x" * 300,
+                "links": [f"https://avd.aquasec.com/nvd/cve-2021-{i:05d}"],
+                "preferred_cvss": {
+                    "score_v3": round(rng.uniform(0, 10), 1),
+                    "vector_v3": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+                },
+                "cwe_ids": [f"CWE-{rng.randint(1, 1000)}"],
+                "vendor_attributes": {
+                    "CVSS": {
+                        "nvd": {
+                            "V3Score": round(rng.uniform(0, 10), 1),
+                            "V3Vector": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+                        }
+                    }
+                },
+            }
+        )
+    return {
+        "generated_at": "2024-01-01T00:00:00Z",
+        "artifact": {
+            "repository_name": "library/nginx",
+            "digest": "sha256:" + "0" * 64,
+            "tag": "latest",
+            "mime_type": "application/vnd.docker.distribution.manifest.v2+json",
+        },
+        "scanner": {"name": "Trivy", "vendor": "Aqua Security", "version": "v0.50.0"},
+        "severity": "Critical",
+        "vulnerabilities": vulnerabilities,
+    }
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(
+    vulnerabilities: int = typer.Option(5000, "--vulnerabilities", "-v"),
+    repeat: int = typer.Option(20, "--repeat", "-r"),
+) -> None:
+    report = make_report(vulnerabilities)
+    backends: List[JSONBackend] = []
+    for backend_cls in JSON_BACKENDS.values():
+        try:
+            backends.append(backend_cls())
+        except ImportError:
+            console.print(f"Skipping {backend_cls.name}: not installed")
+
+    body = JSONBackend().dumps(report)
+    response = httpx.Response(
+        200, content=body, headers={"Content-Type": "application/json"}
+    )
+    console.print(
+        f"Report with {vulnerabilities} vulnerabilities: {len(body) / 1e6:.2f} MB"
+    )
+
+    table = Table("Backend", "Decode (ms)", "MB/s", "Encode (ms)")
+    baseline = best_of(lambda: response.json(), repeat)
+    table.add_row("httpx Response.json()", f"{baseline * 1000:.2f}", "", "")
+    for backend in backends:
+        decode = best_of(
+            lambda: handle_optional_json_response(response, backend), repeat
+        )
+        encode = best_of(lambda: backend.dumps(report), repeat)
+        table.add_row(
+            backend.name,
+            f"{decode * 1000:.2f}",
+            f"{len(body) / 1e6 / decode:.0f}",
+            f"{encode * 1000:.2f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
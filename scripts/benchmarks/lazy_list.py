@@ -0,0 +1,79 @@
+"""Benchmark validating a list of artifacts up front against validating
+items on demand with `LazyList`.
+
+Measures the time and peak memory usage of loading the list and reading
+a few fields of a fraction of its items.
+
+Usage:
+
+    python scripts/benchmarks/lazy_list.py --artifacts 5000 --fraction 0.1
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import typer
+from list_validation import make_artifact
+from pydantic import TypeAdapter
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models import Artifact
+from harborapi.models.lazy import LazyList
+
+console = Console()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Return the fastest run time of `func` in seconds and its peak memory usage in bytes."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main(
+    artifacts: int = typer.Option(5000, "--artifacts", "-n"),
+    fraction: float = typer.Option(0.1, "--fraction", "-f"),
+    repeat: int = typer.Option(10, "--repeat", "-r"),
+) -> None:
+    body = json.dumps([make_artifact(i) for i in range(artifacts)]).encode()
+    adapter = TypeAdapter(List[Artifact])
+    step = max(1, round(1 / fraction))
+
+    def use(items: List[Artifact]) -> None:
+        for artifact in items[::step]:
+            artifact.digest, artifact.tags, artifact.push_time
+
+    def eager() -> None:
+        use(adapter.validate_json(body))
+
+    def lazy() -> None:
+        use(LazyList(json.loads(body), loader=Artifact.model_validate))
+
+    console.print(
+        f"{artifacts} artifacts, {len(body) / 1e6:.2f} MB, "
+        f"accessing every {step} item(s)"
+    )
+    table = Table("Method", "Time (ms)", "Peak memory (MB)")
+    for name, func in [("Validate all items", eager), ("LazyList", lazy)]:
+        elapsed, peak = measure(func, repeat)
+        table.add_row(name, f"{elapsed * 1000:.2f}", f"{peak / 1e6:.2f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,122 @@
+"""Micro-benchmark of validating a list of artifacts with scan overviews.
+
+Compares the previous approach of decoding the response body and then
+validating each item with `model_validate`, against validating the whole
+list with a single `TypeAdapter` call, both from decoded JSON and
+directly from the response bytes.
+
+Usage:
+
+    python scripts/benchmarks/list_validation.py --artifacts 1000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import typer
+from pydantic import TypeAdapter
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models import Artifact
+
+console = Console()
+
+
+def make_artifact(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "type": "IMAGE",
+        "media_type": "application/vnd.docker.container.image.v1+json",
+        "manifest_media_type": "application/vnd.docker.distribution.manifest.v2+json",
+        "project_id": 1,
+        "repository_id": i // 10,
+        "digest": f"sha256:{i:064x}",
+        "size": 1024 * i,
+        "push_time": "2024-01-01T12:00:00.000Z",
+        "pull_time": "2024-01-02T12:00:00.000Z",
+        "extra_attrs": {"architecture": "amd64", "os": "linux"},
+        "tags": [
+            {
+                "id": i,
+                "repository_id": i // 10,
+                "artifact_id": i,
+                "name": f"v{i}",
+                "push_time": "2024-01-01T12:00:00.000Z",
+                "pull_time": "2024-01-02T12:00:00.000Z",
+                "immutable": False,
+            }
+        ],
+        "labels": [],
+        "scan_overview": {
+            "application/vnd.security.vulnerability.report; version=1.1": {
+                "report_id": f"report-{i}",
+                "scan_status": "Success",
+                "severity": "High",
+                "duration": 10,
+                "summary": {
+                    "total": 100,
+                    "fixable": 50,
+                    "summary": {"Critical": 5, "High": 20, "Medium": 75},
+                },
+                "start_time": "2024-01-01T12:00:00Z",
+                "end_time": "2024-01-01T12:00:10Z",
+                "complete_percent": 100,
+                "scanner": {"name": "Trivy", "vendor": "Aqua", "version": "v0.50"},
+            }
+        },
+    }
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(
+    artifacts: int = typer.Option(1000, "--artifacts", "-n"),
+    repeat: int = typer.Option(20, "--repeat", "-r"),
+) -> None:
+    body = json.dumps([make_artifact(i) for i in range(artifacts)]).encode()
+    adapter = TypeAdapter(List[Artifact])
+
+    def per_item() -> List[Artifact]:
+        return [Artifact.model_validate(item) for item in json.loads(body)]
+
+    def adapter_python() -> List[Artifact]:
+        return adapter.validate_python(json.loads(body))
+
+    def adapter_json() -> List[Artifact]:
+        return adapter.validate_json(body)
+
+    assert per_item() == adapter_python() == adapter_json()
+
+    console.print(f"{artifacts} artifacts, {len(body) / 1e6:.2f} MB")
+    results = [
+        (name, best_of(func, repeat))
+        for name, func in [
+            ("json.loads + model_validate per item", per_item),
+            ("json.loads + TypeAdapter.validate_python", adapter_python),
+            ("TypeAdapter.validate_json (bytes)", adapter_json),
+        ]
+    ]
+    baseline = results[0][1]
+    table = Table("Method", "Time (ms)", "Speedup")
+    for name, elapsed in results:
+        table.add_row(name, f"{elapsed * 1000:.2f}", f"{baseline / elapsed:.2f}x")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
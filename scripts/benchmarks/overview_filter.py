@@ -0,0 +1,74 @@
+"""Benchmark crawling the vulnerability reports of all artifacts against
+skipping reports based on the artifacts' scan overviews.
+
+Uses the fake client of `pipelined_crawl.py`, where 1 in 5 artifacts has
+an overall severity of High or Critical. "All reports" fetches the report
+of every artifact, "min_severity=High" only fetches the reports of High and
+Critical artifacts, and "summary_only" fetches no reports and computes the
+severity distribution from the scan overviews.
+
+Usage:
+
+    python scripts/benchmarks/overview_filter.py --repositories 100 --latency 20
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+import typer
+from pipelined_crawl import make_client
+from rich.console import Console
+from rich.table import Table
+
+from harborapi import HarborAsyncClient
+from harborapi.ext.api import get_artifact_vulnerabilities
+from harborapi.models.scanner import Severity
+
+console = Console()
+
+
+def crawl(
+    client: HarborAsyncClient, max_connections: int, **kwargs: Any
+) -> Tuple[float, int]:
+    start = time.perf_counter()
+    artifacts = asyncio.run(
+        get_artifact_vulnerabilities(client, max_connections=max_connections, **kwargs)
+    )
+    return time.perf_counter() - start, len(artifacts)
+
+
+def main(
+    repositories: int = typer.Option(100, "--repositories", "-r"),
+    max_artifacts: int = typer.Option(100, "--max-artifacts", "-a"),
+    latency: float = typer.Option(20, "--latency", "-l", help="Milliseconds."),
+    max_connections: int = typer.Option(10, "--max-connections", "-c"),
+) -> None:
+    client, total = make_client(repositories, max_artifacts, latency / 1000)
+    console.print(
+        f"{repositories} repositories, {total} artifacts, {latency} ms latency, "
+        f"{max_connections} connections"
+    )
+    cases: Dict[str, Dict[str, Any]] = {
+        "All reports": {},
+        "min_severity=High": {"min_severity": Severity.high},
+        "summary_only": {"summary_only": True},
+    }
+    table = Table("Mode", "Artifacts", "Reports fetched", "Time (s)", "Speedup")
+    baseline = 0.0
+    for name, kwargs in cases.items():
+        elapsed, n = crawl(client, max_connections, **kwargs)
+        baseline = baseline or elapsed
+        fetched = 0 if kwargs.get("summary_only") else n
+        table.add_row(
+            name, str(n), str(fetched), f"{elapsed:.2f}", f"{baseline / elapsed:.1f}x"
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,150 @@
+"""Benchmark crawling the vulnerability reports of all artifacts with
+`get_artifact_vulnerabilities` against `aiter_artifact_vulnerabilities`.
+
+The client's endpoints are replaced with fakes that sleep for `--latency`
+milliseconds per request. Listing the artifacts of a repository takes one
+request per page of 10 artifacts, and repositories have between 1 and
+`--max-artifacts` artifacts, so a few large repositories take much longer
+to list than the rest.
+
+"Phased" lists the artifacts of every repository before fetching any report,
+and returns all the artifacts at once. "Pipelined" starts fetching the
+reports of a repository as soon as it has been listed, and yields each
+artifact as soon as its report has been fetched.
+
+Usage:
+
+    python scripts/benchmarks/pipelined_crawl.py --repositories 100 --latency 20
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi import HarborAsyncClient
+from harborapi.ext.api import aiter_artifact_vulnerabilities
+from harborapi.ext.api import get_artifact_vulnerabilities
+from harborapi.models import Artifact
+from harborapi.models import Repository
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+console = Console()
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+SEVERITIES = ["Critical", "High", "Medium", "Low", "None"]
+SEVERITY_WEIGHTS = [5, 15, 40, 30, 10]
+
+
+def make_overview(rng: random.Random) -> Dict[str, Any]:
+    """Make a scan overview where 1 in 5 artifacts are High or Critical."""
+    severity = rng.choices(SEVERITIES, weights=SEVERITY_WEIGHTS)[0]
+    return {
+        "scan_status": "Success",
+        "severity": severity,
+        "summary": {"summary": {severity: 1} if severity != "None" else {}},
+    }
+
+
+def make_client(
+    repositories: int, max_artifacts: int, latency: float
+) -> Tuple[HarborAsyncClient, int]:
+    rng = random.Random(1234)
+    artifacts: Dict[str, List[Artifact]] = {}
+    for i in range(repositories):
+        # Most repositories are small, a few are large
+        n = min(max_artifacts, int(rng.paretovariate(1.0)))
+        artifacts[f"project/repo{i}"] = [
+            Artifact(
+                digest=f"sha256:{i}-{j}",
+                scan_overview={MIME_TYPE: make_overview(rng)},
+            )
+            for j in range(n)
+        ]
+
+    async def get_repositories(*args: Any, **kwargs: Any) -> List[Repository]:
+        await asyncio.sleep(latency)
+        return [Repository(name=name) for name in artifacts]
+
+    async def get_artifacts(
+        project: str, repo: str, *args: Any, **kwargs: Any
+    ) -> List[Artifact]:
+        result = artifacts[f"{project}/{repo}"]
+        pages = len(result) // 10 + 1
+        await asyncio.sleep(latency * pages)
+        return result
+
+    async def get_artifact_vulnerabilities(
+        *args: Any, **kwargs: Any
+    ) -> HarborVulnerabilityReport:
+        await asyncio.sleep(latency)
+        return HarborVulnerabilityReport()
+
+    client = HarborAsyncClient(
+        url="http://localhost/api/v2.0", username="u", secret="s"
+    )
+    setattr(client, "get_repositories", get_repositories)
+    setattr(client, "get_artifacts", get_artifacts)
+    setattr(client, "get_artifact_vulnerabilities", get_artifact_vulnerabilities)
+    return client, sum(len(a) for a in artifacts.values())
+
+
+async def phased(client: HarborAsyncClient, max_connections: int) -> Tuple[float, int]:
+    start = time.perf_counter()
+    artifacts = await get_artifact_vulnerabilities(
+        client, max_connections=max_connections
+    )
+    return time.perf_counter() - start, len(artifacts)
+
+
+async def pipelined(
+    client: HarborAsyncClient, max_connections: int
+) -> Tuple[float, float, int]:
+    start = time.perf_counter()
+    first = 0.0
+    n = 0
+    async for _ in aiter_artifact_vulnerabilities(
+        client, max_connections=max_connections
+    ):
+        if not n:
+            first = time.perf_counter() - start
+        n += 1
+    return first, time.perf_counter() - start, n
+
+
+def main(
+    repositories: int = typer.Option(100, "--repositories", "-r"),
+    max_artifacts: int = typer.Option(100, "--max-artifacts", "-a"),
+    latency: float = typer.Option(20, "--latency", "-l", help="Milliseconds."),
+    max_connections: int = typer.Option(10, "--max-connections", "-c"),
+) -> None:
+    client, total = make_client(repositories, max_artifacts, latency / 1000)
+    console.print(
+        f"{repositories} repositories, {total} artifacts, {latency} ms latency, "
+        f"{max_connections} connections"
+    )
+    phased_time, phased_n = asyncio.run(phased(client, max_connections))
+    first, pipelined_time, pipelined_n = asyncio.run(pipelined(client, max_connections))
+    assert phased_n == pipelined_n == total
+
+    table = Table("Crawler", "First result (s)", "All results (s)")
+    table.add_row("Phased", f"{phased_time:.2f}", f"{phased_time:.2f}")
+    table.add_row("Pipelined", f"{first:.2f}", f"{pipelined_time:.2f}")
+    console.print(table)
+    console.print(
+        f"Time to first result: {phased_time / first:.1f}x faster, "
+        f"total: {phased_time / pipelined_time:.2f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
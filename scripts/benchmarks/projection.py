@@ -0,0 +1,94 @@
+"""Benchmark validating vulnerability reports and artifacts with and
+without projecting them onto a few fields first.
+
+Usage:
+
+    python scripts/benchmarks/projection.py --vulnerabilities 10000 --artifacts 1000
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import typer
+from json_backend import make_report
+from list_validation import make_artifact
+from pydantic import TypeAdapter
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models import Artifact
+from harborapi.models.projection import get_projection
+from harborapi.models.projection import project
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+console = Console()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, int, int]:
+    """Return the fastest run time of `func` in seconds, and the memory
+    retained by its result and the peak memory usage of a call in bytes."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    result = func()  # noqa: F841 (kept alive to measure its size)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), retained, peak
+
+
+def main(
+    vulnerabilities: int = typer.Option(10000, "--vulnerabilities", "-v"),
+    artifacts: int = typer.Option(1000, "--artifacts", "-a"),
+    repeat: int = typer.Option(10, "--repeat", "-r"),
+) -> None:
+    report_body = json.dumps(make_report(vulnerabilities)).encode()
+    artifacts_body = json.dumps([make_artifact(i) for i in range(artifacts)]).encode()
+    adapter = TypeAdapter(List[Artifact])
+    report_projection = get_projection(
+        HarborVulnerabilityReport, ["vulnerabilities.id", "vulnerabilities.severity"]
+    )
+    artifact_projection = get_projection(Artifact, ["digest", "tags.name"])
+
+    cases = [
+        (
+            f"Report ({vulnerabilities} vulnerabilities)",
+            lambda: HarborVulnerabilityReport.model_validate_json(report_body),
+            lambda: HarborVulnerabilityReport.model_validate(
+                project(json.loads(report_body), report_projection)
+            ),
+        ),
+        (
+            f"{artifacts} artifacts",
+            lambda: adapter.validate_json(artifacts_body),
+            lambda: adapter.validate_python(
+                project(json.loads(artifacts_body), artifact_projection)
+            ),
+        ),
+    ]
+    table = Table("Data", "Method", "Time (ms)", "Retained (MB)", "Peak (MB)")
+    for name, full, projected in cases:
+        for method, func in [("All fields", full), ("Projected", projected)]:
+            elapsed, retained, peak = measure(func, repeat)
+            table.add_row(
+                name,
+                method,
+                f"{elapsed * 1000:.2f}",
+                f"{retained / 1e6:.2f}",
+                f"{peak / 1e6:.2f}",
+            )
+            name = ""
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
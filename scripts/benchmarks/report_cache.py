@@ -0,0 +1,150 @@
+"""Benchmark crawling the vulnerability reports of all artifacts with and
+without a `ReportCache`.
+
+The client's repository and artifact endpoints are replaced with fakes, and
+`HarborAsyncClient.get` returns a report with `--vulnerabilities`
+vulnerabilities after sleeping for `--latency` milliseconds, so the client's
+own `get_artifact_vulnerabilities` and its report cache are used.
+
+"Cold" crawls with an empty cache stored in a temporary file, and "Warm"
+crawls again with a new cache opened from the same file, as a later run of
+the same program would. "Rescanned" crawls again after `--rescanned` percent
+of the artifacts have been given new report IDs.
+
+Usage:
+
+    python scripts/benchmarks/report_cache.py --artifacts 1000 --latency 50
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi import HarborAsyncClient
+from harborapi.cache import ReportCache
+from harborapi.ext.api import get_artifact_vulnerabilities
+from harborapi.models import Artifact
+from harborapi.models import Repository
+
+console = Console()
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+
+
+def make_report(n: int) -> Dict[str, Any]:
+    return {
+        "severity": "High",
+        "vulnerabilities": [
+            {
+                "id": f"CVE-2022-{i}",
+                "package": f"package{i % 50}",
+                "version": "1.0.0",
+                "fix_version": "1.0.1",
+                "severity": "High",
+                "description": "Lorem ipsum dolor sit amet " * 10,
+                "links": [f"https://nvd.nist.gov/vuln/detail/CVE-2022-{i}"],
+            }
+            for i in range(n)
+        ],
+    }
+
+
+class FakeRegistry:
+    def __init__(self, artifacts: int, vulnerabilities: int, latency: float) -> None:
+        self.latency = latency
+        self.report = make_report(vulnerabilities)
+        self.artifacts = [
+            Artifact(
+                digest=f"sha256:{i}",
+                scan_overview={
+                    MIME_TYPE: {"scan_status": "Success", "report_id": "report-0"}
+                },
+            )
+            for i in range(artifacts)
+        ]
+        self.requests = 0
+
+    def rescan(self, fraction: float, rng: random.Random) -> None:
+        for artifact in rng.sample(self.artifacts, int(len(self.artifacts) * fraction)):
+            assert artifact.scan_overview is not None
+            overview = artifact.scan_overview.root[MIME_TYPE]
+            overview.report_id = f"report-{rng.random()}"
+
+    def client(self, report_cache: Optional[ReportCache]) -> HarborAsyncClient:
+        client = HarborAsyncClient(
+            url="http://localhost/api/v2.0",
+            username="u",
+            secret="s",
+            report_cache=report_cache,
+        )
+
+        async def get_repositories(*args: Any, **kwargs: Any) -> List[Repository]:
+            return [Repository(name="project/repo")]
+
+        async def get_artifacts(*args: Any, **kwargs: Any) -> List[Artifact]:
+            return self.artifacts
+
+        async def get(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            self.requests += 1
+            await asyncio.sleep(self.latency)
+            return {MIME_TYPE: self.report}
+
+        setattr(client, "get_repositories", get_repositories)
+        setattr(client, "get_artifacts", get_artifacts)
+        setattr(client, "get", get)
+        return client
+
+
+def main(
+    artifacts: int = typer.Option(1000, "--artifacts", "-n"),
+    vulnerabilities: int = typer.Option(200, "--vulnerabilities", "-v"),
+    latency: float = typer.Option(50, "--latency", "-l", help="Milliseconds."),
+    max_connections: int = typer.Option(10, "--max-connections", "-c"),
+    rescanned: float = typer.Option(10, "--rescanned", "-r", help="Percent."),
+) -> None:
+    registry = FakeRegistry(artifacts, vulnerabilities, latency / 1000)
+    rng = random.Random(1234)
+
+    def crawl(report_cache: Optional[ReportCache]) -> List[str]:
+        registry.requests = 0
+        client = registry.client(report_cache)
+        start = time.perf_counter()
+        result = asyncio.run(
+            get_artifact_vulnerabilities(client, max_connections=max_connections)
+        )
+        elapsed = time.perf_counter() - start
+        assert len(result) == artifacts
+        return [f"{elapsed:.2f}", str(registry.requests)]
+
+    console.print(
+        f"{artifacts} artifacts, {vulnerabilities} vulnerabilities per report, "
+        f"{latency} ms latency, {max_connections} connections"
+    )
+    table = Table("Crawl", "Time (s)", "Report requests", "Cache size (MiB)")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "reports.db"
+        table.add_row("No cache", *crawl(None), "")
+        for name in ["Cold", "Warm", "Rescanned"]:
+            if name == "Rescanned":
+                registry.rescan(rescanned / 100, rng)
+            cache = ReportCache(path)
+            row = crawl(cache)
+            table.add_row(name, *row, f"{cache.size / 2**20:.1f}")
+            cache.close()
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
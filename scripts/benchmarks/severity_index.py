@@ -0,0 +1,85 @@
+"""Benchmark the severity and fixability aggregates of vulnerability reports
+served from the report's severity index against recomputing them.
+
+"Recomputed" filters the vulnerabilities of each report on every access,
+as `HarborVulnerabilityReport.fixable`, `critical`, `distribution` etc.
+did before the index was added. "Indexed" uses the properties, which build
+the index on first access and reuse it afterwards.
+
+Usage:
+
+    python scripts/benchmarks/severity_index.py --reports 100 --vulnerabilities 1000
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Any
+from typing import Callable
+from typing import List
+
+import typer
+from json_backend import make_report
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Severity
+
+console = Console()
+
+SEVERITIES = [Severity.critical, Severity.high, Severity.medium, Severity.low]
+
+
+def recomputed(report: HarborVulnerabilityReport) -> None:
+    vulns = report.vulnerabilities
+    [v for v in vulns if v.fixable]
+    [v for v in vulns if not v.fixable]
+    for severity in SEVERITIES:
+        [v for v in vulns if v.severity == severity]
+    Counter(v.severity for v in vulns if v.severity)
+
+
+def indexed(report: HarborVulnerabilityReport) -> None:
+    report.fixable
+    report.unfixable
+    for severity in SEVERITIES:
+        report.vulnerabilities_by_severity(severity)
+    report.distribution
+
+
+def run(
+    func: Callable[[HarborVulnerabilityReport], Any],
+    reports: List[HarborVulnerabilityReport],
+    passes: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(passes):
+        for report in reports:
+            func(report)
+    return time.perf_counter() - start
+
+
+def main(
+    reports: int = typer.Option(100, "--reports", "-n"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    passes: int = typer.Option(10, "--passes", "-p"),
+) -> None:
+    report = HarborVulnerabilityReport.model_validate(make_report(vulnerabilities))
+    report_list = [report.model_copy(deep=True) for _ in range(reports)]
+
+    table = Table("Passes", "Recomputed (ms)", "Indexed (ms)", "Speedup")
+    for n in (1, passes):
+        for r in report_list:
+            r.reindex()
+        old = run(recomputed, report_list, n)
+        new = run(indexed, report_list, n)
+        table.add_row(
+            str(n), f"{old * 1000:.2f}", f"{new * 1000:.2f}", f"{old / new:.1f}x"
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,159 @@
+"""Benchmark crawling a registry where images are promoted between
+repositories and built for multiple platforms, with and without sharing
+the report of each digest between the artifacts with the digest.
+
+Each of `--images` images is a multi-arch image index with one child
+manifest per platform. The index and its children are listed in a
+"dev" repository, and the index and a random share of `--promoted`
+percent of them are promoted to "staging" and then "prod" repositories
+with the same digests.
+
+"Per artifact" fetches the report of every listed artifact, as
+`get_artifact_vulnerabilities` did before reports were shared.
+"Shared" is `get_artifact_vulnerabilities` and "Shared, pipelined" is
+`aiter_artifact_vulnerabilities`, which fetch the report of each digest once.
+
+Fetching a report sleeps for `--latency` milliseconds.
+
+Usage:
+
+    python scripts/benchmarks/shared_reports.py --images 200 --latency 20
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from harborapi import HarborAsyncClient
+from harborapi.ext.api import CrawlStats
+from harborapi.ext.api import _get_artifact_report
+from harborapi.ext.api import aiter_artifact_vulnerabilities
+from harborapi.ext.api import get_artifact_vulnerabilities
+from harborapi.ext.api import get_artifacts
+from harborapi.ext.executor import Executor
+from harborapi.models import Artifact
+from harborapi.models import Reference
+from harborapi.models import Repository
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+console = Console()
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+PLATFORMS = ["amd64", "arm64", "ppc64le"]
+OVERVIEW = {MIME_TYPE: {"scan_status": "Success", "report_id": "report"}}
+
+
+def make_registry(
+    images: int, promoted: float, rng: random.Random
+) -> Dict[str, List[Artifact]]:
+    repos: Dict[str, List[Artifact]] = {}
+    for i in range(images):
+        children = [
+            Artifact(digest=f"sha256:{i}-{p}", scan_overview=OVERVIEW)
+            for p in PLATFORMS
+        ]
+        index = Artifact(
+            digest=f"sha256:{i}",
+            scan_overview=OVERVIEW,
+            references=[Reference(child_digest=c.digest) for c in children],
+        )
+        repos[f"dev/image{i}"] = [index, *children]
+        if rng.random() < promoted:
+            for env in ["staging", "prod"]:
+                repos[f"{env}/image{i}"] = [index, *children]
+    return repos
+
+
+def make_client(
+    repos: Dict[str, List[Artifact]], latency: float
+) -> Tuple[HarborAsyncClient, List[int]]:
+    requests = [0]
+
+    async def get_repositories(*args: Any, **kwargs: Any) -> List[Repository]:
+        return [Repository(name=name) for name in repos]
+
+    async def get_artifacts(
+        project: str, repo: str, *args: Any, **kwargs: Any
+    ) -> List[Artifact]:
+        return repos[f"{project}/{repo}"]
+
+    async def get_artifact_vulnerabilities(
+        *args: Any, **kwargs: Any
+    ) -> HarborVulnerabilityReport:
+        requests[0] += 1
+        await asyncio.sleep(latency)
+        return HarborVulnerabilityReport()
+
+    client = HarborAsyncClient(
+        url="http://localhost/api/v2.0", username="u", secret="s"
+    )
+    setattr(client, "get_repositories", get_repositories)
+    setattr(client, "get_artifacts", get_artifacts)
+    setattr(client, "get_artifact_vulnerabilities", get_artifact_vulnerabilities)
+    return client, requests
+
+
+def main(
+    images: int = typer.Option(200, "--images", "-n"),
+    promoted: float = typer.Option(50, "--promoted", "-p", help="Percent."),
+    latency: float = typer.Option(20, "--latency", "-l", help="Milliseconds."),
+    max_connections: int = typer.Option(10, "--max-connections", "-c"),
+) -> None:
+    repos = make_registry(images, promoted / 100, random.Random(1234))
+    client, requests = make_client(repos, latency / 1000)
+
+    async def per_artifact() -> int:
+        artifacts = await get_artifacts(client, max_connections=max_connections)
+        results = await Executor(max_connections, ordered=True).run(
+            lambda artifact: _get_artifact_report(client, artifact), artifacts
+        )
+        return len(results)
+
+    stats = CrawlStats()
+
+    async def shared() -> int:
+        artifacts = await get_artifact_vulnerabilities(
+            client, max_connections=max_connections, stats=stats
+        )
+        return len(artifacts)
+
+    async def shared_pipelined() -> int:
+        n = 0
+        async for _ in aiter_artifact_vulnerabilities(
+            client, max_connections=max_connections
+        ):
+            n += 1
+        return n
+
+    cases = {
+        "Per artifact": per_artifact,
+        "Shared": shared,
+        "Shared, pipelined": shared_pipelined,
+    }
+    table = Table("Crawl", "Artifacts", "Report requests", "Time (s)")
+    for name, func in cases.items():
+        requests[0] = 0
+        start = time.perf_counter()
+        n = asyncio.run(func())
+        elapsed = time.perf_counter() - start
+        table.add_row(name, str(n), str(requests[0]), f"{elapsed:.2f}")
+    console.print(
+        f"{images} images for {len(PLATFORMS)} platforms, {promoted}% promoted, "
+        f"{latency} ms latency, {max_connections} connections"
+    )
+    console.print(table)
+    console.print(stats)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,129 @@
+"""Benchmark aggregating the vulnerabilities of an `ArtifactReport`
+with its methods against the columnar `VulnerabilityTable`.
+
+Runs a set of typical dashboard queries (severity distribution, CVSS
+statistics, fixable and critical counts, affected artifacts) both ways.
+The table is built once, and the time to build it is reported separately.
+Uses NumPy if it is installed, otherwise `array.array` columns.
+
+Usage:
+
+    python scripts/benchmarks/table.py --artifacts 200 --vulnerabilities 1000
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+import typer
+from json_backend import make_report
+from rich.console import Console
+from rich.table import Table
+
+from harborapi.ext.artifact import ArtifactInfo
+from harborapi.ext.cve import CVSSData
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.table import VulnerabilityTable
+from harborapi.ext.table import numpy_installed
+from harborapi.models import Artifact
+from harborapi.models import Repository
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Severity
+
+console = Console()
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs of `func` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def make_artifact_report(n_artifacts: int, n_vulnerabilities: int) -> ArtifactReport:
+    report = HarborVulnerabilityReport.model_validate(make_report(n_vulnerabilities))
+    return ArtifactReport.from_artifacts(
+        [
+            ArtifactInfo.model_construct(
+                artifact=Artifact(digest=f"sha256:{i:064x}"),
+                repository=Repository(name=f"project/repo-{i % 10}"),
+                # Share the vulnerabilities, but not the report
+                report=report.model_copy(),
+            )
+            for i in range(n_artifacts)
+        ]
+    )
+
+
+def report_queries(report: ArtifactReport) -> Dict[str, Callable[[], Any]]:
+    return {
+        "distribution": lambda: report.distribution,
+        "CVSS statistics": lambda: CVSSData.from_report(report),
+        "fixable count": lambda: sum(1 for _ in report.fixable),
+        "critical count": lambda: sum(1 for _ in report.critical),
+        "artifacts with package": lambda: report.with_package("package-1"),
+    }
+
+
+def table_queries(table: VulnerabilityTable) -> Dict[str, Callable[[], Any]]:
+    return {
+        "distribution": lambda: table.distribution(),
+        "CVSS statistics": lambda: table.cvss_stats(),
+        "fixable count": lambda: table.count(table.mask(fixable=True)),
+        "critical count": lambda: table.count(table.mask(severity=Severity.critical)),
+        "artifacts with package": lambda: table.to_report(
+            table.mask(package="package-1")
+        ),
+    }
+
+
+def main(
+    artifacts: int = typer.Option(200, "--artifacts", "-a"),
+    vulnerabilities: int = typer.Option(1000, "--vulnerabilities", "-v"),
+    repeat: int = typer.Option(5, "--repeat", "-r"),
+) -> None:
+    report = make_artifact_report(artifacts, vulnerabilities)
+    backend = "numpy" if numpy_installed else "array"
+    console.print(
+        f"{artifacts * vulnerabilities} vulnerabilities, table backend: {backend}"
+    )
+
+    start = time.perf_counter()
+    table = VulnerabilityTable.from_report(report)
+    build_time = time.perf_counter() - start
+
+    results = Table(
+        "Query", "ArtifactReport (ms)", "VulnerabilityTable (ms)", "Speedup"
+    )
+    loop_total = table_total = 0.0
+    for (name, loop), (_, vectorized) in zip(
+        report_queries(report).items(), table_queries(table).items()
+    ):
+        loop_time = best_of(loop, repeat)
+        table_time = best_of(vectorized, repeat)
+        loop_total += loop_time
+        table_total += table_time
+        results.add_row(
+            name,
+            f"{loop_time * 1000:.2f}",
+            f"{table_time * 1000:.2f}",
+            f"{loop_time / table_time:.1f}x",
+        )
+    results.add_row(
+        "total",
+        f"{loop_total * 1000:.2f}",
+        f"{table_total * 1000:.2f}",
+        f"{loop_total / table_total:.1f}x",
+    )
+    results.add_row("building the table", "", f"{build_time * 1000:.2f}", "")
+    console.print(results)
+
+
+if __name__ == "__main__":
+    typer.run(main)
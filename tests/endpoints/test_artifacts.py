@@ -396,6 +396,44 @@ async def test_get_artifacts_mock(
     assert [a.model_dump() for a in resp] == [a.model_dump() for a in artifacts]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw", [True, False])
+async def test_get_artifacts_fields_mock(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+    raw: bool,
+):
+    artifacts = [
+        {
+            "id": i,
+            "digest": f"sha256:{i}",
+            "size": 100,
+            "extra_attrs": {"architecture": "amd64"},
+            "tags": [{"id": i, "name": f"v{i}", "push_time": "2024-01-01T12:00:00Z"}],
+        }
+        for i in range(2)
+    ]
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/projects/testproj/repositories/testrepo/artifacts",
+        method="GET",
+    ).respond_with_json(artifacts)
+
+    async_client.raw = raw
+    resp = await async_client.get_artifacts(
+        "testproj", "testrepo", fields=["digest", "tags.name"]
+    )
+    expected = [
+        {"digest": "sha256:0", "tags": [{"name": "v0"}]},
+        {"digest": "sha256:1", "tags": [{"name": "v1"}]},
+    ]
+    if raw:
+        assert resp == expected
+    else:
+        assert [a.model_dump(exclude_unset=True) for a in resp] == expected
+        assert resp[0].size is None
+        assert resp[0].extra_attrs is None
+
+
 @pytest.mark.asyncio
 @given(st.builds(Label))
 @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from harborapi.client import HarborAsyncClient
+from harborapi.ext.api import CrawlStats
+from harborapi.ext.api import _get_artifact_report
+from harborapi.ext.api import aiter_artifact_vulnerabilities
+from harborapi.ext.api import get_artifact_vulnerabilities
+from harborapi.ext.artifact import ArtifactInfo
+from harborapi.ext.report import ArtifactReport
+from harborapi.models import Artifact
+from harborapi.models import Reference
+from harborapi.models import Repository
+from harborapi.models import Tag
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Severity
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+
+
+SEVERITIES = ["Critical", "High", "Medium", "Low", "None"]
+
+
+def make_artifact(
+    digest: str, tag: str, status: str = "Success", severity: str = "None"
+) -> Artifact:
+    summary = {severity: 1} if severity != "None" else {}
+    return Artifact(
+        digest=digest,
+        tags=[Tag(name=tag)],
+        scan_overview={
+            MIME_TYPE: {
+                "scan_status": status,
+                "severity": severity,
+                "summary": {"total": len(summary), "summary": summary},
+            }
+        },
+    )
+
+
+class FakeRegistry:
+    """Stands in for the repository, artifact and report endpoints
+    of a client, keeping track of the requests in flight."""
+
+    def __init__(self, artifacts: Dict[str, List[Artifact]]) -> None:
+        self.artifacts = artifacts
+        self.blocked: Dict[str, asyncio.Event] = {}
+        self.fail: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.reports_fetched = 0
+        self.report_ids: Dict[str, Optional[str]] = {}
+        self.fields: Optional[List[str]] = None
+
+    def patch(self, client: HarborAsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(client, "get_repositories", self.get_repositories)
+        monkeypatch.setattr(client, "get_artifacts", self.get_artifacts)
+        monkeypatch.setattr(
+            client, "get_artifact_vulnerabilities", self.get_artifact_vulnerabilities
+        )
+
+    async def request(self, key: str) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if key in self.blocked:
+                await self.blocked[key].wait()
+            await asyncio.sleep(0.001)
+            if key in self.fail:
+                raise ValueError(key)
+        finally:
+            self.in_flight -= 1
+
+    async def get_repositories(self) -> List[Repository]:
+        return [Repository(name=name) for name in self.artifacts]
+
+    async def get_artifacts(
+        self, project: str, repo: str, *args: Any, **kwargs: Any
+    ) -> List[Artifact]:
+        name = f"{project}/{repo}"
+        self.fields = kwargs.get("fields")
+        await self.request(name)
+        return self.artifacts[name]
+
+    async def get_artifact_vulnerabilities(
+        self, project: str, repo: str, digest: str, **kwargs: Any
+    ) -> Optional[HarborVulnerabilityReport]:
+        await self.request(digest)
+        self.reports_fetched += 1
+        self.report_ids[digest] = kwargs.get("report_id")
+        return HarborVulnerabilityReport(artifact={"digest": digest})
+
+
+@pytest.fixture
+def registry(
+    async_client: HarborAsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> FakeRegistry:
+    registry = FakeRegistry(
+        {
+            f"project/repo{i}": [
+                make_artifact(
+                    f"sha256:{i}-{j}",
+                    tag="latest" if j == 0 else f"v{j}",
+                    severity=SEVERITIES[j],
+                )
+                for j in range(5)
+            ]
+            + [make_artifact(f"sha256:{i}-failed", tag="failed", status="Error")]
+            for i in range(4)
+        }
+    )
+    registry.patch(async_client, monkeypatch)
+    return registry
+
+
+def digests(artifacts: List[ArtifactInfo]) -> List[str]:
+    return sorted(a.artifact.digest or "" for a in artifacts)
+
+
+async def collect(client: HarborAsyncClient, **kwargs: Any) -> List[ArtifactInfo]:
+    return [a async for a in aiter_artifact_vulnerabilities(client, **kwargs)]
+
+
+@pytest.mark.parametrize("max_connections", [1, 3, None])
+@pytest.mark.parametrize("queue_size", [1, 100])
+async def test_aiter_artifact_vulnerabilities(
+    async_client: HarborAsyncClient,
+    registry: FakeRegistry,
+    max_connections: Optional[int],
+    queue_size: int,
+) -> None:
+    artifacts = await collect(
+        async_client, max_connections=max_connections, queue_size=queue_size
+    )
+    assert len(artifacts) == 20
+    assert all(a.report.artifact.digest == a.artifact.digest for a in artifacts)
+    if max_connections is not None:
+        assert registry.max_in_flight <= max_connections
+    # Same artifacts as the phased crawler, without the failed scans
+    expected = await get_artifact_vulnerabilities(async_client)
+    assert digests(artifacts) == digests(expected)
+
+
+async def test_aiter_artifact_vulnerabilities_filters(
+    async_client: HarborAsyncClient, registry: FakeRegistry
+) -> None:
+    artifacts = await collect(async_client, tags=["latest", "failed"])
+    assert digests(artifacts) == [f"sha256:{i}-0" for i in range(4)]
+    artifacts = await get_artifact_vulnerabilities(async_client, tags=["v1"])
+    assert digests(artifacts) == [f"sha256:{i}-1" for i in range(4)]
+    for crawl in [collect, get_artifact_vulnerabilities]:
+        await crawl(async_client, tags=["latest"], fields=["digest"])
+        assert registry.fields is not None and "tags.name" in registry.fields
+    artifacts = await collect(async_client, repositories=["repo1"])
+    assert {a.repository.name for a in artifacts} == {"project/repo1"}
+    assert await collect(async_client, projects=["other"]) == []
+    with pytest.raises(ValueError):
+        await collect(async_client, queue_size=0)
+
+
+async def test_aiter_artifact_vulnerabilities_pipelined(
+    async_client: HarborAsyncClient, registry: FakeRegistry
+) -> None:
+    """Reports are yielded before all repositories have been listed."""
+    registry.blocked["project/repo3"] = asyncio.Event()
+    it = aiter_artifact_vulnerabilities(async_client, max_connections=2)
+    first = await asyncio.wait_for(it.__anext__(), timeout=5)
+    assert first.repository.name != "project/repo3"
+    registry.blocked["project/repo3"].set()
+    rest = [a async for a in it]
+    assert len(rest) == 19
+
+
+async def test_aiter_artifact_vulnerabilities_errors(
+    async_client: HarborAsyncClient, registry: FakeRegistry
+) -> None:
+    registry.fail = ["project/repo0", "sha256:1-1"]
+    errors: List[Exception] = []
+    artifacts = await collect(async_client, callback=errors.extend)
+    assert len(artifacts) == 14
+    assert sorted(str(e) for e in errors) == ["project/repo0", "sha256:1-1"]
+
+
+async def test_aiter_artifact_vulnerabilities_close(
+    async_client: HarborAsyncClient, registry: FakeRegistry
+) -> None:
+    """Closing the iterator early stops fetching reports."""
+    it = aiter_artifact_vulnerabilities(async_client, max_connections=1, queue_size=1)
+    await it.__anext__()
+    await it.aclose()
+    fetched = registry.reports_fetched
+    await asyncio.sleep(0.05)
+    assert registry.reports_fetched == fetched < 20
+    assert registry.in_flight == 0
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+async def test_artifact_vulnerabilities_overview_filters(
+    async_client: HarborAsyncClient, registry: FakeRegistry, pipelined: bool
+) -> None:
+    """Reports are only fetched for artifacts whose scan overview matches."""
+
+    async def crawl(**kwargs: Any) -> List[ArtifactInfo]:
+        registry.reports_fetched = 0
+        if pipelined:
+            return await collect(async_client, **kwargs)
+        return await get_artifact_vulnerabilities(async_client, **kwargs)
+
+    artifacts = await crawl(min_severity=Severity.high)
+    assert {a.scan_severity for a in artifacts} == {Severity.critical, Severity.high}
+    assert len(artifacts) == registry.reports_fetched == 8
+
+    artifacts = await crawl(
+        min_severity=Severity.medium,
+        predicate=lambda a: a.repository.name == "project/repo2",
+    )
+    assert digests(artifacts) == ["sha256:2-0", "sha256:2-1", "sha256:2-2"]
+    assert registry.reports_fetched == 3
+
+    artifacts = await crawl(summary_only=True)
+    assert len(artifacts) == 20
+    assert registry.reports_fetched == 0
+    assert all(not a.report.vulnerabilities for a in artifacts)
+    assert ArtifactReport(artifacts=artifacts).summary_distribution == {
+        Severity.critical: 4,
+        Severity.high: 4,
+        Severity.medium: 4,
+        Severity.low: 4,
+    }
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+async def test_artifact_vulnerabilities_shared_reports(
+    async_client: HarborAsyncClient, monkeypatch: pytest.MonkeyPatch, pipelined: bool
+) -> None:
+    """The report of each digest is fetched once per crawl."""
+    index = make_artifact("sha256:index", tag="latest")
+    index.references = [
+        Reference(child_digest="sha256:amd64"),
+        Reference(child_digest="sha256:arm64"),
+    ]
+    registry = FakeRegistry(
+        {
+            "project/app": [
+                index,
+                make_artifact("sha256:amd64", tag="amd64"),
+                make_artifact("sha256:arm64", tag="arm64"),
+            ],
+            # Promoted and replicated images
+            "prod/app": [
+                make_artifact("sha256:amd64", tag="latest"),
+                make_artifact("sha256:other", tag="v1"),
+            ],
+            "mirror/app": [make_artifact("sha256:other", tag="v1")],
+        }
+    )
+    registry.patch(async_client, monkeypatch)
+
+    async def crawl(**kwargs: Any) -> List[ArtifactInfo]:
+        registry.reports_fetched = 0
+        if pipelined:
+            return await collect(async_client, max_connections=2, **kwargs)
+        return await get_artifact_vulnerabilities(
+            async_client, max_connections=2, **kwargs
+        )
+
+    stats = CrawlStats()
+    artifacts = await crawl(stats=stats)
+    assert len(artifacts) == 6
+    assert registry.reports_fetched == 4
+    assert stats == CrawlStats(
+        artifacts=6, reports_fetched=4, reports_shared=2, index_children=2
+    )
+    by_digest: Dict[str, List[ArtifactInfo]] = {}
+    for artifact in artifacts:
+        assert artifact.report.artifact.digest == artifact.artifact.digest
+        by_digest.setdefault(artifact.artifact.digest or "", []).append(artifact)
+    assert by_digest["sha256:amd64"][0].report is by_digest["sha256:amd64"][1].report
+
+    # Artifacts sharing a failed report fail as well
+    registry.fail = ["sha256:other"]
+    errors: List[Exception] = []
+    stats = CrawlStats()
+    artifacts = await crawl(stats=stats, callback=errors.extend)
+    assert len(artifacts) == 4
+    assert [str(e) for e in errors] == ["sha256:other"] * 2
+    assert registry.reports_fetched == 3
+
+
+async def test_get_artifact_report_report_id(
+    async_client: HarborAsyncClient, registry: FakeRegistry
+) -> None:
+    """The report ID is taken from the scan overview of the requested MIME type."""
+    artifact = Artifact(
+        digest="sha256:abc",
+        scan_overview={
+            "application/vnd.scanner.adapter.vuln.report.harbor+json; version=1.0": {
+                "scan_status": "Success",
+                "report_id": "other",
+            },
+            MIME_TYPE: {"scan_status": "Success", "report_id": "report"},
+        },
+    )
+    assert artifact.scan is not None and artifact.scan.report_id == "other"
+    info = ArtifactInfo(artifact=artifact, repository=Repository(name="project/repo"))
+    await _get_artifact_report(async_client, info)
+    assert registry.report_ids["sha256:abc"] == "report"
+
+    # No report of the requested MIME type in the overview
+    assert artifact.scan_overview is not None and artifact.scan_overview.root
+    del artifact.scan_overview.root[MIME_TYPE]
+    await _get_artifact_report(async_client, info)
+    assert registry.report_ids["sha256:abc"] is None
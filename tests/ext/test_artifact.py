@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from typing import Any
+from typing import Dict
+from typing import Optional
+
 import pytest
 from hypothesis import HealthCheck
 from hypothesis import given
 from hypothesis import settings
 
 from harborapi.ext.artifact import ArtifactInfo
+from harborapi.models import Artifact
+from harborapi.models import Repository
 from harborapi.models import Tag
 from harborapi.models.scanner import Severity
 from harborapi.models.scanner import VulnerabilityItem
@@ -102,3 +108,36 @@ def test_artifactinfo(
     assert artifact.repository_name == "test-repo"
     assert artifact.name_with_digest == "test-project/test-repo@sha256:12345678"
     assert artifact.name_with_tag == "test-project/test-repo:test-tag"
+
+
+@pytest.mark.parametrize(
+    "overview,severity,distribution",
+    [
+        (
+            {"severity": "High", "summary": {"summary": {"High": 2, "Low": 1}}},
+            Severity.high,
+            {Severity.high: 2, Severity.low: 1},
+        ),
+        # Falls back on the summary if the overall severity is missing
+        (
+            {"summary": {"summary": {"Critical": 1, "Negligible": 4, "Low": 0}}},
+            Severity.critical,
+            {Severity.critical: 1, Severity.negligible: 4},
+        ),
+        ({"severity": "None", "summary": {}}, Severity.none, {}),
+        ({"severity": "Bogus"}, None, {}),
+        (None, None, {}),
+    ],
+)
+def test_artifactinfo_scan_summary(
+    overview: Optional[Dict[str, Any]],
+    severity: Optional[Severity],
+    distribution: Dict[Severity, int],
+) -> None:
+    mime_type = "application/vnd.security.vulnerability.report; version=1.1"
+    artifact = ArtifactInfo(
+        artifact=Artifact(scan_overview={mime_type: overview} if overview else None),
+        repository=Repository(name="project/repo"),
+    )
+    assert artifact.scan_severity == severity
+    assert artifact.summary_distribution == distribution
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import pytest
+
+from harborapi.concurrency import AdaptiveLimiter
+from harborapi.ext.executor import Executor
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: List[int] = []
+
+    async def __call__(self, i: int) -> int:
+        self.started.append(i)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later items finish first
+            await asyncio.sleep(0.001 * (10 - i % 10))
+            if i % 7 == 3:
+                raise ValueError(i)
+            return i
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("max_workers", [1, 4, None])
+async def test_executor_map(ordered: bool, max_workers: Optional[int]) -> None:
+    tracker = Tracker()
+    errors: List[Exception] = []
+    executor = Executor(max_workers, ordered=ordered, on_error=errors.append)
+    results = await executor.run(tracker, range(30))
+
+    expected = [i for i in range(30) if i % 7 != 3]
+    if ordered:
+        assert results == expected
+    else:
+        assert sorted(results) == expected
+        if max_workers != 1:
+            assert results != expected
+    assert sorted(e.args[0] for e in errors) == [3, 10, 17, 24]
+    if max_workers is not None:
+        assert tracker.max_in_flight <= max_workers
+    else:
+        assert tracker.max_in_flight == 30
+    assert (executor.submitted, executor.completed, executor.failed) == (30, 26, 4)
+    assert executor.pending == 0
+
+
+async def test_executor_lazy() -> None:
+    """Work items are only taken as results are consumed."""
+    taken: List[int] = []
+
+    def items() -> Iterator[int]:
+        for i in range(1000):
+            taken.append(i)
+            yield i
+
+    async def double(i: int) -> int:
+        return i * 2
+
+    executor = Executor(max_workers=2, buffer_size=4)
+    it = executor.map(double, items())
+    assert await it.__anext__() == 0
+    await asyncio.sleep(0.01)
+    assert len(taken) <= 6
+    assert executor.pending <= 4
+    rest = [result async for result in it]
+    assert len(rest) == 999
+    assert len(taken) == 1000
+
+
+async def test_executor_async_iterable() -> None:
+    async def items() -> AsyncIterator[int]:
+        for i in range(10):
+            await asyncio.sleep(0)
+            yield i
+
+    tracker = Tracker()
+    results = await Executor(3, ordered=True).run(tracker, items())
+    assert results == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+
+async def test_executor_errors_streamed() -> None:
+    """Errors are passed to on_error as soon as they occur."""
+    errors: List[Exception] = []
+
+    async def func(i: int) -> int:
+        if i == 0:
+            raise ValueError(i)
+        await asyncio.sleep(0.05)
+        return i
+
+    it = Executor(2, on_error=errors.append).map(func, range(2))
+    await asyncio.sleep(0)
+    assert await it.__anext__() == 1
+    assert len(errors) == 1
+    await it.aclose()
+
+
+async def test_executor_failure() -> None:
+    def items() -> Iterator[int]:
+        yield 1
+        raise RuntimeError("items")
+
+    tracker = Tracker()
+    with pytest.raises(RuntimeError, match="items"):
+        await Executor(2).run(tracker, items())
+
+    def on_error(e: Exception) -> None:
+        raise RuntimeError("on_error") from e
+
+    with pytest.raises(RuntimeError, match="on_error"):
+        await Executor(2, on_error=on_error).run(tracker, range(10))
+
+
+async def test_executor_cancel() -> None:
+    tracker = Tracker()
+    executor = Executor(2)
+    results: List[int] = []
+
+    async def consume() -> None:
+        async for result in executor.map(tracker, range(1000)):
+            results.append(result)
+            if len(results) == 5:
+                executor.cancel()
+
+    await asyncio.wait_for(consume(), timeout=5)
+    assert len(results) == 5
+    assert tracker.in_flight == 0
+    assert executor.submitted < 1000
+
+
+async def test_executor_close() -> None:
+    """Closing the iterator early cancels the work in progress."""
+    tracker = Tracker()
+    it = Executor(4).map(tracker, range(1000))
+    await it.__anext__()
+    await it.aclose()
+    assert tracker.in_flight == 0
+    started = len(tracker.started)
+    await asyncio.sleep(0.02)
+    assert len(tracker.started) == started
+
+
+async def test_executor_limiter() -> None:
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=3)
+    executor = Executor(None, limiter=limiter)
+    assert executor.max_workers == 3
+    tracker = Tracker()
+    await executor.run(tracker, range(20))
+    assert tracker.max_in_flight <= 3
+    assert limiter.in_flight == 0
+
+
+def test_executor_invalid_args() -> None:
+    with pytest.raises(ValueError):
+        Executor(0)
+    with pytest.raises(ValueError):
+        Executor(buffer_size=0)
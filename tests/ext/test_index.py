@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import re
+from typing import List
+
+import pytest
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+
+from harborapi.ext.artifact import ArtifactInfo
+from harborapi.ext.index import ArtifactIndex
+from harborapi.ext.report import ArtifactReport
+from harborapi.models.models import Artifact
+from harborapi.models.models import Repository
+from harborapi.models.models import Tag
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import VulnerabilityItem
+
+from ..strategies.ext import artifact_report_strategy
+
+
+def make_artifact(
+    i: int, tags: List[str], vulns: List[VulnerabilityItem]
+) -> ArtifactInfo:
+    return ArtifactInfo(
+        artifact=Artifact(digest=f"sha256:{i}", tags=[Tag(name=t) for t in tags]),
+        repository=Repository(name=f"test-project/repo-{i}"),
+        report=HarborVulnerabilityReport(vulnerabilities=vulns),
+    )
+
+
+@pytest.fixture
+def report() -> ArtifactReport:
+    openssl = VulnerabilityItem(id="CVE-2022-0001", package="openssl", version="1.1.1")
+    zlib = VulnerabilityItem(id="CVE-2022-0002", package="zlib", version="1.2.0")
+    libssl = VulnerabilityItem(id="CVE-2021-0003", package="libssl", version="3.0.0")
+    return ArtifactReport(
+        artifacts=[
+            make_artifact(0, ["latest", "1.0"], [openssl, zlib]),
+            make_artifact(1, ["1.1"], [libssl]),
+            make_artifact(2, [], [openssl]),
+        ]
+    )
+
+
+def test_index_lookup(report: ArtifactReport) -> None:
+    index = ArtifactIndex(report.artifacts)
+    assert set(index.cves) == {"CVE-2022-0001", "CVE-2022-0002", "CVE-2021-0003"}
+    vulns = index.lookup_cve("CVE-2022-0001")
+    assert [v.artifact for v in vulns] == [report.artifacts[0], report.artifacts[2]]
+    assert index.lookup_cve("CVE-2022") == []
+    assert [v.vulnerability.id for v in index.lookup_package("zlib")] == [
+        "CVE-2022-0002"
+    ]
+    assert index.lookup_tag("1.1") == [report.artifacts[1]]
+    assert index.lookup_tag("1") == []
+
+
+def test_index_find(report: ArtifactReport) -> None:
+    index = ArtifactIndex(report.artifacts)
+    # Patterns match the start of the key, case insensitively
+    assert len(index.find_cve("cve-2022")) == 3
+    assert index.artifacts_with_cve("CVE-2022-.*") == [
+        report.artifacts[0],
+        report.artifacts[2],
+    ]
+    assert index.artifacts_with_cve("CVE-2021") == [report.artifacts[1]]
+    assert index.artifacts_with_package(".*ssl") == report.artifacts
+    assert index.artifacts_with_package("OpenSSL", case_sensitive=True) == []
+    assert index.artifacts_with_package(".*ssl", min_version=(2, 0, 0)) == [
+        report.artifacts[1]
+    ]
+    assert index.artifacts_with_package("openssl", max_version=(1, 0, 0)) == []
+    with pytest.raises(ValueError):
+        index.artifacts_with_package(
+            "openssl", min_version=(2, 0, 0), max_version=(1, 0, 0)
+        )
+    assert index.artifacts_with_tag("1") == report.artifacts[:2]
+    assert index.artifacts_with_tag("LATEST") == report.artifacts[:1]
+    # Matching keys are cached per pattern
+    assert index._keys[("tags", "1", False)] == ["1.0", "1.1"]
+
+
+def test_report_index_cached(report: ArtifactReport) -> None:
+    index = report.index
+    assert report.index is index
+    assert report.has_cve("CVE-2022-0002")
+
+    # Adding artifacts rebuilds the index
+    report.artifacts.append(
+        make_artifact(3, [], [VulnerabilityItem(id="CVE-2023-0004", package="curl")])
+    )
+    assert report.index is not index
+    assert report.has_cve("CVE-2023-0004")
+
+    # So does replacing them
+    index = report.index
+    report.artifacts = report.artifacts[:1]
+    assert report.index is not index
+    assert not report.has_cve("CVE-2023-0004")
+
+    # Modifying the vulnerabilities and tags of the artifacts rebuilds it too
+    artifact = report.artifacts[0]
+    artifact.report.vulnerabilities.append(VulnerabilityItem(id="CVE-2023-0005"))
+    assert report.has_cve("CVE-2023-0005") == artifact.has_cve("CVE-2023-0005")
+    assert report.has_cve("CVE-2023-0005")
+    artifact.report.vulnerabilities = []
+    assert not report.has_cve("CVE-2022-0002")
+    assert artifact.artifact.tags
+    artifact.artifact.tags.append(Tag(name="stable"))
+    assert report.has_tag("stable")
+    artifact.artifact.tags[-1].name = "unstable"
+    assert not report.has_tag("stable")
+
+    # Modifying the fields of a vulnerability in place requires reindexing
+    vuln = VulnerabilityItem(id="CVE-2023-0006")
+    artifact.report.vulnerabilities.append(vuln)
+    assert report.has_cve("CVE-2023-0006")
+    vuln.id = "CVE-2023-0007"
+    assert not report.has_cve("CVE-2023-0007")
+    report.reindex()
+    assert report.has_cve("CVE-2023-0007")
+
+
+def test_report_index_equality(report: ArtifactReport) -> None:
+    """The index is not part of the compared or pickled state."""
+    other = copy.deepcopy(report)
+    assert report == other
+    assert report.has_cve("CVE-2022-0001")
+    assert report._index is not None
+    assert report == other
+    assert other == report
+
+    copied = pickle.loads(pickle.dumps(report))
+    assert copied == report
+    assert copied._index is None
+    assert copied.has_cve("CVE-2022-0001")
+
+
+@given(artifact_report_strategy)
+@settings(max_examples=25, suppress_health_check=[HealthCheck.too_slow])
+def test_index_parity(report: ArtifactReport) -> None:
+    """The index finds the same artifacts as ArtifactInfo.has_* methods."""
+    report.artifacts.extend(copy.deepcopy(report.artifacts))
+    for artifact in report.artifacts:
+        for vuln in artifact.report.vulnerabilities[:2]:
+            if vuln.id:
+                cve = re.escape(vuln.id)
+                assert report.with_cve(cve).artifacts == [
+                    a for a in report.artifacts if a.has_cve(cve)
+                ]
+            if vuln.package:
+                package = re.escape(vuln.package)
+                assert report.with_package(package).artifacts == [
+                    a for a in report.artifacts if a.has_package(package)
+                ]
+        for tag in artifact.tags[:2]:
+            tag = re.escape(tag)
+            assert report.with_tag(tag).artifacts == [
+                a for a in report.artifacts if a.has_tag(tag)
+            ]
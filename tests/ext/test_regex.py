@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+import pytest
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+from hypothesis import strategies as st
+
+from harborapi.ext.regex import PatternSet
+from harborapi.ext.regex import get_pattern
+from harborapi.ext.report import ArtifactReport
+
+from ..strategies.ext import artifact_report_strategy
+
+text = st.text(alphabet="abcABC-.1", max_size=8)
+
+
+def expected_matches(
+    patterns: List[str], s: str, case_sensitive: bool, search: bool
+) -> List[str]:
+    matches = []
+    for pattern in dict.fromkeys(patterns):
+        compiled = get_pattern(pattern, case_sensitive=case_sensitive)
+        if (compiled.search if search else compiled.match)(s):
+            matches.append(pattern)
+    return matches
+
+
+@given(st.lists(text, max_size=10), text, st.booleans(), st.booleans())
+def test_patternset_literal(
+    literals: List[str], s: str, case_sensitive: bool, search: bool
+) -> None:
+    patterns = PatternSet(
+        literals, case_sensitive=case_sensitive, literal=True, search=search
+    )
+    escaped = {re.escape(literal): literal for literal in literals}
+    assert patterns.match(s) == [
+        escaped[p] for p in expected_matches(list(escaped), s, case_sensitive, search)
+    ]
+
+
+@pytest.mark.parametrize("search", [False, True])
+@pytest.mark.parametrize("case_sensitive", [False, True])
+def test_patternset_regex(search: bool, case_sensitive: bool) -> None:
+    regexes = [
+        "open.*",
+        "lib(ssl|crypto)",  # groups are matched separately
+        "(?i)LIBSSL",  # so are inline flags
+        ".*ssl",
+        "ssl$",
+        "SSL",
+        "a|b",
+        "",
+    ]
+    patterns = PatternSet(regexes, case_sensitive=case_sensitive, search=search)
+    for s in ["openssl", "libssl", "libcrypto", "zlib", "LibSSL", "", "b"]:
+        assert patterns.match(s) == expected_matches(regexes, s, case_sensitive, search)
+
+
+def test_patternset_literal_prefixes() -> None:
+    patterns = PatternSet(["ssl", "ss", "libssl", "SSL"], literal=True, search=True)
+    assert patterns.patterns == ["ssl", "ss", "libssl", "SSL"]
+    assert patterns.match("libssl") == ["ssl", "ss", "libssl", "SSL"]
+    assert patterns.match("crypto") == []
+    assert PatternSet([], literal=True).match("ssl") == []
+
+
+@given(artifact_report_strategy)
+@settings(max_examples=25, suppress_health_check=[HealthCheck.too_slow])
+def test_artifactreport_find(report: ArtifactReport) -> None:
+    """Batch queries find the same vulnerabilities as single queries."""
+    vulns = [v for a in report.artifacts for v in a.report.vulnerabilities]
+    cves = [re.escape(v.id) for v in vulns[:5] if v.id] + ["CVE-.*"]
+    results = report.find_cves(cves)
+    assert list(results) == list(dict.fromkeys(cves))
+    for cve, found in results.items():
+        affected = {id(v.artifact) for v in found}
+        expected = report.with_cve(cve).artifacts
+        assert [a for a in report.artifacts if id(a) in affected] == expected
+
+    packages = [v.package for v in vulns[:5] if v.package]
+    for literal in (False, True):
+        results = report.find_packages(
+            [re.escape(p) for p in packages] if not literal else packages,
+            literal=literal,
+        )
+        for package, found in results.items():
+            pattern = get_pattern(package if not literal else re.escape(package))
+            assert [(v.artifact, v.vulnerability) for v in found] == [
+                (a, v)
+                for a in report.artifacts
+                for v in a.report.vulnerabilities
+                if v.package is not None and pattern.match(v.package)
+            ]
+
+    words = ["the", "a", "vulnerability"]
+    results = report.find_descriptions(words, literal=True, search=True)
+    for word, found in results.items():
+        assert [v.vulnerability for v in found] == [
+            v
+            for v in vulns
+            if v.description is not None and word in v.description.lower()
+        ]
@@ -7,7 +7,12 @@ from hypothesis import assume
 from hypothesis import given
 from hypothesis import settings
 
+from harborapi.ext.artifact import ArtifactInfo
 from harborapi.ext.report import ArtifactReport
+from harborapi.models.models import Artifact
+from harborapi.models.models import Repository
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Scanner
 from harborapi.models.scanner import Severity
 from harborapi.models.scanner import VulnerabilityItem
 
@@ -81,6 +86,7 @@ def test_artifactreport(
                     "redhat": {"V3Score": 5.0, "V2Score": 5.0},
                 }
             }
+        artifact.report.reindex()
     assert report.cvss.max == 5.0
     assert report.cvss.min == 5.0
     assert report.cvss.median == 5.0
@@ -95,6 +101,9 @@ def test_artifactreport(
                     vulnerability.fix_version = "1.0.1"
                 else:
                     vulnerability.fix_version = None
+                # The vulnerability is shared by the reports of all artifacts
+                for a in report.artifacts:
+                    a.report.reindex()
                 fixable = [v.vulnerability for v in report.fixable]
                 unfixable = [v.vulnerability for v in report.unfixable]
                 if is_fixable:
@@ -114,6 +123,7 @@ def test_artifactreport(
             artifact.report.severity = severity
             for vulnerability in artifact.report.vulnerabilities:
                 vulnerability.severity = severity
+            artifact.report.reindex()
             artifact.artifact.digest = f"{artifact.artifact.digest}-{i}-{severity}"
         assert len(report.with_severity(severity).artifacts) == len(report.artifacts)
         assert report.has_severity(severity)
@@ -219,3 +229,57 @@ def test_artifactreport_with_repository(
         len(report.with_repository("test-repo-.*", case_sensitive=True).artifacts) == 0
     )
     # TODO: more extensive regex tests
+
+
+def test_artifactreport_top_vulns() -> None:
+    def vuln(id: str, score: float, **kwargs) -> VulnerabilityItem:
+        return VulnerabilityItem(
+            id=id,
+            vendor_attributes={"CVSS": {"nvd": {"V3Score": score}}},
+            **kwargs,
+        )
+
+    def artifact(i: int, *vulns: VulnerabilityItem) -> ArtifactInfo:
+        return ArtifactInfo(
+            artifact=Artifact(digest=f"sha256:{i}"),
+            repository=Repository(name=f"test-project/repo-{i}"),
+            report=HarborVulnerabilityReport(
+                scanner=Scanner(name="Trivy"), vulnerabilities=list(vulns)
+            ),
+        )
+
+    report = ArtifactReport(
+        artifacts=[
+            artifact(0, vuln("CVE-1", 7.5), vuln("CVE-2", 5.0, fix_version="2")),
+            artifact(1, vuln("CVE-1", 9.8), vuln("CVE-3", 8.0)),
+            artifact(2, vuln("CVE-1", 9.8, fix_version="1"), vuln("", 9.0)),
+        ]
+    )
+    a0, a1, a2 = report.artifacts
+
+    # Each CVE is returned once, with the artifact with the highest score
+    top = report.top_vulns(3)
+    assert [(v.vulnerability.id, v.artifact) for v in top] == [
+        ("CVE-1", a1),
+        ("", a2),
+        ("CVE-3", a1),
+    ]
+    assert [v.vulnerability.id for v in report.top_vulns(10)] == [
+        "CVE-1",
+        "",
+        "CVE-3",
+        "CVE-2",
+    ]
+    assert [(v.vulnerability.id, v.artifact) for v in report.top_vulns(2, True)] == [
+        ("CVE-1", a2),
+        ("CVE-2", a0),
+    ]
+
+    top = report.top_vulns(4, unique=False)
+    assert [(v.vulnerability.id, v.artifact) for v in top] == [
+        ("CVE-1", a1),
+        ("CVE-1", a2),
+        ("", a2),
+        ("CVE-3", a1),
+    ]
+    assert ArtifactReport().top_vulns() == []
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import statistics
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from harborapi.ext.cve import CVSSData
+from harborapi.ext.cve import accumulate_cvss
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.stats import StatsAccumulator
+
+from ..strategies.ext import artifact_report_strategy
+
+scores = st.lists(
+    st.floats(min_value=0.0, max_value=10.0, allow_nan=False).map(lambda f: round(f, 1))
+)
+
+
+def reference_quantile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    position = (len(values) - 1) * q
+    rank = int(position)
+    if rank + 1 == len(values):
+        return values[rank]
+    return values[rank] + (values[rank + 1] - values[rank]) * (position - rank)
+
+
+@given(scores)
+def test_stats_accumulator(values: List[float]) -> None:
+    stats = StatsAccumulator(iter(values))
+    assert stats.count == len(values)
+    if not values:
+        assert stats.mean == stats.median == stats.stdev == 0.0
+        assert stats.min == stats.max == 0.0
+        return
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.median == pytest.approx(statistics.median(values))
+    assert stats.min == min(values)
+    assert stats.max == max(values)
+    if len(values) > 1:
+        assert stats.stdev == pytest.approx(statistics.stdev(values), abs=1e-9)
+    else:
+        assert stats.stdev == 0.0
+    for q in (0.0, 0.25, 0.9, 0.99, 1.0):
+        assert stats.quantile(q) == pytest.approx(reference_quantile(values, q))
+    assert sum(stats.histogram()) == len(values)
+
+
+@given(scores, scores)
+def test_stats_accumulator_merge(a: List[float], b: List[float]) -> None:
+    merged = StatsAccumulator(a).merge(StatsAccumulator(b))
+    expected = StatsAccumulator(a + b)
+    assert merged.count == expected.count
+    assert merged.counts == expected.counts
+    assert merged.mean == pytest.approx(expected.mean)
+    assert merged.stdev == pytest.approx(expected.stdev, abs=1e-9)
+    assert (merged.min, merged.max) == (expected.min, expected.max)
+    assert merged.median == expected.median
+
+
+def test_stats_accumulator_histogram() -> None:
+    stats = StatsAccumulator([0.0, 0.5, 1.0, 9.9, 10.0, 11.0])
+    assert stats.histogram() == [2, 1, 0, 0, 0, 0, 0, 0, 0, 2]
+    assert stats.histogram(bins=2, low=0.0, high=20.0) == [4, 2]
+    with pytest.raises(ValueError):
+        stats.histogram(bins=0)
+
+
+def test_stats_accumulator_precision() -> None:
+    stats = StatsAccumulator([1.04, 1.06, 1.11], precision=1)
+    assert stats.counts == {1.0: 1, 1.1: 2}
+    assert stats.median == 1.1
+    # Mean, min and max use the exact values
+    assert stats.mean == pytest.approx(1.07)
+    assert stats.min == 1.04
+    with pytest.raises(ValueError):
+        stats.merge(StatsAccumulator())
+    with pytest.raises(ValueError):
+        stats.quantile(1.5)
+
+
+@given(artifact_report_strategy)
+def test_cvssdata_from_artifacts(report: ArtifactReport) -> None:
+    scores = [s for a in report.artifacts for s in a.report.cvss_scores]
+    cvss = CVSSData.from_artifacts(a for a in report.artifacts)
+    assert cvss == report.cvss
+    assert cvss.p90 == pytest.approx(reference_quantile(scores, 0.9) if scores else 0.0)
+
+    # Accumulators of separate groups of artifacts can be merged
+    half = len(report.artifacts) // 2
+    stats = accumulate_cvss(report.artifacts[:half])
+    stats = stats.merge(accumulate_cvss(report.artifacts[half:]))
+    merged = CVSSData.from_stats(stats)
+    assert merged.model_dump() == pytest.approx(cvss.model_dump())
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+
+from harborapi.ext import table as table_module
+from harborapi.ext.artifact import ArtifactInfo
+from harborapi.ext.cve import CVSSData
+from harborapi.ext.report import ArtifactReport
+from harborapi.ext.table import VulnerabilityTable
+from harborapi.models.models import Artifact
+from harborapi.models.models import Repository
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Severity
+from harborapi.models.scanner import VulnerabilityItem
+
+from ..strategies.ext import artifact_report_strategy
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run tests with NumPy columns (if installed) and array.array columns."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(table_module, "numpy_installed", False)
+    return str(request.param)
+
+
+def make_vuln(
+    id: str,
+    package: str,
+    severity: Severity,
+    fix_version: str = "",
+    score: float = 0.0,
+) -> VulnerabilityItem:
+    return VulnerabilityItem(
+        id=id,
+        package=package,
+        version="1.0.0",
+        fix_version=fix_version or None,
+        severity=severity,
+        vendor_attributes={"CVSS": {"nvd": {"V3Score": score}}} if score else None,
+    )
+
+
+def assert_cvss_equal(a: CVSSData, b: CVSSData) -> None:
+    # NumPy and the statistics module may round differently
+    assert a.model_dump() == pytest.approx(b.model_dump())
+
+
+@pytest.fixture
+def report() -> ArtifactReport:
+    vulns: List[List[VulnerabilityItem]] = [
+        [
+            make_vuln("CVE-1", "openssl", Severity.critical, "1.0.1", 9.8),
+            make_vuln("CVE-2", "zlib", Severity.high, score=7.5),
+        ],
+        [
+            make_vuln("CVE-1", "openssl", Severity.critical, "1.0.1", 9.8),
+            make_vuln("CVE-3", "OpenSSL-libs", Severity.low),
+        ],
+        [],
+    ]
+    return ArtifactReport(
+        artifacts=[
+            ArtifactInfo(
+                artifact=Artifact(digest=f"sha256:{i}"),
+                repository=Repository(name=f"test-project/repo-{i}"),
+                report=HarborVulnerabilityReport(
+                    scanner={"name": "Trivy"}, vulnerabilities=v
+                ),
+            )
+            for i, v in enumerate(vulns)
+        ]
+    )
+
+
+def test_table(report: ArtifactReport, backend: str) -> None:
+    table = VulnerabilityTable.from_report(report)
+    assert len(table) == 4
+    assert list(table.artifact) == [0, 0, 1, 1]
+    assert table.ids == ["CVE-1", "CVE-2", "CVE-3"]
+    assert list(table.id) == [0, 1, 0, 2]
+    assert table.packages == ["openssl", "zlib", "OpenSSL-libs"]
+    assert list(table.fixable) == [True, False, True, False]
+    assert list(table.cvss) == [9.8, 7.5, 9.8, 0.0]
+    assert table.vendors == ("nvd", "redhat")
+    assert list(table.vendor_cvss["nvd"])[:3] == [9.8, 7.5, 9.8]
+
+    assert table.count() == 4
+    assert table.count(table.mask(severity=Severity.critical)) == 2
+    assert table.count(table.mask(min_severity=Severity.high)) == 3
+    assert table.count(table.mask(fixable=False)) == 2
+    assert table.count(table.mask(cve="CVE-1")) == 2
+    assert table.count(table.mask(cve="CVE-4")) == 0
+    assert table.count(table.mask(min_cvss=7.5)) == 3
+    # Package names are matched as case insensitive regular expressions
+    assert table.count(table.mask(package="openssl")) == 3
+    assert table.count(table.mask(package="openssl", case_sensitive=True)) == 2
+    # Criteria are combined
+    assert table.count(table.mask(package="openssl", fixable=False)) == 1
+
+    assert table.distribution() == report.distribution
+    assert table.distribution(table.mask(fixable=True)) == {Severity.critical: 2}
+
+    stats = table.cvss_stats()
+    assert_cvss_equal(stats, report.cvss)
+    assert stats.max == 9.8
+    assert stats.min == 7.5
+    assert table.cvss_stats(table.mask(cve="CVE-2")).stdev == 0.0
+    assert table.cvss_stats(vendor="redhat").max == 0.0
+
+    vulns = list(table.iter_vulnerabilities(table.mask(severity=Severity.low)))
+    assert len(vulns) == 1
+    assert vulns[0].vulnerability.id == "CVE-3"
+    assert vulns[0].artifact is report.artifacts[1]
+
+    assert table.to_report(table.mask(cve="CVE-2")).artifacts == report.artifacts[:1]
+    assert table.to_report().artifacts == report.artifacts[:2]
+
+
+def test_table_select(report: ArtifactReport, backend: str) -> None:
+    table = VulnerabilityTable.from_report(report)
+    critical = table.filter(severity=Severity.critical)
+    assert len(critical) == 2
+    assert critical.ids is table.ids
+    assert list(critical.artifact) == [0, 1]
+    assert critical.distribution() == {Severity.critical: 2}
+    # Filtering the filtered table
+    assert len(critical.filter(cve="CVE-2")) == 0
+    assert critical.cvss_stats().mean == 9.8
+    assert len(table.filter()) == len(table)
+
+
+def test_table_empty(backend: str) -> None:
+    table = VulnerabilityTable.from_report(ArtifactReport())
+    assert len(table) == 0
+    assert table.count(table.mask(severity=Severity.high)) == 0
+    assert table.distribution() == {}
+    assert table.cvss_stats().max == 0.0
+    assert not table.to_report()
+
+
+def test_report_table_cached(report: ArtifactReport) -> None:
+    assert report.table is report.table
+    assert len(report.table) == 4
+
+
+@given(artifact_report_strategy)
+@settings(
+    max_examples=25,
+    suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
+)
+def test_table_parity(report: ArtifactReport) -> None:
+    """The table gives the same results as ArtifactReport."""
+    table = VulnerabilityTable.from_report(report)
+    assert table.distribution() == report.distribution
+    assert_cvss_equal(table.cvss_stats(), report.cvss)
+    assert [
+        v.vulnerability for v in table.iter_vulnerabilities(table.mask(fixable=True))
+    ] == [v.vulnerability for v in report.fixable]
+    assert [
+        v.vulnerability
+        for v in table.iter_vulnerabilities(table.mask(severity=Severity.critical))
+    ] == [v.vulnerability for v in report.critical]
+
+
+def test_to_dataframe(report: ArtifactReport) -> None:
+    pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    df = report.table.to_dataframe()
+    assert list(df.columns) == [
+        "artifact",
+        "id",
+        "package",
+        "severity",
+        "fixable",
+        "cvss",
+        "cvss_nvd",
+        "cvss_redhat",
+    ]
+    assert df["id"].tolist() == ["CVE-1", "CVE-2", "CVE-1", "CVE-3"]
+    assert df["severity"].tolist() == ["Critical", "High", "Critical", "Low"]
+    assert df["cvss"].sum() == pytest.approx(27.1)
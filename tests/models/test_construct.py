@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+from pydantic import AliasChoices
+from pydantic import Field
+
+from harborapi.models import Artifact
+from harborapi.models import NativeReportSummary
+from harborapi.models import ScanOverview
+from harborapi.models import Tag
+from harborapi.models.base import BaseModel
+from harborapi.models.construct import construct
+from harborapi.models.construct import get_plan
+from harborapi.models.scanner import CVSSDetails
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import Severity
+
+from ..strategies.artifact import get_hbv_strategy
+
+
+@given(get_hbv_strategy())
+@settings(max_examples=25, suppress_health_check=[HealthCheck.too_slow])
+def test_construct_report(report: HarborVulnerabilityReport) -> None:
+    data = report.model_dump(mode="json")
+    constructed = construct(HarborVulnerabilityReport, data)
+    assert constructed.vulnerabilities == report.vulnerabilities
+    assert constructed.scanner == report.scanner
+    assert constructed.severity == report.severity
+    for vuln in constructed.vulnerabilities:
+        assert isinstance(vuln.severity, Severity)
+        if vuln.preferred_cvss is not None:
+            assert isinstance(vuln.preferred_cvss, CVSSDetails)
+
+
+def test_construct_artifact() -> None:
+    mime_type = "application/vnd.security.vulnerability.report; version=1.1"
+    data = {
+        "id": 1,
+        "digest": "sha256:123",
+        "push_time": "2024-01-01T12:00:00Z",
+        "tags": [{"id": 1, "name": "latest"}, None],
+        "scan_overview": {
+            mime_type: {"report_id": "abc", "scan_status": "Success"},
+        },
+        "labels": [],
+        "foo": "bar",
+    }
+    artifact = construct(Artifact, data)
+    assert isinstance(artifact, Artifact)
+    assert artifact.tags == [Tag(id=1, name="latest"), None]
+    assert isinstance(artifact.scan_overview, ScanOverview)
+    summary = artifact.scan_overview[mime_type]
+    assert isinstance(summary, NativeReportSummary)
+    assert summary.report_id == "abc"
+    # Non-JSON types keep their JSON values
+    assert artifact.push_time == "2024-01-01T12:00:00Z"
+    # Extra fields are kept
+    assert artifact.foo == "bar"
+    assert artifact.model_extra == {"foo": "bar"}
+    # Defaults are filled in, but not marked as set
+    assert artifact.size is None
+    assert artifact.model_fields_set == set(data) - {"foo"}
+
+
+class Child(BaseModel):
+    value: int = 0
+    severity: Optional[Severity] = None
+
+
+class Parent(BaseModel):
+    child: Optional[Child] = None
+    children: List[Child] = Field(default_factory=list)
+    by_name: Dict[str, Child] = {}
+    either: Union[Child, List[Child], None] = None
+    aliased: Optional[Child] = Field(None, alias="Aliased")
+    anything: Any = None
+
+
+def test_construct_nested() -> None:
+    parent = construct(
+        Parent,
+        {
+            "child": {"value": 1, "severity": "High"},
+            "children": [{"value": 2}],
+            "by_name": {"a": {"value": 3}},
+            "either": [{"value": 4}],
+            "Aliased": {"value": 5},
+            "anything": {"value": 6},
+        },
+    )
+    assert parent.child == Child(value=1, severity=Severity.high)
+    assert parent.children == [Child(value=2)]
+    assert parent.by_name == {"a": Child(value=3)}
+    assert parent.either == [Child(value=4)]
+    assert parent.aliased == Child(value=5)
+    assert parent.anything == {"value": 6}
+
+
+def test_construct_invalid_values() -> None:
+    """Values that do not match the field types are kept as-is."""
+    parent = construct(
+        Parent,
+        {"child": "foo", "children": {"value": 1}, "either": 123},
+    )
+    assert parent.child == "foo"
+    assert parent.children == {"value": 1}
+    assert parent.either == 123
+    child = construct(Child, {"severity": "Very High"})
+    assert child.severity == "Very High"
+
+
+def test_construct_mutable_defaults() -> None:
+    parent1 = construct(Parent, {})
+    parent2 = construct(Parent, {})
+    assert parent1.by_name == {}
+    assert parent1.by_name is not parent2.by_name
+    assert parent1.children is not parent2.children
+    assert parent1.model_fields_set == set()
+
+
+class Complex(BaseModel):
+    value: Optional[Child] = Field(
+        None, validation_alias=AliasChoices("value", "Value")
+    )
+    initialized: bool = False
+
+    def model_post_init(self, __context: Any) -> None:
+        self.__dict__["initialized"] = True
+
+
+def test_construct_fallback_model_construct() -> None:
+    """Models with post-init hooks or alias choices are instantiated
+    by model_construct."""
+    assert not get_plan(Complex).simple
+    m = construct(Complex, {"Value": {"value": 1}})
+    assert m.value == {"value": 1}  # alias choices are not converted
+    assert m.initialized
+    m = construct(Complex, {"value": {"value": 1}})
+    assert m.value == Child(value=1)
+
+
+def test_get_plan_cached() -> None:
+    assert get_plan(Parent) is get_plan(Parent)
+    plan = get_plan(Parent)
+    assert plan.simple
+    assert plan.extra
+    assert plan.keys == {
+        "child",
+        "children",
+        "by_name",
+        "either",
+        "Aliased",
+        "anything",
+    }
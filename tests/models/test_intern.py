@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+
+from harborapi.models.intern import InternPool
+from harborapi.models.scanner import HarborVulnerabilityReport
+from harborapi.models.scanner import VulnerabilityItem
+
+from ..strategies.artifact import get_hbv_strategy
+
+
+def make_vulnerability(i: int, version: str = "1.0.0") -> dict:
+    return {
+        "id": f"CVE-2024-{i}",
+        "package": "openssl",
+        "version": version,
+        "severity": "High",
+        "description": "A long description " * 50,
+        "links": [f"https://avd.aquasec.com/nvd/cve-2024-{i}"],
+        "preferred_cvss": {"score_v3": 7.5},
+        "vendor_attributes": {"CVSS": {"nvd": {"V3Score": 7.5}}},
+    }
+
+
+def make_report(*vulnerabilities: dict) -> HarborVulnerabilityReport:
+    return HarborVulnerabilityReport.model_validate(
+        {
+            "scanner": {"name": "Trivy", "vendor": "Aqua Security"},
+            "vulnerabilities": list(vulnerabilities),
+        }
+    )
+
+
+def test_intern_identical_vulnerabilities() -> None:
+    pool = InternPool()
+    report1 = pool.intern_report(make_report(make_vulnerability(1)))
+    report2 = pool.intern_report(
+        make_report(make_vulnerability(1), make_vulnerability(2))
+    )
+    assert report1.vulnerabilities[0] is report2.vulnerabilities[0]
+    assert report1.scanner is report2.scanner
+    assert len(pool) == 2
+    assert pool.hits == 1
+    assert pool.misses == 2
+
+
+def test_intern_values_of_distinct_vulnerabilities() -> None:
+    pool = InternPool()
+    report = pool.intern_report(
+        make_report(make_vulnerability(1), make_vulnerability(1, version="1.0.1"))
+    )
+    vuln1, vuln2 = report.vulnerabilities
+    assert vuln1 is not vuln2
+    assert vuln1.version != vuln2.version
+    assert vuln1.description is vuln2.description
+    assert vuln1.links is vuln2.links
+    assert vuln1.preferred_cvss is vuln2.preferred_cvss
+    assert vuln1.vendor_attributes is vuln2.vendor_attributes
+
+
+def test_intern_distinguishes_equal_values() -> None:
+    """Values that compare equal but have different types are not merged."""
+    pool = InternPool()
+    vuln1 = VulnerabilityItem(id="CVE-1", vendor_attributes={"score": 1})
+    vuln2 = VulnerabilityItem(id="CVE-1", vendor_attributes={"score": 1.0})
+    vuln3 = VulnerabilityItem(id="CVE-1", vendor_attributes={"score": True})
+    interned = [pool.intern_vulnerability(v) for v in (vuln1, vuln2, vuln3)]
+    assert interned == [vuln1, vuln2, vuln3]
+    assert [type(v.vendor_attributes["score"]) for v in interned] == [
+        int,
+        float,
+        bool,
+    ]
+    # Fields that are set are part of the identity
+    vuln4 = VulnerabilityItem(id="CVE-1", description=None)
+    vuln5 = VulnerabilityItem(id="CVE-1")
+    assert pool.intern_vulnerability(vuln4) is vuln4
+    assert pool.intern_vulnerability(vuln5) is vuln5
+
+
+def test_intern_pool_clear() -> None:
+    pool = InternPool()
+    pool.intern_report(make_report(make_vulnerability(1)))
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.hits == pool.misses == 0
+
+
+@given(get_hbv_strategy())
+@settings(max_examples=25, suppress_health_check=[HealthCheck.too_slow])
+def test_intern_report_unchanged(report: HarborVulnerabilityReport) -> None:
+    expected = report.model_dump()
+    pool = InternPool()
+    assert pool.intern_report(report).model_dump() == expected
+    copy = HarborVulnerabilityReport.model_validate(expected)
+    assert pool.intern_report(copy).model_dump() == expected
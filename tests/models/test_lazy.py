@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from harborapi.models import Tag
+from harborapi.models.lazy import LazyList
+
+
+def make_lazy(n: int = 3) -> LazyList[Tag]:
+    return LazyList(
+        [{"id": i, "name": f"tag{i}"} for i in range(n)], loader=Tag.model_validate
+    )
+
+
+def test_lazy_list_getitem() -> None:
+    tags = make_lazy()
+    assert isinstance(tags, list)
+    assert len(tags) == 3
+    assert tags.n_loaded == 0
+    assert tags[1] == Tag(id=1, name="tag1")
+    assert tags.n_loaded == 1
+    # Items are only loaded once
+    assert tags[1] is tags[1]
+    assert tags[-1].name == "tag2"
+    assert tags.n_loaded == 2
+
+
+def test_lazy_list_slice() -> None:
+    tags = make_lazy()
+    sliced = tags[1:]
+    assert isinstance(sliced, LazyList)
+    assert sliced.n_loaded == 0
+    assert [tag.id for tag in sliced] == [1, 2]
+
+
+def test_lazy_list_iter() -> None:
+    tags = make_lazy()
+    it = iter(tags)
+    assert next(it).id == 0
+    assert tags.n_loaded == 1
+    assert [tag.id for tag in it] == [1, 2]
+    assert [tag.id for tag in reversed(tags)] == [2, 1, 0]
+    assert tags.n_loaded == 3
+
+
+def test_lazy_list_load_all() -> None:
+    tags = make_lazy()
+    assert tags == [Tag(id=i, name=f"tag{i}") for i in range(3)]
+    assert tags.n_loaded == 3
+    assert make_lazy() == make_lazy()
+    assert make_lazy() != make_lazy(2)
+    assert Tag(id=1, name="tag1") in make_lazy()
+    assert make_lazy().index(Tag(id=2, name="tag2")) == 2
+    assert "tag0" in repr(make_lazy())
+    assert len(make_lazy() + make_lazy()) == 6
+    assert all(isinstance(tag, Tag) for tag in make_lazy() + [])
+    tags = make_lazy()
+    tags.sort(key=lambda tag: -tag.id)
+    assert [tag.id for tag in tags] == [2, 1, 0]
+
+
+def test_lazy_list_mutation() -> None:
+    tags = make_lazy()
+    tags.append(Tag(id=3, name="tag3"))
+    assert tags.pop().id == 3
+    assert tags.pop(0).id == 0
+    assert tags.n_loaded == 0
+    tags.insert(0, Tag(id=4))
+    assert [tag.id for tag in tags] == [4, 1, 2]
+    copied = tags.copy()
+    assert isinstance(copied, LazyList)
+    assert copied == tags
+
+
+def test_lazy_list_copy_pickle() -> None:
+    tags = make_lazy()
+    assert copy.deepcopy(tags) == tags
+    assert pickle.loads(pickle.dumps(tags)) == tags
+
+
+def test_lazy_list_invalid_item() -> None:
+    tags = LazyList([{"id": 1}, {"id": "foo"}], loader=Tag.model_validate)
+    assert tags[0].id == 1
+    with pytest.raises(ValidationError):
+        tags[1]
+    # The item stays unloaded
+    assert tags.n_loaded == 1
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from pydantic import Field
+
+from harborapi.models import Artifact
+from harborapi.models.base import BaseModel
+from harborapi.models.projection import get_projection
+from harborapi.models.projection import project
+from harborapi.models.scanner import HarborVulnerabilityReport
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+
+ARTIFACT = {
+    "id": 1,
+    "digest": "sha256:123",
+    "size": 1024,
+    "extra_attrs": {"architecture": "amd64"},
+    "tags": [{"id": 1, "name": "latest", "immutable": False}],
+    "scan_overview": {
+        MIME_TYPE: {"report_id": "abc", "scan_status": "Success", "severity": "High"}
+    },
+    "foo": "bar",
+}
+
+
+def test_project_artifact() -> None:
+    projection = get_projection(
+        Artifact, ["digest", "tags.name", "scan_overview.severity", "foo"]
+    )
+    assert project(ARTIFACT, projection) == {
+        "digest": "sha256:123",
+        "tags": [{"name": "latest"}],
+        "scan_overview": {MIME_TYPE: {"severity": "High"}},
+        "foo": "bar",
+    }
+    # Lists are projected item by item
+    assert (
+        project([ARTIFACT, ARTIFACT], projection) == [project(ARTIFACT, projection)] * 2
+    )
+    # Missing fields are skipped
+    assert project({"id": 1}, projection) == {}
+
+
+def test_project_whole_field() -> None:
+    """A field selected both as a whole and by subfields is kept as a whole."""
+    projection = get_projection(Artifact, ["tags", "tags.name"])
+    assert project(ARTIFACT, projection) == {"tags": ARTIFACT["tags"]}
+
+
+def test_project_report() -> None:
+    report = {
+        "severity": "High",
+        "vulnerabilities": [
+            {"id": "CVE-1", "package": "foo", "description": "long text"},
+            {"id": "CVE-2", "package": "bar", "links": ["https://example.com"]},
+        ],
+    }
+    projection = get_projection(HarborVulnerabilityReport, ["vulnerabilities.id"])
+    assert project(report, projection) == {
+        "vulnerabilities": [{"id": "CVE-1"}, {"id": "CVE-2"}]
+    }
+
+
+class Child(BaseModel):
+    required: int
+    value: Optional[str] = None
+    other: Optional[str] = None
+
+
+class Parent(BaseModel):
+    child: Optional[Child] = None
+    children: Dict[str, List[Child]] = {}
+    aliased: Optional[str] = Field(None, alias="Aliased")
+    value: int = 0
+
+
+def test_projection_required_and_aliased_fields() -> None:
+    projection = get_projection(Parent, ["child.value", "children.other", "aliased"])
+    data = {
+        "child": {"required": 1, "value": "a", "other": "b"},
+        "children": {"x": [{"required": 2, "value": "c", "other": "d"}]},
+        "Aliased": "e",
+        "value": 3,
+    }
+    projected = project(data, projection)
+    assert projected == {
+        "child": {"required": 1, "value": "a"},
+        "children": {"x": [{"required": 2, "other": "d"}]},
+        "Aliased": "e",
+    }
+    parent = Parent.model_validate(projected)
+    assert parent.child == Child(required=1, value="a")
+    assert parent.value == 0
+
+
+def test_projection_invalid() -> None:
+    with pytest.raises(ValueError):
+        get_projection(Parent, ["value.foo"])
+    with pytest.raises(ValueError):
+        get_projection(Parent, ["unknown.foo"])
+
+
+def test_projection_cached() -> None:
+    assert get_projection(Artifact, ["digest", "id"]) is get_projection(
+        Artifact, ("id", "digest")
+    )
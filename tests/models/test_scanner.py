@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+
 import pytest
 from hypothesis import HealthCheck
 from hypothesis import given
@@ -7,6 +9,7 @@ from hypothesis import settings
 from hypothesis import strategies as st
 from pytest_mock import MockerFixture
 
+from harborapi.models.construct import construct
 from harborapi.models.scanner import CVSSDetails
 from harborapi.models.scanner import HarborVulnerabilityReport
 from harborapi.models.scanner import Scanner
@@ -146,6 +149,152 @@ def test_harborvulnerabilityreport(report: HarborVulnerabilityReport) -> None:
         assert report.vulnerabilities[0] == test_vuln3
 
 
+def test_harborvulnerabilityreport_severity_index() -> None:
+    report = HarborVulnerabilityReport(
+        scanner=Scanner(name="Trivy"),
+        vulnerabilities=[
+            VulnerabilityItem(id="CVE-1", severity=Severity.low),
+            VulnerabilityItem(id="CVE-2", severity=Severity.critical, fix_version="2"),
+            VulnerabilityItem(id="CVE-3", severity=Severity.low, fix_version="3"),
+        ],
+    )
+    assert [v.id for v in report.low] == ["CVE-1", "CVE-3"]
+    assert [v.id for v in report.fixable] == ["CVE-2", "CVE-3"]
+    assert report.distribution == {Severity.low: 2, Severity.critical: 1}
+
+    # The index is reused, but results can be modified by the caller
+    index = report._get_severity_index()
+    assert report._get_severity_index() is index
+    report.low.clear()
+    report.distribution.clear()
+    assert len(report.low) == 2
+    assert report.distribution[Severity.low] == 2
+
+    # Sorting rebuilds the index
+    report.sort(descending=False)
+    assert report._get_severity_index() is not index
+    assert [v.id for v in report.fixable] == ["CVE-3", "CVE-2"]
+
+    # Modifying a vulnerability in place requires reindexing
+    report.vulnerabilities[0].fix_version = "1"
+    report.reindex()
+    assert [v.id for v in report.fixable] == ["CVE-1", "CVE-3", "CVE-2"]
+
+    # Replacing, appending or removing vulnerabilities rebuilds the index
+    report.vulnerabilities[2] = VulnerabilityItem(id="CVE-4", severity=Severity.low)
+    assert report.distribution == {Severity.low: 3}
+    assert [v.id for v in report.fixable] == ["CVE-1", "CVE-3"]
+    report.vulnerabilities.append(VulnerabilityItem(severity=Severity.high))
+    assert report.distribution[Severity.high] == 1
+    del report.vulnerabilities[0]
+    assert [v.id for v in report.low] == ["CVE-3", "CVE-4"]
+    report.vulnerabilities = []
+    assert report.distribution == {}
+    assert report.fixable == []
+
+
+def test_harborvulnerabilityreport_severity_index_construct() -> None:
+    """Reports constructed without validation have their own index."""
+    data = {"vulnerabilities": [{"id": "CVE-1", "severity": "High"}]}
+    report = construct(HarborVulnerabilityReport, data)
+    assert report.distribution == {Severity.high: 1}
+    assert "_severity_index" not in report.__dict__
+    report2 = construct(HarborVulnerabilityReport, data)
+    assert report2._severity_index is None
+
+
+def test_harborvulnerabilityreport_severity_index_equality() -> None:
+    """The severity index is not part of the compared or pickled state."""
+
+    def make_report() -> HarborVulnerabilityReport:
+        return HarborVulnerabilityReport(
+            vulnerabilities=[
+                VulnerabilityItem(id="CVE-1", severity=Severity.high, fix_version="1"),
+                VulnerabilityItem(id="CVE-2", severity=Severity.low),
+            ],
+        )
+
+    report = make_report()
+    other = make_report()
+    assert report == other
+    assert report.fixable and report.distribution and report.get_cvss_scores()
+    assert report._severity_index is not None
+    assert report == other
+    assert other == report
+
+    copy = pickle.loads(pickle.dumps(report))
+    assert copy == report
+    assert copy._severity_index is None
+    assert copy.distribution == report.distribution
+
+    other.vulnerabilities[1] = VulnerabilityItem(id="CVE-3", severity=Severity.low)
+    assert report != other
+
+
+def _cvss_vuln(id: str, nvd: float, redhat: float, **kwargs) -> VulnerabilityItem:
+    return VulnerabilityItem(
+        id=id,
+        vendor_attributes={
+            "CVSS": {"nvd": {"V3Score": nvd}, "redhat": {"V3Score": redhat}}
+        },
+        **kwargs,
+    )
+
+
+def test_harborvulnerabilityreport_cvss_scores() -> None:
+    report = HarborVulnerabilityReport(
+        scanner=Scanner(name="Trivy"),
+        vulnerabilities=[
+            _cvss_vuln("CVE-1", 5.0, 9.0, severity=Severity.high),
+            _cvss_vuln("CVE-2", 9.8, 1.0, severity=Severity.high, fix_version="2"),
+            _cvss_vuln("CVE-3", 7.5, 7.5, severity=Severity.critical),
+            VulnerabilityItem(id="CVE-4", severity=Severity.low),
+        ],
+    )
+    assert report.get_cvss_scores() == [5.0, 9.8, 7.5, 0.0]
+    assert report.get_cvss_scores(vendor_priority=["redhat"]) == [9.0, 1.0, 7.5, 0.0]
+    assert report.cvss_scores == [5.0, 9.8, 7.5]
+
+    # Scores are stored per scanner, version and vendor priority
+    index = report._get_severity_index()
+    assert set(index.cvss_scores) == {
+        ("Trivy", 3, ("nvd", "redhat")),
+        ("Trivy", 3, ("redhat",)),
+    }
+
+    assert [v.id for v in report.top_vulns(2)] == ["CVE-2", "CVE-3"]
+    assert [v.id for v in report.top_vulns(2, fixable=True)] == ["CVE-2"]
+
+    # Sorting keeps the scores in the new order
+    report.sort(use_cvss=True)
+    ids = [v.id for v in report.vulnerabilities]
+    assert ids == ["CVE-3", "CVE-2", "CVE-1", "CVE-4"]
+    scores = report._get_severity_index().cvss_scores
+    assert scores[("Trivy", 3, ("redhat",))] == [7.5, 1.0, 9.0, 0.0]
+
+    # Reindexing after modifying a vulnerability resolves the scores again
+    report.vulnerabilities[3].vendor_attributes = {"CVSS": {"nvd": {"V3Score": 10.0}}}
+    report.reindex()
+    assert report.get_cvss_scores() == [7.5, 9.8, 5.0, 10.0]
+    assert report.top_vulns(1)[0].id == "CVE-4"
+
+    # So does changing the scanner
+    report.scanner = Scanner(name="Clair")
+    assert report.get_cvss_scores() == [0.0, 0.0, 0.0, 0.0]
+
+
+@given(get_hbv_strategy())
+@settings(max_examples=50, suppress_health_check=[HealthCheck.too_slow])
+def test_harborvulnerabilityreport_top_vulns(report: HarborVulnerabilityReport) -> None:
+    """top_vulns ranks the same as sorting on the score of each vulnerability."""
+    for fixable in (False, True):
+        vulns = report.fixable if fixable else report.vulnerabilities
+        expected = sorted(
+            vulns, key=lambda v: v.get_cvss_score(report.scanner), reverse=True
+        )
+        assert report.top_vulns(5, fixable=fixable) == expected[:5]
+
+
 def test_vulnerability_item_severity_none() -> None:
     """Passing None to VulnerabilityItem.severity should assign it Severity.unknown"""
     v = VulnerabilityItem(
@@ -294,6 +443,5 @@ def test_vulnerability_item_get_cvss_score_preferred_cvss(
 #   - high
 #   - critical
 #   - vulnerabilities_by_severity
-#   - top_vulns
 #   - get_severity with all severities
 # - sort_distribution
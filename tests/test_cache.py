@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+from pytest_httpserver import HTTPServer
+
+from harborapi import HarborAsyncClient
+from harborapi.cache import ReportCache
+from harborapi.cache import ResponseCache
+from harborapi.models import Project
+
+
+def _response(headers: dict) -> httpx.Response:
+    return httpx.Response(200, headers=headers, json={})
+
+
+@pytest.fixture
+def cached_client(async_client: HarborAsyncClient) -> HarborAsyncClient:
+    async_client.cache = ResponseCache()
+    return async_client
+
+
+async def test_cache_not_modified(
+    cached_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_oneshot_request("/api/v2.0/projects/1").respond_with_json(
+        {"name": "project1", "project_id": 1}, headers={"ETag": '"v1"'}
+    )
+    httpserver.expect_request(
+        "/api/v2.0/projects/1", headers={"If-None-Match": '"v1"'}
+    ).respond_with_data(status=304)
+
+    project = await cached_client.get_project(1)
+    assert project.name == "project1"
+    assert cached_client.cache is not None
+    assert cached_client.cache.misses == 1
+    assert cached_client.cache.hits == 0
+
+    # Revalidated with the server, and a new model is constructed
+    # from the cached response
+    project2 = await cached_client.get_project(1)
+    assert project2 == project
+    assert project2 is not project
+    assert cached_client.cache.hits == 1
+    assert len(httpserver.log) == 2
+    assert httpserver.log[1][1].status_code == 304
+
+
+async def test_cache_modified(
+    cached_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_oneshot_request("/api/v2.0/projects/1").respond_with_json(
+        {"name": "project1", "project_id": 1},
+        headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/projects/1",
+        headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    ).respond_with_json({"name": "project1-renamed", "project_id": 1})
+
+    project = await cached_client.get_project(1)
+    assert project.name == "project1"
+    project2 = await cached_client.get_project(1)
+    assert project2.name == "project1-renamed"
+    assert cached_client.cache is not None
+    assert cached_client.cache.misses == 1
+    # Response without validators replaces the cached entry
+    assert len(cached_client.cache) == 0
+
+
+async def test_cache_results_not_shared(
+    cached_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """Modifying the results of a call doesn't affect the results of
+    subsequent calls answered from the cache."""
+    httpserver.expect_oneshot_request("/api/v2.0/projects").respond_with_json(
+        [{"name": "project1"}], headers={"ETag": '"v1"'}
+    )
+    httpserver.expect_request(
+        "/api/v2.0/projects", headers={"If-None-Match": '"v1"'}
+    ).respond_with_data(status=304)
+
+    projects = await cached_client.get_projects()
+    assert isinstance(projects[0], Project)
+    projects[0].name = "modified"
+    projects.append(Project(name="project2"))
+    assert await cached_client.get_projects() == [Project(name="project1")]
+
+    with cached_client.raw_mode():
+        raw = await cached_client.get_projects()
+        assert raw == [{"name": "project1"}]
+        raw[0]["name"] = "modified"
+        assert await cached_client.get_projects() == [{"name": "project1"}]
+    with cached_client.no_validation():
+        projects2 = await cached_client.get_projects()
+    assert projects2 == [Project(name="project1")]
+    assert cached_client.cache is not None
+    assert cached_client.cache.hits == 4
+
+
+async def test_no_cache(
+    cached_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_request("/api/v2.0/systeminfo").respond_with_json(
+        {"harbor_version": "v2.10.0"}, headers={"ETag": '"v1"'}
+    )
+
+    with cached_client.no_cache():
+        await cached_client.get_system_info()
+    assert cached_client.cache is not None
+    assert len(cached_client.cache) == 0
+    await cached_client.get_system_info()
+    assert len(cached_client.cache) == 1
+
+
+def test_response_cache_make_key() -> None:
+    key = ResponseCache.make_key(
+        "http://example.com/api/v2.0/projects",
+        {"page": 1, "q": "name=foo"},
+        {"Accept": "application/json"},
+    )
+    assert key == ResponseCache.make_key(
+        "http://example.com/api/v2.0/projects?page=1&q=name%3Dfoo",
+        None,
+        {"Accept": "application/json"},
+    )
+    assert key != ResponseCache.make_key(
+        "http://example.com/api/v2.0/projects?page=1&q=name%3Dfoo",
+        None,
+        {"Accept": "text/plain"},
+    )
+
+
+def test_response_cache_make_key_representation() -> None:
+    """Headers selecting the representation of a response are part of the key."""
+    url = "http://example.com/api/v2.0/projects/p/repositories/r/artifacts"
+    v11 = "application/vnd.security.vulnerability.report; version=1.1"
+    v10 = "application/vnd.scanner.adapter.vuln.report.harbor+json; version=1.0"
+    key = ResponseCache.make_key(url, None, {"X-Accept-Vulnerabilities": v11})
+    assert key == ResponseCache.make_key(url, None, {"x-accept-vulnerabilities": v11})
+    assert key != ResponseCache.make_key(url, None, {"X-Accept-Vulnerabilities": v10})
+    assert key != ResponseCache.make_key(url, None, {})
+    # Other headers are ignored
+    assert key == ResponseCache.make_key(
+        url, None, {"X-Accept-Vulnerabilities": v11, "X-Request-Id": "1"}
+    )
+
+
+async def test_cache_per_vulnerability_mime_type(
+    cached_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """Artifacts listed with different report MIME types are cached separately."""
+    path = "/api/v2.0/projects/p/repositories/r/artifacts"
+    v11 = "application/vnd.security.vulnerability.report; version=1.1"
+    v10 = "application/vnd.scanner.adapter.vuln.report.harbor+json; version=1.0"
+    httpserver.expect_request(
+        path, headers={"If-None-Match": '"sha256:v11"'}
+    ).respond_with_data(status=304)
+    for mime_type, digest in [(v11, "sha256:v11"), (v10, "sha256:v10")]:
+        httpserver.expect_request(
+            path, headers={"X-Accept-Vulnerabilities": mime_type}
+        ).respond_with_json([{"digest": digest}], headers={"ETag": f'"{digest}"'})
+
+    a = await cached_client.get_artifacts("p", "r", mime_type=v11)
+    b = await cached_client.get_artifacts("p", "r", mime_type=v10)
+    assert a[0].digest == "sha256:v11"
+    assert b[0].digest == "sha256:v10"
+    assert cached_client.cache is not None
+    assert len(cached_client.cache) == 2
+    assert cached_client.cache.hits == 0
+
+    assert await cached_client.get_artifacts("p", "r", mime_type=v11) == a
+    assert cached_client.cache.hits == 1
+
+
+def test_response_cache_no_validators() -> None:
+    cache = ResponseCache()
+    assert cache.update("a", _response({})) is None
+    assert "a" not in cache
+    assert cache.misses == 0
+
+
+def test_response_cache_lru() -> None:
+    cache = ResponseCache(maxsize=2)
+    for key in ["a", "b"]:
+        cache.update(key, _response({"ETag": key}))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.update("c", _response({"ETag": "c"}))
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_response_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("harborapi.cache.time.monotonic", lambda: now)
+    cache = ResponseCache(ttl=10)
+    entry = cache.update("a", _response({"ETag": '"v1"'}))
+    assert entry is not None
+    assert entry.validators == {"If-None-Match": '"v1"'}
+    assert cache.get("a") is entry
+
+    now += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_response_cache_stores_body() -> None:
+    cache = ResponseCache()
+    entry = cache.update("a", _response({"ETag": '"v1"'}))
+    assert entry is not None
+    assert entry.data == b"{}"
+    assert cache.misses == 1
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+MIME_TYPE = "application/vnd.security.vulnerability.report; version=1.1"
+DIGEST = "sha256:1234"
+
+
+def _report(n: int) -> dict:
+    return {
+        "severity": "High",
+        "vulnerabilities": [
+            {"id": f"CVE-2022-{i}", "package": "foo", "severity": "High"}
+            for i in range(n)
+        ],
+    }
+
+
+def test_report_cache(tmp_path: Path) -> None:
+    path = tmp_path / "reports.db"
+    cache = ReportCache(path)
+    assert cache.get(DIGEST, MIME_TYPE, "r1") is None
+    cache.set(DIGEST, MIME_TYPE, "r1", _report(2))
+    assert cache.get(DIGEST, MIME_TYPE, "r1") == _report(2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (DIGEST, MIME_TYPE, "r1") in cache
+    assert (DIGEST, MIME_TYPE, "r2") not in cache
+    assert "r1" not in cache
+    assert len(cache) == 1
+    cache.close()
+
+    # Persisted across instances
+    cache = ReportCache(path)
+    assert cache.get(DIGEST, MIME_TYPE, "r1") == _report(2)
+
+    # A new report for the artifact supersedes the old one
+    cache.set(DIGEST, MIME_TYPE, "r2", _report(3))
+    assert cache.get(DIGEST, MIME_TYPE, "r1") is None
+    assert cache.get(DIGEST, MIME_TYPE, "r2") == _report(3)
+    # Other MIME types are kept
+    cache.set(DIGEST, "other", "r1", _report(1))
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    cache.close()
+
+
+def test_report_cache_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("harborapi.cache.time.time", lambda: now)
+    cache = ReportCache()
+    cache.set("sha256:a", MIME_TYPE, "r", _report(100))
+    size = cache.size
+    assert size > 0
+    cache.max_size = size * 2 + size // 2
+
+    now += 1
+    cache.set("sha256:b", MIME_TYPE, "r", _report(100))
+    now += 1
+    # Make "a" the most recently used report
+    assert cache.get("sha256:a", MIME_TYPE, "r") is not None
+    now += 1
+    cache.set("sha256:c", MIME_TYPE, "r", _report(100))
+    assert cache.evictions == 1
+    assert ("sha256:b", MIME_TYPE, "r") not in cache
+    assert ("sha256:a", MIME_TYPE, "r") in cache
+    assert ("sha256:c", MIME_TYPE, "r") in cache
+    assert cache.size <= cache.max_size
+
+    # Reports larger than the cache are not stored
+    cache.max_size = 10
+    cache.set("sha256:d", MIME_TYPE, "r", _report(100))
+    assert ("sha256:d", MIME_TYPE, "r") not in cache
+
+
+def test_report_cache_size(tmp_path: Path) -> None:
+    path = tmp_path / "reports.db"
+    cache = ReportCache(path)
+
+    def stored_size() -> int:
+        row = cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM reports")
+        return row.fetchone()[0]
+
+    # Storing reports does not sum the sizes of the whole table
+    statements: List[str] = []
+    cache._conn.set_trace_callback(statements.append)
+    cache.set("sha256:a", MIME_TYPE, "r1", _report(10))
+    cache.set("sha256:b", MIME_TYPE, "r1", _report(20))
+    cache._conn.set_trace_callback(None)
+    assert "SELECT COALESCE(SUM(size), 0) FROM reports" not in statements
+    assert cache.size == stored_size() > 0
+    # Replacing a report subtracts the size of the old one
+    cache.set("sha256:a", MIME_TYPE, "r2", _report(50))
+    assert cache.size == stored_size()
+    # Evicting reports subtracts their sizes
+    cache.max_size = cache.size - 1
+    cache.set("sha256:c", MIME_TYPE, "r1", _report(1))
+    assert cache.evictions > 0
+    assert cache.size == stored_size() <= cache.max_size
+    size = cache.size
+    cache.close()
+
+    # Recomputed when the cache is opened
+    cache = ReportCache(path)
+    assert cache.size == size
+    cache.clear()
+    assert cache.size == stored_size() == 0
+    cache.close()
+
+
+def test_report_cache_access_batched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = 1000.0
+    monkeypatch.setattr("harborapi.cache.time.time", lambda: now)
+    path = tmp_path / "reports.db"
+    cache = ReportCache(path, flush_interval=2)
+    cache.set("sha256:a", MIME_TYPE, "r", _report(1))
+    cache.set("sha256:b", MIME_TYPE, "r", _report(1))
+
+    def accessed() -> dict:
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute("SELECT digest, accessed FROM reports")
+            return dict(rows.fetchall())
+
+    now += 1
+    assert cache.get("sha256:a", MIME_TYPE, "r") is not None
+    # Not written until `flush_interval` hits
+    assert accessed() == {"sha256:a": 1000.0, "sha256:b": 1000.0}
+    assert cache.get("sha256:b", MIME_TYPE, "r") is not None
+    assert accessed() == {"sha256:a": 1001.0, "sha256:b": 1001.0}
+
+    now += 1
+    assert cache.get("sha256:a", MIME_TYPE, "r") is not None
+    cache.close()
+    assert accessed()["sha256:a"] == 1002.0
+
+
+async def test_client_report_cache(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    async_client.report_cache = ReportCache()
+    httpserver.expect_oneshot_request(
+        f"/api/v2.0/projects/p/repositories/r/artifacts/{DIGEST}/additions/vulnerabilities",
+        method="GET",
+    ).respond_with_json({MIME_TYPE: _report(2)})
+
+    report = await async_client.get_artifact_vulnerabilities(
+        "p", "r", DIGEST, report_id="r1"
+    )
+    assert len(report.vulnerabilities) == 2
+    assert (DIGEST, MIME_TYPE, "r1") in async_client.report_cache
+
+    # Served from the cache, the oneshot request would fail otherwise
+    cached = await async_client.get_artifact_vulnerabilities(
+        "p", "r", DIGEST, report_id="r1", fields=["severity"]
+    )
+    assert cached.severity == report.severity
+    assert cached.vulnerabilities == []
+    assert async_client.report_cache.hits == 1
+    # Reports are encoded with the client's JSON backend
+    assert async_client.report_cache.json_backend is async_client.json_backend
+    httpserver.check_assertions()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -11,11 +14,14 @@ from hypothesis import settings
 from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
 from pytest_mock import MockerFixture
+from werkzeug import Request
+from werkzeug import Response
 
 from harborapi.auth import HarborAuthFile
 from harborapi.client import HarborAsyncClient
 from harborapi.exceptions import BadRequest
 from harborapi.exceptions import Forbidden
+from harborapi.exceptions import HarborAPIException
 from harborapi.exceptions import InternalServerError
 from harborapi.exceptions import NotFound
 from harborapi.exceptions import PreconditionFailed
@@ -24,6 +30,9 @@ from harborapi.exceptions import Unauthorized
 from harborapi.models import Error
 from harborapi.models import Errors
 from harborapi.models import UserResp
+from harborapi.models.intern import InternPool
+from harborapi.models.lazy import LazyList
+from harborapi.models.scanner import HarborVulnerabilityReport
 from harborapi.utils import get_basicauth
 
 from .strategies import errors_strategy
@@ -303,6 +312,222 @@ async def test_get_pagination_invalid_mock(
     assert "Unable to handle paginated results" in caplog.text
 
 
+def _expect_user_pages(
+    httpserver: HTTPServer, n_pages: int, page_size: int, total: int
+) -> None:
+    """Set up paginated /users responses with X-Total-Count headers."""
+    for page in range(1, n_pages + 1):
+        start = (page - 1) * page_size
+        users = [
+            {"username": f"user{i}"}
+            for i in range(start, min(start + page_size, total))
+        ]
+        headers = {"X-Total-Count": str(total)}
+        if page < n_pages:
+            headers["link"] = (
+                f'</api/v2.0/users?page={page + 1}&page_size={page_size}>; rel="next"'
+            )
+        httpserver.expect_oneshot_request(
+            "/api/v2.0/users",
+            query_string=f"page={page}&page_size={page_size}",
+        ).respond_with_json(users, headers=headers)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_concurrency", [None, 1, 2, 10])
+async def test_get_pagination_concurrent(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+    page_concurrency: Optional[int],
+) -> None:
+    """Test fetching pages concurrently using the X-Total-Count header."""
+    _expect_user_pages(httpserver, n_pages=5, page_size=3, total=14)
+    async_client.page_concurrency = page_concurrency
+
+    users = await async_client.get("/users", params={"page": 1, "page_size": 3})
+    assert isinstance(users, list)
+    assert [u["username"] for u in users] == [f"user{i}" for i in range(14)]
+    assert len(httpserver.log) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_pagination_concurrent_limit(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    """Pages beyond the limit should not be fetched."""
+    _expect_user_pages(httpserver, n_pages=5, page_size=3, total=14)
+
+    users = await async_client.get(
+        "/users", params={"page": 1, "page_size": 3}, limit=7, page_concurrency=4
+    )
+    assert isinstance(users, list)
+    assert [u["username"] for u in users] == [f"user{i}" for i in range(7)]
+    assert len(httpserver.log) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_pagination_concurrent_no_total_count(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    """Without X-Total-Count, we fall back on following the Link header."""
+    httpserver.expect_oneshot_request("/api/v2.0/users").respond_with_json(
+        [{"username": "user1"}, {"username": "user2"}],
+        headers={"link": '</api/v2.0/users?page=2&page_size=2>; rel="next"'},
+    )
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/users", query_string="page=2&page_size=2"
+    ).respond_with_json([{"username": "user3"}])
+
+    users = await async_client.get("/users", page_concurrency=5)
+    assert isinstance(users, list)
+    assert [u["username"] for u in users] == ["user1", "user2", "user3"]
+
+
+@pytest.mark.asyncio
+async def test_get_iter(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    """Test iterating over paginated results."""
+    _expect_user_pages(httpserver, n_pages=5, page_size=3, total=14)
+
+    users = []
+    async for user in async_client.get_iter(
+        "/users", params={"page": 1, "page_size": 3}
+    ):
+        users.append(user)
+    assert [u["username"] for u in users] == [f"user{i}" for i in range(14)]
+    assert len(httpserver.log) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 3, 4, 14, 100])
+async def test_get_iter_limit(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+    limit: int,
+) -> None:
+    """Pages beyond the limit should not be fetched, not even in the background."""
+    _expect_user_pages(httpserver, n_pages=5, page_size=3, total=14)
+
+    users = [
+        user
+        async for user in async_client.get_iter(
+            "/users", params={"page": 1, "page_size": 3}, limit=limit
+        )
+    ]
+    n = min(limit, 14)
+    assert [u["username"] for u in users] == [f"user{i}" for i in range(n)]
+    assert len(httpserver.log) == -(-n // 3)
+
+
+@pytest.mark.asyncio
+async def test_get_iter_read_ahead(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    """The next page is requested before the current page is consumed."""
+    _expect_user_pages(httpserver, n_pages=3, page_size=2, total=6)
+
+    it = async_client.get_iter("/users", params={"page": 1, "page_size": 2})
+    user = await it.__anext__()
+    assert user["username"] == "user0"
+    # Let the read-ahead request complete
+    await asyncio.sleep(0.5)
+    assert len(httpserver.log) == 2
+    await it.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aiter_users(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    _expect_user_pages(httpserver, n_pages=5, page_size=3, total=14)
+
+    users = [u async for u in async_client.aiter_users(page_size=3)]
+    assert all(isinstance(u, UserResp) for u in users)
+    assert [u.username for u in users] == [f"user{i}" for i in range(14)]
+
+
+def _slow_json_handler(data: object, status: int = 200, delay: float = 0.2):
+    def handler(request: Request) -> Response:
+        time.sleep(delay)
+        return Response(
+            json.dumps(data), status=status, content_type="application/json"
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalesce", [True, False])
+async def test_get_coalesce_requests(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+    coalesce: bool,
+) -> None:
+    httpserver.expect_request("/api/v2.0/users").respond_with_handler(
+        _slow_json_handler([{"username": "user1"}])
+    )
+    async_client.coalesce_requests = coalesce
+
+    results = await asyncio.gather(*(async_client.get_users() for _ in range(5)))
+    assert all(r == [UserResp(username="user1")] for r in results)
+    if coalesce:
+        assert len(httpserver.log) == 1
+        assert async_client.singleflight.calls == 1
+        assert async_client.singleflight.coalesced == 4
+    else:
+        assert len(httpserver.log) == 5
+        assert async_client.singleflight.coalesced == 0
+    assert len(async_client.singleflight) == 0
+
+    # Requests made after the first one finishes are not coalesced
+    await async_client.get_users()
+    assert len(httpserver.log) == 2 if coalesce else 6
+
+
+@pytest.mark.asyncio
+async def test_get_coalesce_requests_different_params(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    httpserver.expect_request("/api/v2.0/users").respond_with_handler(
+        _slow_json_handler([{"username": "user1"}])
+    )
+    async_client.coalesce_requests = True
+
+    await asyncio.gather(
+        async_client.get("/users", params={"q": "username=user1"}),
+        async_client.get("/users", params={"q": "username=user1"}),
+        async_client.get("/users", params={"q": "username=user2"}),
+        async_client.get("/users", headers={"X-Foo": "bar"}),
+    )
+    assert len(httpserver.log) == 3
+    assert async_client.singleflight.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_get_coalesce_requests_error(
+    async_client: HarborAsyncClient,
+    httpserver: HTTPServer,
+) -> None:
+    """Errors are raised in every caller sharing the request."""
+    httpserver.expect_request("/api/v2.0/users").respond_with_handler(
+        _slow_json_handler({"errors": [{"code": "NOT_FOUND"}]}, status=404)
+    )
+    async_client.coalesce_requests = True
+
+    results = await asyncio.gather(
+        *(async_client.get("/users") for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, NotFound) for r in results)
+    assert len(httpserver.log) == 1
+
+
 @pytest.mark.asyncio
 async def test_construct_model(async_client: HarborAsyncClient, mocker: MockerFixture):
     c = async_client
@@ -332,7 +557,6 @@ async def test_construct_model_no_validation(
 ):
     c = async_client
     c.validate = False
-    construct_spy = mocker.spy(UserResp, "model_construct")
     parse_spy = mocker.spy(UserResp, "model_validate")
 
     # Extra field "foo" is added to the model
@@ -340,16 +564,85 @@ async def test_construct_model_no_validation(
     assert isinstance(m, UserResp)
     assert m.username == "user1"
     assert m.foo == "bar"
-    assert construct_spy.call_count == 1
+    assert m.model_fields_set == {"username"}
     assert parse_spy.call_count == 0
 
     # Invalid value for "username" if validation was enabled
     m = c.construct_model(UserResp, {"username": {}})
     assert m.username == {}
-    assert construct_spy.call_count == 2
     assert parse_spy.call_count == 0
 
 
+@pytest.mark.parametrize("validate", [True, False])
+@pytest.mark.parametrize("raw", [True, False])
+def test_construct_model_bytes(
+    async_client: HarborAsyncClient, validate: bool, raw: bool
+) -> None:
+    """Undecoded JSON is handled the same as decoded JSON."""
+    async_client.validate = validate
+    async_client.raw = raw
+    data = [{"username": "user1"}, {"username": "user2"}]
+    body = json.dumps(data).encode()
+
+    users = async_client.construct_model(UserResp, body, is_list=True)
+    assert users == async_client.construct_model(UserResp, data, is_list=True)
+    user = async_client.construct_model(UserResp, json.dumps(data[0]).encode())
+    assert user == async_client.construct_model(UserResp, data[0])
+    if raw:
+        assert users == data
+    else:
+        assert all(isinstance(u, UserResp) for u in users)
+
+
+def test_construct_model_bytes_invalid(async_client: HarborAsyncClient) -> None:
+    with pytest.raises(ValidationError) as e:
+        async_client.construct_model(
+            UserResp, b'[{"username": "user1"}, {"username": {}}]', is_list=True
+        )
+    # Errors refer to the invalid item, not the list
+    assert e.value.errors()[0]["loc"] == ("username",)
+
+    with pytest.raises(HarborAPIException):
+        async_client.construct_model(UserResp, b'[{"username": ', is_list=True)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_construct_model_lazy(async_client: HarborAsyncClient, validate: bool) -> None:
+    async_client.validate = validate
+    data = [{"username": "user1"}, {"username": "user2"}]
+    with async_client.lazy_mode():
+        users = async_client.construct_model(UserResp, json.dumps(data).encode(), True)
+        # Single models are not affected
+        user = async_client.construct_model(UserResp, data[0])
+    assert not async_client.lazy
+    assert isinstance(users, LazyList)
+    assert users.n_loaded == 0
+    assert users[1].username == "user2"
+    assert users.n_loaded == 1
+    assert users == async_client.construct_model(UserResp, data, is_list=True)
+    assert isinstance(user, UserResp)
+
+
+def test_construct_model_lazy_invalid(async_client: HarborAsyncClient) -> None:
+    async_client.lazy = True
+    users = async_client.construct_model(
+        UserResp, [{"username": "user1"}, {"username": {}}], is_list=True
+    )
+    assert users[0].username == "user1"
+    # Invalid items raise when they are accessed
+    with pytest.raises(ValidationError):
+        users[1]
+
+
+def test_construct_model_intern_pool(async_client: HarborAsyncClient) -> None:
+    async_client.intern_pool = InternPool()
+    data = {"vulnerabilities": [{"id": "CVE-2024-1", "package": "openssl"}]}
+    report1 = async_client.construct_model(HarborVulnerabilityReport, data)
+    report2 = async_client.construct_model(HarborVulnerabilityReport, data)
+    assert report1.vulnerabilities[0] is report2.vulnerabilities[0]
+    assert async_client.intern_pool.hits == 1
+
+
 @pytest.mark.asyncio
 async def test_client_no_validation_ctx_manager_get(
     async_client: HarborAsyncClient,
@@ -725,6 +1018,32 @@ def test_authenticate_verify(verify: bool) -> None:
     assert id(client.client) != client_id_pre
 
 
+@pytest.mark.parametrize("http2", [True, False])
+def test_client_connection_pool_options(http2: bool) -> None:
+    client = HarborAsyncClient(
+        url="https://example.com/api/v2.0",
+        username="username",
+        secret="secret",
+        max_connections=50,
+        max_keepalive_connections=25,
+        keepalive_expiry=30.0,
+        http2=http2,
+    )
+
+    def assert_pool_options() -> None:
+        pool = client.client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 25
+        assert pool._keepalive_expiry == 30.0
+        assert pool._http2 == http2
+
+    assert_pool_options()
+
+    # Options must survive re-instantiation of the HTTPX client
+    client.authenticate(verify=False)
+    assert_pool_options()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "status_code",
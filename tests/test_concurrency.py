@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from pytest_httpserver import HTTPServer
+
+from harborapi import HarborAsyncClient
+from harborapi.concurrency import AdaptiveLimiter
+from harborapi.concurrency import SingleFlight
+from harborapi.exceptions import StatusError
+from harborapi.ext.api import run_coros
+
+
+async def test_singleflight_cancel_caller() -> None:
+    """Cancelling one caller does not cancel the call for the others."""
+    sf = SingleFlight()
+
+    async def func() -> int:
+        await asyncio.sleep(0.1)
+        return 1
+
+    t1 = asyncio.ensure_future(sf.do("key", func))
+    t2 = asyncio.ensure_future(sf.do("key", func))
+    await asyncio.sleep(0)
+    t1.cancel()
+    assert await t2 == 1
+    assert sf.calls == 1
+    assert sf.coalesced == 1
+    assert len(sf) == 0
+
+
+async def _track_concurrency(limiter: AdaptiveLimiter, n: int, delay: float) -> int:
+    """Run `n` tasks through the limiter and return the max concurrency seen."""
+    current = 0
+    highest = 0
+
+    async def task() -> None:
+        nonlocal current, highest
+        async with limiter.acquire():
+            current += 1
+            highest = max(highest, current)
+            await asyncio.sleep(delay)
+            current -= 1
+
+    await asyncio.gather(*(task() for _ in range(n)))
+    return highest
+
+
+async def test_adaptive_limiter_limits_concurrency() -> None:
+    limiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+    assert await _track_concurrency(limiter, 20, 0.01) == 3
+    assert limiter.in_flight == 0
+    assert limiter.limit == 3
+
+
+async def test_adaptive_limiter_additive_increase() -> None:
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=10)
+    await _track_concurrency(limiter, 50, 0.01)
+    assert 2 < limiter.limit <= 10
+    assert limiter.backoffs == 0
+
+
+def _status_error(status_code: int) -> StatusError:
+    request = httpx.Request("GET", "http://example.com")
+    response = httpx.Response(status_code, request=request)
+    exc = StatusError("error")
+    exc.__cause__ = httpx.HTTPStatusError("error", request=request, response=response)
+    return exc
+
+
+@pytest.mark.parametrize(
+    "exc, backoff",
+    [
+        (_status_error(429), True),
+        (_status_error(503), True),
+        (httpx.ReadTimeout("timeout"), True),
+        (asyncio.TimeoutError(), True),
+        (_status_error(404), False),
+        (_status_error(500), False),
+        (ValueError(), False),
+    ],
+)
+async def test_adaptive_limiter_backoff(exc: Exception, backoff: bool) -> None:
+    limiter = AdaptiveLimiter(initial_limit=8, backoff_factor=0.5)
+
+    async def fail() -> None:
+        async with limiter.acquire():
+            await asyncio.sleep(0.01)
+            raise exc
+
+    # Concurrent failures at the same limit only decrease it once
+    results = await asyncio.gather(*(fail() for _ in range(4)), return_exceptions=True)
+    assert all(r is exc for r in results)
+    assert limiter.backoffs == (1 if backoff else 0)
+    assert limiter.limit == (4 if backoff else 8)
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_limiter_latency_backoff() -> None:
+    limiter = AdaptiveLimiter(initial_limit=10, window=20, latency_tolerance=2.0)
+    for _ in range(20):
+        limiter._on_success(0.1)
+    assert limiter.baseline_p95 == 0.1
+    # A single slow request does not affect the p95 of 20 requests
+    for latency in [0.1] * 19 + [1.0]:
+        limiter._on_success(latency)
+    assert limiter.backoffs == 0
+    for _ in range(20):
+        limiter._on_success(0.3)
+    assert limiter.backoffs == 1
+    assert limiter.limit == 5
+
+
+def test_adaptive_limiter_invalid_args() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(backoff_factor=1.5)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(rate=0)
+
+
+async def test_adaptive_limiter_rate() -> None:
+    limiter = AdaptiveLimiter(initial_limit=10, rate=50, burst=1)
+    start = time.monotonic()
+    await _track_concurrency(limiter, 6, 0)
+    # First request uses the initial token, the rest wait 1/50s each
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_adaptive_limiter_cancel_waiter() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.acquire():
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await holder
+    assert limiter.in_flight == 0
+    # Limiter is still usable
+    assert await _track_concurrency(limiter, 3, 0) == 1
+
+
+async def test_run_coros_limiter() -> None:
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+
+    async def coro(i: int) -> int:
+        await asyncio.sleep(0.01)
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    results = await run_coros([coro(i) for i in range(5)], None, limiter=limiter)
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], ValueError)
+    assert results[4] == 4
+    assert limiter.in_flight == 0
+
+
+async def test_run_coros_limiter_backoff() -> None:
+    """The limiter backs off on overload errors raised by the coroutines."""
+    limiter = AdaptiveLimiter(initial_limit=8, max_limit=8)
+
+    async def coro(i: int) -> int:
+        await asyncio.sleep(0.01)
+        raise _status_error(429)
+
+    results = await run_coros([coro(i) for i in range(20)], None, limiter=limiter)
+    assert len(results) == 20
+    assert all(isinstance(r, StatusError) for r in results)
+    assert limiter.backoffs > 0
+    assert limiter.limit < 8
+    assert limiter.in_flight == 0
+
+
+async def test_run_coros_unlimited() -> None:
+    async def coro(i: int) -> int:
+        await asyncio.sleep(0.01)
+        return i
+
+    results = await asyncio.wait_for(
+        run_coros((coro(i) for i in range(5)), None), timeout=5
+    )
+    assert results == [0, 1, 2, 3, 4]
+
+
+async def test_client_limiter(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_oneshot_request("/api/v2.0/systeminfo").respond_with_data(
+        status=503
+    )
+    httpserver.expect_request("/api/v2.0/systeminfo").respond_with_json(
+        {"harbor_version": "v2.10.0"}
+    )
+    async_client.limiter = AdaptiveLimiter(initial_limit=4)
+
+    with async_client.no_retry():
+        with pytest.raises(StatusError):
+            await async_client.get_system_info()
+    assert async_client.limiter.backoffs == 1
+    assert async_client.limiter.limit == 2
+
+    info = await async_client.get_system_info()
+    assert info.harbor_version == "v2.10.0"
+    assert async_client.limiter.in_flight == 0
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import asyncio
 
+import backoff
 import pytest
 from backoff._typing import Details
 from httpx import ConnectError
+from httpx import HTTPStatusError
+from httpx import ReadTimeout
+from httpx import Request
+from httpx import Response
 from pytest_httpserver import HTTPServer
 
 from harborapi.client import HarborAsyncClient
+from harborapi.exceptions import CircuitOpenError
 from harborapi.exceptions import HarborAPIException
 from harborapi.exceptions import StatusError
+from harborapi.retry import CircuitBreaker
+from harborapi.retry import CircuitState
+from harborapi.retry import RetryBudget
 from harborapi.retry import RetrySettings
 from harborapi.retry import get_backoff_kwargs
 from harborapi.retry import retry
@@ -243,3 +252,248 @@ def test_retry_decorator_on_other_class() -> None:
         f = Foo()
         f.foo()
     assert "HarborAsyncClient method" in str(exc_info.value)
+
+
+def _status_error(status_code: int) -> StatusError:
+    request = Request("GET", "http://example.com")
+    response = Response(status_code, request=request)
+    exc = StatusError("error")
+    exc.__cause__ = HTTPStatusError("error", request=request, response=response)
+    return exc
+
+
+@pytest.mark.parametrize(
+    "exc, is_failure",
+    [
+        (ConnectError("error"), True),
+        (ReadTimeout("error"), True),
+        (_status_error(429), True),
+        (_status_error(500), True),
+        (_status_error(503), True),
+        (_status_error(404), False),
+        (ValueError(), False),
+    ],
+)
+def test_circuit_breaker_is_failure(exc: Exception, is_failure: bool) -> None:
+    assert CircuitBreaker().is_failure(exc) is is_failure
+
+
+def test_circuit_breaker_states(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("harborapi.retry.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    # Closed: failures are counted, successes reset the count
+    for _ in range(2):
+        breaker.before_call()
+        breaker.after_call(ConnectError("error"))
+    breaker.before_call()
+    breaker.after_call(_status_error(404))
+    assert breaker.failures == 0
+    for _ in range(3):
+        breaker.before_call()
+        breaker.after_call(ConnectError("error"))
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 1
+
+    # Open: requests are rejected
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+    # Half-open: a single trial request is allowed
+    now += 10
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    # Failed trial request opens the circuit again
+    breaker.after_call(ConnectError("error"))
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 2
+
+    # Successful trial request closes the circuit
+    now += 10
+    breaker.before_call()
+    breaker.after_call()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_half_open_cancelled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cancelled trial request frees its slot."""
+    now = 1000.0
+    monkeypatch.setattr("harborapi.retry.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.before_call()
+    breaker.after_call(ConnectError("error"))
+    now += 10
+    breaker.before_call()
+    breaker.after_call(asyncio.CancelledError())
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+
+
+def test_retry_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("harborapi.retry.time.monotonic", lambda: now)
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window=10)
+    assert budget.available == 0
+    assert not budget.try_retry()
+    assert budget.exhausted == 1
+
+    for _ in range(4):
+        budget.record_request()
+    assert budget.available == 2
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+    # Requests and retries expire after the window
+    now += 11
+    assert budget.available == 0
+    budget.record_request()
+    budget.record_request()
+    assert budget.available == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_exhausted(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.stop()
+    budget = RetryBudget(ratio=1, min_retries_per_second=0)
+    async_client.retry = RetrySettings(
+        max_tries=10, wait_gen=backoff.constant, interval=0, retry_budget=budget
+    )
+
+    with pytest.raises(ConnectError):
+        await async_client.get("/users")
+    # One request allows for one retry
+    assert budget.exhausted == 1
+    assert budget.available == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_client(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_request("/api/v2.0/users").respond_with_data(status=500)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    async_client.retry = RetrySettings(circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(StatusError):
+            await async_client.get("/users")
+    assert breaker.state == CircuitState.OPEN
+
+    # Fails fast without sending a request
+    with pytest.raises(CircuitOpenError):
+        await async_client.get("/users")
+    assert len(httpserver.log) == 2
+
+    # Circuit breaker applies even when retrying is disabled
+    async_client.retry.enabled = False
+    with pytest.raises(CircuitOpenError):
+        await async_client.get("/users")
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_stops_retrying(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """Retrying stops once the circuit opens."""
+    httpserver.stop()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    async_client.retry = RetrySettings(
+        max_tries=10, wait_gen=backoff.constant, interval=0, circuit_breaker=breaker
+    )
+
+    with pytest.raises(ConnectError):
+        await async_client.get("/users")
+    assert breaker.failures == 3
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_retry_after(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """Retry-After is used instead of the wait generator."""
+    httpserver.expect_oneshot_request("/api/v2.0/users").respond_with_data(
+        status=429, headers={"Retry-After": "0"}
+    )
+    httpserver.expect_request("/api/v2.0/users").respond_with_json([])
+    waits = []
+
+    def on_backoff(details: Details) -> None:
+        waits.append(details["wait"])
+
+    async_client.retry = RetrySettings(
+        wait_gen=backoff.constant, interval=60, on_backoff=on_backoff
+    )
+    assert await async_client.get("/users") == []
+    assert waits == [0.0]
+    assert len(httpserver.log) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_exceeds_max_time(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """Give up immediately if the server wants us to wait past max_time."""
+    httpserver.expect_request("/api/v2.0/users").respond_with_data(
+        status=503, headers={"Retry-After": "3600"}
+    )
+    async_client.retry = RetrySettings(max_time=60)
+
+    with pytest.raises(StatusError) as exc_info:
+        await async_client.get("/users")
+    assert exc_info.value.status_code == 503
+    assert len(httpserver.log) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_safe_only(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    """429 and 503 responses are only retried for GET and HEAD requests."""
+    for method in ["GET", "POST"]:
+        httpserver.expect_oneshot_request(
+            "/api/v2.0/users", method=method
+        ).respond_with_data(status=429, headers={"Retry-After": "0"})
+    httpserver.expect_request("/api/v2.0/users", method="GET").respond_with_json([])
+    httpserver.expect_request("/api/v2.0/users", method="POST").respond_with_data(
+        status=201, headers={"Location": "/api/v2.0/users/1"}
+    )
+    async_client.retry = RetrySettings(wait_gen=backoff.constant, interval=0)
+
+    assert await async_client.get("/users") == []
+    assert len(httpserver.log) == 2
+    with pytest.raises(StatusError) as exc_info:
+        await async_client.post("/users", json={})
+    assert exc_info.value.status_code == 429
+    assert len(httpserver.log) == 3
+
+    # Opt in to retrying them for all requests
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/users", method="POST"
+    ).respond_with_data(status=503, headers={"Retry-After": "0"})
+    async_client.retry.safe_only_exception = ()
+    await async_client.post("/users", json={})
+    assert len(httpserver.log) == 5
+
+
+def test_retry_policy_cached() -> None:
+    settings = RetrySettings()
+    policy = settings.policy
+    assert settings.policy is policy
+
+    # Changing a setting compiles a new policy
+    settings.max_tries = 3
+    assert settings.policy is not policy
+    assert settings.policy.max_tries == 3
+
+    # Copies do not share the compiled policy
+    copy = settings.model_copy()
+    assert copy.policy is not settings.policy
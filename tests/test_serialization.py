@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from harborapi import HarborAsyncClient
+from harborapi.exceptions import HarborAPIException
+from harborapi.models import ProjectReq
+from harborapi.serialization import JSONBackend
+from harborapi.serialization import OrjsonBackend
+from harborapi.serialization import get_json_backend
+from harborapi.serialization import orjson_installed
+
+BACKENDS = ["json", pytest.param("orjson", marks=pytest.mark.skipif(not orjson_installed, reason="orjson not installed"))]  # fmt: skip
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend_roundtrip(name: str) -> None:
+    backend = get_json_backend(name)
+    assert backend.name == name
+    data = {"name": "æøå", "values": [1, 2.5, None, True], "nested": {"a": []}}
+    encoded = backend.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert backend.loads(encoded) == data
+    assert backend.loads(encoded.decode()) == data
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend_decode_error(name: str) -> None:
+    backend = get_json_backend(name)
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b"{not json")
+
+
+def test_backend_dump_model() -> None:
+    project = ProjectReq(project_name="test", public=True)
+    encoded = JSONBackend().dump_model(project)
+    assert json.loads(encoded) == project.model_dump(mode="json", exclude_unset=True)
+
+
+def test_get_json_backend() -> None:
+    backend = JSONBackend()
+    assert get_json_backend(backend) is backend
+    expected = OrjsonBackend if orjson_installed else JSONBackend
+    assert type(get_json_backend("auto")) is expected
+    assert type(get_json_backend(None)) is expected
+    with pytest.raises(ValueError):
+        get_json_backend("simplejson")
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+async def test_client_json_backend(
+    async_client: HarborAsyncClient, httpserver: HTTPServer, name: str
+) -> None:
+    async_client.json_backend = get_json_backend(name)
+    project = ProjectReq(project_name="test", public=True)
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/projects",
+        method="POST",
+        json={"project_name": "test", "public": True},
+        headers={"Content-Type": "application/json"},
+    ).respond_with_data(status=201, headers={"Location": "/api/v2.0/projects/test"})
+    httpserver.expect_oneshot_request(
+        "/api/v2.0/projects/test", method="PUT", json={"foo": "bar"}
+    ).respond_with_json({"ok": True})
+    httpserver.expect_oneshot_request("/api/v2.0/projects/test").respond_with_json(
+        {"name": "test", "project_id": 1}
+    )
+
+    assert await async_client.create_project(project) == "/api/v2.0/projects/test"
+    assert await async_client.put("/projects/test", json={"foo": "bar"}) == {"ok": True}
+    assert (await async_client.get_project("test")).project_id == 1
+
+
+async def test_client_json_backend_decode_error(
+    async_client: HarborAsyncClient, httpserver: HTTPServer
+) -> None:
+    httpserver.expect_request("/api/v2.0/projects/test").respond_with_data(
+        "{not json", content_type="application/json"
+    )
+    with pytest.raises(HarborAPIException):
+        await async_client.get_project("test")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from json import JSONDecodeError
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -13,7 +14,10 @@ from harborapi._types import JSONType
 from harborapi.exceptions import HarborAPIException
 from harborapi.utils import get_artifact_path
 from harborapi.utils import get_basicauth
+from harborapi.utils import get_page_urls
 from harborapi.utils import get_project_headers
+from harborapi.utils import get_retry_after
+from harborapi.utils import get_total_count
 from harborapi.utils import handle_optional_json_response
 from harborapi.utils import is_json
 from harborapi.utils import parse_pagination_url
@@ -275,3 +279,83 @@ def test_parse_pagination_url(url: str, expected: Optional[str]) -> None:
 )
 def test_parse_pagination_url_nostrip(url: str, expected: Optional[str]) -> None:
     assert parse_pagination_url(url, strip=False) == expected
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"X-Total-Count": "42"}, 42),
+        ({"x-total-count": "0"}, 0),
+        ({"X-Total-Count": "foo"}, None),
+        ({}, None),
+    ],
+)
+def test_get_total_count(headers: Dict[str, str], expected: Optional[int]) -> None:
+    assert get_total_count(Response(200, headers=headers)) == expected
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Retry-After": "120"}, 120.0),
+        ({"retry-after": "1.5"}, 1.5),
+        ({"Retry-After": "-1"}, 0.0),
+        # Dates in the past mean we can retry immediately
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "foo"}, None),
+        ({}, None),
+    ],
+)
+def test_get_retry_after(headers: Dict[str, str], expected: Optional[float]) -> None:
+    assert get_retry_after(Response(429, headers=headers)) == expected
+
+
+@pytest.mark.parametrize(
+    "next_url, total_count, limit, expected",
+    [
+        (
+            "/users?page=2&page_size=10",
+            35,
+            0,
+            [
+                "/users?page=2&page_size=10",
+                "/users?page=3&page_size=10",
+                "/users?page=4&page_size=10",
+            ],
+        ),
+        # Exact multiple of page size
+        (
+            "/users?page=2&page_size=10",
+            30,
+            0,
+            ["/users?page=2&page_size=10", "/users?page=3&page_size=10"],
+        ),
+        # Limit stops before the last page
+        (
+            "/users?page=2&page_size=10",
+            100,
+            11,
+            ["/users?page=2&page_size=10", "/users?page=3&page_size=10"],
+        ),
+        # Other params are left untouched
+        (
+            "/users?q=name%3D~page&page=2&page_size=5&sort=name",
+            12,
+            0,
+            [
+                "/users?q=name%3D~page&page=2&page_size=5&sort=name",
+                "/users?q=name%3D~page&page=3&page_size=5&sort=name",
+            ],
+        ),
+        # Missing page_size
+        ("/users?page=2", 100, 0, []),
+        # Missing page
+        ("/users?page_size=10", 100, 0, []),
+        # Invalid page size
+        ("/users?page=2&page_size=0", 100, 0, []),
+    ],
+)
+def test_get_page_urls(
+    next_url: str, total_count: int, limit: int, expected: List[str]
+) -> None:
+    assert get_page_urls(next_url, total_count, limit=limit) == expected